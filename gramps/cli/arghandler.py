@@ -48,8 +48,6 @@ from gramps.gen.utils.file import rm_tempdir, get_empty_tempdir
 from .clidbman import CLIDbManager, NAME_FILE, find_locker_name
 from gramps.gen.db.utils import make_database
 from gramps.gen.plug import BasePluginManager
-from gramps.gen.plug.report import CATEGORY_BOOK, CATEGORY_CODE, BookList
-from .plug import cl_report, cl_book
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 from gramps.gen.config import config
@@ -261,12 +259,7 @@ class ArgHandler:
             family_tree_format = os.path.splitext(fname)[-1][1:].lower()
 
         pmgr = BasePluginManager.get_instance()
-        plugin_found = False
-        for plugin in pmgr.get_import_plugins():
-            if family_tree_format == plugin.get_extension():
-                plugin_found = True
-
-        if plugin_found:
+        if pmgr.get_import_plugins(family_tree_format):
             self.imports.append((fname, family_tree_format))
         else:
             self.__error(_('Error: Unrecognized type: "%(format)s" for '
@@ -308,12 +301,7 @@ class ArgHandler:
             family_tree_format = os.path.splitext(fname)[-1][1:].lower()
 
         pmgr = BasePluginManager.get_instance()
-        plugin_found = False
-        for plugin in pmgr.get_export_plugins():
-            if family_tree_format == plugin.get_extension():
-                plugin_found = True
-
-        if plugin_found:
+        if pmgr.get_export_plugins(family_tree_format):
             self.exports.append((fullpath, family_tree_format))
         else:
             self.__error(_("ERROR: Unrecognized format for export file %s"
@@ -567,10 +555,9 @@ class ArgHandler:
         Try to import filename using the family_tree_format.
         """
         pmgr = BasePluginManager.get_instance()
-        for plugin in pmgr.get_import_plugins():
-            if family_tree_format == plugin.get_extension():
-                import_function = plugin.get_import_function()
-                import_function(self.dbstate.db, filename, self.user)
+        for plugin in pmgr.get_import_plugins(family_tree_format):
+            import_function = plugin.get_import_function()
+            import_function(self.dbstate.db, filename, self.user)
 
     #-------------------------------------------------------------------------
     #
@@ -583,10 +570,9 @@ class ArgHandler:
         Try to write into filename using the family_tree_format.
         """
         pmgr = BasePluginManager.get_instance()
-        for plugin in pmgr.get_export_plugins():
-            if family_tree_format == plugin.get_extension():
-                export_function = plugin.get_export_function()
-                export_function(self.dbstate.db, filename, self.user)
+        for plugin in pmgr.get_export_plugins(family_tree_format):
+            export_function = plugin.get_export_function()
+            export_function(self.dbstate.db, filename, self.user)
 
     #-------------------------------------------------------------------------
     #
@@ -599,6 +585,8 @@ class ArgHandler:
         """
         pmgr = BasePluginManager.get_instance()
         if action == "report":
+            from gramps.gen.plug.report import CATEGORY_BOOK, CATEGORY_CODE
+            from .plug import cl_report
             try:
                 options_str_dict = _split_options(options_str)
             except:
@@ -695,6 +683,8 @@ class ArgHandler:
                           file=sys.stderr)
 
         elif action == "book":
+            from gramps.gen.plug.report import BookList
+            from .plug import cl_book
             try:
                 options_str_dict = _split_options(options_str)
             except:
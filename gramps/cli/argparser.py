@@ -46,7 +46,7 @@ import logging
 #
 #-------------------------------------------------------------------------
 from gramps.gen.const import LONGOPTS, SHORTOPTS, PLUGINS_DIR, USER_PLUGINS
-from gramps.gen.plug import BasePluginManager
+from gramps.gen.plug import BasePluginManager, PluginRegister
 from gramps.gen.config import config
 from gramps.gen.utils.cast import get_type_converter
 from gramps.gen.const import GRAMPS_LOCALE as glocale
@@ -80,6 +80,7 @@ Application options
   -c, --config=[config.setting[:value]]  Set config setting(s) and start Gramps
   -y, --yes                              Don't ask to confirm dangerous actions (non-GUI mode only)
   -q, --quiet                            Suppress progress indication output (non-GUI mode only)
+  --rebuild-plugin-cache                 Register all the plugins again, ignoring the plugin cache
   -v, --version                          Show versions
 """)
 
@@ -158,6 +159,7 @@ class ArgParser:
     -c, --config=SETTINGS           Set config setting(s) and start Gramps
     -y, --yes                       Don't ask to confirm dangerous actions
     -q, --quiet                     Suppress progress indication output
+    --rebuild-plugin-cache          Ignore the plugin cache
     -v, --version                   Show versions
     -h, --help                      Display the help
     --usage                         Display usage information
@@ -396,6 +398,9 @@ class ArgParser:
                 self.auto_accept = True
             elif option in ['-q', '--quiet']:
                 self.quiet = True
+            elif option in ['--rebuild-plugin-cache']:
+                PluginRegister.get_instance().clear_cache()
+                cleandbg += [opt_ix]
 
         #clean options list
         cleandbg.reverse()
@@ -208,19 +208,9 @@ class CommandLineReport:
     def __init__(self, database, name, category, option_class, options_str_dict,
                  noopt=False):
 
-        pmgr = BasePluginManager.get_instance()
         self.__textdoc_plugins = []
         self.__drawdoc_plugins = []
         self.__bookdoc_plugins = []
-        for plugin in pmgr.get_docgen_plugins():
-            if plugin.get_text_support() and plugin.get_extension():
-                self.__textdoc_plugins.append(plugin)
-            if plugin.get_draw_support() and plugin.get_extension():
-                self.__drawdoc_plugins.append(plugin)
-            if (plugin.get_extension()
-                    and plugin.get_text_support()
-                    and plugin.get_draw_support()):
-                self.__bookdoc_plugins.append(plugin)
 
         self.database = database
         self.category = category
@@ -263,6 +253,11 @@ class CommandLineReport:
         self.option_class.load_previous_values()
         _validate_options(self.option_class, database)
         self.show = options_str_dict.pop('show', None)
+        if category in (CATEGORY_TEXT, CATEGORY_DRAW, CATEGORY_BOOK):
+            self.__load_docgen_plugins(
+                options_str_dict.get(
+                    'off', self.option_class.handler.get_format_name()),
+                self.show is not None)
 
         self.options_str_dict = options_str_dict
         self.init_standard_options(noopt)
@@ -271,6 +266,35 @@ class CommandLineReport:
         self.init_report_options_help()
         self.show_options()
 
+    def __load_docgen_plugins(self, extension, all_plugins):
+        """
+        Load the docgen plugins of the output format, or all of them if
+        they must be listed, or if none of them suits the report.
+        """
+        pmgr = BasePluginManager.get_instance()
+        if not all_plugins:
+            self.__set_docgen_plugins(pmgr.get_docgen_plugins(extension))
+            plugins = {CATEGORY_TEXT: self.__textdoc_plugins,
+                       CATEGORY_DRAW: self.__drawdoc_plugins,
+                       CATEGORY_BOOK: self.__bookdoc_plugins}[self.category]
+            if plugins:
+                return
+        self.__set_docgen_plugins(pmgr.get_docgen_plugins())
+
+    def __set_docgen_plugins(self, docgen_plugins):
+        self.__textdoc_plugins = []
+        self.__drawdoc_plugins = []
+        self.__bookdoc_plugins = []
+        for plugin in docgen_plugins:
+            if plugin.get_text_support() and plugin.get_extension():
+                self.__textdoc_plugins.append(plugin)
+            if plugin.get_draw_support() and plugin.get_extension():
+                self.__drawdoc_plugins.append(plugin)
+            if (plugin.get_extension()
+                    and plugin.get_text_support()
+                    and plugin.get_draw_support()):
+                self.__bookdoc_plugins.append(plugin)
+
     def init_standard_options(self, noopt):
         """
         Initialize the options that are hard-coded into the report system.
@@ -0,0 +1,95 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that checks what the command line interface imports at startup
+"""
+import os
+import sys
+import json
+import subprocess
+import unittest
+
+# Seconds allowed to import the modules of the command line interface.
+# The time depends on the machine, so it is only checked if set.
+IMPORT_BUDGET = os.environ.get('GRAMPS_IMPORT_BUDGET')
+
+ROOT = os.path.join(os.path.dirname(__file__), "..", "..", "..")
+
+STARTUP = """
+import sys, time, json
+start = time.perf_counter()
+import gramps.grampsapp
+import gramps.cli.argparser
+import gramps.cli.grampscli
+import gramps.cli.arghandler
+elapsed = time.perf_counter() - start
+%s
+print()
+print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))
+"""
+
+IMPORTER = """
+from gramps.gen.plug import BasePluginManager
+from gramps.gen.const import PLUGINS_DIR
+pmgr = BasePluginManager.get_instance()
+pmgr.reg_plugins(PLUGINS_DIR, None, None)
+plugins = pmgr.get_import_plugins('vcf')
+assert [plugin.get_extension() for plugin in plugins] == ['vcf']
+"""
+
+class ImportTimeTest(unittest.TestCase):
+    """
+    Check that the command line interface only imports what it needs.
+    """
+
+    def run_startup(self, code=""):
+        env = dict(os.environ, PYTHONPATH=os.path.abspath(ROOT))
+        result = subprocess.run([sys.executable, "-W", "ignore", "-c",
+                                 STARTUP % code],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL,
+                                env=env, check=True)
+        # Some modules print warnings to the standard output
+        return json.loads(result.stdout.decode().splitlines()[-1])
+
+    @unittest.skipUnless(IMPORT_BUDGET, "Set GRAMPS_IMPORT_BUDGET to run")
+    def test_budget(self):
+        result = self.run_startup()
+        self.assertLess(result['elapsed'], float(IMPORT_BUDGET))
+
+    def test_startup_modules(self):
+        modules = self.run_startup()['modules']
+        for module in modules:
+            self.assertFalse(module.startswith('gramps.gen.datehandler._date_'),
+                             module)
+        for module in ('gramps.gen.plug.docgen', 'gramps.gen.relationship',
+                       'gramps.cli.plug'):
+            self.assertNotIn(module, modules)
+
+    def test_selected_plugin(self):
+        modules = self.run_startup(IMPORTER)['modules']
+        self.assertIn('importvcard', modules)
+        for module in ('importcsv', 'importgedcom', 'importxml'):
+            self.assertNotIn(module, modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -141,6 +141,9 @@ register('behavior.do-not-show-previously-seen-addon-updates', True)
 register('behavior.date-about-range', 50)
 register('behavior.date-after-range', 50)
 register('behavior.date-before-range', 50)
+# Number of processes applying a filter to a database on disk; the worker
+# processes are forked, so a filter is applied in one process on Windows
+register('behavior.filter-workers', 0)
 register('behavior.generation-depth', 15)
 register('behavior.max-age-prob-alive', 110)
 register('behavior.max-sib-age-diff', 20)
@@ -158,6 +161,7 @@ register('behavior.web-search-url', 'http://google.com/#&q=%(text)s')
 register('behavior.addons-url', "https://raw.githubusercontent.com/gramps-project/addons/master/gramps51")
 
 register('database.backend', 'bsddb')
+register('database.blob-codec', 'pickle')
 register('database.compress-backup', True)
 register('database.backup-path', USER_HOME)
 register('database.backup-on-exit', True)
@@ -165,6 +169,16 @@ register('database.autobackup', 0)
 register('database.path', os.path.join(HOME_DIR, 'grampsdb'))
 register('database.host', '')
 register('database.port', '')
+register('database.sqlite-profile', 'safe')
+register('database.sqlite-journal-mode', '')
+register('database.sqlite-synchronous', '')
+register('database.sqlite-temp-store', '')
+register('database.sqlite-cache-size', 0)
+register('database.sqlite-mmap-size', -1)
+register('database.sqlite-page-size', 0)
+register('database.undo-memory-budget', 16384)
+register('database.undo-history-depth', 1000)
+register('database.trace-transactions', False)
 
 register('export.proxy-order',
          [["privacy", 0],
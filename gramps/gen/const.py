@@ -110,6 +110,7 @@ VERSION_DIR = os.path.join(
     HOME_DIR, "gramps%s%s" % (VERSION_TUPLE[0], VERSION_TUPLE[1]))
 
 CUSTOM_FILTERS = os.path.join(VERSION_DIR, "custom_filters.xml")
+PLUGIN_CACHE = os.path.join(VERSION_DIR, "plugin_cache.pickle")
 REPORT_OPTIONS = os.path.join(HOME_DIR, "report_options.xml")
 TOOL_OPTIONS = os.path.join(HOME_DIR, "tool_options.xml")
 PLACE_FORMATS = os.path.join(HOME_DIR, "place_formats.xml")
@@ -305,6 +306,7 @@ LONGOPTS = [
     "version",
     "yes",
     "quiet",
+    "rebuild-plugin-cache",
 ]
 
 SHORTOPTS = "O:U:P:C:i:e:f:a:p:d:c:r:lLthuv?syq"
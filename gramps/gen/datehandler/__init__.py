@@ -41,36 +41,10 @@ _ = glocale.translation.sgettext
 from ._datehandler import (LANG, LANG_SHORT, LANG_TO_PARSER, LANG_TO_DISPLAY,
                            locale_tformat, main_locale)
 from . import _datestrings
+from ._dateparser import CachedDateParser
 
-# Import all the localized handlers
-from . import _date_ar
-from . import _date_bg
-from . import _date_ca
-from . import _date_cs
-from . import _date_da
-from . import _date_de
-from . import _date_el
-from . import _date_es
-from . import _date_fi
-from . import _date_fr
-from . import _date_hr
-from . import _date_hu
-from . import _date_is
-from . import _date_it
-from . import _date_ja
-from . import _date_lt
-from . import _date_nb
-from . import _date_nl
-from . import _date_pl
-from . import _date_pt
-from . import _date_ru
-from . import _date_sk
-from . import _date_sl
-from . import _date_sr
-from . import _date_sv
-from . import _date_uk
-from . import _date_zh_CN
-from . import _date_zh_TW
+# The localized handlers are imported when their language is looked up,
+# see HANDLER_MODULES in _datehandler
 
 # Initialize global parser
 try:
@@ -83,6 +57,9 @@ except:
         _("Date parser for '%s' not available, using default") % LANG)
     parser = LANG_TO_PARSER["C"](plocale=glocale)
 
+# Global parser remembering the dates it parsed, for the imports and editors
+cached_parser = CachedDateParser(parser)
+
 # Initialize global displayer
 try:
     from ..config import config
@@ -29,6 +29,7 @@ Class handling language-specific selection for date parser and displayer.
 #
 #-------------------------------------------------------------------------
 import os
+import importlib
 
 #-------------------------------------------------------------------------
 #
@@ -73,18 +74,125 @@ else:
 LANG = str(LANG)
 LANG_SHORT = str(LANG_SHORT)
 
-LANG_TO_PARSER = {
-    'C'                     : DateParser,
+# The modules of the localized handlers, with the language codes they
+# register.  A module is only imported when one of its languages is looked
+# up, since each handler loads the translations of its language.
+HANDLER_MODULES = {
+    '_date_ar': ('ar_EG', 'ar_AR', 'ar', 'Arabic', 'arabic'),
+    '_date_bg': ('bg_BG', 'bg', 'bulgarian', 'Bulgarian'),
+    '_date_ca': ('ca_ES', 'ca', 'català', 'Catalan', 'ca_FR', 'ca_AD',
+                 'ca_IT'),
+    '_date_cs': ('cs_CZ', 'cs', 'CS', 'Czech'),
+    '_date_da': ('da_DK', 'da', 'dansk', 'Danish'),
+    '_date_de': ('de_DE', 'german', 'German', 'de_AT', 'de_CH', 'de_LI',
+                 'de_LU', 'de_BE', 'de'),
+    '_date_el': ('el_GR', 'el_CY', 'el', 'Greek', 'greek'),
+    '_date_es': ('es_ES', 'es', 'spanish', 'Spanish'),
+    '_date_fi': ('fi_FI', 'fi', 'finnish', 'Finnish'),
+    '_date_fr': ('fr_FR', 'fr', 'french', 'French', 'fr_CA', 'fr_BE',
+                 'fr_CH'),
+    '_date_hr': ('hr_HR', 'hr', 'HR', 'croatian', 'Croatian', 'hrvatski'),
+    '_date_hu': ('hu_HU', 'hu', 'hungarian', 'Hungarian', 'magyar'),
+    '_date_is': ('is_IS', 'is', 'íslenskt', 'Icelandic'),
+    '_date_it': ('it_IT', 'it', 'italian', 'Italian', 'it_CH'),
+    '_date_ja': ('ja_JP', 'ja', 'japanese', 'Japanese'),
+    '_date_lt': ('lt_LT', 'lt', 'lithuanian', 'Lithuanian'),
+    '_date_nb': ('nb_NO', 'nb', 'nn_NO', 'nn', 'norsk', 'Norwegian'),
+    '_date_nl': ('nl_NL', 'dutch', 'Dutch', 'nl_BE', 'nl'),
+    '_date_pl': ('pl_PL', 'polish', 'Polish_Poland', 'pl'),
+    '_date_pt': ('pt_PT', 'pt_PT.UTF-8', 'pt_BR', 'pt_BR.UTF-8',
+                 'ptportuguese', 'Portuguese'),
+    '_date_ru': ('ru_RU', 'ru', 'russian', 'Russian'),
+    '_date_sk': ('sk_SK', 'sk', 'SK', 'Slovak'),
+    '_date_sl': ('sl_SI', 'sl', 'SL', 'slovenščina', 'slovenian',
+                 'Slovenian'),
+    '_date_sr': ('sr_RS.utf8@latin', 'srpski', 'Srpski', 'sr_Latn',
+                 'sr_Latn_RS', 'sr_RS@latin', 'sr_RS', 'sr', 'sr_Cyrl',
+                 'sr_Cyrl_RS', 'српски', 'Српски', 'serbian'),
+    '_date_sv': ('sv_SE', 'sv_SE.UTF-8', 'sv', 'Swedish'),
+    '_date_uk': ('uk_UA', 'uk', 'ukrainian', 'Ukrainian'),
+    '_date_zh_CN': ('zh_CN', 'zh_SG', 'zh', 'chinese', 'Chinese'),
+    '_date_zh_TW': ('zh_TW', 'zh_HK'),
     }
 
-LANG_TO_DISPLAY = {
+_LANG_TO_MODULE = {lang: module
+                   for module, langs in HANDLER_MODULES.items()
+                   for lang in langs}
+
+_loaded_modules = set()
+
+def load_handler_module(lang):
+    """
+    Import the module of the localized handlers of a language, if any and
+    not done yet.
+    """
+    module = _LANG_TO_MODULE.get(lang)
+    if module is not None and module not in _loaded_modules:
+        _loaded_modules.add(module)
+        importlib.import_module('.' + module, __package__)
+
+def load_all_handler_modules():
+    """
+    Import the modules of all the localized handlers.
+    """
+    for langs in HANDLER_MODULES.values():
+        load_handler_module(langs[0])
+
+class LazyHandlerDict(dict):
+    """
+    A dictionary by language code, which is filled as the modules of the
+    localized handlers are imported.  Looking a language up imports its
+    module; listing the dictionary imports all of them.
+    """
+
+    def __missing__(self, lang):
+        if lang in _LANG_TO_MODULE:
+            load_handler_module(lang)
+            if dict.__contains__(self, lang):
+                return dict.__getitem__(self, lang)
+        raise KeyError(lang)
+
+    def __contains__(self, lang):
+        if not dict.__contains__(self, lang):
+            load_handler_module(lang)
+        return dict.__contains__(self, lang)
+
+    def get(self, lang, default=None):
+        return self[lang] if lang in self else default
+
+    def __iter__(self):
+        load_all_handler_modules()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        load_all_handler_modules()
+        return dict.__len__(self)
+
+    def keys(self):
+        load_all_handler_modules()
+        return dict.keys(self)
+
+    def values(self):
+        load_all_handler_modules()
+        return dict.values(self)
+
+    def items(self):
+        load_all_handler_modules()
+        return dict.items(self)
+
+LANG_TO_PARSER = LazyHandlerDict({
+    'C'                     : DateParser,
+    })
+
+LANG_TO_DISPLAY = LazyHandlerDict({
     'C'                     : DateDisplayEn,
     'ko_KR'                 : DateDisplay,
-    }
+    })
 
-main_locale = { } # this will be augmented by calls to register_datehandler
+# this will be augmented by calls to register_datehandler
+main_locale = LazyHandlerDict()
 
-locale_tformat = {} # locale "tformat" (date format) strings
+locale_tformat = LazyHandlerDict() # locale "tformat" (date format) strings
 
 for no_handler in (
     ('C', ('%d/%m/%Y',)),
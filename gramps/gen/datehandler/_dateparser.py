@@ -49,6 +49,7 @@ log = logging.getLogger(".DateParser")
 from ..lib.date import Date, DateError, Today
 from ..const import GRAMPS_LOCALE as glocale
 from ..utils.grampslocale import GrampsLocale
+from ..utils.lru import LRU
 from ._datestrings import DateStrings
 
 #-------------------------------------------------------------------------
@@ -56,6 +57,9 @@ from ._datestrings import DateStrings
 # Top-level module functions
 #
 #-------------------------------------------------------------------------
+# Number of distinct texts remembered by a CachedDateParser
+DEFAULT_CACHE_SIZE = 10000
+
 _max_days  = [ 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31 ]
 _leap_days = [ 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31 ]
 
@@ -949,3 +953,64 @@ class DateParser:
         except DateError:
             new_date.set_as_text(text)
         return new_date
+
+#-------------------------------------------------------------------------
+#
+# CachedDateParser
+#
+#-------------------------------------------------------------------------
+class CachedDateParser:
+    """
+    Front end of a date parser, which remembers the dates of the last texts
+    it parsed.  Imports parse the same few texts over and over.
+
+    The locale and the date format of a parser are set when it is created,
+    so the texts are the keys of the cache.  Texts referring to today are
+    not remembered.
+    """
+    def __init__(self, parser, size=DEFAULT_CACHE_SIZE):
+        """
+        :param parser: the date parser
+        :type parser: a :class:`.DateParser` instance
+        :param size: the number of texts remembered, 0 to disable the cache
+        :type size: int
+        """
+        self.parser = parser
+        self.cache = LRU(size)
+        self._today = re.compile(parser._today_str, re.IGNORECASE)
+        self.reset_cache_stats()
+
+    def parse(self, text):
+        """
+        Parses the text, returning a new :class:`.Date` object.
+        """
+        if text in self.cache:
+            self.stats['hits'] += 1
+            return Date(self.cache[text])
+        self.stats['misses'] += 1
+        date = self.parser.parse(text)
+        if not self._today.search(text):
+            if len(self.cache.data) >= self.cache.count > 1:
+                self.stats['evictions'] += 1
+            self.cache[text] = Date(date)
+        return date
+
+    def clear_cache(self):
+        """
+        Forget the dates parsed.
+        """
+        self.cache.clear()
+
+    def get_cache_stats(self):
+        """
+        Return the statistics of the cache, as a dictionary with the number
+        of 'hits', 'misses' and 'evictions', and the current 'size'.
+        """
+        self.stats['size'] = len(self.cache.data)
+        return self.stats
+
+    def reset_cache_stats(self):
+        """
+        Reset the hit, miss and eviction counters.
+        """
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0}
@@ -49,6 +49,8 @@ if '-v' in sys.argv or '--verbose' in sys.argv:
 from ...lib import Date, DateError
 from .. import parser as _dp
 from .. import displayer as _dd
+from .. import LANG_TO_DISPLAY, LANG_TO_PARSER
+from .._datehandler import HANDLER_MODULES
 
 #-------------------------------------------------------------------------
 #
@@ -182,5 +184,28 @@ class DateHandlerTest(unittest.TestCase):
             d.set(Date.QUAL_NONE, Date.MOD_SPAN, Date.CAL_GREGORIAN,
                   (4, 7, 1789, False, 5, 88, 1876, False), "Text comment")
 
+class HandlerModulesTest(unittest.TestCase):
+    """
+    Check the table of the modules of the localized handlers, which are
+    imported on demand.
+    """
+
+    def test_lookup(self):
+        self.assertIn('fr_FR', LANG_TO_DISPLAY)
+        self.assertEqual(LANG_TO_PARSER['fr'].__module__,
+                         'gramps.gen.datehandler._date_fr')
+        self.assertNotIn('xx_XX', LANG_TO_PARSER)
+        self.assertIsNone(LANG_TO_PARSER.get('xx_XX'))
+
+    def test_table(self):
+        registered = {}
+        for lang, display_class in LANG_TO_DISPLAY.items():
+            module = display_class.__module__.rsplit('.', 1)[1]
+            if module in HANDLER_MODULES:
+                registered.setdefault(module, set()).add(lang)
+        self.assertEqual(registered,
+                         {module: set(langs)
+                          for module, langs in HANDLER_MODULES.items()})
+
 if __name__ == "__main__":
     unittest.main()
@@ -121,5 +121,49 @@ class Test_generate_variants(unittest.TestCase):
         v = self.month_variants[5]
         self.assertIn("Maj", v)
 
+class CachedDateParserTest(unittest.TestCase):
+    def setUp(self):
+        from .._dateparser import DateParser, CachedDateParser
+        self.parser = DateParser()
+        self.cached = CachedDateParser(self.parser, size=2)
+
+    def assert_stats(self, hits, misses, evictions, size):
+        self.assertEqual(self.cached.get_cache_stats(),
+                         {'hits': hits, 'misses': misses,
+                          'evictions': evictions, 'size': size})
+
+    def test_same_date(self):
+        for text in ("abt 1850", "1900-05-03", "from 1800 to 1810", "junk"):
+            date = self.cached.parse(text)
+            self.assertTrue(date.is_equal(self.parser.parse(text)))
+            self.assertEqual(date.get_text(), self.parser.parse(text).get_text())
+            date = self.cached.parse(text)
+            self.assertTrue(date.is_equal(self.parser.parse(text)))
+        self.assert_stats(4, 4, 2, 2)
+
+    def test_new_date(self):
+        date = self.cached.parse("1850")
+        date.set_quality(Date.QUAL_ESTIMATED)
+        other = self.cached.parse("1850")
+        self.assertIsNot(date, other)
+        self.assertEqual(other.get_quality(), Date.QUAL_NONE)
+        other.set_year(1851)
+        self.assertEqual(self.cached.parse("1850").get_year(), 1850)
+        self.assert_stats(2, 1, 0, 1)
+
+    def test_today_not_cached(self):
+        self.cached.parse("today")
+        self.cached.parse("before today")
+        self.assert_stats(0, 2, 0, 0)
+
+    def test_reset(self):
+        self.cached.parse("1850")
+        self.cached.parse("1850")
+        self.cached.reset_cache_stats()
+        self.cached.clear_cache()
+        self.assert_stats(0, 0, 0, 0)
+        self.cached.parse("1850")
+        self.assert_stats(0, 1, 0, 1)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1433,6 +1433,64 @@ class DbReadBase:
         """
         return False
 
+    def select_handles(self, class_name, where, params):
+        """
+        Return the handles of the objects of a class which match an SQL
+        condition on the secondary columns of its table.
+
+        This is used to evaluate filter rules in the database.  Databases
+        which do not support it, including proxies, return None.
+
+        :param class_name: name of the primary object class.
+        :type class_name: str
+        :param where: SQL WHERE clause with ? placeholders.
+        :type where: str
+        :param params: values of the placeholders.
+        :type params: list
+        :returns: list of handles, or None.
+        """
+        return None
+
+    def get_generation(self):
+        """
+        Return a number which changes whenever data in the database is
+        changed, so that values derived from the data can be cached.
+
+        Databases which do not count changes return None.
+        """
+        return None
+
+    def get_serial(self):
+        """
+        Return a number which changes whenever data in the database is
+        changed, and which is stored with the data, so that values derived
+        from the data can be kept between sessions.
+
+        Databases which do not count changes return None.
+        """
+        return None
+
+    def get_person_summary(self, handle):
+        """
+        Return the summary of the events shown as the birth and the death
+        of a person, maintained by the database, as a dictionary with the
+        keys:
+
+        birth_ref, death_ref
+            The handle of the event of the date, or None.
+        birth_sortval, death_sortval
+            The sort value of the date, or None.
+        birth_fallback, death_fallback
+            True if the event is a fallback, like a baptism or a burial.
+        birth_place_ref, death_place_ref
+            The handle of the event of the place, or None.
+        birth_place_fallback, death_place_fallback
+            True if the event of the place is a fallback.
+
+        Databases which do not maintain the summaries return None.
+        """
+        return None
+
     def method(self, fmt, *args):
         """
         Convenience function to return database methods.
@@ -0,0 +1,386 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+An index of the links between people and families of a database.
+
+Relationship filter rules and the relationship calculator walk the family
+graph many times.  Loading a person and a family object for every step is
+slow, so the links are kept in dictionaries of handles which are shared by
+all users of a database.  The index is built when it is first used, and is
+kept up to date from the person and family signals of the database; the
+signals of the other objects only tell that the index is still current.  If
+the database changed without sending signals, for example in a batch
+transaction, the index is built again.
+
+Usage::
+
+    graph = get_family_graph(db)
+    ancestors = graph.get_ancestors(person_handle)
+"""
+
+#-------------------------------------------------------------------------
+#
+# Standard python modules
+#
+#-------------------------------------------------------------------------
+import weakref
+from collections import deque
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from ..utils.callback import Callback
+
+_GRAPHS = weakref.WeakKeyDictionary()
+
+#-------------------------------------------------------------------------
+#
+# FamilyGraph
+#
+#-------------------------------------------------------------------------
+class FamilyGraph:
+    """
+    The links between the people and families of a database.
+    """
+
+    def __init__(self, db):
+        self.__db = weakref.ref(db)
+        self.__built = False
+        self.__generation = None
+        self.__cache = {}
+        # person handle -> tuple of parent family handles, main family first
+        self.parent_families = {}
+        # person handle -> tuple of family handles where the person is a
+        # parent
+        self.families = {}
+        # family handle -> (father handle, mother handle)
+        self.parents = {}
+        # family handle -> tuple of (child handle, mother relation value,
+        # father relation value)
+        self.children = {}
+
+    def connect(self, db):
+        """
+        Keep the index up to date from the signals of the database.
+        """
+        for signal in ('person-add', 'person-update'):
+            db.connect(signal, self.__update_people)
+        db.connect('person-delete', self.__delete_people)
+        for signal in ('family-add', 'family-update'):
+            db.connect(signal, self.__update_families)
+        db.connect('family-delete', self.__delete_families)
+        for signal in ('person-rebuild', 'family-rebuild'):
+            db.connect(signal, self.clear)
+        for obj_type in ('event', 'place', 'source', 'citation', 'media',
+                         'repository', 'note', 'tag'):
+            for action in ('add', 'update', 'delete'):
+                db.connect('%s-%s' % (obj_type, action), self.__follow)
+
+    def clear(self, *args):
+        """
+        Discard the index, so that it is built again when next used.
+        """
+        self.__built = False
+        self.__cache.clear()
+        self.parent_families = {}
+        self.families = {}
+        self.parents = {}
+        self.children = {}
+
+    def get_generation(self):
+        """
+        Return the database generation the index corresponds to.
+        """
+        self.__sync()
+        return self.__generation
+
+    #---------------------------------------------------------------------
+    #
+    # Maintenance
+    #
+    #---------------------------------------------------------------------
+    def __sync(self):
+        db = self.__db()
+        generation = db.get_generation()
+        if self.__built and generation == self.__generation:
+            return
+        self.clear()
+        for person in db.iter_people():
+            self.__add_person(person)
+        for family in db.iter_families():
+            self.__add_family(family)
+        self.__built = True
+        self.__generation = generation
+
+    def __is_current(self, generation):
+        """
+        Tell if the index is current at the generation of a commit sending
+        signals.  Each commit increases the generation by one, so if the
+        index missed a commit without signals, it is not.  A database which
+        does not count its changes can only be followed from its signals.
+        """
+        if generation is None or self.__generation is None:
+            return generation == self.__generation
+        return generation in (self.__generation, self.__generation + 1)
+
+    def __follow(self, *args):
+        """
+        Take the generation of a commit which did not change the index.
+        """
+        generation = self.__db().get_generation()
+        if self.__built and self.__is_current(generation):
+            self.__generation = generation
+
+    def __changed(self):
+        self.__cache.clear()
+        generation = self.__db().get_generation()
+        if not self.__is_current(generation):
+            self.clear()
+        self.__generation = generation
+
+    def __add_person(self, person):
+        self.parent_families[person.handle] = tuple(
+            person.get_parent_family_handle_list())
+        self.families[person.handle] = tuple(person.get_family_handle_list())
+
+    def __add_family(self, family):
+        self.parents[family.handle] = (family.get_father_handle(),
+                                       family.get_mother_handle())
+        self.children[family.handle] = tuple(
+            (ref.ref, int(ref.get_mother_relation()),
+             int(ref.get_father_relation()))
+            for ref in family.get_child_ref_list())
+
+    def __update_people(self, handles):
+        if self.__built:
+            db = self.__db()
+            for handle in handles:
+                person = db.get_person_from_handle(handle)
+                if person:
+                    self.__add_person(person)
+            self.__changed()
+
+    def __delete_people(self, handles):
+        if self.__built:
+            for handle in handles:
+                self.parent_families.pop(handle, None)
+                self.families.pop(handle, None)
+            self.__changed()
+
+    def __update_families(self, handles):
+        if self.__built:
+            db = self.__db()
+            for handle in handles:
+                family = db.get_family_from_handle(handle)
+                if family:
+                    self.__add_family(family)
+            self.__changed()
+
+    def __delete_families(self, handles):
+        if self.__built:
+            for handle in handles:
+                self.parents.pop(handle, None)
+                self.children.pop(handle, None)
+            self.__changed()
+
+    #---------------------------------------------------------------------
+    #
+    # Links
+    #
+    #---------------------------------------------------------------------
+    def get_parent_families(self, handle):
+        """
+        Return the handles of the families in which a person is a child,
+        with the main family first.
+        """
+        self.__sync()
+        return self.parent_families.get(handle, ())
+
+    def get_families(self, handle):
+        """
+        Return the handles of the families in which a person is a parent.
+        """
+        self.__sync()
+        return self.families.get(handle, ())
+
+    def has_family(self, family_handle):
+        """
+        Return True if a family is in the index.
+        """
+        self.__sync()
+        return family_handle in self.parents
+
+    def get_parents(self, family_handle):
+        """
+        Return the father and mother handles of a family, which may be
+        None.
+        """
+        self.__sync()
+        return self.parents.get(family_handle, (None, None))
+
+    def get_children(self, family_handle):
+        """
+        Return the children of a family, as a tuple of (child handle,
+        mother relation value, father relation value) tuples.
+        """
+        self.__sync()
+        return self.children.get(family_handle, ())
+
+    def get_main_parents(self, handle):
+        """
+        Return the father and mother handles of the main family of a
+        person, which may be None.
+        """
+        self.__sync()
+        families = self.parent_families.get(handle)
+        if families:
+            return self.parents.get(families[0], (None, None))
+        return (None, None)
+
+    def get_neighbours(self, handle):
+        """
+        Return the handles of the parents, siblings, partners and children
+        of a person.
+        """
+        self.__sync()
+        people = set()
+        for family_handle in (self.families.get(handle, ()) +
+                              self.parent_families.get(handle, ())):
+            people.update(self.parents.get(family_handle, ()))
+            people.update(child[0]
+                          for child in self.children.get(family_handle, ()))
+        people.discard(None)
+        people.discard(handle)
+        return people
+
+    #---------------------------------------------------------------------
+    #
+    # Closures
+    #
+    #---------------------------------------------------------------------
+    def __closure(self, key, handle, step, min_depth, max_depth):
+        """
+        Return the people reached from a person by a number of steps
+        between min_depth and max_depth.  The person is at depth 0.
+        """
+        self.__sync()
+        key = (key, handle, min_depth, max_depth)
+        result = self.__cache.get(key)
+        if result is not None:
+            return result
+        result = set()
+        seen = set()
+        queue = deque([(handle, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            # All depths from min_depth on are equivalent.
+            state = (current, min(depth, min_depth))
+            if state in seen:
+                continue
+            seen.add(state)
+            if depth >= min_depth:
+                result.add(current)
+            if max_depth is None or depth < max_depth:
+                for other in step(current):
+                    queue.append((other, depth + 1))
+        result = frozenset(result)
+        self.__cache[key] = result
+        return result
+
+    def __main_parents(self, handle):
+        return [parent for parent in self.get_main_parents(handle) if parent]
+
+    def __all_parents(self, handle):
+        return [parent for family_handle in self.parent_families.get(handle, ())
+                for parent in self.parents.get(family_handle, ()) if parent]
+
+    def __children(self, handle):
+        return [child[0] for family_handle in self.families.get(handle, ())
+                for child in self.children.get(family_handle, ())]
+
+    def get_ancestors(self, handle, min_depth=0, max_depth=None,
+                      all_families=False):
+        """
+        Return the handles of the ancestors of a person.
+
+        :param handle: handle of the person.
+        :param min_depth: lowest number of generations between the person
+                          and an ancestor.  With 0 the person is included.
+        :param max_depth: highest number of generations, or None.
+        :param all_families: if False only the main parents are followed.
+        :rtype: frozenset
+        """
+        if all_families:
+            return self.__closure('all-ancestors', handle, self.__all_parents,
+                                  min_depth, max_depth)
+        return self.__closure('ancestors', handle, self.__main_parents,
+                              min_depth, max_depth)
+
+    def get_descendants(self, handle, min_depth=0, max_depth=None):
+        """
+        Return the handles of the descendants of a person, through all of
+        their families.
+
+        :param handle: handle of the person.
+        :param min_depth: lowest number of generations between the person
+                          and a descendant.  With 0 the person is included.
+        :param max_depth: highest number of generations, or None.
+        :rtype: frozenset
+        """
+        return self.__closure('descendants', handle, self.__children,
+                              min_depth, max_depth)
+
+    def get_relatives(self, handle):
+        """
+        Return the handles of the people connected to a person by any chain
+        of parents, siblings, partners and children, including the person.
+
+        :rtype: frozenset
+        """
+        return self.__closure('relatives', handle, self.get_neighbours, 0,
+                              None)
+
+#-------------------------------------------------------------------------
+#
+# Functions
+#
+#-------------------------------------------------------------------------
+def get_family_graph(db):
+    """
+    Return the shared family graph index of a database.
+
+    The index of a database which sends signals is updated incrementally.
+    Proxy databases do not send signals, and their index is built again
+    whenever the underlying database changes.  If the database does not
+    count its changes either, a new index is returned, which its caller
+    may only use while the database does not change.
+    """
+    graph = _GRAPHS.get(db)
+    if graph is None:
+        graph = FamilyGraph(db)
+        if isinstance(db, Callback):
+            graph.connect(db)
+        elif db.get_generation() is None:
+            return graph
+        _GRAPHS[db] = graph
+    return graph
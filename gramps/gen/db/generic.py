@@ -35,6 +35,9 @@ import ast
 import sys
 import datetime
 import glob
+import sqlite3
+import zlib
+from itertools import chain
 
 #------------------------------------------------------------------------
 #
@@ -78,50 +81,180 @@ def touch(fname, mode=0o666, dir_fd=None, **kwargs):
                      dir_fd=None if os.supports_fd else dir_fd, **kwargs)
 
 class DbGenericUndo(DbUndo):
-    def __init__(self, grampsdb, path):
+    """
+    Undo/redo manager of the DB-API databases.
+
+    The records of the recent transactions are kept in memory.  When they
+    take more than the memory budget, the oldest ones are compressed and
+    moved to a SQLite database beside the family tree, from where they are
+    loaded again if an old transaction is undone.  Only the last
+    transactions, up to the history depth, can be undone; the records of
+    older transactions are discarded.
+    """
+    def __init__(self, grampsdb, path, memory_budget=None,
+                 history_depth=None):
+        """
+        :param path: the file of the database holding the records which do
+                     not fit in memory.  If None, a temporary file is used.
+        :param memory_budget: the size, in bytes, of the records kept in
+                              memory.  Defaults to the
+                              database.undo-memory-budget key, in KiB.
+        :param history_depth: the number of transactions which can be
+                              undone, 0 for no limit.  Defaults to the
+                              database.undo-history-depth key.
+        """
         super(DbGenericUndo, self).__init__(grampsdb)
-        self.undodb = []
+        self.path = path
+        if memory_budget is None:
+            memory_budget = config.get('database.undo-memory-budget') * 1024
+        if history_depth is None:
+            history_depth = config.get('database.undo-history-depth')
+        self.memory_budget = memory_budget
+        self.history_depth = history_depth
+        self.undodb = {}
+        self.memory_size = 0
+        self.count = 0
+        self.first = 0
+        self.spilled = 0
+        self.connection = None
 
     def open(self, value=None):
         """
-        Open the backing storage.  Needs to be overridden in the derived
-        class.
+        Open the backing storage.  The database for the records is only
+        created when the memory budget is exceeded.
         """
-        pass
+        self.__remove_file()
 
     def close(self):
         """
-        Close the backing storage.  Needs to be overridden in the derived
-        class.
+        Close the backing storage and remove the records.
         """
-        pass
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+        self.__remove_file()
+        self.undodb = {}
+        self.memory_size = 0
+        self.first = self.spilled = self.count
+        self.clear()
+
+    def __remove_file(self):
+        if self.path:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def __connect(self):
+        """
+        Create the database for the records which do not fit in memory.
+        Its content is not needed after a crash, so it is not journaled.
+        """
+        self.connection = sqlite3.connect(self.path or "")
+        self.connection.execute("PRAGMA journal_mode = OFF")
+        self.connection.execute("PRAGMA synchronous = OFF")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS undo "
+                                "(recno INTEGER PRIMARY KEY, data BLOB)")
+
+    def __spill(self):
+        """
+        Move the oldest records to disk, until those left in memory take
+        less than three quarters of the budget.
+        """
+        if self.connection is None:
+            self.__connect()
+        limit = self.memory_budget * 3 // 4
+        records = []
+        while self.memory_size > limit and self.spilled < self.count:
+            value = self.undodb.pop(self.spilled)
+            self.memory_size -= len(value)
+            records.append((self.spilled, zlib.compress(value, 1)))
+            self.spilled += 1
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO undo (recno, data) VALUES (?, ?)",
+                records)
+
+    def discard(self, recno):
+        """
+        Remove the records before the given record number.
+        """
+        recno = min(recno, self.count)
+        for index in range(max(self.first, self.spilled), recno):
+            self.memory_size -= len(self.undodb.pop(index))
+        if self.connection is not None and self.first < self.spilled:
+            with self.connection:
+                self.connection.execute("DELETE FROM undo WHERE recno < ?",
+                                        [recno])
+        self.first = max(self.first, recno)
+        self.spilled = max(self.spilled, recno)
+
+    def clear(self):
+        """
+        Clear the undo/redo list and discard the records.
+        """
+        super(DbGenericUndo, self).clear()
+        self.discard(self.count)
+
+    def commit(self, txn, msg):
+        """
+        Commit the transaction to the undo/redo database, and forget the
+        oldest transactions beyond the history depth.
+        """
+        super(DbGenericUndo, self).commit(txn, msg)
+        if self.history_depth and self.undo_count > self.history_depth:
+            while self.undo_count > self.history_depth:
+                self.undoq.popleft()
+            # batch and empty transactions have no records
+            firsts = [trans.first for trans in chain(self.undoq, self.redoq)
+                      if trans.first is not None]
+            self.discard(min(firsts) if firsts else self.count)
 
     def append(self, value):
         """
-        Add a new entry on the end.  Needs to be overridden in the derived
-        class.
+        Add a new entry on the end, and return its record number.
         """
-        self.undodb.append(value)
+        recno = self.count
+        self.undodb[recno] = value
+        self.memory_size += len(value)
+        self.count += 1
+        if self.memory_size > self.memory_budget:
+            self.__spill()
+        return recno
 
     def __getitem__(self, index):
         """
-        Returns an entry by index number.  Needs to be overridden in the
-        derived class.
+        Returns an entry by index number, loading it from disk if needed.
         """
-        return self.undodb[index]
+        if index < self.first or index >= self.count:
+            raise IndexError(index)
+        if index >= self.spilled:
+            return self.undodb[index]
+        row = self.connection.execute("SELECT data FROM undo WHERE recno = ?",
+                                      [index]).fetchone()
+        return zlib.decompress(row[0])
 
     def __setitem__(self, index, value):
         """
-        Set an entry to a value.  Needs to be overridden in the derived class.
+        Set an entry to a value.
         """
-        self.undodb[index] = value
+        if index < self.first or index >= self.count:
+            raise IndexError(index)
+        if index >= self.spilled:
+            self.memory_size += len(value) - len(self.undodb[index])
+            self.undodb[index] = value
+        else:
+            with self.connection:
+                self.connection.execute(
+                    "UPDATE undo SET data = ? WHERE recno = ?",
+                    [zlib.compress(value, 1), index])
 
     def __len__(self):
         """
-        Returns the number of entries.  Needs to be overridden in the derived
-        class.
+        Returns the number of entries appended since the manager was
+        created.
         """
-        return len(self.undodb)
+        return self.count
 
     def _redo(self, update_history):
         """
@@ -141,14 +274,18 @@ class DbGenericUndo(DbUndo):
             self.db._txn_begin()
             for record_id in subitems:
                 (key, trans_type, handle, old_data, new_data) = \
-                    pickle.loads(self.undodb[record_id])
+                    pickle.loads(self[record_id])
 
                 if key == REFERENCE_KEY:
                     self.undo_reference(new_data, handle)
                 else:
                     self.undo_data(new_data, handle, key)
                     sigs[key][trans_type].append(handle)
+            self.db._update_summaries(chain(*sigs[PERSON_KEY]),
+                                      chain(*sigs[EVENT_KEY]))
             # now emit the signals
+            self.db.generation += 1
+            self.db._update_serial()
             self.undo_sigs(sigs, False)
 
             self.db._txn_commit()
@@ -190,14 +327,18 @@ class DbGenericUndo(DbUndo):
             self.db._txn_begin()
             for record_id in subitems:
                 (key, trans_type, handle, old_data, new_data) = \
-                        pickle.loads(self.undodb[record_id])
+                        pickle.loads(self[record_id])
 
                 if key == REFERENCE_KEY:
                     self.undo_reference(old_data, handle)
                 else:
                     self.undo_data(old_data, handle, key)
                     sigs[key][trans_type].append(handle)
+            self.db._update_summaries(chain(*sigs[PERSON_KEY]),
+                                      chain(*sigs[EVENT_KEY]))
             # now emit the signals
+            self.db.generation += 1
+            self.db._update_serial()
             self.undo_sigs(sigs, True)
 
             self.db._txn_commit()
@@ -245,13 +386,13 @@ class DbGenericUndo(DbUndo):
             sql = "DELETE FROM %s WHERE handle = ?" % table
             self.db.dbapi.execute(sql, [handle])
         else:
+            obj = self.db._get_table_func(cls)["class_func"].create(data)
             if self.db._has_handle(obj_key, handle):
                 sql = "UPDATE %s SET blob_data = ? WHERE handle = ?" % table
-                self.db.dbapi.execute(sql, [pickle.dumps(data), handle])
+                self.db.dbapi.execute(sql, [self.db._encode(obj), handle])
             else:
                 sql = "INSERT INTO %s (handle, blob_data) VALUES (?, ?)" % table
-                self.db.dbapi.execute(sql, [handle, pickle.dumps(data)])
-            obj = self.db._get_table_func(cls)["class_func"].create(data)
+                self.db.dbapi.execute(sql, [handle, self.db._encode(obj)])
             self.db._update_secondary_values(obj)
 
     def undo_sigs(self, sigs, undo):
@@ -570,6 +711,8 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         self.abort_possible = False
         self._bm_changes = 0
         self.has_changed = False
+        self.generation = 0
+        self.serial = 0
         self.surname_list = []
         self.genderStats = GenderStats() # can pass in loaded stats as dict
         self.owner = Researcher()
@@ -667,13 +810,20 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
 
         # surname list
         self.surname_list = self.get_surname_list()
+        self.generation += 1
+        self.serial = self._get_metadata('serial', 0)
 
         self._set_save_path(directory)
 
-        if self._directory:
+        # A read-only database must not touch the undo log of the process
+        # writing to the family tree
+        if (self._directory and self._directory != ":memory:" and
+                not self.readonly):
             self.undolog = os.path.join(self._directory, DBUNDOFN)
         else:
             self.undolog = None
+        if self.undodb is not None:
+            self.undodb.close()
         self.undodb = DbGenericUndo(self, self.undolog)
         self.undodb.open()
 
@@ -705,6 +855,8 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
         Close the database.
         if update is False, don't change access times, etc.
         """
+        if self.undodb is not None:
+            self.undodb.close()
         if self._directory != ":memory:":
             if update:
                 # This is just a dummy file to indicate last modified time of
@@ -777,6 +929,28 @@ class DbGeneric(DbWriteBase, DbReadBase, UpdateCallback, Callback):
     def is_open(self):
         return self.db_is_open
 
+    def get_generation(self):
+        """
+        Return a number which changes whenever data in the database is
+        changed, so that values derived from the data can be cached.
+        """
+        return self.generation
+
+    def get_serial(self):
+        """
+        Return a number which changes whenever data in the database is
+        changed, and which is stored with the data, so that values derived
+        from the data can be kept between sessions.
+        """
+        return self.serial
+
+    def _update_serial(self):
+        """
+        Increment the serial number, in the current database transaction.
+        """
+        self.serial += 1
+        self._set_metadata('serial', self.serial, use_txn=False)
+
     def get_dbid(self):
         """
         We use the file directory name as the unique ID for
@@ -0,0 +1,215 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Persistent sort indexes of the list views.
+
+A sort index holds the (sort key, handle) list of all the objects shown by
+a view, for one sort column.  The indexes are stored in a SQLite database
+beside the family tree, so that a view can be sorted again without
+computing the sort keys of all the objects, even in a later session.
+
+Each index is stamped with the serial number of the database (see
+:meth:`.DbReadBase.get_serial`) it is valid for, and is ignored if the
+database has changed since.  The view which owns an index keeps it up to
+date with :meth:`SortIndex.update` when its objects change, if the sort
+key of an object does not depend on other objects; if any other change
+was made to the database in the meantime, the index becomes stale.
+
+An index is saved as a whole, and the changes are saved apart until they
+are merged into it when it is loaded.
+"""
+
+#-------------------------------------------------------------------------
+#
+# Standard python modules
+#
+#-------------------------------------------------------------------------
+import os
+import pickle
+import sqlite3
+import logging
+import weakref
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from .dbconst import DBLOGNAME
+
+_LOG = logging.getLogger(DBLOGNAME)
+
+SORTINDEXFN = "sortindex.db"
+
+# Number of changes after which they are merged into the saved index
+COMPACT_CHANGES = 1000
+
+#-------------------------------------------------------------------------
+#
+# SortIndex
+#
+#-------------------------------------------------------------------------
+class SortIndex:
+    """
+    The sort indexes of a database, by name.
+
+    The name of an index should identify the view, the sort column and
+    anything else the sort keys depend on, like the collation.
+    """
+
+    def __init__(self, db, path=None):
+        """
+        :param path: the file of the indexes.  If None, the indexes are only
+                     kept in memory.
+        """
+        self.__db = weakref.ref(db)
+        self.path = path
+        self.connection = None
+
+    def __get_db_serial(self):
+        db = self.__db()
+        return db.get_serial() if db is not None else None
+
+    def __connect(self):
+        if self.connection is None:
+            try:
+                self.connection = sqlite3.connect(self.path or ":memory:")
+                self.connection.execute("PRAGMA synchronous = OFF")
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS sort_index "
+                    "(name TEXT PRIMARY KEY, serial INTEGER, keys BLOB)")
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS sort_change "
+                    "(name TEXT, handle TEXT, sortkey TEXT, "
+                    "PRIMARY KEY (name, handle))")
+            except sqlite3.Error as err:
+                # The indexes are only an optimisation
+                _LOG.warning("Cannot open the sort indexes %s: %s",
+                             self.path, err)
+                self.connection = None
+        return self.connection
+
+    def close(self):
+        """
+        Close the database of the indexes.
+        """
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def __get_serial(self, name):
+        row = self.connection.execute(
+            "SELECT serial FROM sort_index WHERE name = ?", [name]).fetchone()
+        return row[0] if row else None
+
+    def load(self, name):
+        """
+        Return the sorted (sort key, handle) list of an index, or None if
+        the index does not exist or is stale.
+        """
+        serial = self.__get_db_serial()
+        if serial is None or self.__connect() is None:
+            return None
+        row = self.connection.execute(
+            "SELECT serial, keys FROM sort_index WHERE name = ?",
+            [name]).fetchone()
+        if row is None or row[0] != serial:
+            return None
+        keys = pickle.loads(row[1])
+        changes = dict(self.connection.execute(
+            "SELECT handle, sortkey FROM sort_change WHERE name = ?",
+            [name]).fetchall())
+        if changes:
+            keys = [key for key in keys if key[1] not in changes]
+            keys.extend((sortkey, handle)
+                        for handle, sortkey in changes.items()
+                        if sortkey is not None)
+            keys.sort()
+            if len(changes) > COMPACT_CHANGES:
+                self.save(name, keys)
+        return keys
+
+    def save(self, name, keys):
+        """
+        Replace an index by the sorted (sort key, handle) list of all the
+        objects.
+        """
+        serial = self.__get_db_serial()
+        if serial is None or self.__connect() is None:
+            return
+        with self.connection:
+            self.connection.execute("DELETE FROM sort_change WHERE name = ?",
+                                    [name])
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sort_index (name, serial, keys) "
+                "VALUES (?, ?, ?)",
+                [name, serial, pickle.dumps(keys, pickle.HIGHEST_PROTOCOL)])
+
+    def update(self, name, handle, sortkey):
+        """
+        Set the sort key of an object in an index, after a change of the
+        object in the database.  A sort key of None removes the object.
+
+        The index stays valid if the change was made by the last
+        transaction, and the index was valid before it.
+        """
+        serial = self.__get_db_serial()
+        if serial is None or self.__connect() is None:
+            return
+        index_serial = self.__get_serial(name)
+        if index_serial not in (serial - 1, serial):
+            return
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sort_change (name, handle, sortkey) "
+                "VALUES (?, ?, ?)", [name, handle, sortkey])
+            self.connection.execute(
+                "UPDATE sort_index SET serial = ? WHERE name = ?",
+                [serial, name])
+
+    def clear(self):
+        """
+        Remove all the indexes.
+        """
+        if self.__connect() is not None:
+            with self.connection:
+                self.connection.execute("DELETE FROM sort_change")
+                self.connection.execute("DELETE FROM sort_index")
+
+_INDEXES = weakref.WeakKeyDictionary()
+
+def get_sort_index(db):
+    """
+    Return the sort indexes of a database, which are shared by all the
+    views of the database.
+    """
+    directory = db.get_save_path()
+    if directory and directory != ":memory:" and os.path.isdir(directory):
+        path = os.path.join(directory, SORTINDEXFN)
+    else:
+        path = None
+    index = _INDEXES.get(db)
+    if index is None or index.path != path:
+        if index is not None:
+            index.close()
+        index = SortIndex(db, path)
+        _INDEXES[db] = index
+    return index
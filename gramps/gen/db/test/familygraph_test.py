@@ -0,0 +1,212 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the family graph index
+"""
+import unittest
+
+from .. import DbTxn
+from ..utils import make_database
+from ..familygraph import get_family_graph
+from ...lib import Person, Family, ChildRef, Note
+from ...proxy import PrivateProxyDb
+from ...filters import GenericFilter
+from ...filters.rules.person import (IsAncestorOf, IsDescendantOf,
+                                     IsLessThanNthGenerationDescendantOf)
+
+class FamilyGraphTest(unittest.TestCase):
+    """
+    Family graph tests.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.people = {}
+        with DbTxn('Add people', self.db) as trans:
+            for name in ('grandfather', 'father', 'mother', 'child',
+                         'sibling'):
+                person = Person()
+                self.db.add_person(person, trans)
+                self.people[name] = person.handle
+            self.add_family('grandfather', None, ['father'], trans)
+            self.add_family('father', 'mother', ['child', 'sibling'], trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def add_family(self, father, mother, children, trans):
+        family = Family()
+        for name, setter in ((father, family.set_father_handle),
+                             (mother, family.set_mother_handle)):
+            if name:
+                setter(self.people[name])
+        for name in children:
+            child_ref = ChildRef()
+            child_ref.set_reference_handle(self.people[name])
+            family.add_child_ref(child_ref)
+        self.db.add_family(family, trans)
+        for name in (father, mother):
+            if name:
+                person = self.db.get_person_from_handle(self.people[name])
+                person.add_family_handle(family.handle)
+                self.db.commit_person(person, trans)
+        for name in children:
+            person = self.db.get_person_from_handle(self.people[name])
+            person.add_parent_family_handle(family.handle)
+            self.db.commit_person(person, trans)
+        return family
+
+    def names(self, handles):
+        return sorted(name for name, handle in self.people.items()
+                      if handle in handles)
+
+    def test_closures(self):
+        graph = get_family_graph(self.db)
+        child = self.people['child']
+        self.assertEqual(self.names(graph.get_ancestors(child)),
+                         ['child', 'father', 'grandfather', 'mother'])
+        self.assertEqual(self.names(graph.get_ancestors(child, 2)),
+                         ['grandfather'])
+        self.assertEqual(self.names(graph.get_ancestors(child, 1, 1)),
+                         ['father', 'mother'])
+        self.assertEqual(
+            self.names(graph.get_descendants(self.people['grandfather'], 1)),
+            ['child', 'father', 'sibling'])
+        self.assertEqual(self.names(graph.get_relatives(child)),
+                         sorted(self.people))
+        self.assertEqual(self.names(graph.get_neighbours(child)),
+                         ['father', 'mother', 'sibling'])
+
+    def test_signals(self):
+        graph = get_family_graph(self.db)
+        father = self.people['father']
+        self.assertEqual(len(graph.get_descendants(father, 1)), 2)
+        with DbTxn('Add grandchild', self.db) as trans:
+            person = Person()
+            self.db.add_person(person, trans)
+            self.people['grandchild'] = person.handle
+            family = self.add_family('child', None, ['grandchild'], trans)
+        self.assertEqual(self.names(graph.get_descendants(father, 1)),
+                         ['child', 'grandchild', 'sibling'])
+        self.assertEqual(graph.get_generation(), self.db.get_generation())
+
+        with DbTxn('Remove family', self.db) as trans:
+            self.db.remove_family_relationships(family.handle, trans)
+        self.assertEqual(self.names(graph.get_descendants(father, 1)),
+                         ['child', 'sibling'])
+
+        self.db.undo()
+        self.assertEqual(self.names(graph.get_descendants(father, 1)),
+                         ['child', 'grandchild', 'sibling'])
+
+    def test_batch(self):
+        graph = get_family_graph(self.db)
+        mother = self.people['mother']
+        self.assertEqual(self.names(graph.get_ancestors(mother, 1)), [])
+        generation = self.db.get_generation()
+        with DbTxn('Add parents', self.db, batch=True) as trans:
+            person = Person()
+            self.db.add_person(person, trans)
+            self.people['grandmother'] = person.handle
+            self.add_family(None, 'grandmother', ['mother'], trans)
+        self.assertNotEqual(self.db.get_generation(), generation)
+        self.assertEqual(self.names(graph.get_ancestors(mother, 1)),
+                         ['grandmother'])
+
+    def count_builds(self):
+        builds = []
+        iter_people = self.db.iter_people
+        def counted():
+            builds.append(1)
+            return iter_people()
+        self.db.iter_people = counted
+        return builds
+
+    def test_other_objects(self):
+        graph = get_family_graph(self.db)
+        father = self.people['father']
+        builds = self.count_builds()
+        self.assertEqual(len(graph.get_descendants(father, 1)), 2)
+        with DbTxn('Add note', self.db) as trans:
+            self.db.add_note(Note(), trans)
+        self.assertEqual(len(graph.get_descendants(father, 1)), 2)
+        self.assertEqual(graph.get_generation(), self.db.get_generation())
+        self.assertEqual(len(builds), 1)
+
+    def test_batch_then_signals(self):
+        graph = get_family_graph(self.db)
+        mother = self.people['mother']
+        self.assertEqual(self.names(graph.get_ancestors(mother, 1)), [])
+        with DbTxn('Add parents', self.db, batch=True) as trans:
+            person = Person()
+            self.db.add_person(person, trans)
+            self.people['grandmother'] = person.handle
+            self.add_family(None, 'grandmother', ['mother'], trans)
+        with DbTxn('Add note', self.db) as trans:
+            self.db.add_note(Note(), trans)
+        with DbTxn('Add person', self.db) as trans:
+            self.db.add_person(Person(), trans)
+        self.assertEqual(self.names(graph.get_ancestors(mother, 1)),
+                         ['grandmother'])
+
+    def test_no_generation(self):
+        self.db.get_generation = lambda: None
+        warnings = []
+        self.db._warn = warnings.append
+        graph = get_family_graph(self.db)
+        father = self.people['father']
+        self.assertEqual(len(graph.get_descendants(father, 1)), 2)
+        with DbTxn('Add grandchild', self.db) as trans:
+            person = Person()
+            self.db.add_person(person, trans)
+            self.people['grandchild'] = person.handle
+            self.add_family('child', None, ['grandchild'], trans)
+            self.db.add_note(Note(), trans)
+        self.assertEqual(self.names(graph.get_descendants(father, 1)),
+                         ['child', 'grandchild', 'sibling'])
+        self.assertEqual(warnings, [])
+
+        # Without signals, the index is not shared
+        proxy = PrivateProxyDb(self.db)
+        graph = get_family_graph(proxy)
+        self.assertIsNot(get_family_graph(proxy), graph)
+        self.assertEqual(self.names(graph.get_descendants(father, 1)),
+                         ['child', 'grandchild', 'sibling'])
+
+    def test_rules(self):
+        grandfather = self.db.get_person_from_handle(
+            self.people['grandfather']).gramps_id
+        child = self.db.get_person_from_handle(self.people['child']).gramps_id
+        for rule, names in (
+                (IsAncestorOf([child, '0']),
+                 ['father', 'grandfather', 'mother']),
+                (IsDescendantOf([grandfather, '1']),
+                 ['child', 'father', 'grandfather', 'sibling']),
+                (IsLessThanNthGenerationDescendantOf([grandfather, '1']),
+                 ['father'])):
+            filter_ = GenericFilter()
+            filter_.add_rule(rule)
+            self.assertEqual(self.names(filter_.apply(self.db)), names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the persistent sort indexes
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import DbTxn
+from ..utils import make_database
+from ..sortindex import get_sort_index, SORTINDEXFN
+from ...lib import Person, Event
+
+class SortIndexTest(unittest.TestCase):
+    """
+    Sort index tests.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db = make_database("sqlite")
+        self.db.load(self.directory)
+        self.handles = []
+        with DbTxn('Add people', self.db) as trans:
+            for dummy in range(3):
+                self.handles.append(self.db.add_person(Person(), trans))
+
+    def tearDown(self):
+        if self.db.is_open():
+            self.db.close()
+        shutil.rmtree(self.directory)
+
+    def commit_person(self, handle):
+        with DbTxn('Edit person', self.db) as trans:
+            self.db.commit_person(self.db.get_person_from_handle(handle),
+                                  trans)
+
+    def test_serial(self):
+        serial = self.db.get_serial()
+        self.commit_person(self.handles[0])
+        self.assertEqual(self.db.get_serial(), serial + 1)
+        self.db.undo()
+        self.assertEqual(self.db.get_serial(), serial + 2)
+        self.db.close()
+        self.db.load(self.directory)
+        self.assertEqual(self.db.get_serial(), serial + 2)
+
+    def test_index(self):
+        index = get_sort_index(self.db)
+        self.assertIs(get_sort_index(self.db), index)
+        keys = sorted(zip('bca', self.handles))
+        self.assertIsNone(index.load('name'))
+        index.save('name', keys)
+        self.assertEqual(index.load('name'), keys)
+        self.assertTrue(os.path.exists(os.path.join(self.directory,
+                                                    SORTINDEXFN)))
+
+        # Changes reported by the owner of the index keep it valid
+        self.commit_person(self.handles[0])
+        index.update('name', self.handles[0], 'd')
+        index.update('name', self.handles[1], None)
+        self.assertEqual(index.load('name'),
+                         [('a', self.handles[2]), ('d', self.handles[0])])
+
+        # The index is kept between sessions
+        self.db.close()
+        self.db.load(self.directory)
+        index = get_sort_index(self.db)
+        self.assertEqual(len(index.load('name')), 2)
+
+        # Other changes make it stale
+        with DbTxn('Add event', self.db) as trans:
+            self.db.add_event(Event(), trans)
+        self.commit_person(self.handles[0])
+        index.update('name', self.handles[0], 'e')
+        self.assertIsNone(index.load('name'))
+
+
+if __name__ == "__main__":
+    unittest.main()
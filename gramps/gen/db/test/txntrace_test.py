@@ -0,0 +1,93 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the tracing of the transactions
+"""
+import os
+import json
+import tempfile
+import unittest
+
+from .. import DbTxn
+from ..utils import make_database
+from ..txntrace import TRACER
+from ...config import config
+from ...lib import Person, Event
+
+class TxnTraceTest(unittest.TestCase):
+    """
+    Transaction tracing tests.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        TRACER.clear()
+
+    def tearDown(self):
+        config.set('database.trace-transactions', False)
+        TRACER.clear()
+        self.db.close()
+
+    def add_objects(self):
+        with DbTxn('Add objects', self.db) as trans:
+            self.db.add_person(Person(), trans)
+            self.db.add_person(Person(), trans)
+            self.db.add_event(Event(), trans)
+
+    def test_disabled(self):
+        self.add_objects()
+        self.assertEqual(TRACER.get_records(), [])
+
+    def test_trace(self):
+        config.set('database.trace-transactions', True)
+        self.add_objects()
+        with self.assertRaises(ValueError):
+            with DbTxn('Failed', self.db, batch=True):
+                raise ValueError
+        records = TRACER.get_records()
+        self.assertEqual(len(records), 2)
+        record = records[0]
+        self.assertEqual(record['description'], 'Add objects')
+        self.assertEqual(record['file'], 'txntrace_test.py')
+        self.assertEqual(record['function'], 'add_objects')
+        self.assertEqual(record['counts'], {'person': 2, 'event': 1})
+        self.assertFalse(record['aborted'])
+        self.assertGreaterEqual(record['duration'], record['commit'])
+        self.assertTrue(records[1]['batch'])
+        self.assertTrue(records[1]['aborted'])
+
+        summary = TRACER.get_summary()
+        self.assertEqual(summary[('txntrace_test.py', 'add_objects')]
+                         ['transactions'], 1)
+
+        handle, filename = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        try:
+            TRACER.export(filename)
+            with open(filename, encoding='utf-8') as trace_file:
+                self.assertEqual(json.load(trace_file), records)
+        finally:
+            os.remove(filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
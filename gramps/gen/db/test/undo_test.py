@@ -0,0 +1,123 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the undo log of the DB-API databases
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import DbTxn, DBUNDOFN
+from ..dbconst import DBMODE_R
+from ..generic import DbGenericUndo
+from ..utils import make_database
+from ...lib import Person
+
+class UndoTest(unittest.TestCase):
+    """
+    Undo log tests.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db = make_database("sqlite")
+        self.db.load(self.directory)
+        self.undodb = DbGenericUndo(self.db, self.db.undolog,
+                                    memory_budget=500, history_depth=5)
+        self.undodb.open()
+        self.db.undodb = self.undodb
+
+    def tearDown(self):
+        if self.db.is_open():
+            self.db.close()
+        shutil.rmtree(self.directory)
+
+    def add_people(self, count):
+        handles = []
+        for index in range(count):
+            with DbTxn('Add person %d' % index, self.db) as trans:
+                handles.append(self.db.add_person(Person(), trans))
+        return handles
+
+    def test_spill(self):
+        handles = self.add_people(4)
+        self.assertGreater(self.undodb.spilled, 0)
+        self.assertLessEqual(self.undodb.memory_size, 500)
+        self.assertTrue(os.path.exists(os.path.join(self.directory,
+                                                    DBUNDOFN)))
+        for handle in reversed(handles):
+            self.assertTrue(self.db.has_person_handle(handle))
+            self.assertTrue(self.db.undo())
+            self.assertFalse(self.db.has_person_handle(handle))
+        self.assertTrue(self.db.redo())
+        self.assertTrue(self.db.has_person_handle(handles[0]))
+
+        self.db.close()
+        self.assertFalse(os.path.exists(os.path.join(self.directory,
+                                                     DBUNDOFN)))
+        self.assertEqual(self.undodb.undo_count, 0)
+
+    def test_history_depth(self):
+        handles = self.add_people(8)
+        self.assertEqual(self.undodb.undo_count, 5)
+        first = self.undodb.undoq[0].first
+        self.assertEqual(self.undodb.first, first)
+        self.assertRaises(IndexError, self.undodb.__getitem__, first - 1)
+        while self.db.undo():
+            pass
+        self.assertEqual([self.db.has_person_handle(handle)
+                          for handle in handles], [True] * 3 + [False] * 5)
+
+        self.undodb.clear()
+        self.assertEqual(self.undodb.memory_size, 0)
+        self.assertEqual(self.undodb.first, len(self.undodb))
+
+    def test_batch_history_depth(self):
+        self.undodb.history_depth = 1
+        handles = self.add_people(1)
+        with DbTxn('Add person', self.db, batch=True) as trans:
+            handles.append(self.db.add_person(Person(), trans))
+        with DbTxn('Empty', self.db):
+            pass
+        self.assertEqual(self.undodb.undo_count, 1)
+        self.assertEqual(self.undodb.first, len(self.undodb))
+        self.assertEqual(self.undodb.memory_size, 0)
+        handles += self.add_people(1)
+        self.assertTrue(self.db.undo())
+        self.assertFalse(self.db.has_person_handle(handles[2]))
+        self.assertTrue(self.db.has_person_handle(handles[1]))
+
+    def test_read_only(self):
+        self.add_people(4)
+        undo_file = os.path.join(self.directory, DBUNDOFN)
+        self.assertTrue(os.path.exists(undo_file))
+        reader = make_database("sqlite")
+        reader.load(self.directory, mode=DBMODE_R)
+        self.assertIsNone(reader.undodb.path)
+        reader.close()
+        self.assertTrue(os.path.exists(undo_file))
+        self.assertTrue(self.db.undo())
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,10 +30,8 @@ database.
 #-------------------------------------------------------------------------
 import pickle
 import logging
-from collections import defaultdict
+from collections import defaultdict, Counter
 import time
-import inspect
-import os
 
 #-------------------------------------------------------------------------
 #
@@ -41,6 +39,7 @@ import os
 #
 #-------------------------------------------------------------------------
 from .dbconst import DBLOGNAME
+from .txntrace import TRACER
 
 _LOG = logging.getLogger(DBLOGNAME)
 
@@ -62,7 +61,7 @@ class DbTxn(defaultdict):
         """
         Context manager entry method
         """
-        _LOG.debug("    DbTxn %s entered" % hex(id(self)))
+        _LOG.debug("    DbTxn %s entered", hex(id(self)))
         self.start_time = time.time()
         self.db.transaction_begin(self)
         return self
@@ -71,22 +70,21 @@ class DbTxn(defaultdict):
         """
         Context manager exit method
         """
+        commit_time = time.perf_counter()
         if exc_type is None:
             self.db.transaction_commit(self)
         else:
             self.db.transaction_abort(self)
+        commit_time = time.perf_counter() - commit_time
 
         elapsed_time = time.time() - self.start_time
-        if __debug__:
-            caller_frame = inspect.stack()[1]
+        if self.caller is not None:
             _LOG.debug("    **** DbTxn %s exited. Called from file %s, "
-                       "line %s, in %s **** %.2f seconds" %
-                       ((hex(id(self)),)+
-                        (os.path.split(caller_frame[1])[1],)+
-                        tuple(caller_frame[i] for i in range(2, 4))+
-                        (elapsed_time,)
-                       )
-                      )
+                       "line %s, in %s **** %.2f seconds",
+                       hex(id(self)), *self.caller, elapsed_time)
+            if TRACER.is_enabled():
+                TRACER.add(self, self.start_time, elapsed_time, commit_time,
+                           exc_type is not None)
 
         return False
 
@@ -123,26 +121,24 @@ class DbTxn(defaultdict):
                 data   = pickled representation of the object
         """
 
-        # Conditional on __debug__ because all that frame stuff may be slow
-        if __debug__:
-            caller_frame = inspect.stack()[1]
-            # If the call comes from gramps.gen.db.generic.DbGenericTxn.__init__
-            # then it is just a dummy redirect, so we need to go back another
-            # frame to get any real information. The test does not accurately
-            # check this, but seems to be good enough for the current diagnostic
-            # purposes.
-            if os.path.split(caller_frame[1])[1] == "generic.py" and \
-               caller_frame[3] == "__init__":
-                caller_frame = inspect.stack()[2]
-            _LOG.debug("%sDbTxn %s instantiated for '%s'. Called from file %s, "
-                       "line %s, in %s" %
-                       (("Batch " if batch else "",)+
-                        (hex(id(self)),)+
-                        (msg,)+
-                        (os.path.split(caller_frame[1])[1],)+
-                        (tuple(caller_frame[i] for i in range(2, 4)))
-                       )
-                      )
+        # The caller is only looked up when it is logged or traced, and
+        # without capturing the whole stack, as some tools create thousands
+        # of transactions.
+        if _LOG.isEnabledFor(logging.DEBUG) or TRACER.is_enabled():
+            self.caller = TRACER.get_caller()
+            # If the call comes from the __init__ of a subclass in
+            # generic.py, then it is just a dummy redirect, so we need to go
+            # back another frame to get any real information.
+            if self.caller[0] == "generic.py" and \
+               self.caller[2] == "__init__":
+                self.caller = TRACER.get_caller(2)
+            _LOG.debug("%sDbTxn %s instantiated for '%s'. Called from file "
+                       "%s, line %s, in %s",
+                       "Batch " if batch else "", hex(id(self)), msg,
+                       *self.caller)
+            self.counts = Counter()
+        else:
+            self.caller = None
         defaultdict.__init__(self, list, {})
 
         self.msg = msg
@@ -183,7 +179,9 @@ class DbTxn(defaultdict):
             self.last = len(self.commitdb) -1
         if self.first is None:
             self.first = self.last
-        _LOG.debug('added to trans: %d %d %s' % (obj_type, trans_type, handle))
+        _LOG.debug('added to trans: %d %d %s', obj_type, trans_type, handle)
+        if self.caller is not None:
+            self.counts[obj_type] += 1
         self[(obj_type, trans_type)] += [(handle, new_data)]
         return
 
@@ -0,0 +1,177 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Tracing of the database transactions.
+
+Tracing is enabled by the database.trace-transactions config key, or by
+setting the level of the ".Db.Trace" logger to DEBUG.  For each
+transaction used as a context, a record is kept with the caller, the
+duration, the time spent in the commit and the number of changes per
+object type::
+
+    from gramps.gen.db.txntrace import TRACER
+    config.set('database.trace-transactions', True)
+    ...
+    TRACER.export('transactions.json')
+"""
+
+#-------------------------------------------------------------------------
+#
+# Standard python modules
+#
+#-------------------------------------------------------------------------
+import os
+import sys
+import json
+import logging
+from collections import deque, Counter
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from .dbconst import DBLOGNAME, KEY_TO_NAME_MAP, REFERENCE_KEY
+from ..config import config
+
+_LOG = logging.getLogger(DBLOGNAME + ".Trace")
+
+#-------------------------------------------------------------------------
+#
+# TxnTracer
+#
+#-------------------------------------------------------------------------
+class TxnTracer:
+    """
+    Collect the trace records of the transactions.
+
+    Each record is a dictionary with the keys:
+
+    description
+        The description of the transaction.
+    batch
+        True for a batch transaction.
+    file, line, function
+        Where the transaction was created.
+    start
+        The time.time() when the transaction was entered.
+    duration
+        Seconds between the entry and the exit of the context.
+    commit
+        Seconds spent to commit, or abort, the transaction.
+    aborted
+        True if the transaction was aborted by an exception.
+    counts
+        The number of changes per object type.  Batch transactions do not
+        record their changes, so their counts are empty.
+    """
+
+    def __init__(self, max_records=10000):
+        """
+        :param max_records: the number of records kept; older records are
+                            dropped.
+        """
+        self.records = deque(maxlen=max_records)
+
+    def is_enabled(self):
+        """
+        Return True if the transactions must be traced.
+        """
+        return (_LOG.isEnabledFor(logging.DEBUG) or
+                config.get('database.trace-transactions'))
+
+    @staticmethod
+    def get_caller(depth=1):
+        """
+        Return the file name, line number and function name of a calling
+        frame, without capturing the whole stack.
+
+        :param depth: the number of frames to go up from the caller of this
+                      method.
+        """
+        frame = sys._getframe(depth + 1)
+        code = frame.f_code
+        return (os.path.basename(code.co_filename), frame.f_lineno,
+                code.co_name)
+
+    def add(self, txn, start, duration, commit, aborted):
+        """
+        Record a transaction which has been committed or aborted.
+        """
+        counts = {KEY_TO_NAME_MAP[obj_type]: count
+                  for obj_type, count in txn.counts.items()
+                  if obj_type != REFERENCE_KEY}
+        filename, line, function = txn.caller
+        record = {'description': txn.get_description(),
+                  'batch': txn.batch,
+                  'file': filename,
+                  'line': line,
+                  'function': function,
+                  'start': start,
+                  'duration': duration,
+                  'commit': commit,
+                  'aborted': aborted,
+                  'counts': counts}
+        self.records.append(record)
+        _LOG.debug("%(description)s from %(file)s:%(line)d in %(function)s: "
+                   "%(duration).4f s, commit %(commit).4f s, %(counts)s",
+                   record)
+
+    def get_records(self):
+        """
+        Return the list of the trace records, oldest first.
+        """
+        return list(self.records)
+
+    def get_summary(self):
+        """
+        Return the totals of the records by calling function, as a
+        dictionary with (file, function) keys, and dictionaries with the
+        number of 'transactions', the total 'duration' and 'commit' times,
+        and the 'counts' per object type as values.
+        """
+        summary = {}
+        for record in self.records:
+            key = (record['file'], record['function'])
+            if key not in summary:
+                summary[key] = {'transactions': 0, 'duration': 0.0,
+                                'commit': 0.0, 'counts': Counter()}
+            totals = summary[key]
+            totals['transactions'] += 1
+            totals['duration'] += record['duration']
+            totals['commit'] += record['commit']
+            totals['counts'].update(record['counts'])
+        return summary
+
+    def clear(self):
+        """
+        Remove all the records.
+        """
+        self.records.clear()
+
+    def export(self, filename):
+        """
+        Write the records to a file, as a JSON list.
+        """
+        with open(filename, 'w', encoding='utf-8') as trace_file:
+            json.dump(self.get_records(), trace_file, indent=1)
+
+TRACER = TxnTracer()
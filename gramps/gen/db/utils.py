@@ -126,6 +126,32 @@ def lookup_family_tree(dbname):
                 return (dirpath, locked, locked_by, backend)
     return None
 
+def get_database_source(db):
+    """
+    Return the backend and directory with which other processes can open
+    the database read-only, or None if they cannot see the same data: the
+    database is in memory, is a proxy other than CacheProxyDb, or has an
+    open transaction.
+    """
+    from ..proxy.cache import CacheProxyDb
+    from ..proxy.proxybase import ProxyDbBase
+    while isinstance(db, CacheProxyDb):
+        db = db.db
+    if isinstance(db, ProxyDbBase):
+        return None
+    if getattr(db, 'transaction', None) is not None:
+        return None
+    directory = db.get_save_path()
+    if not directory or directory == ':memory:':
+        return None
+    try:
+        with open(os.path.join(directory, "database.txt"), 'r',
+                  encoding='utf8') as ifile:
+            backend = ifile.read().strip()
+    except (OSError, IOError):
+        return None
+    return (backend, directory)
+
 def import_as_dict(filename, user, skp_imp_adds=True):
     """
     Import the filename into a InMemoryDB and return it.
@@ -28,7 +28,8 @@ CustomFilters = None
 from ..const import CUSTOM_FILTERS
 from ._filterlist import FilterList
 from ._genericfilter import (GenericFilter, GenericFilterFactory,
-                             DeferredFilter, DeferredFamilyFilter)
+                             DeferredFilter, DeferredFamilyFilter,
+                             set_profile_hook)
 from ._paramfilter import ParamFilter
 from ._searchfilter import SearchFilter, ExactSearchFilter
 
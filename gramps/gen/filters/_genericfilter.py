@@ -24,6 +24,13 @@
 Package providing filtering framework for Gramps.
 """
 
+#------------------------------------------------------------------------
+#
+# Standard Python modules
+#
+#------------------------------------------------------------------------
+from time import perf_counter
+
 #------------------------------------------------------------------------
 #
 # Gramps imports
@@ -39,9 +46,40 @@ from ..lib.repo import Repository
 from ..lib.media import Media
 from ..lib.note import Note
 from ..lib.tag import Tag
+from ..config import config
+from ._parallel import check_parallel
 from ..const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 
+# Number of objects tested after which the rules of a filter are sorted again
+# using their runtime statistics.
+REORDER_INTERVAL = 100
+
+_PROFILE_HOOK = None
+
+def set_profile_hook(hook):
+    """
+    Set a function to be called after a filter has been applied, with the
+    filter and its profile as arguments.  See :meth:`GenericFilter.get_profile`.
+
+    :param hook: the function, or None to disable profiling.
+    :type hook: callable
+    """
+    global _PROFILE_HOOK
+    _PROFILE_HOOK = hook
+
+def _apply_rule(rule, db, obj):
+    """
+    Apply a rule, and update its runtime statistics.
+    """
+    start = perf_counter()
+    match = rule.apply(db, obj)
+    rule.elapsed += perf_counter() - start
+    rule.calls += 1
+    if match:
+        rule.matches += 1
+    return match
+
 #-------------------------------------------------------------------------
 #
 # GenericFilter
@@ -67,6 +105,8 @@ class GenericFilter:
             self.comment = ''
             self.logical_op = 'and'
             self.invert = False
+        self.plan = None
+        self.plan_count = 0
 
     def match(self, handle, db):
         """
@@ -87,6 +127,7 @@ class GenericFilter:
             self.logical_op = val
         else:
             self.logical_op = 'and'
+        self.plan = None
 
     def get_logical_op(self):
         return self.logical_op
@@ -111,12 +152,15 @@ class GenericFilter:
 
     def add_rule(self, rule):
         self.flist.append(rule)
+        self.plan = None
 
     def delete_rule(self, rule):
         self.flist.remove(rule)
+        self.plan = None
 
     def set_rules(self, rules):
         self.flist = rules
+        self.plan = None
 
     def get_rules(self):
         return self.flist
@@ -133,6 +177,114 @@ class GenericFilter:
     def get_number(self, db):
         return db.get_number_of_people()
 
+    def sort_rules(self, rules):
+        """
+        Return rules in the order in which they are best evaluated.
+
+        With the 'and' operator, rules which are cheap and reject most
+        objects come first, and with 'or' rules which are cheap and match
+        most objects.  The other operators evaluate every rule, so the order
+        is kept.
+        """
+        if self.logical_op == 'and':
+            key = lambda rule: (rule.get_cost() /
+                                max(1 - rule.get_selectivity(), 0.001))
+        elif self.logical_op == 'or':
+            key = lambda rule: (rule.get_cost() /
+                                max(rule.get_selectivity(), 0.001))
+        else:
+            return list(rules)
+        return sorted(rules, key=key)
+
+    def get_plan(self):
+        """
+        Return the rules in evaluation order.  They are sorted again after
+        every REORDER_INTERVAL calls, as runtime statistics accumulate.
+        """
+        if self.plan is None or self.plan_count >= REORDER_INTERVAL:
+            self.plan = self.sort_rules(self.flist)
+            self.plan_count = 0
+        self.plan_count += 1
+        return self.plan
+
+    def get_profile(self, depth=0, seen=None):
+        """
+        Return the runtime statistics of the rules of the filter, followed
+        by those of the rules of any nested filters.
+
+        :returns: a list of (depth, rule, calls, matches, elapsed) tuples,
+                  where depth is 0 for the rules of this filter and elapsed
+                  is in seconds.
+        :rtype: list
+        """
+        if seen is None:
+            seen = set()
+        seen.add(id(self))
+        profile = []
+        for rule in self.flist:
+            profile.append((depth, rule, rule.calls, rule.matches,
+                            rule.elapsed))
+            if hasattr(rule, 'find_filter'):
+                filt = rule.find_filter()
+                if filt is not None and id(filt) not in seen:
+                    profile.extend(filt.get_profile(depth + 1, seen))
+        return profile
+
+    def split_rules(self, flist):
+        """
+        Split rules into those which can be evaluated in SQL and the others.
+
+        :returns: a tuple of a list of SQL conditions, their parameters and
+                  a list of the remaining rules.
+        """
+        conditions = []
+        params = []
+        rules = []
+        for rule in flist:
+            sql = rule.get_sql()
+            if sql is None:
+                rules.append(rule)
+            else:
+                conditions.append("(%s)" % sql[0])
+                params.extend(sql[1])
+        return conditions, params, rules
+
+    def select_handles(self, db, where, params, rules, task, user=None):
+        """
+        Select objects in SQL, and then apply the remaining rules to them.
+
+        The conditions are evaluated by the database, and the task is then
+        called with each selected object and the remaining rules.
+
+        :returns: a list of matching handles, or None if the database does
+                  not support SQL queries.
+        """
+        class_name = self.make_obj().__class__.__name__
+        handles = db.select_handles(class_name, where, params)
+        if handles is None:
+            return None
+        if rules:
+            matches = []
+            if user:
+                user.begin_progress(_('Filter'), _('Applying ...'),
+                                    len(handles))
+            for handle in handles:
+                obj = self.find_from_handle(db, handle)
+                if user:
+                    user.step_progress()
+                if task(db, obj, rules):
+                    matches.append(handle)
+            if user:
+                user.end_progress()
+        else:
+            matches = handles
+        if self.invert:
+            matches = set(matches)
+            return [handle for handle in db.select_handles(class_name, "1 = 1",
+                                                           [])
+                    if handle not in matches]
+        return matches
+
     def check_func(self, db, id_list, task, user=None, tupleind=None):
         final_list = []
         if user:
@@ -163,8 +315,15 @@ class GenericFilter:
         return final_list
 
     def check_and(self, db, id_list, user=None, tupleind=None):
+        if id_list is None:
+            conditions, params, rules = self.split_rules(self.flist)
+            if conditions:
+                final_list = self.select_handles(db, " AND ".join(conditions),
+                                                 params, self.sort_rules(rules),
+                                                 self.and_test, user)
+                if final_list is not None:
+                    return final_list
         final_list = []
-        flist = self.flist
         if user:
             user.begin_progress(_('Filter'), _('Applying ...'),
                                 self.get_number(db))
@@ -175,7 +334,7 @@ class GenericFilter:
                     person.unserialize(data)
                     if user:
                         user.step_progress()
-                    val = all(rule.apply(db, person) for rule in flist)
+                    val = self.and_test(db, person)
                     if val != self.invert:
                         final_list.append(handle)
         else:
@@ -187,7 +346,7 @@ class GenericFilter:
                 person = self.find_from_handle(db, handle)
                 if user:
                     user.step_progress()
-                val = all(rule.apply(db, person) for rule in flist if person)
+                val = person is None or self.and_test(db, person)
                 if val != self.invert:
                     final_list.append(data)
         if user:
@@ -195,6 +354,14 @@ class GenericFilter:
         return final_list
 
     def check_or(self, db, id_list, user=None, tupleind=None):
+        if id_list is None:
+            conditions, params, rules = self.split_rules(self.flist)
+            if conditions and not rules:
+                final_list = self.select_handles(db, " OR ".join(conditions),
+                                                 params, rules, self.and_test,
+                                                 user)
+                if final_list is not None:
+                    return final_list
         return self.check_func(db, id_list, self.or_test, user, tupleind)
 
     def check_one(self, db, id_list, user=None, tupleind=None):
@@ -206,20 +373,35 @@ class GenericFilter:
     def xor_test(self, db, person):
         test = False
         for rule in self.flist:
-            test = test ^ rule.apply(db, person)
+            test = test ^ _apply_rule(rule, db, person)
         return test
 
     def one_test(self, db, person):
         found_one = False
         for rule in self.flist:
-            if rule.apply(db, person):
+            if _apply_rule(rule, db, person):
                 if found_one:
                     return False    # There can be only one!
                 found_one = True
         return found_one
 
+    def and_test(self, db, person, rules=None):
+        if rules is None:
+            rules = self.get_plan()
+        return all(_apply_rule(rule, db, person) for rule in rules)
+
     def or_test(self, db, person):
-        return any(rule.apply(db, person) for rule in self.flist)
+        return any(_apply_rule(rule, db, person) for rule in self.get_plan())
+
+    def test(self, db, obj):
+        """
+        Return True if the object matches the filter.
+        """
+        try:
+            task = getattr(self, self.logical_op + '_test')
+        except AttributeError:
+            task = self.and_test
+        return task(db, obj) != self.invert
 
     def get_check_func(self):
         try:
@@ -231,7 +413,8 @@ class GenericFilter:
     def check(self, db, handle):
         return self.get_check_func()(db, [handle])
 
-    def apply(self, db, id_list=None, tupleind=None, user=None):
+    def apply(self, db, id_list=None, tupleind=None, user=None,
+              workers=None):
         """
         Apply the filter using db.
         If id_list given, the handles in id_list are used. If not given
@@ -243,15 +426,33 @@ class GenericFilter:
 
         user is optional. If present it must be an instance of a User class.
 
+        workers is the number of processes used to apply the filter.  If
+        None, the behavior.filter-workers preference is used.  The filter
+        is only applied in worker processes if the database is stored on
+        disk and is not a proxy, there are enough objects, and processes
+        can be forked, which excludes Windows.
+
         :Returns: if id_list given, it is returned with the items that
                 do not match the filter, filtered out.
                 if id_list not given, all items in the database that
                 match the filter are returned as a list of handles
         """
+        if workers is None:
+            workers = config.get('behavior.filter-workers')
+        if workers > 1:
+            if id_list is not None:
+                id_list = list(id_list)
+            res = check_parallel(self, db, id_list, tupleind, workers, user)
+            if res is not None:
+                return res
+
         m = self.get_check_func()
+        self.plan = None
         for rule in self.flist:
             rule.requestprepare(db, user)
         res = m(db, id_list, user, tupleind)
+        if _PROFILE_HOOK:
+            _PROFILE_HOOK(self, self.get_profile())
         for rule in self.flist:
             rule.requestreset()
         return res
@@ -0,0 +1,175 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Apply a filter in several processes.
+
+The objects to be tested are split into chunks, and each worker process
+tests chunks against its own read-only connection to the database.  This
+is only possible for databases stored on disk which are not wrapped in a
+proxy, since the workers cannot see the changes made by a proxy or by an
+open transaction.
+
+The workers are forked, so that they inherit the registered plugins and
+the custom filters the filter may refer to.  Where processes cannot be
+forked, as on Windows, the filter is applied in the calling process.
+"""
+
+#-------------------------------------------------------------------------
+#
+# Standard Python modules
+#
+#-------------------------------------------------------------------------
+import pickle
+import logging
+import multiprocessing
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from ..const import GRAMPS_LOCALE as glocale
+_ = glocale.translation.gettext
+
+LOG = logging.getLogger(".filter")
+
+# Smallest number of objects worth starting worker processes for.
+MIN_OBJECTS = 1000
+
+# Smallest number of objects sent to a worker at once.
+MIN_CHUNK = 100
+
+_WORKER_DB = None
+_WORKER_FILTER = None
+
+#-------------------------------------------------------------------------
+#
+# Worker process
+#
+#-------------------------------------------------------------------------
+def _init_worker(backend, directory, data):
+    """
+    Open the database read-only and prepare the filter.
+    """
+    global _WORKER_DB, _WORKER_FILTER
+    from ..db.utils import make_database
+    from ..db.dbconst import DBMODE_R
+    try:
+        _WORKER_DB = make_database(backend)
+        _WORKER_DB.load(directory, mode=DBMODE_R)
+        _WORKER_FILTER = pickle.loads(data)
+        for rule in _WORKER_FILTER.flist:
+            rule.requestprepare(_WORKER_DB, None)
+    except Exception:
+        # An exception would make the pool start new workers forever.
+        LOG.warning("Unable to start filter worker", exc_info=True)
+        _WORKER_FILTER = None
+
+def _check_chunk(handles):
+    """
+    Return the handles of a chunk which match the filter, or None if the
+    worker could not be started.
+    """
+    if _WORKER_FILTER is None:
+        return None
+    return _WORKER_FILTER.get_check_func()(_WORKER_DB, handles)
+
+#-------------------------------------------------------------------------
+#
+# Parent process
+#
+#-------------------------------------------------------------------------
+def _get_context():
+    """
+    Return the multiprocessing context forking the workers, or None if
+    processes cannot be forked.
+    """
+    try:
+        return multiprocessing.get_context('fork')
+    except ValueError:
+        return None
+
+def check_parallel(filter_, db, id_list, tupleind, workers, user=None):
+    """
+    Apply the filter to the objects of the id_list in worker processes.
+    If id_list is None, the filter is applied to all the objects of the
+    database.
+
+    :returns: the items of the id_list which match the filter, in their
+              original order, or None if the filter cannot be applied in
+              worker processes.
+    """
+    if id_list is None:
+        count = filter_.get_number(db)
+    else:
+        count = len(id_list)
+    if count < MIN_OBJECTS:
+        return None
+    context = _get_context()
+    if context is None:
+        return None
+    from ..db.utils import get_database_source
+    source = get_database_source(db)
+    if source is None:
+        return None
+    try:
+        data = pickle.dumps(filter_)
+    except (pickle.PicklingError, TypeError, AttributeError) as err:
+        LOG.debug("Filter %s cannot be sent to workers: %s",
+                  filter_.get_name(), err)
+        return None
+
+    if id_list is None:
+        class_name = filter_.make_obj().__class__.__name__
+        id_list = db.method('get_%s_handles', class_name)()
+    size = max(MIN_CHUNK, len(id_list) // (workers * 4) + 1)
+    chunks = [id_list[start:start + size]
+              for start in range(0, len(id_list), size)]
+    if tupleind is None:
+        handle_chunks = chunks
+    else:
+        handle_chunks = [[item[tupleind] for item in chunk]
+                         for chunk in chunks]
+
+    if user:
+        user.begin_progress(_('Filter'), _('Applying ...'), len(chunks))
+    final_list = []
+    pool = context.Pool(min(workers, len(chunks)), _init_worker,
+                                source + (data,))
+    try:
+        results = pool.imap(_check_chunk, handle_chunks)
+        for chunk, handles in zip(chunks, results):
+            if handles is None:
+                return None
+            if user:
+                user.step_progress()
+            if tupleind is None:
+                final_list.extend(handles)
+            else:
+                handles = set(handles)
+                final_list.extend(item for item in chunk
+                                  if item[tupleind] in handles)
+    finally:
+        pool.terminate()
+        pool.join()
+        if user:
+            user.end_progress()
+    return final_list
@@ -46,6 +46,7 @@ class HasGrampsId(Rule):
     name        = 'Object with <Id>'
     description = "Matches objects with a specified Gramps ID"
     category    = _('General filters')
+    selectivity = 0.001
 
     def apply(self, db, obj):
         """
@@ -53,3 +54,6 @@ class HasGrampsId(Rule):
         return true if the rule passes, false otherwise.
         """
         return obj.gramps_id == self.list[0]
+
+    def get_sql(self):
+        return ("gramps_id = ?", [self.list[0]])
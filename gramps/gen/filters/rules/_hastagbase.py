@@ -50,6 +50,7 @@ class HasTagBase(Rule):
     name        = 'Objects with the <tag>'
     description = "Matches objects with the given tag"
     category    = _('General filters')
+    selectivity = 0.1
 
     def prepare(self, db, user):
         """
@@ -67,3 +68,9 @@ class HasTagBase(Rule):
         if self.tag_handle is None:
             return False
         return self.tag_handle in obj.get_tag_list()
+
+    def get_sql(self):
+        if self.tag_handle is None:
+            return ("1 = 0", [])
+        return ("handle IN (SELECT obj_handle FROM reference "
+                "WHERE ref_handle = ?)", [self.tag_handle])
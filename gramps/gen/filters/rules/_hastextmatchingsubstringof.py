@@ -46,6 +46,7 @@ class HasTextMatchingSubstringOf(Rule):
     description = "Matches objects whose records contain text " \
                    "matching a substring"
     category    = _('General filters')
+    cost        = 500.0
 
     # FIXME: This needs to be written for an arbitrary object
     # if possible
@@ -40,3 +40,6 @@ class IsPublic(Rule):
 
     def apply(self, db, obj):
         return not obj.get_privacy()
+
+    def get_sql(self):
+        return ("private = ?", [0])
@@ -35,6 +35,7 @@ LOG = logging.getLogger(".filter")
 # when we need this variable, not import it at the start!
 import gramps.gen.filters
 from . import Rule
+from ._rule import STATS_MIN_CALLS
 from ...const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 
@@ -83,9 +84,21 @@ class MatchesFilterBase(Rule):
             filters = gramps.gen.filters.CustomFilters.get_filters_dict(self.namespace)
             if self.list[0] in filters:
                 filt = filters[self.list[0]]
-                return filt.check(db, obj.handle)
+                return filt.test(db, obj)
         return False
 
+    def get_cost(self):
+        """
+        Return the cost of apply in microseconds.  Until it is measured, it
+        is estimated as the total cost of the rules of the filter.
+        """
+        if self.calls >= STATS_MIN_CALLS:
+            return Rule.get_cost(self)
+        filt = self.find_filter()
+        if filt is None:
+            return self.cost
+        return sum(rule.get_cost() for rule in filt.flist)
+
     def find_filter(self):
         """
         Return the selected filter or None.
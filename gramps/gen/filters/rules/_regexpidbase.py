@@ -54,3 +54,12 @@ class RegExpIdBase(Rule):
 
     def apply(self, db, obj):
         return self.match_substring(0, obj.gramps_id)
+
+    def get_sql(self):
+        if not self.list[0]:
+            return None
+        if self.use_regex:
+            pattern = self.regex[0].pattern
+        else:
+            pattern = re.escape(self.list[0])
+        return ("gramps_id REGEXP ?", ["(?i)" + pattern])
@@ -40,6 +40,10 @@ import re
 import logging
 LOG = logging.getLogger(".")
 
+# Number of calls after which the measured cost and selectivity of a rule
+# replace its estimates.
+STATS_MIN_CALLS = 50
+
 #-------------------------------------------------------------------------
 #
 # Rule
@@ -54,6 +58,17 @@ class Rule:
     description = _('No description')
     allow_regex = False
 
+    # Estimated time taken by apply, in microseconds, and estimated fraction
+    # of the objects which match.  They are used to order the rules of a
+    # filter until runtime statistics are available.
+    cost        = 1.0
+    selectivity = 0.5
+
+    # Runtime statistics, gathered by the filter which applies the rule.
+    calls       = 0
+    matches     = 0
+    elapsed     = 0.0
+
     def __init__(self, arg, use_regex=False):
         self.list = []
         self.regex = []
@@ -62,6 +77,20 @@ class Rule:
         self.use_regex = use_regex
         self.nrprepare = 0
 
+    def __getstate__(self):
+        """
+        Return the state of the rule for pickling, without the bound method
+        used for matching, which is set again when the rule is prepared.
+        """
+        state = self.__dict__.copy()
+        state.pop('match_substring', None)
+        state['nrprepare'] = 0
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.match_substring = self.__match_substring
+
     def is_empty(self):
         return False
 
@@ -86,6 +115,7 @@ class Rule:
                         except re.error:
                             self.regex[i] = re.compile('')
                 self.match_substring = self.match_regex
+            self.reset_stats()
             self.prepare(db, user)
         self.nrprepare += 1
 
@@ -112,6 +142,30 @@ class Rule:
         """remove no longer needed memory"""
         pass
 
+    def reset_stats(self):
+        """Clear the runtime statistics of the rule."""
+        self.calls = 0
+        self.matches = 0
+        self.elapsed = 0.0
+
+    def get_cost(self):
+        """
+        Return the cost of apply in microseconds, measured if the rule has
+        been applied often enough, or else estimated.
+        """
+        if self.calls >= STATS_MIN_CALLS:
+            return self.elapsed * 1000000 / self.calls
+        return self.cost
+
+    def get_selectivity(self):
+        """
+        Return the fraction of the objects matched by the rule, measured if
+        the rule has been applied often enough, or else estimated.
+        """
+        if self.calls >= STATS_MIN_CALLS:
+            return self.matches / self.calls
+        return self.selectivity
+
     def set_list(self, arg):
         """Store the values of this rule."""
         assert isinstance(arg, list) or arg is None, "Argument is not a list"
@@ -133,6 +187,22 @@ class Rule:
         """Apply the rule to some database entry; must be overwritten."""
         return True
 
+    def get_sql(self):
+        """
+        Return an SQL condition equivalent to the apply method, so that the
+        rule can be evaluated by databases which support SQL queries.
+
+        The condition may only use the secondary columns of the table of
+        the primary object, the reference table and the regexp function.
+        It is requested after the rule has been prepared.
+
+        :returns: a tuple of an SQL WHERE clause with ? placeholders and a
+                  list of parameters, or None if the rule can only be
+                  applied in Python.
+        :rtype: tuple
+        """
+        return None
+
     def display_values(self):
         """Return the labels and values of this rule."""
         l_v = ( '%s="%s"' % (_(self.labels[ix]), self.list[ix])
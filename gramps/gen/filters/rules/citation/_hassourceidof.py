@@ -54,3 +54,7 @@ class HasSourceIdOf(HasGrampsId):
         if HasGrampsId.apply(self, dbase, source):
             return True
         return False
+
+    def get_sql(self):
+        # The ID is the one of the source, not of the citation.
+        return None
@@ -56,3 +56,7 @@ class RegExpSourceIdOf(RegExpIdBase):
         if RegExpIdBase.apply(self, dbase, source):
             return True
         return False
+
+    def get_sql(self):
+        # The ID is the one of the source, not of the citation.
+        return None
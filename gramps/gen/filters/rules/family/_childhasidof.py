@@ -49,3 +49,7 @@ class ChildHasIdOf(RegExpIdBase):
     category    = _('Child filters')
     base_class = RegExpIdBase
     apply = child_base
+
+    def get_sql(self):
+        # The ID is the one of the children, not of the family.
+        return None
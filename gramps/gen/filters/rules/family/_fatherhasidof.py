@@ -49,3 +49,7 @@ class FatherHasIdOf(RegExpIdBase):
     category    = _('Father filters')
     base_class = RegExpIdBase
     apply = father_base
+
+    def get_sql(self):
+        # The ID is the one of the father, not of the family.
+        return None
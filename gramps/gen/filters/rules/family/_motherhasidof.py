@@ -49,3 +49,7 @@ class MotherHasIdOf(RegExpIdBase):
     category    = _('Mother filters')
     base_class = RegExpIdBase
     apply = mother_base
+
+    def get_sql(self):
+        # The ID is the one of the mother, not of the family.
+        return None
@@ -33,6 +33,7 @@ from collections import deque
 #
 #-------------------------------------------------------------------------
 from .. import Rule
+from ....db.familygraph import get_family_graph
 from . import MatchesFilter
 from ....const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
@@ -119,6 +120,7 @@ def find_deep_relations(db, user, person, target_people):
     # the value is a handle of the previous person in the path, or None at
     # head of path.  This forms a linked list of handles along the path.
     done[person.handle] = None
+    graph = get_family_graph(db)
 
     while todo:
         handle = todo.popleft()
@@ -136,11 +138,7 @@ def find_deep_relations(db, user, person, target_people):
             if not target_people:  # Quit searching if all targets found
                 break
 
-        person = db.get_person_from_handle(handle)
-        if person is None:
-            continue
-
-        people = get_person_family_people(db, person, handle)
+        people = graph.get_neighbours(handle)
         for p_hndl in people:
             if p_hndl in done:     # check if we have already been here
                 continue           # and ignore if we have
@@ -33,6 +33,7 @@ _ = glocale.translation.gettext
 #-------------------------------------------------------------------------
 from ....utils.db import for_each_ancestor
 from .. import Rule
+from ....db.familygraph import get_family_graph
 
 #-------------------------------------------------------------------------
 #
@@ -45,6 +46,7 @@ class HasCommonAncestorWith(Rule):
     labels      = [ _('ID:') ]
     name        = _('People with a common ancestor with <person>')
     category    = _("Ancestral filters")
+    cost        = 100.0
     description = _("Matches people that have a common ancestor "
                     "with a specified person")
 
@@ -63,30 +65,27 @@ class HasCommonAncestorWith(Rule):
             self.with_people = []
 
     def add_ancs(self, db, person):
-        if person and person.handle not in self.ancestor_cache:
-            self.ancestor_cache[person.handle] = set()
-            # We are going to compare ancestors of one person with that of
-            # another person; if that other person is an ancestor and itself
-            # has no ancestors is must be included, this is achieved by the
-            # little trick of making a person his own ancestor.
-            self.ancestor_cache[person.handle].add(person.handle)
-        else:
+        if person:
+            self.add_handle_ancs(get_family_graph(db), person.handle)
+
+    def add_handle_ancs(self, graph, handle):
+        if handle in self.ancestor_cache:
             return
+        # We are going to compare ancestors of one person with that of
+        # another person; if that other person is an ancestor and itself
+        # has no ancestors is must be included, this is achieved by the
+        # little trick of making a person his own ancestor.
+        ancestors = self.ancestor_cache[handle] = set([handle])
 
-        for fam_handle in person.get_parent_family_handle_list():
+        for fam_handle in graph.get_parent_families(handle):
             parentless_fam = True
-            fam = db.get_family_from_handle(fam_handle)
-            if fam:
-                for par_handle in (fam.get_father_handle(), fam.get_mother_handle()):
-                    if par_handle:
-                        parentless_fam = False
-                        par = db.get_person_from_handle(par_handle)
-                        if par and par.handle not in self.ancestor_cache:
-                            self.add_ancs(db, par)
-                        if par:
-                            self.ancestor_cache[person.handle] |= self.ancestor_cache[par.handle]
-                if parentless_fam:
-                    self.ancestor_cache[person.handle].add(fam_handle)
+            for par_handle in graph.get_parents(fam_handle):
+                if par_handle:
+                    parentless_fam = False
+                    self.add_handle_ancs(graph, par_handle)
+                    ancestors |= self.ancestor_cache[par_handle]
+            if parentless_fam:
+                ancestors.add(fam_handle)
 
     def reset(self):
         self.ancestor_cache = {}
@@ -49,6 +49,7 @@ class HasDeath(Rule):
     name        = _('People with the <death data>')
     description = _("Matches people with death data of a particular value")
     category    = _('Event filters')
+    cost        = 30.0
     allow_regex = True
 
     def prepare(self, db, user):
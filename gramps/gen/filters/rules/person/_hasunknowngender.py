@@ -48,3 +48,6 @@ class HasUnknownGender(Rule):
 
     def apply(self,db,person):
         return person.gender == Person.UNKNOWN
+
+    def get_sql(self):
+        return ("gender = ?", [Person.UNKNOWN])
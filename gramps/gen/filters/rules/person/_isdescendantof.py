@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 #
 #-------------------------------------------------------------------------
 from .. import Rule
+from ....db.familygraph import get_family_graph
 
 #-------------------------------------------------------------------------
 #
@@ -67,15 +68,7 @@ class IsDescendantOf(Rule):
         return person.handle in self.map
 
     def init_list(self, person, first):
-        if not person or person.handle in self.map:
-            # if we have been here before, skip
+        if not person:
             return
-        if not first:
-            self.map.add(person.handle)
-
-        for fam_id in person.get_family_handle_list():
-            fam = self.db.get_family_from_handle(fam_id)
-            if fam:
-                for child_ref in fam.get_child_ref_list():
-                    self.init_list(
-                        self.db.get_person_from_handle(child_ref.ref), 0)
+        self.map |= get_family_graph(self.db).get_descendants(
+            person.handle, min_depth=1 if first else 0)
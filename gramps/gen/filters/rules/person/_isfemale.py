@@ -48,3 +48,6 @@ class IsFemale(Rule):
 
     def apply(self,db,person):
         return person.gender == Person.FEMALE
+
+    def get_sql(self):
+        return ("gender = ?", [Person.FEMALE])
@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 #
 #-------------------------------------------------------------------------
 from .. import Rule
+from ....db.familygraph import get_family_graph
 
 #-------------------------------------------------------------------------
 #
@@ -65,17 +66,8 @@ class IsLessThanNthGenerationDescendantOf(Rule):
         return person.handle in self.map
 
     def init_list(self,person,gen):
-        if not person or person.handle in self.map:
-            # if we have been here before, skip
+        if not person:
             return
-        if gen:
-            self.map.add(person.handle)
-            if gen >= int(self.list[1]):
-                return
-
-        for fam_id in person.get_family_handle_list():
-            fam = self.db.get_family_from_handle(fam_id)
-            if fam:
-                for child_ref in fam.get_child_ref_list():
-                    self.init_list(
-                        self.db.get_person_from_handle(child_ref.ref), gen+1)
+        self.map |= get_family_graph(self.db).get_descendants(
+            person.handle, min_depth=max(1 - gen, 0),
+            max_depth=max(int(self.list[1]) - gen, 0))
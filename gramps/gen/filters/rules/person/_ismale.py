@@ -48,3 +48,6 @@ class IsMale(Rule):
 
     def apply(self,db,person):
         return person.gender == Person.MALE
+
+    def get_sql(self):
+        return ("gender = ?", [Person.MALE])
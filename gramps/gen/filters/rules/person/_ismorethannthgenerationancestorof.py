@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 #
 #-------------------------------------------------------------------------
 from .. import Rule
+from ....db.familygraph import get_family_graph
 
 #-------------------------------------------------------------------------
 #
@@ -58,24 +59,9 @@ class IsMoreThanNthGenerationAncestorOf(Rule):
                 self.init_ancestor_list(root_handle)
 
     def init_ancestor_list(self, root_handle):
-        queue = [(root_handle, 1)] # generation 1 is root
-        while queue:
-            handle, gen = queue.pop(0) # pop off front of queue
-            if gen > int(self.list[1]):
-                self.map.add(handle)
-            gen += 1
-            p = self.db.get_person_from_handle(handle)
-            fam_id = p.get_main_parents_family_handle()
-            if fam_id:
-                fam = self.db.get_family_from_handle(fam_id)
-                if fam:
-                    f_id = fam.get_father_handle()
-                    m_id = fam.get_mother_handle()
-                    # append to back of queue:
-                    if f_id:
-                        queue.append((f_id, gen))
-                    if m_id:
-                        queue.append((m_id, gen))
+        # generation 1 is root
+        self.map |= get_family_graph(self.db).get_ancestors(
+            root_handle, min_depth=max(int(self.list[1]), 0))
 
     def reset(self):
         self.map.clear()
@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 #
 #-------------------------------------------------------------------------
 from .. import Rule
+from ....db.familygraph import get_family_graph
 
 #-------------------------------------------------------------------------
 #
@@ -67,12 +68,5 @@ class IsMoreThanNthGenerationDescendantOf(Rule):
     def init_list(self, person, gen):
         if not person:
             return
-        if gen >= int(self.list[1]):
-            self.map.add(person.handle)
-
-        for fam_id in person.get_family_handle_list():
-            fam = self.db.get_family_from_handle(fam_id)
-            if fam:
-                for child_ref in fam.get_child_ref_list():
-                    self.init_list(
-                        self.db.get_person_from_handle(child_ref.ref), gen+1)
+        self.map |= get_family_graph(self.db).get_descendants(
+            person.handle, min_depth=max(int(self.list[1]) - gen, 0))
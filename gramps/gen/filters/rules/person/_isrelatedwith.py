@@ -32,6 +32,7 @@ _ = glocale.translation.gettext
 #
 #-------------------------------------------------------------------------
 from .. import Rule
+from ....db.familygraph import get_family_graph
 
 #-------------------------------------------------------------------------
 #
@@ -53,52 +54,19 @@ class IsRelatedWith(Rule):
         """
         self.db = db
 
-        self.relatives = []
+        self.relatives = set()
         self.add_relative(db.get_person_from_gramps_id(self.list[0]))
 
     def reset(self):
-        self.relatives = []
+        self.relatives = set()
 
     def apply(self, db, person):
         return person.handle in self.relatives
 
 
     def add_relative(self, start):
-        """Non-recursive function that scans relatives and add them to self.relatives"""
+        """Add the people connected to start to self.relatives"""
         if not(start):
             return
 
-        expand = [start]
-        relatives = {}
-
-        while expand:
-            person = expand.pop()
-            # Add the relative to the list
-            if person is None or (person.handle in relatives):
-                continue
-            relatives[person.handle] = True
-
-            for family_handle in person.get_parent_family_handle_list():
-                family = self.db.get_family_from_handle(family_handle)
-                if family:
-            # Check Parents
-                    for parent_handle in (family.get_father_handle(), family.get_mother_handle()):
-                        if parent_handle:
-                            expand.append(self.db.get_person_from_handle(parent_handle))
-            # Check Sibilings
-                    for child_ref in family.get_child_ref_list():
-                        expand.append(self.db.get_person_from_handle(child_ref.ref))
-
-            for family_handle in person.get_family_handle_list():
-                family = self.db.get_family_from_handle(family_handle)
-                if family:
-            # Check Spouse
-                    for parent_handle in (family.get_father_handle(), family.get_mother_handle()):
-                        if parent_handle:
-                            expand.append(self.db.get_person_from_handle(parent_handle))
-            # Check Children
-                    for child_ref in family.get_child_ref_list():
-                        expand.append(self.db.get_person_from_handle(child_ref.ref))
-
-        self.relatives = list(relatives.keys())
-        return
+        self.relatives = get_family_graph(self.db).get_relatives(start.handle)
@@ -31,7 +31,7 @@ _ = glocale.translation.gettext
 # Gramps modules
 #
 #-------------------------------------------------------------------------
-from ....utils.alive import probably_alive
+from ....utils.alive import get_alive_estimator
 from .. import Rule
 from ....datehandler import parser
 
@@ -45,12 +45,14 @@ class ProbablyAlive(Rule):
     name        =  _('People probably alive')
     description = _("Matches people without indications of death that are not too old")
     category    = _('General filters')
+    cost        = 200.0
 
     def prepare(self, db, user):
         try:
             self.current_date = parser.parse(str(self.list[0]))
         except:
             self.current_date = None
+        self.estimator = get_alive_estimator(db)
 
     def apply(self,db,person):
-        return probably_alive(person,db,self.current_date)
+        return self.estimator.probably_alive(person, self.current_date)
@@ -0,0 +1,219 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the ordering and profiling of filter rules
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from ...db import DbTxn
+from ...db.utils import make_database
+from ...lib import Person
+from ... import filters
+from .. import GenericFilter, set_profile_hook, _parallel
+from .._parallel import check_parallel
+from ..rules import Rule
+from ..rules.person import MatchesFilter, IsMale, RegExpIdOf
+
+class MatchAll(Rule):
+    """Rule matching every object."""
+    labels = []
+
+    def apply(self, db, obj):
+        return True
+
+class MatchNone(Rule):
+    """Rule matching no object."""
+    labels = []
+
+    def apply(self, db, obj):
+        return False
+
+class Expensive(MatchAll):
+    """Rule declared as slow."""
+    cost = 1000.0
+
+class BaseTest(unittest.TestCase):
+    """
+    Rule ordering tests.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = make_database("sqlite")
+        cls.db.load(":memory:")
+        with DbTxn('Add people', cls.db, batch=True) as trans:
+            for dummy in range(300):
+                cls.db.add_person(Person(), trans)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+
+    def make_filter(self, rules, logical_op='and'):
+        filter_ = GenericFilter()
+        filter_.set_rules(rules)
+        filter_.set_logical_op(logical_op)
+        return filter_
+
+    def test_estimated_cost(self):
+        """
+        Test that cheap rules are evaluated first.
+        """
+        expensive = Expensive([])
+        filter_ = self.make_filter([expensive, MatchNone([])])
+        self.assertEqual(filter_.apply(self.db), [])
+        self.assertEqual(expensive.calls, 0)
+
+        expensive = Expensive([])
+        filter_ = self.make_filter([expensive, MatchAll([])], 'or')
+        self.assertEqual(len(filter_.apply(self.db)), 300)
+        self.assertEqual(expensive.calls, 0)
+
+    def test_measured_selectivity(self):
+        """
+        Test that rules are reordered using runtime statistics.
+        """
+        match_all = MatchAll([])
+        match_none = MatchNone([])
+        filter_ = self.make_filter([match_all, match_none])
+        self.assertEqual(filter_.apply(self.db), [])
+        self.assertEqual(match_none.calls, 300)
+        self.assertEqual(match_all.calls, 100)
+        self.assertEqual(match_all.get_selectivity(), 1.0)
+        self.assertEqual(match_none.get_selectivity(), 0.0)
+        self.assertEqual(filter_.get_rules(), [match_all, match_none])
+
+    def test_invert(self):
+        """
+        Test that the order does not change the result of other operators.
+        """
+        rules = [MatchAll([]), MatchNone([])]
+        for logical_op, count in (('and', 300), ('or', 0), ('one', 0),
+                                  ('xor', 0)):
+            filter_ = self.make_filter(rules, logical_op)
+            filter_.set_invert(True)
+            self.assertEqual(len(filter_.apply(self.db)), count)
+
+    def test_nested_profile(self):
+        """
+        Test the profile of a filter with a nested filter.
+        """
+        inner = self.make_filter([Expensive([]), MatchNone([])])
+        inner.set_name('Inner')
+        filters.CustomFilters.add('Person', inner)
+        filters.CustomFilters._cached = {}
+        profiles = []
+        set_profile_hook(lambda filt, profile: profiles.append(profile))
+        try:
+            matches = MatchesFilter(['Inner'])
+            self.assertEqual(matches.get_cost(), 1001.0)
+            outer = self.make_filter([matches, MatchAll([])])
+            self.assertEqual(outer.apply(self.db), [])
+        finally:
+            set_profile_hook(None)
+            filters.CustomFilters.filter_namespaces['Person'].remove(inner)
+            filters.CustomFilters._cached = {}
+        self.assertEqual(len(profiles), 1)
+        self.assertEqual([(depth, rule.__class__.__name__, calls)
+                          for depth, rule, calls, dummy, dummy in profiles[0]],
+                         [(0, 'MatchesFilter', 300), (1, 'Expensive', 0),
+                          (1, 'MatchNone', 300), (0, 'MatchAll', 100)])
+
+    def test_serial_fallback(self):
+        """
+        Test that a filter applied serially to all the objects, when it
+        cannot be applied in worker processes, does not get their handles.
+        """
+        filter_ = self.make_filter([MatchAll([])])
+        id_lists = []
+        check_and = filter_.check_and
+        def record(db, id_list, user=None, tupleind=None):
+            id_lists.append(id_list)
+            return check_and(db, id_list, user, tupleind)
+        filter_.check_and = record
+        self.assertEqual(len(filter_.apply(self.db, workers=2)), 300)
+        self.assertEqual(id_lists, [None])
+
+
+class ParallelTest(unittest.TestCase):
+    """
+    Tests of filters applied in worker processes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        with open(os.path.join(cls.directory, "database.txt"), 'w') as file:
+            file.write("sqlite")
+        cls.db = make_database("sqlite")
+        cls.db.load(cls.directory)
+        with DbTxn('Add people', cls.db, batch=True) as trans:
+            for num in range(1500):
+                person = Person()
+                person.set_gender(num % 3)
+                cls.db.add_person(person, trans)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close(update=False)
+        shutil.rmtree(cls.directory)
+
+    def test_parallel(self):
+        """
+        Test that the results match those of a single process.
+        """
+        filter_ = GenericFilter()
+        filter_.add_rule(IsMale([]))
+        filter_.add_rule(RegExpIdOf(['^I0'], True))
+        handles = self.db.get_person_handles()
+        expected = filter_.apply(self.db, handles, workers=0)
+        self.assertEqual(len(expected), 333)
+        self.assertEqual(filter_.apply(self.db, handles, workers=2), expected)
+
+        items = [(num, handle) for num, handle in enumerate(handles)]
+        result = filter_.apply(self.db, items, tupleind=1, workers=2)
+        self.assertEqual([item[1] for item in result], expected)
+        self.assertEqual(sorted(filter_.apply(self.db, workers=2)),
+                         sorted(expected))
+
+    def test_no_fork(self):
+        """
+        Test that a filter is applied in one process if processes cannot
+        be forked.
+        """
+        filter_ = GenericFilter()
+        filter_.add_rule(IsMale([]))
+        handles = self.db.get_person_handles()
+        self.assertEqual(check_parallel(filter_, self.db, handles, None, 2),
+                         filter_.apply(self.db, handles, workers=0))
+        with mock.patch.object(_parallel, '_get_context', lambda: None):
+            self.assertIsNone(check_parallel(filter_, self.db, handles,
+                                             None, 2))
+            self.assertEqual(len(filter_.apply(self.db, handles, workers=2)),
+                             500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,7 +24,6 @@ This module provides the Plugin class for document generator plugins.
 """
 
 from . import Plugin
-from .docgen import TextDoc, DrawDoc
 
 class DocGenPlugin(Plugin):
     """
@@ -121,6 +120,7 @@ class DocGenPlugin(Plugin):
         :return: bool: True if :class:`.TextDoc` is supported; False if
                        :class:`.TextDoc` is not supported.
         """
+        from .docgen import TextDoc # only needed once a plugin is loaded
         return bool(issubclass(self.__basedoc, TextDoc))
 
     def get_draw_support(self):
@@ -130,4 +130,5 @@ class DocGenPlugin(Plugin):
         :return: bool: True if :class:`.DrawDoc` is supported; False if
                        :class:`.DrawDoc` is not supported.
         """
+        from .docgen import DrawDoc # only needed once a plugin is loaded
         return bool(issubclass(self.__basedoc, DrawDoc))
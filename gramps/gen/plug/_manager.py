@@ -138,6 +138,7 @@ class BasePluginManager:
                         dirnames.remove(dirname)
                 # LOG.warning("Plugin dir scanned: %s", dirpath)
                 self.__pgr.scan_dir(dirpath, filenames, uistate=uistate)
+            self.__pgr.save_cache()
 
         if load_on_reg:
             # Run plugins that request to be loaded on startup and
@@ -520,89 +521,127 @@ class BasePluginManager:
             return process(retval)
         return retval
 
-    def get_import_plugins(self):
+    def get_import_plugins(self, extension=None):
         """
         Get the list of import plugins.
 
+        :param extension: if given, only the plugins for this file extension
+                          are returned, and only their modules are loaded.
         :return: :class:`.ImportPlugin` (a list of ImportPlugin instances)
         """
         ## TODO: would it not be better to remove ImportPlugin and use
         ## only PluginData, loading from module when importfunction needed?
+        if extension is not None:
+            if self.__import_plugins == []:
+                return self.__make_plugins(self.__make_import_plugin,
+                                           self.get_reg_importers(), extension)
+            return [plugin for plugin in self.__import_plugins
+                    if plugin.get_extension() == extension]
         if self.__import_plugins == []:
             #The module still needs to be imported
-            for pdata in self.get_reg_importers():
-                if pdata.id in config.get("plugin.hiddenplugins"):
-                    continue
-                mod = self.load_plugin(pdata)
-                if mod:
-                    imp = ImportPlugin(name=pdata.name,
-                        description     = pdata.description,
-                        import_function = getattr(mod, pdata.import_function),
-                        extension       = pdata.extension)
-                    self.__import_plugins.append(imp)
+            self.__import_plugins.extend(self.__make_plugins(
+                self.__make_import_plugin, self.get_reg_importers()))
 
         return self.__import_plugins
 
-    def get_export_plugins(self):
+    def get_export_plugins(self, extension=None):
         """
         Get the list of export plugins.
 
+        :param extension: if given, only the plugins for this file extension
+                          are returned, and only their modules are loaded.
         :return: :class:`.ExportPlugin` (a list of ExportPlugin instances)
         """
         ## TODO: would it not be better to remove ExportPlugin and use
         ## only PluginData, loading from module when export/options needed?
+        if extension is not None:
+            if self.__export_plugins == []:
+                return self.__make_plugins(self.__make_export_plugin,
+                                           self.get_reg_exporters(), extension)
+            return [plugin for plugin in self.__export_plugins
+                    if plugin.get_extension() == extension]
         if self.__export_plugins == []:
             #The modules still need to be imported
-            for pdata in self.get_reg_exporters():
-                if pdata.id in config.get("plugin.hiddenplugins"):
-                    continue
-                mod = self.load_plugin(pdata)
-                if mod:
-                    options = None
-                    if (pdata.export_options and
-                        hasattr(mod, pdata.export_options)):
-                        options = getattr(mod, pdata.export_options)
-                    exp = ExportPlugin(name=pdata.name_accell,
-                        description     = pdata.description,
-                        export_function = getattr(mod, pdata.export_function),
-                        extension       = pdata.extension,
-                        config          = (pdata.export_options_title, options))
-                    self.__export_plugins.append(exp)
+            self.__export_plugins.extend(self.__make_plugins(
+                self.__make_export_plugin, self.get_reg_exporters()))
 
         return self.__export_plugins
 
-    def get_docgen_plugins(self):
+    def get_docgen_plugins(self, extension=None):
         """
         Get the list of docgen plugins.
 
+        :param extension: if given, only the plugins for this file extension
+                          are returned, and only their modules are loaded.
         :return: :class:`.DocGenPlugin` (a list of DocGenPlugin instances)
         """
         ## TODO: would it not be better to return list of plugindata, and only
         ##       import those docgen that will then actuallly be needed?
         ##       So, only do import when docgen.get_basedoc() is requested
+        if extension is not None:
+            if self.__docgen_plugins == []:
+                return self.__make_plugins(self.__make_docgen_plugin,
+                                           self.get_reg_docgens(), extension)
+            return [plugin for plugin in self.__docgen_plugins
+                    if plugin.get_extension() == extension]
         if self.__docgen_plugins == []:
             #The modules still need to be imported
-            hiddenplugins = config.get("plugin.hiddenplugins")
-            for pdata in self.get_reg_docgens():
-                if pdata.id in hiddenplugins:
-                    continue
-                mod = self.load_plugin(pdata)
-                if mod:
-                    oclass = None
-                    if pdata.optionclass:
-                        oclass = getattr(mod, pdata.optionclass)
-                    dgp = DocGenPlugin(name=pdata.name,
-                            description = pdata.description,
-                            basedoc     = getattr(mod, pdata.docclass),
-                            paper       = pdata.paper,
-                            style       = pdata.style,
-                            extension   = pdata.extension,
-                            docoptclass = oclass,
-                            basedocname = pdata.docclass )
-                    self.__docgen_plugins.append(dgp)
+            self.__docgen_plugins.extend(self.__make_plugins(
+                self.__make_docgen_plugin, self.get_reg_docgens()))
 
         return self.__docgen_plugins
 
+    def __make_plugins(self, make_plugin, pdatas, extension=None):
+        """
+        Load the modules of the registered plugins which are not hidden,
+        and of the given file extension if any, and return the list of the
+        plugin objects made by make_plugin from the plugin data and module.
+        """
+        hiddenplugins = config.get("plugin.hiddenplugins")
+        plugins = []
+        for pdata in pdatas:
+            if pdata.id in hiddenplugins:
+                continue
+            if extension is not None and pdata.extension != extension:
+                continue
+            mod = self.load_plugin(pdata)
+            if mod:
+                plugins.append(make_plugin(pdata, mod))
+        return plugins
+
+    @staticmethod
+    def __make_import_plugin(pdata, mod):
+        return ImportPlugin(name=pdata.name,
+            description     = pdata.description,
+            import_function = getattr(mod, pdata.import_function),
+            extension       = pdata.extension)
+
+    @staticmethod
+    def __make_export_plugin(pdata, mod):
+        options = None
+        if (pdata.export_options and
+            hasattr(mod, pdata.export_options)):
+            options = getattr(mod, pdata.export_options)
+        return ExportPlugin(name=pdata.name_accell,
+            description     = pdata.description,
+            export_function = getattr(mod, pdata.export_function),
+            extension       = pdata.extension,
+            config          = (pdata.export_options_title, options))
+
+    @staticmethod
+    def __make_docgen_plugin(pdata, mod):
+        oclass = None
+        if pdata.optionclass:
+            oclass = getattr(mod, pdata.optionclass)
+        return DocGenPlugin(name=pdata.name,
+                description = pdata.description,
+                basedoc     = getattr(mod, pdata.docclass),
+                paper       = pdata.paper,
+                style       = pdata.style,
+                extension   = pdata.extension,
+                docoptclass = oclass,
+                basedocname = pdata.docclass )
+
     def get_docgen_names(self):
         """
         Get the list of docgen plugin names.
@@ -32,6 +32,7 @@ and a register for the data of all plugins .
 import os
 import sys
 import re
+import pickle
 import traceback
 
 #-------------------------------------------------------------------------
@@ -40,7 +41,7 @@ import traceback
 #
 #-------------------------------------------------------------------------
 from ...version import VERSION as GRAMPSVERSION, VERSION_TUPLE
-from ..const import IMAGE_DIR
+from ..const import IMAGE_DIR, PLUGIN_CACHE
 from ..const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 import logging
@@ -1078,6 +1079,158 @@ def make_environment(**kwargs):
     env.update(kwargs)
     return env
 
+#-------------------------------------------------------------------------
+#
+# PluginCache
+#
+#-------------------------------------------------------------------------
+
+def is_static_registration(stream):
+    """
+    Return True if a registration file always registers the same plugins,
+    so that its registrations can be cached.
+
+    The registrations of a file are not cached if it has conditions, loops,
+    functions or classes at the top level, like a check that a library is
+    installed, or if it uses the uistate.
+    """
+    import ast # only needed when the cache is updated
+    try:
+        tree = ast.parse(stream)
+    except (SyntaxError, ValueError):
+        return False
+    static_statements = (ast.Expr, ast.Assign, ast.AnnAssign, ast.AugAssign,
+                         ast.Import, ast.ImportFrom, ast.Pass)
+    for node in tree.body:
+        if not isinstance(node, static_statements):
+            return False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and node.id == 'uistate':
+            return False
+    return True
+
+class PluginCache:
+    """
+    A persistent cache of the plugins registered by the registration files.
+
+    The :class:`PluginData` objects registered by a file are stored with the
+    modification time and size of the file, and are reused as long as the
+    file has not changed, so that the file is neither compiled nor executed.
+    The whole cache is discarded when the version of Gramps or Python, or
+    the language, change.
+    """
+
+    def __init__(self, path=PLUGIN_CACHE):
+        """
+        :param path: the file of the cache.
+        """
+        self.path = path
+        self.entries = None
+        self.changed = False
+
+    @staticmethod
+    def get_environment():
+        """
+        Return what the registrations depend on, besides the files.
+        """
+        return (GRAMPSVERSION, sys.version_info[:2], __debug__,
+                glocale.lang, tuple(glocale.language))
+
+    def __load(self):
+        if self.entries is not None:
+            return
+        self.entries = {}
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, 'rb') as cache:
+                environment, entries = pickle.load(cache)
+        except Exception as err:
+            # The cache is only an optimisation
+            LOG.warning("Cannot read the plugin cache %s: %s", self.path, err)
+            return
+        if environment == self.get_environment():
+            self.entries = entries
+
+    @staticmethod
+    def __stat(filename):
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, filename):
+        """
+        Return the list of :class:`PluginData` registered by a file, or None
+        if the file is not in the cache, has changed or is not cacheable.
+        """
+        self.__load()
+        entry = self.entries.get(filename)
+        if entry is None or entry[1] is None:
+            return None
+        if entry[0] != self.__stat(filename):
+            return None
+        try:
+            return pickle.loads(entry[1])
+        except Exception:
+            return None
+
+    def put(self, filename, stream, plugins):
+        """
+        Store the list of :class:`PluginData` registered by a file, as read
+        from the stream.  They must be stored before they are checked.
+        """
+        self.__load()
+        stat = self.__stat(filename)
+        entry = self.entries.get(filename)
+        if stat is None or (entry is not None and entry[0] == stat):
+            return
+        data = None
+        if is_static_registration(stream):
+            try:
+                data = pickle.dumps(plugins, pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                # Objects like functions cannot be cached
+                data = None
+        self.entries[filename] = (stat, data)
+        self.changed = True
+
+    def save(self):
+        """
+        Write the cache, if it has changed.  The entries of the files which
+        do not exist any longer are removed.
+        """
+        if not self.changed:
+            return
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            return
+        entries = {filename: entry for filename, entry in self.entries.items()
+                   if os.path.exists(filename)}
+        temp = self.path + ".tmp"
+        try:
+            with open(temp, 'wb') as cache:
+                pickle.dump((self.get_environment(), entries), cache,
+                            pickle.HIGHEST_PROTOCOL)
+            os.replace(temp, self.path)
+        except OSError as err:
+            LOG.warning("Cannot write the plugin cache %s: %s", self.path, err)
+            return
+        self.entries = entries
+        self.changed = False
+
+    def clear(self):
+        """
+        Remove all the entries of the cache, and its file.
+        """
+        self.entries = {}
+        self.changed = True
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
 #-------------------------------------------------------------------------
 #
 # PluginRegister
@@ -1110,6 +1263,7 @@ class PluginRegister:
             self.stable_only = False
         self.__plugindata  = []
         self.__id_to_pdata = {}
+        self.cache = PluginCache()
 
     def add_plugindata(self, plugindata):
         """ This is used to add an entry to the registration list.  The way it
@@ -1138,45 +1292,14 @@ class PluginRegister:
                 continue
             lenpd = len(self.__plugindata)
             full_filename = os.path.join(dir, filename)
-            try:
-                with open(full_filename, "r", encoding='utf-8') as fd:
-                    stream = fd.read()
-            except Exception as msg:
-                print(_('ERROR: Failed reading plugin registration %(filename)s') % \
-                            {'filename' : filename})
-                print(msg)
-                continue
-            if os.path.exists(os.path.join(os.path.dirname(full_filename),
-                                           'locale')):
-                try:
-                    local_gettext = glocale.get_addon_translator(full_filename).gettext
-                except ValueError:
-                    print(_('WARNING: Plugin %(plugin_name)s has no translation'
-                            ' for any of your configured languages, using US'
-                            ' English instead') %
-                          {'plugin_name' : filename.split('.')[0] })
-                    local_gettext = glocale.translation.gettext
-            else:
-                local_gettext = glocale.translation.gettext
-            try:
-                exec (compile(stream, filename, 'exec'),
-                      make_environment(_=local_gettext), {'uistate': uistate})
-                for pdata in self.__plugindata[lenpd:]:
-                    # should not be duplicate IDs in different plugins
-                    assert pdata.id not in self.__id_to_pdata
-                    # if pdata.id in self.__id_to_pdata:
-                    #     print("Error: %s is duplicated!" % pdata.id)
+            cached = self.cache.get(full_filename)
+            if cached is not None and not any(pdata.id in self.__id_to_pdata
+                                              for pdata in cached):
+                self.__plugindata.extend(cached)
+                for pdata in cached:
                     self.__id_to_pdata[pdata.id] = pdata
-            except ValueError as msg:
-                print(_('ERROR: Failed reading plugin registration %(filename)s') % \
-                            {'filename' : filename})
-                print(msg)
-                self.__plugindata = self.__plugindata[:lenpd]
-            except:
-                print(_('ERROR: Failed reading plugin registration %(filename)s') % \
-                            {'filename' : filename})
-                print("".join(traceback.format_exception(*sys.exc_info())))
-                self.__plugindata = self.__plugindata[:lenpd]
+            else:
+                self.__register_file(full_filename, uistate)
             #check if:
             #  1. plugin exists, if not remove, otherwise set module name
             #  2. plugin not stable, if stable_only=True, remove
@@ -1232,6 +1355,68 @@ class PluginRegister:
                 del self.__id_to_pdata[self.__plugindata[ind].id]
                 del self.__plugindata[ind]
 
+    def __register_file(self, full_filename, uistate):
+        """
+        Execute a registration file, and store its registrations in the
+        cache.
+        """
+        filename = os.path.basename(full_filename)
+        lenpd = len(self.__plugindata)
+        try:
+            with open(full_filename, "r", encoding='utf-8') as fd:
+                stream = fd.read()
+        except Exception as msg:
+            print(_('ERROR: Failed reading plugin registration %(filename)s') % \
+                        {'filename' : filename})
+            print(msg)
+            return
+        if os.path.exists(os.path.join(os.path.dirname(full_filename),
+                                       'locale')):
+            try:
+                local_gettext = glocale.get_addon_translator(full_filename).gettext
+            except ValueError:
+                print(_('WARNING: Plugin %(plugin_name)s has no translation'
+                        ' for any of your configured languages, using US'
+                        ' English instead') %
+                      {'plugin_name' : filename.split('.')[0] })
+                local_gettext = glocale.translation.gettext
+        else:
+            local_gettext = glocale.translation.gettext
+        try:
+            exec (compile(stream, filename, 'exec'),
+                  make_environment(_=local_gettext), {'uistate': uistate})
+            for pdata in self.__plugindata[lenpd:]:
+                # should not be duplicate IDs in different plugins
+                assert pdata.id not in self.__id_to_pdata
+                # if pdata.id in self.__id_to_pdata:
+                #     print("Error: %s is duplicated!" % pdata.id)
+                self.__id_to_pdata[pdata.id] = pdata
+        except ValueError as msg:
+            print(_('ERROR: Failed reading plugin registration %(filename)s') % \
+                        {'filename' : filename})
+            print(msg)
+            self.__plugindata = self.__plugindata[:lenpd]
+        except:
+            print(_('ERROR: Failed reading plugin registration %(filename)s') % \
+                        {'filename' : filename})
+            print("".join(traceback.format_exception(*sys.exc_info())))
+            self.__plugindata = self.__plugindata[:lenpd]
+        else:
+            self.cache.put(full_filename, stream, self.__plugindata[lenpd:])
+
+    def save_cache(self):
+        """
+        Write the cache of the registrations, if it has changed.
+        """
+        self.cache.save()
+
+    def clear_cache(self):
+        """
+        Remove the cache of the registrations, so that all the registration
+        files are executed again.
+        """
+        self.cache.clear()
+
     def get_plugin(self, id):
         """
         Return the :class:`PluginData` for the plugin with id
@@ -0,0 +1,122 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the cache of the plugin registrations
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from .._pluginreg import PluginRegister, PluginCache
+
+REGISTRATION = """
+register(GENERAL,
+         id = 'cache_test_%(name)s',
+         name = "Cache test",
+         gramps_target_version = GRAMPSVERSION,
+         status = STABLE,
+         fname = 'cachetest.py',
+         load_on_reg = False,
+         )
+"""
+
+class PluginCacheTest(unittest.TestCase):
+    """
+    Plugin registration cache tests.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open(os.path.join(self.directory, 'cachetest.py'), 'w'):
+            pass
+        self.pgr = PluginRegister.get_instance()
+        self.plugindata = self.pgr._PluginRegister__plugindata[:]
+        self.id_to_pdata = self.pgr._PluginRegister__id_to_pdata.copy()
+        self.saved_cache = self.pgr.cache
+        self.path = os.path.join(self.directory, 'cache.pickle')
+        self.pgr.cache = PluginCache(self.path)
+
+    def tearDown(self):
+        self.pgr._PluginRegister__plugindata = self.plugindata
+        self.pgr._PluginRegister__id_to_pdata = self.id_to_pdata
+        self.pgr.cache = self.saved_cache
+        shutil.rmtree(self.directory)
+
+    def write_registration(self, filename, text):
+        with open(os.path.join(self.directory, filename), 'w',
+                  encoding='utf-8') as gpr:
+            gpr.write(text)
+
+    def scan(self):
+        self.pgr._PluginRegister__plugindata = self.plugindata[:]
+        self.pgr._PluginRegister__id_to_pdata = self.id_to_pdata.copy()
+        self.pgr.scan_dir(self.directory, sorted(os.listdir(self.directory)))
+        self.pgr.save_cache()
+
+    def test_cache(self):
+        filename = os.path.join(self.directory, 'static.gpr.py')
+        self.write_registration('static.gpr.py',
+                                REGISTRATION % {'name': 'static'})
+        self.scan()
+        plugin = self.pgr.get_plugin('cache_test_static')
+        self.assertEqual(plugin.mod_name, 'cachetest')
+        self.assertTrue(os.path.exists(self.path))
+
+        # The registrations are read from the cache in a new session
+        cache = PluginCache(self.path)
+        cached = cache.get(filename)
+        self.assertEqual([pdata.id for pdata in cached],
+                         ['cache_test_static'])
+        self.pgr.cache = cache
+        with mock.patch.object(PluginRegister,
+                               '_PluginRegister__register_file') as register:
+            self.scan()
+        register.assert_not_called()
+        plugin = self.pgr.get_plugin('cache_test_static')
+        self.assertEqual(plugin.mod_name, 'cachetest')
+
+        # A change of the file invalidates its entry
+        self.write_registration('static.gpr.py',
+                                REGISTRATION % {'name': 'changed'})
+        self.assertIsNone(PluginCache(self.path).get(filename))
+        self.scan()
+        self.assertIsNone(self.pgr.get_plugin('cache_test_static'))
+        self.assertIsNotNone(self.pgr.get_plugin('cache_test_changed'))
+
+        # Clearing the cache removes its file
+        self.pgr.clear_cache()
+        self.assertFalse(os.path.exists(self.path))
+        self.assertIsNone(self.pgr.cache.get(filename))
+
+    def test_dynamic(self):
+        filename = os.path.join(self.directory, 'dynamic.gpr.py')
+        self.write_registration('dynamic.gpr.py', "if True:\n" + "\n".join(
+            "    " + line
+            for line in (REGISTRATION % {'name': 'dynamic'}).splitlines()))
+        self.scan()
+        self.assertIsNotNone(self.pgr.get_plugin('cache_test_dynamic'))
+        self.assertIsNone(PluginCache(self.path).get(filename))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,31 +22,88 @@
 Proxy class for the Gramps databases. Caches lookups from handles.
 """
 
+import weakref
+
+from ..utils.callback import Callback
 from ..utils.lru import LRU
 
+# Memory allocation is power of 2 where slots has to fit.
+# LRU uses one extra slot in its work, so use 2^n-1 entries
+# otherwise we are just wasting memory
+DEFAULT_LIMITS = {
+    'Person': 65535,
+    'Family': 32767,
+    'Event': 131071,
+    'Place': 32767,
+    'Source': 8191,
+    'Citation': 65535,
+    'Repository': 4095,
+    'Media': 8191,
+    'Note': 32767,
+    'Tag': 1023,
+    }
+
+# Name of the objects in the signals of the database
+SIGNAL_NAMES = {
+    'Person': 'person',
+    'Family': 'family',
+    'Event': 'event',
+    'Place': 'place',
+    'Source': 'source',
+    'Citation': 'citation',
+    'Repository': 'repository',
+    'Media': 'media',
+    'Note': 'note',
+    'Tag': 'tag',
+    }
+
 class CacheProxyDb:
     """
     A Proxy for a database with cached lookups on handles.
 
-    Does not invalid caches. Should be used only in read-only
-    places, and not where caches are altered.
+    Each object type has its own cache with its own size limit.  If the
+    database sends signals, entries are removed from the caches when the
+    objects are updated or deleted, so that the proxy can be used in front
+    of a database which is being edited.  If the database changed without
+    sending signals, for example in a batch transaction, all the caches are
+    cleared.  Each commit increases the generation of the database by one,
+    so a signal whose commit does not follow the last one seen tells that
+    such a change was missed.
+
+    The cached objects are shared by all users of the proxy.  They must
+    not be modified; get a copy from the database itself for editing.
     """
-    def __init__(self, database):
+    def __init__(self, database, limits=None):
         """
         CacheProxy will cache items based on their handle.
 
-        Assumes all handles (regardless of type) are unique.
         Database is called self.db for consistency with other
         proxies.
+
+        :param database: the database to cache.
+        :param limits: number of objects to keep for each object type, by
+                       class name.  Types which are not given use the
+                       defaults of DEFAULT_LIMITS; 0 disables the cache of
+                       a type.
+        :type limits: dict
         """
         self.db = database
-        # Memory allocation is power of 2 where slots has to fit.
-        # LRU uses one extra slot in its work, so set max to 2^17-1
-        # otherwise we are just wasting memory
-        self.cache_handle = LRU(131071)
+        self.__keys = []
+        self.limits = dict(DEFAULT_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        self.cache = {class_name: LRU(limit)
+                      for class_name, limit in self.limits.items()}
+        self.stats = {}
+        self.reset_cache_stats()
+        self.__generation = self.__get_generation()
+        if isinstance(database, Callback):
+            self.__connect_signals()
 
     def __del__(self):
-        self.cache_handle.clear()
+        self.disconnect_signals()
+        for cache in self.cache.values():
+            cache.clear()
 
     def __getattr__(self, attr):
         """
@@ -55,102 +112,179 @@ class CacheProxyDb:
         """
         return getattr(self.db, attr)
 
-    def clear_cache(self, handle=None):
+    def __get_generation(self):
+        get_generation = getattr(self.db, 'get_generation', None)
+        return get_generation() if get_generation else None
+
+    def __connect_signals(self):
+        """
+        Connect to the signals of the database.  The callbacks only hold a
+        weak reference to the proxy, so that the database does not keep it
+        alive.
+        """
+        proxy_ref = weakref.ref(self)
+
+        def make_callback(class_name):
+            def invalidate(handles):
+                proxy = proxy_ref()
+                if proxy is not None:
+                    proxy.invalidate(class_name, handles)
+            return invalidate
+
+        def make_rebuild(class_name):
+            def rebuild(*args):
+                proxy = proxy_ref()
+                if proxy is not None:
+                    proxy.clear_cache(class_name=class_name)
+            return rebuild
+
+        for class_name, name in SIGNAL_NAMES.items():
+            for action in ('-add', '-update', '-delete'):
+                self.__keys.append(self.db.connect(
+                    name + action, make_callback(class_name)))
+            self.__keys.append(self.db.connect(name + '-rebuild',
+                                               make_rebuild(class_name)))
+
+    def disconnect_signals(self):
+        """
+        Disconnect from the signals of the database.
         """
-        Clears all caches if handle is None, or
-        specific entry.
+        for key in self.__keys:
+            self.db.disconnect(key)
+        self.__keys = []
+
+    def invalidate(self, class_name, handles):
+        """
+        Remove the objects with the given handles from the cache of a type.
+        """
+        cache = self.cache[class_name]
+        for handle in handles:
+            if handle in cache:
+                del cache[handle]
+        generation = self.__get_generation()
+        if (generation is not None and
+                generation not in (self.__generation, self.__generation + 1)):
+            self.clear_cache()
+        self.__generation = generation
+
+    def clear_cache(self, handle=None, class_name=None):
+        """
+        Clears all caches if handle and class_name are None, the cache of
+        one object type if class_name is given, or a specific entry.
         """
         if handle:
-            del self.cache_handle[handle]
+            for cache in self.cache.values():
+                if handle in cache:
+                    del cache[handle]
+        elif class_name:
+            self.cache[class_name].clear()
         else:
-            self.cache_handle.clear()
+            for cache in self.cache.values():
+                cache.clear()
+
+    def get_cache_stats(self):
+        """
+        Return the statistics of the caches, as a dictionary with the class
+        names as keys, and dictionaries with the number of 'hits', 'misses'
+        and 'evictions', and the current 'size', as values.
+        """
+        for class_name, stats in self.stats.items():
+            stats['size'] = len(self.cache[class_name].data)
+        return self.stats
+
+    def reset_cache_stats(self):
+        """
+        Reset the hit, miss and eviction counters.
+        """
+        self.stats = {class_name: {'hits': 0, 'misses': 0, 'evictions': 0,
+                                   'size': 0}
+                      for class_name in self.limits}
+
+    def __get_object(self, class_name, method, handle):
+        """
+        Gets item from cache if it exists, otherwise from the database.
+        """
+        generation = self.__get_generation()
+        if generation != self.__generation:
+            self.clear_cache()
+            self.__generation = generation
+        cache = self.cache[class_name]
+        stats = self.stats[class_name]
+        if handle in cache:
+            stats['hits'] += 1
+            return cache[handle]
+        stats['misses'] += 1
+        obj = method(handle)
+        if len(cache.data) >= cache.count > 1:
+            stats['evictions'] += 1
+        cache[handle] = obj
+        return obj
 
     def get_person_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_person_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Person', self.db.get_person_from_handle,
+                                 handle)
 
     def get_event_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_event_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Event', self.db.get_event_from_handle,
+                                 handle)
 
     def get_family_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_family_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Family', self.db.get_family_from_handle,
+                                 handle)
 
     def get_repository_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_repository_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Repository',
+                                 self.db.get_repository_from_handle, handle)
 
     def get_place_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_place_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Place', self.db.get_place_from_handle,
+                                 handle)
 
     def get_citation_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_citation_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Citation', self.db.get_citation_from_handle,
+                                 handle)
 
     def get_source_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_source_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Source', self.db.get_source_from_handle,
+                                 handle)
 
     def get_note_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_note_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Note', self.db.get_note_from_handle,
+                                 handle)
 
     def get_media_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_media_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Media', self.db.get_media_from_handle,
+                                 handle)
 
     def get_tag_from_handle(self, handle):
         """
-        Gets item from cache if it exists. Converts
-        handles to string, for uniformity.
+        Gets item from cache if it exists.
         """
-        if handle not in self.cache_handle:
-            self.cache_handle[handle] = self.db.get_tag_from_handle(handle)
-        return self.cache_handle[handle]
+        return self.__get_object('Tag', self.db.get_tag_from_handle, handle)
@@ -31,7 +31,7 @@ Proxy class for the Gramps databases. Filter out all living people.
 from .proxybase import ProxyDbBase
 from ..lib import (Date, Person, Name, Surname, NameOriginType, Family, Source,
                    Citation, Event, Media, Place, Repository, Note, Tag)
-from ..utils.alive import probably_alive
+from ..utils.alive import get_alive_estimator
 from ..config import config
 from ..const import GRAMPS_LOCALE as glocale
 
@@ -91,6 +91,7 @@ class LivingProxyDb(ProxyDbBase):
         else:
             self.current_date = None
         self.years_after_death = years_after_death
+        self.estimator = get_alive_estimator(dbase)
         self._ = llocale.translation.gettext
         self._p_f_n = self._(config.get('preferences.private-given-text'))
         self._p_s_n = self._(config.get('preferences.private-surname-text'))
@@ -240,10 +241,9 @@ class LivingProxyDb(ProxyDbBase):
         """
         person_handle = person.get_handle()
         unfil_person = self.get_unfiltered_person(person_handle)
-        return probably_alive( unfil_person,
-                               self.db,
-                               self.current_date,
-                               self.years_after_death )
+        return self.estimator.probably_alive(unfil_person,
+                                             self.current_date,
+                                             self.years_after_death)
 
     def __remove_living_from_family(self, family):
         """
@@ -737,6 +737,13 @@ class ProxyDbBase(DbReadBase):
         """returns the save path of the file, or "" if one does not exist"""
         return self.db.get_save_path()
 
+    def get_generation(self):
+        """
+        Return a number which changes whenever data in the database is
+        changed.
+        """
+        return self.db.get_generation()
+
     def get_event_attribute_types(self):
         """returns a list of all Attribute types associated with Event
         instances in the database"""
@@ -0,0 +1,128 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the cache proxy database
+"""
+import gc
+import weakref
+import unittest
+
+from ...db import DbTxn
+from ...db.utils import make_database
+from ...errors import HandleError
+from ...lib import Person, Event, Note
+from .. import CacheProxyDb
+
+class CacheProxyTest(unittest.TestCase):
+    """
+    Cache proxy tests.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.handles = []
+        with DbTxn('Add people', self.db) as trans:
+            for dummy in range(5):
+                self.handles.append(self.db.add_person(Person(), trans))
+            self.event = self.db.add_event(Event(), trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_limits(self):
+        proxy = CacheProxyDb(self.db, {'Person': 3})
+        for handle in self.handles + self.handles[-2:]:
+            proxy.get_person_from_handle(handle)
+        proxy.get_event_from_handle(self.event)
+        stats = proxy.get_cache_stats()
+        self.assertEqual(stats['Person'], {'hits': 2, 'misses': 5,
+                                           'evictions': 2, 'size': 3})
+        self.assertEqual(stats['Event']['misses'], 1)
+        proxy.reset_cache_stats()
+        self.assertEqual(proxy.get_cache_stats()['Person']['hits'], 0)
+
+        proxy = CacheProxyDb(self.db, {'Person': 0})
+        proxy.get_person_from_handle(self.handles[0])
+        proxy.get_person_from_handle(self.handles[0])
+        self.assertEqual(proxy.get_cache_stats()['Person']['size'], 0)
+
+    def test_invalidation(self):
+        proxy = CacheProxyDb(self.db)
+        person = proxy.get_person_from_handle(self.handles[0])
+        self.assertIs(proxy.get_person_from_handle(self.handles[0]), person)
+        other = proxy.get_person_from_handle(self.handles[2])
+
+        with DbTxn('Edit person', self.db) as trans:
+            person = self.db.get_person_from_handle(self.handles[0])
+            person.set_gender(Person.FEMALE)
+            self.db.commit_person(person, trans)
+        self.assertEqual(proxy.get_person_from_handle(
+            self.handles[0]).get_gender(), Person.FEMALE)
+        # Other objects stay in the cache
+        self.assertIs(proxy.get_person_from_handle(self.handles[2]), other)
+
+        with DbTxn('Remove person', self.db) as trans:
+            self.db.remove_person(self.handles[0], trans)
+        self.assertRaises(HandleError, proxy.get_person_from_handle,
+                          self.handles[0])
+
+        proxy.get_person_from_handle(self.handles[1])
+        with DbTxn('Batch edit', self.db, batch=True) as trans:
+            person = self.db.get_person_from_handle(self.handles[1])
+            person.set_gender(Person.MALE)
+            self.db.commit_person(person, trans)
+        self.assertEqual(proxy.get_person_from_handle(
+            self.handles[1]).get_gender(), Person.MALE)
+
+    def test_add(self):
+        proxy = CacheProxyDb(self.db)
+        people = [proxy.get_person_from_handle(handle)
+                  for handle in self.handles[:3]]
+        with DbTxn('Add note', self.db) as trans:
+            self.db.add_note(Note(), trans)
+        for handle, person in zip(self.handles, people):
+            self.assertIs(proxy.get_person_from_handle(handle), person)
+        self.assertEqual(proxy.get_cache_stats()['Person']['hits'], 3)
+
+        # A commit without signals before is not missed
+        with DbTxn('Batch edit', self.db, batch=True) as trans:
+            person = self.db.get_person_from_handle(self.handles[0])
+            person.set_gender(Person.FEMALE)
+            self.db.commit_person(person, trans)
+        with DbTxn('Add note', self.db) as trans:
+            self.db.add_note(Note(), trans)
+        self.assertEqual(proxy.get_person_from_handle(
+            self.handles[0]).get_gender(), Person.FEMALE)
+
+    def test_release(self):
+        proxy = CacheProxyDb(self.db)
+        proxy_ref = weakref.ref(proxy)
+        del proxy
+        gc.collect()
+        self.assertIsNone(proxy_ref())
+        with DbTxn('Edit person', self.db) as trans:
+            person = self.db.get_person_from_handle(self.handles[0])
+            self.db.commit_person(person, trans)
+
+
+if __name__ == "__main__":
+    unittest.main()
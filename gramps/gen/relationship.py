@@ -35,6 +35,8 @@ import logging
 #-------------------------------------------------------------------------
 from .lib import Person, ChildRefType, EventType, FamilyRelType
 from .plug import PluginRegister, BasePluginManager
+from .db.familygraph import get_family_graph
+from .errors import HandleError
 from .const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
 
@@ -1260,13 +1262,14 @@ class RelationshipCalculator:
                  self.__crosslinks, self.__msg = self.map_meta
                 self.__msg = list(self.__msg)
             else:
-                self.__apply_filter(db, orig_person, '', [], first_map)
+                self.__apply_filter(db, orig_person.handle, '', [],
+                                    first_map)
                 self.map_meta = (self.__max_depth_reached,
                                  self.__loop_detected,
                                  self.__all_families,
                                  self.__all_dist, self.__only_birth,
                                  self.__crosslinks, list(self.__msg))
-            self.__apply_filter(db, other_person, '', [], second_map,
+            self.__apply_filter(db, other_person.handle, '', [], second_map,
                                 stoprecursemap=first_map)
         except RuntimeError:
             return (-1, None, -1, [], -1, []), \
@@ -1352,7 +1355,7 @@ class RelationshipCalculator:
         else:
             return [(-1, None, '', [], '', [])], self.__msg
 
-    def __apply_filter(self, db, person, rel_str, rel_fam, pmap,
+    def __apply_filter(self, db, handle, rel_str, rel_fam, pmap,
                        depth=1, stoprecursemap=None):
         """
         Typically this method is called recursively in two ways:
@@ -1366,8 +1369,11 @@ class RelationshipCalculator:
         of first contains loops, and parents
         will be looked up anyway an stored if common. At end the doubles
         are filtered out
+
+        The family links are read from the shared family graph index of the
+        database, so people and families are not loaded.
         """
-        if person is None or not person.handle:
+        if not handle:
             return
 
         if depth > self.__max_depth:
@@ -1382,34 +1388,40 @@ class RelationshipCalculator:
         store = True                            #normally we store all parents
         if stoprecursemap:
             store = False                       #but not if a stop map given
-            if person.handle in stoprecursemap:
+            if handle in stoprecursemap:
                 commonancestor = True
                 store = True
 
         #add person to the map, take into account that person can be obtained
         #from different sides
-        if person.handle in pmap:
+        if handle in pmap:
             #person is already a grandparent in another branch, we already have
             # had lookup of all parents, we call that a crosslink
             if not stoprecursemap:
                 self.__crosslinks = True
-            pmap[person.handle][0] += [rel_str]
-            pmap[person.handle][1] += [rel_fam]
+            pmap[handle][0] += [rel_str]
+            pmap[handle][1] += [rel_fam]
             #check if there is no loop father son of his son, ...
             # loop means person is twice reached, same rel_str in begin
-            for rel1 in pmap[person.handle][0]:
-                for rel2 in pmap[person.handle][0]:
+            for rel1 in pmap[handle][0]:
+                for rel2 in pmap[handle][0]:
                     if len(rel1) < len(rel2) and \
                             rel1 == rel2[:len(rel1)]:
                         #loop, keep one message in storage!
                         self.__loop_detected = True
+                        # the handle may come from a dangling family link
+                        try:
+                            name = db.get_person_from_handle(
+                                handle).get_primary_name().get_name()
+                        except (HandleError, AttributeError):
+                            name = handle
                         self.__msg += [_("Relationship loop detected:") + " " +
                                        _("Person %(person)s connects to himself via %(relation)s")  %
-                                       {'person' : person.get_primary_name().get_name(),
+                                       {'person' : name,
                                         'relation' : rel2[len(rel1):]}]
                         return
         elif store:
-            pmap[person.handle] = [[rel_str], [rel_fam]]
+            pmap[handle] = [[rel_str], [rel_fam]]
 
         #having added person to the pmap, we only look up recursively to
         # parents if this person is not common relative
@@ -1418,34 +1430,28 @@ class RelationshipCalculator:
             #don't continue search, great speedup!
             return
 
-        family_handles = []
-        main = person.get_main_parents_family_handle()
-        if main:
-            family_handles = [main]
-        if self.__all_families:
-            family_handles = person.get_parent_family_handle_list()
+        graph = get_family_graph(db)
+        family_handles = graph.get_parent_families(handle)
+        if not self.__all_families:
+            family_handles = family_handles[:1]
 
         try:
             parentstodo = {}
             fam = 0
             for family_handle in family_handles:
                 rel_fam_new = rel_fam + [fam]
-                family = db.get_family_from_handle(family_handle)
-                if not family:
+                if not graph.has_family(family_handle):
                     continue
                 #obtain childref for this person
-                childrel = [(ref.get_mother_relation(),
-                             ref.get_father_relation())
-                            for ref in family.get_child_ref_list()
-                            if ref.ref == person.handle]
-                fhandle = family.father_handle
-                mhandle = family.mother_handle
+                childrel = [(mrel, frel) for (chandle, mrel, frel)
+                            in graph.get_children(family_handle)
+                            if chandle == handle]
+                fhandle, mhandle = graph.get_parents(family_handle)
                 for data in [(fhandle, self.REL_FATHER,
                               self.REL_FATHER_NOTBIRTH, childrel[0][1]),
                              (mhandle, self.REL_MOTHER,
                               self.REL_MOTHER_NOTBIRTH, childrel[0][0])]:
                     if data[0] and data[0] not in parentstodo:
-                        persontodo = db.get_person_from_handle(data[0])
                         if data[3] == ChildRefType.BIRTH:
                             addstr = data[1]
                         elif not self.__only_birth:
@@ -1453,7 +1459,7 @@ class RelationshipCalculator:
                         else:
                             addstr = ''
                         if addstr:
-                            parentstodo[data[0]] = (persontodo,
+                            parentstodo[data[0]] = (data[0],
                                                     rel_str + addstr,
                                                     rel_fam_new)
                     elif data[0] and data[0] in parentstodo:
@@ -1473,8 +1479,9 @@ class RelationshipCalculator:
                     #family without parents, add brothers for orig person
                     #other person has recusemap, and will stop when seeing
                     #the brother.
-                    child_list = [ref.ref for ref in family.get_child_ref_list()
-                                  if ref.ref != person.handle]
+                    child_list = [child[0] for child
+                                  in graph.get_children(family_handle)
+                                  if child[0] != handle]
                     addstr = self.REL_SIBLING
                     for chandle in child_list:
                         if chandle in pmap:
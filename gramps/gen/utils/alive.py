@@ -31,6 +31,7 @@ privacy in reports and exports.
 #
 #-------------------------------------------------------------------------
 import logging
+import weakref
 LOG = logging.getLogger(".gen.utils.alive")
 
 #-------------------------------------------------------------------------
@@ -40,6 +41,7 @@ LOG = logging.getLogger(".gen.utils.alive")
 #-------------------------------------------------------------------------
 from ..display.name import displayer as name_displayer
 from ..lib.date import Date, Today
+from ..lib.eventtype import EventType
 from ..errors import DatabaseError
 from ..const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.sgettext
@@ -467,6 +469,495 @@ class ProbablyAlive:
 
         return (None, None, "", None)
 
+#-------------------------------------------------------------------------
+#
+# AliveEstimator class
+#
+#-------------------------------------------------------------------------
+# Kinds of events which are evidence
+_OTHER, _BIRTH, _DEATH, _BIRTH_FALLBACK, _DEATH_FALLBACK = range(5)
+
+# Evidence which depends on the order of the walk through the relatives, as
+# when there is a loop in the descendants; it is left to ProbablyAlive.
+_UNKNOWN = object()
+
+class AliveEstimator:
+    """
+    The estimated birth and death dates of all the people of a database.
+
+    The estimates are those of :meth:`ProbablyAlive.probably_alive_range`,
+    but the evidence of the siblings, spouses and descendants of everybody
+    is found in one pass over the database, with the descendants in
+    topological order, instead of walking through the relatives again for
+    every person.  The evidence is kept until the database changes, as told
+    by :meth:`.DbReadBase.get_generation`, and only holds handles and years,
+    the dates being made when they are asked for.
+
+    Like :meth:`ProbablyAlive.probably_alive_range`, the ancestors are not
+    evidence: the person is marked as seen by the walk through the
+    descendants, so the walk through the ancestors stops at once.
+    """
+
+    def __init__(self,
+                 db,
+                 max_sib_age_diff=None,
+                 max_age_prob_alive=None,
+                 avg_generation_gap=None):
+        self.__db = weakref.ref(db)
+        if max_sib_age_diff is None:
+            max_sib_age_diff = _MAX_SIB_AGE_DIFF
+        if max_age_prob_alive is None:
+            max_age_prob_alive = _MAX_AGE_PROB_ALIVE
+        if avg_generation_gap is None:
+            avg_generation_gap = _AVG_GENERATION_GAP
+        self.MAX_SIB_AGE_DIFF = max_sib_age_diff
+        self.MAX_AGE_PROB_ALIVE = max_age_prob_alive
+        self.AVG_GENERATION_GAP = avg_generation_gap
+        self.__generation = None
+        self.clear()
+
+    def clear(self):
+        """
+        Discard the evidence, so that it is found again when next used.
+        """
+        self.__generation = None
+        # event handle -> (kind, serialized date)
+        self.__events = {}
+        # family handle -> (father handle, mother handle, child handles,
+        # year of the first dated family event or 0)
+        self.__families = {}
+        # family handle -> (kind, year, explain, child handle) of the first
+        # child with a dated birth or death
+        self.__siblings = {}
+        # person handle -> ((kind, event handle, explain) of the birth or
+        # death, (kind, event handle, explain) of the fallback) of the
+        # person as a descendant
+        self.__children = {}
+        # person handle -> (kind, event handle, explain, descendant handle,
+        # depth) of the first descendant with a dated event
+        self.__descendants = {}
+        # person handle -> (birth year, death year, explain, relative handle)
+        # of the person as a spouse
+        self.__spouses = {}
+
+    #---------------------------------------------------------------------
+    #
+    # Estimates
+    #
+    #---------------------------------------------------------------------
+    def get_range(self, person):
+        """
+        Computes estimated birth and death dates.
+        Returns: (birth_date, death_date, explain_text, related_person)
+        """
+        result = self.__get_range(person)
+        if result is None:
+            return self.__probably_alive_range(person)
+        birth, death, explain, relative = result
+        if relative == person.handle:
+            relative = person
+        elif relative in self.__children:
+            relative = self.__db().get_person_from_handle(relative)
+        else:
+            relative = None
+        return (birth, death, explain, relative)
+
+    def probably_alive(self, person, current_date=None, limit=0,
+                       return_range=False):
+        """
+        Return true if the person may be alive on current_date.
+
+        See :func:`probably_alive` for the parameters.
+        """
+        if return_range:
+            result = self.get_range(person)
+        else:
+            result = (self.__get_range(person) or
+                      self.__probably_alive_range(person))
+        return _check_range(person, result, current_date, limit,
+                            return_range)
+
+    def __get_range(self, person):
+        """
+        Return the estimate of a person, with the handle of the relative
+        the evidence comes from, or None if it is left to ProbablyAlive.
+        """
+        if person is None:
+            return (None, None, "", None)
+        if not self.__sync():
+            return None
+        result = self.__get_own_range(person)
+        if result is None:
+            result = self.__get_sibling_range(
+                person.get_parent_family_handle_list())
+        families = person.get_family_handle_list()
+        if result is None:
+            result = self.__get_spouse_range(person.handle, families)
+        if result is None:
+            result = self.__get_descendant_range(
+                self.__find_descendant(families))
+        if result is _UNKNOWN:
+            return None
+        return result or (None, None, "", None)
+
+    def __probably_alive_range(self, person):
+        pb = ProbablyAlive(self.__db(), self.MAX_SIB_AGE_DIFF,
+                           self.MAX_AGE_PROB_ALIVE, self.AVG_GENERATION_GAP)
+        return pb.probably_alive_range(person)
+
+    def __get_date(self, handle):
+        """
+        Return the date of an event, or None if there is no such event.
+        """
+        event = self.__events.get(handle)
+        if event is None:
+            return None
+        date = Date()
+        if event[1] is not None:
+            date.unserialize(event[1])
+        return date
+
+    def __get_kind(self, handle):
+        event = self.__events.get(handle)
+        return _OTHER if event is None else event[0]
+
+    def __get_own_range(self, person):
+        """
+        Return the estimate from the events of a person, or None.
+        """
+        birth_ref = person.get_birth_ref()
+        death_ref = person.get_death_ref()
+        death_date = None
+        birth_date = None
+        explain = ""
+        if death_ref and death_ref.get_role().is_primary():
+            death_date = self.__get_date(death_ref.ref)
+
+        # Look for Cause Of Death, Burial or Cremation events.
+        if not death_date:
+            for ev_ref in person.get_primary_event_ref_list():
+                if self.__get_kind(ev_ref.ref) == _DEATH_FALLBACK:
+                    death_date = self.__get_date(ev_ref.ref)
+                    if not death_date.is_valid():
+                        death_date = Today() # before today
+                        death_date.set_modifier(Date.MOD_BEFORE)
+
+        if birth_ref and birth_ref.get_role().is_primary():
+            birth = self.__get_date(birth_ref.ref)
+            if birth and birth.get_start_date() != Date.EMPTY:
+                birth_date = birth
+
+        # Look for Baptism, etc events.
+        if not birth_date:
+            for ev_ref in person.get_primary_event_ref_list():
+                if self.__get_kind(ev_ref.ref) == _BIRTH_FALLBACK:
+                    birth_date = self.__get_date(ev_ref.ref)
+
+        if not birth_date and death_date:
+            if death_date.is_valid():
+                birth_date = death_date.copy_offset_ymd(
+                    year=-self.MAX_AGE_PROB_ALIVE)
+            explain = _("death date")
+
+        if not death_date and birth_date:
+            death_date = birth_date.copy_offset_ymd(
+                year=self.MAX_AGE_PROB_ALIVE)
+            explain = _("birth date")
+
+        if death_date and birth_date:
+            return (birth_date, death_date, explain, person.handle)
+        return None
+
+    def __get_sibling_range(self, family_handles):
+        """
+        Return the estimate from the siblings in the families, or None.
+        """
+        for family_handle in family_handles:
+            sibling = self.__siblings.get(family_handle)
+            if sibling is None:
+                continue
+            kind, year, explain, child_handle = sibling
+            if kind == _BIRTH:
+                year -= self.MAX_SIB_AGE_DIFF
+            else:
+                year -= self.MAX_SIB_AGE_DIFF + self.MAX_AGE_PROB_ALIVE
+            return (Date().copy_ymd(year),
+                    Date().copy_ymd(year + self.MAX_AGE_PROB_ALIVE),
+                    explain, child_handle)
+        return None
+
+    def __get_spouse_range(self, handle, family_handles):
+        """
+        Return the estimate from the spouses and the family events of a
+        person, or None.
+        """
+        for family_handle in family_handles:
+            family = self.__families.get(family_handle)
+            if family is None:
+                continue
+            father_handle, mother_handle, dummy, year = family
+            other = None
+            if handle == mother_handle and father_handle:
+                other = father_handle
+            elif handle == father_handle and mother_handle:
+                other = mother_handle
+            if other:
+                spouse = self.__spouses.get(other)
+                if spouse is _UNKNOWN:
+                    return _UNKNOWN
+                if spouse:
+                    year1, year2, explain, relative = spouse
+                    if year1:
+                        return (Date().copy_ymd(year1 -
+                                                self.AVG_GENERATION_GAP),
+                                Date().copy_ymd(year1 -
+                                                self.AVG_GENERATION_GAP +
+                                                self.MAX_AGE_PROB_ALIVE),
+                                _("a spouse's birth-related date, ") +
+                                explain, relative)
+                    elif year2:
+                        return (Date().copy_ymd(year2 +
+                                                self.AVG_GENERATION_GAP -
+                                                self.MAX_AGE_PROB_ALIVE),
+                                Date().copy_ymd(year2 +
+                                                self.AVG_GENERATION_GAP),
+                                _("a spouse's death-related date, ") +
+                                explain, relative)
+            if year:
+                return (Date().copy_ymd(year - self.AVG_GENERATION_GAP),
+                        Date().copy_ymd(year - self.AVG_GENERATION_GAP +
+                                        self.MAX_AGE_PROB_ALIVE),
+                        _("event with spouse"), other)
+        return None
+
+    def __get_descendant_range(self, descendant):
+        """
+        Return the estimate from the evidence of a descendant, or None.
+        """
+        if descendant is None or descendant is _UNKNOWN:
+            return descendant
+        kind, event_handle, explain, child_handle, depth = descendant
+        dobj = self.__get_date(event_handle)
+        if kind == _BIRTH:
+            dobj.set_year(dobj.get_year() -
+                          self.AVG_GENERATION_GAP * (depth + 1))
+            return (dobj, dobj.copy_offset_ymd(self.MAX_AGE_PROB_ALIVE),
+                    explain, child_handle)
+        return (dobj.copy_offset_ymd(- self.AVG_GENERATION_GAP),
+                dobj.copy_offset_ymd(- self.AVG_GENERATION_GAP +
+                                     self.MAX_AGE_PROB_ALIVE),
+                explain, child_handle)
+
+    def __find_descendant(self, family_handles):
+        """
+        Return the evidence of the first descendant with a dated event in
+        the families, which have all been walked through, or None.
+        """
+        for child_handle in self.__iter_children(family_handles):
+            before, after = self.__children[child_handle]
+            if before:
+                return before + (child_handle, 0)
+            descendant = self.__descendants[child_handle]
+            if descendant is _UNKNOWN:
+                return _UNKNOWN
+            if descendant:
+                return descendant[:4] + (descendant[4] + 1,)
+            if after:
+                return after + (child_handle, 0)
+        return None
+
+    def __iter_children(self, family_handles):
+        """
+        Iterate over the children of the families who are in the database.
+        """
+        for family_handle in family_handles:
+            family = self.__families.get(family_handle)
+            if family:
+                for child_handle in family[2]:
+                    if child_handle in self.__children:
+                        yield child_handle
+
+    #---------------------------------------------------------------------
+    #
+    # Evidence
+    #
+    #---------------------------------------------------------------------
+    def __sync(self):
+        """
+        Find the evidence again if the database has changed.  Return False
+        if the database does not tell when it changes.
+        """
+        db = self.__db()
+        generation = db.get_generation()
+        if generation is None:
+            return False
+        if generation != self.__generation:
+            self.clear()
+            self.__build(db)
+            self.__generation = generation
+        return True
+
+    def __build(self, db):
+        # The events are read raw, since only the type and date are needed.
+        event_type = EventType()
+        with db.get_event_cursor() as cursor:
+            for handle, data in cursor:
+                event_type.unserialize(data[2])
+                if event_type.is_birth():
+                    kind = _BIRTH
+                elif event_type.is_death():
+                    kind = _DEATH
+                elif event_type.is_birth_fallback():
+                    kind = _BIRTH_FALLBACK
+                elif event_type.is_death_fallback():
+                    kind = _DEATH_FALLBACK
+                else:
+                    kind = _OTHER
+                self.__events[handle] = (kind, data[3])
+
+        for family in db.iter_families():
+            year = 0
+            for ref in family.get_event_ref_list():
+                date = self.__get_date(ref.ref)
+                if date and date.get_year() != 0:
+                    year = date.get_year()
+                    break
+            self.__families[family.handle] = (
+                family.get_father_handle(), family.get_mother_handle(),
+                tuple(ref.ref for ref in family.get_child_ref_list()), year)
+
+        siblings = {}
+        families = {}
+        parent_families = {}
+        for person in db.iter_people():
+            self.__children[person.handle] = self.__get_child_evidence(person)
+            own = self.__get_own_range(person)
+            if own:
+                self.__spouses[person.handle] = (
+                    own[0].get_year(), own[1].get_year(), own[2],
+                    person.handle)
+            siblings[person.handle] = self.__get_sibling_evidence(person)
+            families[person.handle] = person.get_family_handle_list()
+            parent_families[person.handle] = (
+                person.get_parent_family_handle_list())
+
+        for family_handle, family in self.__families.items():
+            for child_handle in family[2]:
+                if siblings.get(child_handle):
+                    self.__siblings[family_handle] = (
+                        siblings[child_handle] + (child_handle,))
+                    break
+
+        self.__walk_descendants(families)
+
+        for handle in families:
+            if handle in self.__spouses:
+                continue
+            result = self.__get_sibling_range(parent_families[handle])
+            if result is None:
+                descendant = self.__descendants[handle]
+                result = self.__get_descendant_range(descendant)
+                if (result and result is not _UNKNOWN and
+                        result[0].get_year() == 0 and
+                        result[1].get_year() == 0):
+                    # The spouse's walk through the descendants would have
+                    # stopped here, and its marks would change the walk
+                    # through the descendants of the person.
+                    result = _UNKNOWN
+            if result is _UNKNOWN:
+                self.__spouses[handle] = _UNKNOWN
+            elif result:
+                self.__spouses[handle] = (
+                    result[0].get_year(), result[1].get_year(), result[2],
+                    result[3])
+
+    def __get_child_evidence(self, person):
+        """
+        Return the evidence of a person as a descendant, from the birth and
+        death, and from the fallback events.
+        """
+        before = None
+        for ref, kind, explain in (
+                (person.get_birth_ref(), _BIRTH, _("descendant birth date")),
+                (person.get_death_ref(), _DEATH, _("descendant death date"))):
+            if ref:
+                dobj = self.__get_date(ref.ref)
+                if dobj and dobj.get_start_date() != Date.EMPTY:
+                    before = (kind, ref.ref, explain)
+                    break
+        after = None
+        for ev_ref in person.get_primary_event_ref_list():
+            kind = self.__get_kind(ev_ref.ref)
+            if kind == _BIRTH_FALLBACK:
+                explain = _("descendant birth-related date")
+            elif kind == _DEATH_FALLBACK:
+                explain = _("descendant death-related date")
+            else:
+                continue
+            dobj = self.__get_date(ev_ref.ref)
+            if dobj.get_start_date() != Date.EMPTY:
+                after = (_BIRTH if kind == _BIRTH_FALLBACK else _DEATH,
+                         ev_ref.ref, explain)
+                break
+        return (before, after)
+
+    def __get_sibling_evidence(self, person):
+        """
+        Return the (kind, year, explain) evidence of a person as a sibling,
+        or None.
+        """
+        for birth, death, birth_explain, death_explain in (
+                (_BIRTH, _DEATH, _("sibling birth date"),
+                 _("sibling death date")),
+                (_BIRTH_FALLBACK, _DEATH_FALLBACK,
+                 _("sibling birth-related date"),
+                 _("sibling death-related date"))):
+            for ev_ref in person.get_primary_event_ref_list():
+                kind = self.__get_kind(ev_ref.ref)
+                if kind == birth:
+                    explain = birth_explain
+                elif kind == death:
+                    explain = death_explain
+                else:
+                    continue
+                dobj = self.__get_date(ev_ref.ref)
+                if dobj.get_start_date() != Date.EMPTY:
+                    year = dobj.get_year()
+                    if year != 0:
+                        return (_BIRTH if kind == birth else _DEATH, year,
+                                explain)
+        return None
+
+    def __walk_descendants(self, families):
+        """
+        Find the evidence of the descendants of everybody, children first.
+        The people in a loop of descendants are marked as unknown.
+        """
+        for root in families:
+            if root in self.__descendants:
+                continue
+            stack = [(root, self.__iter_children(families[root]))]
+            path = {root}
+            looped = set()
+            while stack:
+                handle, children = stack[-1]
+                for child_handle in children:
+                    if child_handle in path:
+                        looped.add(handle)
+                    elif child_handle not in self.__descendants:
+                        stack.append((child_handle, self.__iter_children(
+                            families[child_handle])))
+                        path.add(child_handle)
+                        break
+                else:
+                    stack.pop()
+                    path.discard(handle)
+                    if handle in looped:
+                        self.__descendants[handle] = _UNKNOWN
+                    else:
+                        self.__descendants[handle] = self.__find_descendant(
+                            families[handle])
+
 #-------------------------------------------------------------------------
 #
 # probably_alive
@@ -495,8 +986,16 @@ def probably_alive(person, db,
     """
     # First, get the real database to use all people
     # for determining alive status:
-    birth, death, explain, relative = probably_alive_range(person, db,
-            max_sib_age_diff, max_age_prob_alive, avg_generation_gap)
+    result = probably_alive_range(person, db, max_sib_age_diff,
+                                  max_age_prob_alive, avg_generation_gap)
+    return _check_range(person, result, current_date, limit, return_range)
+
+def _check_range(person, result, current_date, limit, return_range):
+    """
+    Return true if current_date is in the estimated range of a person, see
+    probably_alive.
+    """
+    birth, death, explain, relative = result
     if current_date is None:
         current_date = Today()
     LOG.debug("%s: b.%s, d.%s - %s".format(
@@ -536,6 +1035,37 @@ def probably_alive_range(person, db,
                        max_age_prob_alive, avg_generation_gap)
     return pb.probably_alive_range(person)
 
+_ESTIMATORS = weakref.WeakKeyDictionary()
+
+def get_alive_estimator(db,
+                        max_sib_age_diff=None,
+                        max_age_prob_alive=None,
+                        avg_generation_gap=None):
+    """
+    Return the shared AliveEstimator of a database for the parameters,
+    which are those of probably_alive.
+
+    Like probably_alive, the estimates use all the people of the real
+    database behind any proxy, so the proxies share its estimator.
+    """
+    from ..proxy.proxybase import ProxyDbBase
+    basedb = db
+    while isinstance(basedb, ProxyDbBase):
+        basedb = basedb.db
+    if max_sib_age_diff is None:
+        max_sib_age_diff = _MAX_SIB_AGE_DIFF
+    if max_age_prob_alive is None:
+        max_age_prob_alive = _MAX_AGE_PROB_ALIVE
+    if avg_generation_gap is None:
+        avg_generation_gap = _AVG_GENERATION_GAP
+    key = (max_sib_age_diff, max_age_prob_alive, avg_generation_gap)
+    estimators = _ESTIMATORS.setdefault(basedb, {})
+    estimator = estimators.get(key)
+    if estimator is None:
+        estimator = AliveEstimator(basedb, *key)
+        estimators[key] = estimator
+    return estimator
+
 def update_constants():
     """
     Used to update the constants that are cached in this module.
@@ -0,0 +1,163 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the estimates of the birth and death dates
+"""
+import unittest
+
+from ...db import DbTxn
+from ...db.utils import make_database
+from ...lib import (Person, Family, Event, EventType, EventRef, ChildRef,
+                    Date)
+from ...proxy import LivingProxyDb, PrivateProxyDb
+from ..alive import probably_alive_range, get_alive_estimator
+
+def serialize_range(result):
+    birth, death, explain, relative = result
+    return (birth.serialize() if birth else None,
+            death.serialize() if death else None, explain,
+            relative.handle if relative else None)
+
+class AliveEstimatorTest(unittest.TestCase):
+    """
+    Tests of the estimates of the whole database.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.people = {}
+        with DbTxn('Add people', self.db) as trans:
+            # Two undated generations between a grandfather and a
+            # great-grandson, a wife known from her brother, and a son of
+            # the grandfather without evidence.
+            for name, events in (('grandfather', [(EventType.BIRTH, 1700)]),
+                                 ('father', []),
+                                 ('mother', []),
+                                 ('uncle', [(EventType.BAPTISM, 1905)]),
+                                 ('son', [(EventType.BURIAL, None)]),
+                                 ('grandson', []),
+                                 ('great-grandson', [(EventType.BIRTH,
+                                                      1990)]),
+                                 ('brother', [])):
+                self.people[name] = self.add_person(events, trans)
+            self.add_family('grandfather', None, ['father', 'brother'],
+                            trans)
+            self.add_family(None, None, ['mother', 'uncle'], trans)
+            self.add_family('father', 'mother', ['son'], trans)
+            self.add_family('son', None, ['grandson'], trans)
+            self.add_family('grandson', None, ['great-grandson'], trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def add_person(self, events, trans):
+        person = Person()
+        self.add_events(person, events, trans)
+        return self.db.add_person(person, trans)
+
+    def add_events(self, person, events, trans):
+        for event_type, year in events:
+            event = Event()
+            event.set_type(event_type)
+            if year:
+                date = Date()
+                date.set_yr_mon_day(year, 0, 0)
+                event.set_date_object(date)
+            ref = EventRef()
+            ref.ref = self.db.add_event(event, trans)
+            person.add_event_ref(ref)
+            if event_type == EventType.BIRTH:
+                person.set_birth_ref(ref)
+
+    def add_family(self, father, mother, children, trans):
+        family = Family()
+        if father:
+            family.set_father_handle(self.people[father])
+        if mother:
+            family.set_mother_handle(self.people[mother])
+        for child in children:
+            ref = ChildRef()
+            ref.ref = self.people[child]
+            family.add_child_ref(ref)
+        family_handle = self.db.add_family(family, trans)
+        for name in (father, mother):
+            if name:
+                person = self.db.get_person_from_handle(self.people[name])
+                person.add_family_handle(family_handle)
+                self.db.commit_person(person, trans)
+        for child in children:
+            person = self.db.get_person_from_handle(self.people[child])
+            person.add_parent_family_handle(family_handle)
+            self.db.commit_person(person, trans)
+        return family_handle
+
+    def check_all(self, db):
+        estimator = get_alive_estimator(db)
+        for handle in db.iter_person_handles():
+            person = db.get_person_from_handle(handle)
+            self.assertEqual(
+                serialize_range(estimator.get_range(person)),
+                serialize_range(probably_alive_range(person, db)))
+
+    def get_explain(self, name):
+        person = self.db.get_person_from_handle(self.people[name])
+        return get_alive_estimator(self.db).get_range(person)[2]
+
+    def test_estimates(self):
+        self.check_all(self.db)
+        self.check_all(PrivateProxyDb(self.db))
+        self.assertEqual(self.get_explain('grandson'),
+                         "descendant birth date")
+        self.assertEqual(self.get_explain('father'),
+                         "a spouse's birth-related date, "
+                         "sibling birth-related date")
+        # the ancestors are not evidence, as in ProbablyAlive
+        self.assertEqual(self.get_explain('brother'), "")
+        estimator = get_alive_estimator(self.db)
+        brother = self.db.get_person_from_handle(self.people['brother'])
+        self.assertTrue(estimator.probably_alive(brother))
+        self.assertEqual(estimator.probably_alive(brother,
+                                                  return_range=True)[3],
+                         "no evidence")
+
+    def test_changes(self):
+        estimator = get_alive_estimator(self.db)
+        self.assertIs(estimator, get_alive_estimator(
+            LivingProxyDb(self.db, LivingProxyDb.MODE_EXCLUDE_ALL)))
+        self.assertIsNot(estimator, get_alive_estimator(self.db, 10))
+        self.assertEqual(self.get_explain('grandson'),
+                         "descendant birth date")
+        with DbTxn('Add birth', self.db) as trans:
+            person = self.db.get_person_from_handle(self.people['grandson'])
+            self.add_events(person, [(EventType.BIRTH, 1950)], trans)
+            self.db.commit_person(person, trans)
+        self.assertEqual(self.get_explain('grandson'), "birth date")
+        self.check_all(self.db)
+
+    def test_loop(self):
+        with DbTxn('Add loop', self.db) as trans:
+            self.add_family('great-grandson', None, ['father'], trans)
+        self.check_all(self.db)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -124,7 +124,7 @@ class BaseSelector(ManagedWindow):
         else:
             self.showall.hide()
         if default:
-            self.goto_handle(default)
+            self.model.call_when_populated(self.goto_handle, default)
 
     def goto_handle(self, handle):
         """
@@ -339,13 +339,15 @@ class ListView(NavigationView):
             self.list.set_model(self.model)
             cput3 = time.clock()
             self.__display_column_sort()
-            self.goto_active(None)
+            self.model.call_when_populated(self.goto_active, None)
 
             self.dirty = False
             cput4 = time.clock()
             self.uistate.show_filter_results(self.dbstate,
                                              self.model.displayed(),
                                              self.model.total())
+            if self.model.is_populating():
+                self.model.call_when_populated(self.__show_filter_results)
             LOG.debug(self.__class__.__name__ + ' build_tree ' +
                     str(time.clock() - cput0) + ' sec')
             LOG.debug('parts ' + str(cput1-cput0) + ' , '
@@ -357,6 +359,15 @@ class ListView(NavigationView):
         else:
             self.dirty = True
 
+    def __show_filter_results(self):
+        """
+        Show the number of rows once the model is populated.
+        """
+        if self.active:
+            self.uistate.show_filter_results(self.dbstate,
+                                             self.model.displayed(),
+                                             self.model.total())
+
     def search_build_tree(self):
         self.build_tree()
 
@@ -654,7 +665,7 @@ class ListView(NavigationView):
         self.__display_column_sort()
 
         if handle:
-            self.goto_handle(handle)
+            self.model.call_when_populated(self.goto_handle, handle)
 
         # set the search column to be the sorted column
         search_col = self.column_order()[data][1]
@@ -683,6 +694,8 @@ class ListView(NavigationView):
         Called when the database is changed.
         """
         self.list.set_model(None)
+        if self.model:
+            self.model.cancel_population()
         self._change_db(db)
         self.connect_signals()
 
@@ -1060,6 +1073,9 @@ class ListView(NavigationView):
         else:
             ofile = ODSTab(len(column_names))
 
+        # Export all the rows
+        self.model.complete_population()
+
         ofile.open(name)
         ofile.start_page()
         ofile.start_row()
@@ -27,6 +27,7 @@
 #-------------------------------------------------------------------------
 from gramps.gen.utils.lru import LRU
 from gramps.gen.config import config
+from .populator import CancelToken, Populator
 
 class BaseModel:
 
@@ -36,14 +37,93 @@ class BaseModel:
     def __init__(self):
         self.lru_data  = LRU(BaseModel._CACHE_SIZE)
         self.lru_path = LRU(BaseModel._CACHE_SIZE)
+        self._populator = None
+        self._pending = []
+        self._populated_callbacks = []
 
     def destroy(self):
         """
         Destroy the items in memory.
         """
+        self.cancel_population()
         self.lru_data = None
         self.lru_path = None
 
+    ## Population of the model in steps:
+    def _populate(self, steps, *args, total=None):
+        """
+        Populate the model with the generator steps(token, *args).  The
+        first steps are run at once, and the others from the main loop.
+        A running population is cancelled.
+        """
+        self.cancel_population()
+        token = CancelToken()
+        self._populator = Populator(steps(token, *args), token,
+                                    self.uistate, total, self.__populated)
+        self._populator.start()
+
+    def __populated(self, background):
+        self._populator = None
+        self._populated(background)
+        # Apply the changes of the database made during the population
+        pending, self._pending = self._pending, []
+        for method, handle in pending:
+            method(handle)
+        callbacks, self._populated_callbacks = self._populated_callbacks, []
+        for callback, args in callbacks:
+            callback(*args)
+
+    def _populated(self, background):
+        """
+        Called when the population is complete.  background is True if the
+        population was not completed at once.
+        """
+        pass
+
+    def is_populating(self):
+        """
+        Return True if the model is being populated.
+        """
+        return self._populator is not None and self._populator.is_active()
+
+    def cancel_population(self):
+        """
+        Cancel the population of the model.
+        """
+        if self._populator is not None:
+            self._populator.cancel()
+            self._populator = None
+        self._pending = []
+        self._populated_callbacks = []
+
+    def complete_population(self):
+        """
+        Run the remaining steps of the population at once.
+        """
+        if self.is_populating():
+            self._populator.run_to_end()
+
+    def call_when_populated(self, callback, *args):
+        """
+        Call callback(*args) once the model is populated, or at once if it
+        is not being populated.
+        """
+        if self.is_populating():
+            self._populated_callbacks.append((callback, args))
+        else:
+            callback(*args)
+
+    def _defer(self, method, handle):
+        """
+        Delay a change of a row until the end of the population, since the
+        row may not have been added yet.  Return True if the change is
+        delayed.
+        """
+        if self.is_populating():
+            self._pending.append((method, handle))
+            return True
+        return False
+
     def clear_cache(self, handle=None):
         """
         Clear the LRU cache. Always clear lru_path, because paths may have
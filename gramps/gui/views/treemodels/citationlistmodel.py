@@ -56,6 +56,8 @@ class CitationListModel(CitationBaseModel, FlatBaseModel):
     """
     Flat citation model.  (Original code in CitationBaseModel).
     """
+    OWN_SORT_COLUMNS = (0, 1, 2, 3, 4, 6)
+
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(), sort_map=None):
         self.map = db.get_raw_citation_data
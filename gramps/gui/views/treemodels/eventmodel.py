@@ -71,6 +71,8 @@ INVALID_DATE_FORMAT = config.get('preferences.invalid-date-format')
 #-------------------------------------------------------------------------
 class EventModel(FlatBaseModel):
 
+    OWN_SORT_COLUMNS = (0, 1, 2, 3, 5, 7)
+
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(), sort_map=None):
         self.gen_cursor = db.get_event_cursor
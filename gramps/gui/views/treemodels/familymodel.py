@@ -56,6 +56,8 @@ invalid_date_format = config.get('preferences.invalid-date-format')
 #-------------------------------------------------------------------------
 class FamilyModel(FlatBaseModel):
 
+    OWN_SORT_COLUMNS = (0, 3, 5, 7)
+
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(), sort_map=None):
         self.gen_cursor = db.get_family_cursor
@@ -72,7 +72,11 @@ from gi.repository import Gtk
 #-------------------------------------------------------------------------
 from gramps.gen.filters import SearchFilter, ExactSearchFilter
 from gramps.gen.const import GRAMPS_LOCALE as glocale
+from gramps.gen.config import config
+from gramps.gen.db.sortindex import get_sort_index
+from gramps.gen.utils.grampslocale import HAVE_ICU
 from .basemodel import BaseModel
+from .populator import STEP_SIZE, read_cursor
 from ...user import User
 
 #-------------------------------------------------------------------------
@@ -83,6 +87,17 @@ from ...user import User
 
 UEMPTY = ""
 
+# Seconds between the updates of a view while its model is populated
+PUBLISH_TIME = 0.5
+
+def _merge(keys, new_keys):
+    """
+    Return a new sorted list of the (sortkey, handle) of two lists.
+    """
+    merged = keys + new_keys
+    merged.sort()
+    return merged
+
 class FlatNodeMap:
     """
     A NodeMap for a flat treeview. In such a TreeView, the paths possible are
@@ -448,6 +463,12 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
             so as to have localized sort
     """
 
+    # The columns whose sort keys are computed from the object alone.  The
+    # sort index of another column is not updated after a change, since
+    # the change may alter the sort keys of other objects: the index is
+    # then only reused while the database does not change.
+    OWN_SORT_COLUMNS = ()
+
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(),
                  sort_map=None):
@@ -476,6 +497,9 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         # get the function that maps data to sort_keys
         self.sort_func = lambda x: glocale.sort_key(self.smap[col](x))
         self.sort_col = scol
+        self.sort_index = get_sort_index(db)
+        self.sort_index_name = self.get_sort_index_name(col)
+        self.sort_index_updated = col in self.OWN_SORT_COLUMNS
         self.skip = skip
         self._in_build = False
 
@@ -495,6 +519,7 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         BaseModel.destroy(self)
         self.db = None
         self.sort_func = None
+        self.sort_index = None
         if self.node_map:
             self.node_map.destroy()
         self.node_map = None
@@ -558,19 +583,24 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         """
         return None
 
-    def sort_keys(self):
+    def get_sort_index_name(self, col):
+        """
+        Return the name of the persistent sort index of a model column.
+        The sort keys depend on the collation and on the display formats.
+        """
+        return '%s:%d:%s:%s:%s:%s:%s:%s' % (
+            self.__class__.__name__, col, glocale.get_collation(), HAVE_ICU,
+            config.get('preferences.name-format'),
+            config.get('preferences.date-format'),
+            config.get('preferences.place-format'),
+            config.get('preferences.place-auto'))
+
+    def _update_sort_index(self, handle, sortkey):
         """
-        Return the (sort_key, handle) list of all data that can maximally
-        be shown.
-        This list is sorted ascending, via localized string sort.
+        Keep the sort index up to date after a change of an object.
         """
-        # use cursor as a context manager
-        with self.gen_cursor() as cursor:
-            #loop over database and store the sort field, and the handle
-            srt_keys=[(self.sort_func(data), key)
-                      for key, data in cursor]
-            srt_keys.sort()
-            return srt_keys
+        if self.sort_index_updated:
+            self.sort_index.update(self.sort_index_name, handle, sortkey)
 
     def _rebuild_search(self, ignore=None):
         """ function called when view must be build, given a search text
@@ -579,25 +609,19 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         self.clear_cache()
         self._in_build = True
         if (self.db is not None) and self.db.is_open():
-            allkeys = self.node_map.full_srtkey_hndl_map()
-            if not allkeys:
-                allkeys = self.sort_keys()
-            if self.search and self.search.text:
-                dlist = [h for h in allkeys
-                             if self.search.match(h[1], self.db) and
-                             h[1] not in self.skip and h[1] != ignore]
-                ident = False
-            elif ignore is None and not self.skip:
+            search = self.search
+            skip = self.skip
+            if search and search.text:
+                keep = lambda handle: (search.match(handle, self.db) and
+                                       handle not in skip and handle != ignore)
+            elif ignore is None and not skip:
                 #nothing to remove from the keys present
-                ident = True
-                dlist = allkeys
+                keep = None
             else:
-                ident = False
-                dlist = [h for h in allkeys
-                             if h[1] not in self.skip and h[1] != ignore]
-            self.node_map.set_path_map(dlist, allkeys, identical=ident,
-                                       reverse=self._reverse)
+                keep = lambda handle: handle not in skip and handle != ignore
+            self._populate(self._populate_steps, keep)
         else:
+            self.cancel_population()
             self.node_map.clear_map()
         self._in_build = False
 
@@ -608,40 +632,136 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         self.clear_cache()
         self._in_build = True
         if (self.db is not None) and self.db.is_open():
-            allkeys = self.node_map.full_srtkey_hndl_map()
-            if not allkeys:
-                allkeys = self.sort_keys()
-            if self.search:
-                ident = False
-                if ignore is None:
-                    dlist = self.search.apply(self.db, allkeys, tupleind=1,
-                                              user=self.user)
-                else:
-                    dlist = self.search.apply(self.db,
-                                [ k for k in allkeys if k[1] != ignore],
-                                tupleind=1)
-            elif ignore is None :
-                ident = True
-                dlist = allkeys
-            else:
-                ident = False
-                dlist = [ k for k in allkeys if k[1] != ignore ]
-            self.node_map.set_path_map(dlist, allkeys, identical=ident,
-                                       reverse=self._reverse)
+            self._populate(self._filter_steps, self.search, ignore)
         else:
+            self.cancel_population()
             self.node_map.clear_map()
         self._in_build = False
 
+    def _filter_steps(self, token, dfilter, ignore):
+        """
+        Generator populating the model with the objects matching a filter.
+        The filter is applied first, and the rows are then added in steps.
+        """
+        keep = None
+        if dfilter:
+            matches = set(dfilter.apply(self.db, user=self.user))
+            if token.cancelled:
+                return
+            if ignore is None:
+                keep = matches.__contains__
+            else:
+                keep = lambda handle: handle in matches and handle != ignore
+        elif ignore is not None:
+            keep = lambda handle: handle != ignore
+        yield from self._populate_steps(token, keep)
+
+    def _populate_steps(self, token, keep):
+        """
+        Generator populating the model in steps.
+
+        The sort keys of all the objects are taken from the model or from
+        the sort index if they are known, or computed a step at a time and
+        saved in the sort index.
+        The rows for which keep(handle) is True, or all rows if keep is
+        None, are shown as they are found, at most every PUBLISH_TIME
+        seconds.
+        """
+        serial = self.db.get_serial()
+        allkeys = self.node_map.full_srtkey_hndl_map()
+        if not allkeys:
+            allkeys = self.sort_index.load(self.sort_index_name)
+        self.node_map.clear_map()
+        if allkeys and keep is None:
+            self._publish(allkeys, allkeys, allkeys)
+            return
+        if allkeys:
+            full = allkeys
+            chunks = (allkeys[index:index + STEP_SIZE]
+                      for index in range(0, len(allkeys), STEP_SIZE))
+        else:
+            full = []
+            chunks = self._sort_key_steps()
+        shown = []
+        new_full = []
+        new_shown = []
+        count = 0
+        published = time.perf_counter()
+        for chunk in chunks:
+            count += len(chunk)
+            if not allkeys:
+                new_full.extend(chunk)
+            if keep is None:
+                new_shown.extend(chunk)
+            else:
+                new_shown.extend(key for key in chunk if keep(key[1]))
+            if time.perf_counter() - published >= PUBLISH_TIME:
+                if new_full:
+                    full = _merge(full, new_full)
+                    new_full = []
+                shown = full if keep is None else _merge(shown, new_shown)
+                self._publish(shown, full, new_shown)
+                new_shown = []
+                published = time.perf_counter()
+            yield count
+        if not allkeys:
+            full = _merge(full, new_full)
+            # The keys are not valid for the database if it changed while
+            # they were computed
+            if self.db.get_serial() == serial:
+                self.sort_index.save(self.sort_index_name, full)
+        shown = full if keep is None else _merge(shown, new_shown)
+        self._publish(shown, full, new_shown)
+
+    def _sort_key_steps(self):
+        """
+        Generator of the (sort_key, handle) of all objects, in sorted chunks
+        of STEP_SIZE objects.
+        """
+        rows = read_cursor(self.gen_cursor)
+        for index in range(0, len(rows), STEP_SIZE):
+            chunk = [(self.sort_func(data), key)
+                     for key, data in rows[index:index + STEP_SIZE]]
+            chunk.sort()
+            yield chunk
+
+    def _publish(self, shown, full, new):
+        """
+        Show the (sort_key, handle) list shown, out of the full list, new
+        being the rows added since the last call.  The rows are added
+        silently while the model is built, and signalled to the view
+        afterwards.
+        """
+        self.clear_cache()
+        self.node_map.set_path_map(shown, full, identical=shown is full,
+                                   reverse=self._reverse)
+        if self._in_build or not new:
+            return
+        # Signal the rows in the order of their paths, so that each path
+        # is valid when it is signalled
+        handles = set(key[1] for key in new)
+        indexes = [index for index, key in enumerate(shown)
+                   if key[1] in handles]
+        if self._reverse:
+            indexes.reverse()
+        for index in indexes:
+            path = self.node_map.real_path(index)
+            self.row_inserted(Gtk.TreePath((path,)),
+                              self.node_map.get_iter(path))
+
     def add_row_by_handle(self, handle):
         """
         Add a row. This is called after object with handle is created.
         Row is only added if search/filter data is such that it must be shown
         """
         assert isinstance(handle, str)
+        if self._defer(self.add_row_by_handle, handle):
+            return
         if self.node_map.get_path_from_handle(handle) is not None:
             return # row is already displayed
         data = self.map(handle)
         insert_val = (self.sort_func(data), handle)
+        self._update_sort_index(handle, insert_val[0])
         if not self.search or \
                 (self.search and self.search.match(handle, self.db)):
             #row needs to be added to the model
@@ -658,6 +778,9 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         Delete a row, called after the object with handle is deleted
         """
         assert isinstance(handle, str)
+        if self._defer(self.delete_row_by_handle, handle):
+            return
+        self._update_sort_index(handle, None)
         if self.node_map.get_path_from_handle(handle) is None:
             return # row is not currently displayed
         self.clear_cache(handle)
@@ -671,8 +794,12 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         """
         Update a row, called after the object with handle is changed
         """
+        if self._defer(self.update_row_by_handle, handle):
+            return
         if self.node_map.get_path_from_handle(handle) is None:
-            return # row is not currently displayed
+            # row is not currently displayed, but its sort key may change
+            self._update_sort_index(handle, self.sort_func(self.map(handle)))
+            return
         self.clear_cache(handle)
         oldsortkey = self.node_map.get_sortkey(handle)
         newsortkey = self.sort_func(self.map(handle))
@@ -683,6 +810,7 @@ class FlatBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
             self.add_row_by_handle(handle)
         else:
             #the row is visible in the view, is changed, but the order is fixed
+            self._update_sort_index(handle, newsortkey)
             path = self.node_map.get_path_from_handle(handle)
             node = self.do_get_iter(path)[1]
             self.row_changed(path, node)
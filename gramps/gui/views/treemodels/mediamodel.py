@@ -52,6 +52,8 @@ from .flatbasemodel import FlatBaseModel
 #-------------------------------------------------------------------------
 class MediaModel(FlatBaseModel):
 
+    OWN_SORT_COLUMNS = (0, 1, 2, 3, 4, 5, 7)
+
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(), sort_map=None):
         self.gen_cursor = db.get_media_cursor
@@ -52,6 +52,8 @@ from gramps.gen.lib import (Note, NoteType, StyledText)
 class NoteModel(FlatBaseModel):
     """
     """
+    OWN_SORT_COLUMNS = (0, 1, 2, 3, 5)
+
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(), sort_map=None):
         """Setup initial values for instance variables."""
@@ -60,6 +60,7 @@ from gramps.gen.lib import (Name, EventRef, EventType, EventRoleType,
 from gramps.gen.display.name import displayer as name_displayer
 from gramps.gen.display.place import displayer as place_displayer
 from gramps.gen.datehandler import format_time, get_date, get_date_valid
+from gramps.gen.errors import HandleError
 from .flatbasemodel import FlatBaseModel
 from .treebasemodel import TreeBaseModel
 from .basemodel import BaseModel
@@ -238,7 +239,55 @@ class PeopleBaseModel(BaseModel):
             self.set_cached_value(handle, "SORT_BIRTH_DAY", value)
         return value
 
+    def _get_summary_date(self, summary, name, sort_mode):
+        """
+        Return the birth or death date of a person, from the summary of the
+        events maintained by the database.
+        """
+        handle = summary[name + '_ref']
+        if handle is None:
+            return ''
+        if sort_mode:
+            sortval = summary[name + '_sortval']
+            return '' if sortval is None else "%09d" % sortval
+        try:
+            event = self.db.get_event_from_handle(handle)
+        except HandleError:
+            return ''
+        date_str = get_date(event)
+        if date_str == "":
+            return ''
+        if summary[name + '_fallback']:
+            retval = "<i>%s</i>" % escape(date_str)
+        else:
+            retval = escape(date_str)
+        if not get_date_valid(event):
+            return invalid_date_format % retval
+        return retval
+
+    def _get_summary_place(self, summary, name):
+        """
+        Return the birth or death place of a person, from the summary of
+        the events maintained by the database.
+        """
+        handle = summary[name + '_place_ref']
+        if handle is None:
+            return ''
+        try:
+            event = self.db.get_event_from_handle(handle)
+        except HandleError:
+            return ''
+        place_title = place_displayer.display_event(self.db, event)
+        if not place_title:
+            return ''
+        if summary[name + '_place_fallback']:
+            return "<i>%s</i>" % escape(place_title)
+        return escape(place_title)
+
     def _get_birth_data(self, data, sort_mode):
+        summary = self.db.get_person_summary(data[0])
+        if summary is not None:
+            return self._get_summary_date(summary, 'birth', sort_mode)
         index = data[COLUMN_BIRTH]
         if index != -1:
             try:
@@ -296,6 +345,9 @@ class PeopleBaseModel(BaseModel):
         return value
 
     def _get_death_data(self, data, sort_mode):
+        summary = self.db.get_person_summary(data[0])
+        if summary is not None:
+            return self._get_summary_date(summary, 'death', sort_mode)
         index = data[COLUMN_DEATH]
         if index != -1:
             try:
@@ -342,6 +394,11 @@ class PeopleBaseModel(BaseModel):
         cached, value = self.get_cached_value(handle, "BIRTH_PLACE")
         if cached:
             return value
+        summary = self.db.get_person_summary(handle)
+        if summary is not None:
+            value = self._get_summary_place(summary, 'birth')
+            self.set_cached_value(handle, "BIRTH_PLACE", value)
+            return value
         else:
             index = data[COLUMN_BIRTH]
             if index != -1:
@@ -382,6 +439,11 @@ class PeopleBaseModel(BaseModel):
         cached, value = self.get_cached_value(handle, "DEATH_PLACE")
         if cached:
             return value
+        summary = self.db.get_person_summary(handle)
+        if summary is not None:
+            value = self._get_summary_place(summary, 'death')
+            self.set_cached_value(handle, "DEATH_PLACE", value)
+            return value
         else:
             index = data[COLUMN_DEATH]
             if index != -1:
@@ -568,6 +630,8 @@ class PersonListModel(PeopleBaseModel, FlatBaseModel):
     """
     Listed people model.
     """
+    OWN_SORT_COLUMNS = (0, 1, 2, 12, 14)
+
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(), sort_map=None):
         PeopleBaseModel.__init__(self, db)
@@ -251,6 +251,8 @@ class PlaceListModel(PlaceBaseModel, FlatBaseModel):
     """
     Flat place model.  (Original code in PlaceBaseModel).
     """
+    OWN_SORT_COLUMNS = (0, 1, 3, 4, 5, 6, 7, 9)
+
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(), sort_map=None):
 
@@ -0,0 +1,219 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Population of the view models in steps.
+
+A model is populated by a generator, which does a small amount of work on
+each iteration and yields the number of objects handled so far.  The
+Populator runs the first steps at once, and the remaining ones from the
+GLib main loop, a chunk of steps at a time, so that the interface stays
+responsive while the model is filled.
+
+The database connections cannot be shared between threads, so the steps
+all run in the main thread.
+"""
+
+#-------------------------------------------------------------------------
+#
+# python modules
+#
+#-------------------------------------------------------------------------
+import time
+import logging
+
+_LOG = logging.getLogger(".gui.basetreemodel")
+
+#-------------------------------------------------------------------------
+#
+# GNOME/GTK modules
+#
+#-------------------------------------------------------------------------
+from gi.repository import GLib
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from gramps.gen.const import GRAMPS_LOCALE as glocale
+_ = glocale.translation.gettext
+
+# Number of objects handled by a step of a population
+STEP_SIZE = 250
+
+# Seconds of steps run at a time, before returning to the main loop
+CHUNK_TIME = 0.05
+
+def read_cursor(gen_cursor):
+    """
+    Return the (handle, data) rows of the cursor made by gen_cursor().
+
+    The rows are all read in one step, and the cursor closed, since a
+    cursor must not stay open across the steps of a population: the
+    database cannot begin a batch transaction while a cursor reads it.
+    """
+    with gen_cursor() as cursor:
+        return list(cursor)
+
+#-------------------------------------------------------------------------
+#
+# CancelToken
+#
+#-------------------------------------------------------------------------
+class CancelToken:
+    """
+    Shared by a population and its owner, to stop the population.
+
+    A cancelled population is not resumed.  A step which may run the main
+    loop, like a filter showing its progress, must check the token
+    afterwards, since the population can be cancelled meanwhile.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Stop the population.
+        """
+        self.cancelled = True
+
+#-------------------------------------------------------------------------
+#
+# Populator
+#
+#-------------------------------------------------------------------------
+class Populator:
+    """
+    Run the steps of a population.
+    """
+
+    def __init__(self, steps, token, uistate=None, total=None,
+                 callback=None):
+        """
+        :param steps: the generator of the steps.
+        :param token: the CancelToken of the population.
+        :param uistate: the DisplayState whose progress bar shows the
+                        progress, if any.
+        :param total: the number of objects to handle, if known.
+        :param callback: called with True if the population completed in
+                         the main loop, or False if it completed at once.
+        """
+        self.steps = steps
+        self.token = token
+        self.uistate = uistate
+        self.total = total
+        self.callback = callback
+        self.count = 0
+        self.background = False
+        self.finished = False
+        self.__source = None
+
+    def start(self):
+        """
+        Run the first chunk of steps, and schedule the others.
+        """
+        if self.__run():
+            self.background = True
+            self.__show_progress()
+            self.__source = GLib.idle_add(self.__idle)
+
+    def run_to_end(self):
+        """
+        Run all the remaining steps at once.
+        """
+        self.__remove_source()
+        while self.__run():
+            pass
+
+    def cancel(self):
+        """
+        Cancel the population.
+        """
+        self.token.cancel()
+        self.__remove_source()
+        if not self.finished:
+            self.__finish()
+            if not self.steps.gi_running:
+                self.steps.close()
+
+    def is_active(self):
+        """
+        Return True if the population is not finished.
+        """
+        return not self.finished
+
+    def __idle(self):
+        if self.__run():
+            self.__show_progress()
+            return True
+        self.__source = None
+        return False
+
+    def __run(self):
+        """
+        Run steps for up to CHUNK_TIME seconds.  Return True if there are
+        steps left.
+        """
+        deadline = time.perf_counter() + CHUNK_TIME
+        try:
+            while not self.token.cancelled:
+                self.count = next(self.steps)
+                if time.perf_counter() >= deadline:
+                    return True
+        except StopIteration:
+            pass
+        except Exception:
+            self.__finish()
+            raise
+        if not self.finished:
+            self.__finish()
+            if not self.token.cancelled and self.callback:
+                self.callback(self.background)
+        return False
+
+    def __finish(self):
+        self.finished = True
+        if self.background and self.uistate is not None:
+            self.uistate.progress.hide()
+            self.uistate.status.pop(self.uistate.status_id)
+        _LOG.debug("population of %d objects %s", self.count,
+                   "cancelled" if self.token.cancelled else "finished")
+
+    def __remove_source(self):
+        if self.__source is not None:
+            GLib.source_remove(self.__source)
+            self.__source = None
+
+    def __show_progress(self):
+        if self.uistate is None:
+            return
+        progress = self.uistate.progress
+        if self.__source is None:
+            self.uistate.status.push(self.uistate.status_id,
+                                     _("Loading items..."))
+            progress.show()
+        if self.total:
+            progress.set_fraction(min(self.count / self.total, 1.0))
+            progress.set_text("%d%%" % (100 * self.count // self.total))
+        else:
+            progress.pulse()
+            progress.set_text(str(self.count))
@@ -49,6 +49,8 @@ from gramps.gen.const import GRAMPS_LOCALE as glocale
 #-------------------------------------------------------------------------
 class SourceModel(FlatBaseModel):
 
+    OWN_SORT_COLUMNS = (0, 1, 2, 3, 4, 5, 7)
+
     def __init__(self, db, uistate, scol=0, order=Gtk.SortType.ASCENDING,
                  search=None, skip=set(), sort_map=None):
         self.map = db.get_raw_source_data
@@ -52,11 +52,11 @@ from gi.repository import Gtk
 #-------------------------------------------------------------------------
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
-import gramps.gui.widgets.progressdialog as progressdlg
 from ...user import User
 from bisect import bisect_right
 from gramps.gen.filters import SearchFilter, ExactSearchFilter
 from .basemodel import BaseModel
+from .populator import STEP_SIZE, read_cursor
 
 #-------------------------------------------------------------------------
 #
@@ -497,7 +497,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         else:
             self._build_data(self.current_filter, None, skip)
 
-        self._in_build = False
+        # The build goes on while the model is populated in the background
+        self._in_build = self.is_populating()
 
         self.current_filter = data_filter
         if self.has_secondary:
@@ -514,37 +515,39 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         self.__displayed = 0
 
         items = self.number_items()
+        if self.has_secondary:
+            items += self.number_items2()
+        self._populate(self.__search_steps, dfilter, dfilter2, skip,
+                       total=items)
+
+    def __search_steps(self, token, dfilter, dfilter2, skip):
+        """
+        Generator populating the data map where a search condition is
+        applied.
+        """
         _LOG.debug("rebuild search primary")
-        self.__rebuild_search(dfilter, skip, items,
-                              self.gen_cursor, self.add_row)
+        yield from self.__rebuild_search(dfilter, skip, self.gen_cursor,
+                                         self.add_row)
 
         if self.has_secondary:
             _LOG.debug("rebuild search secondary")
-            items = self.number_items2()
-            self.__rebuild_search(dfilter2, skip, items,
-                                  self.gen_cursor2, self.add_row2)
+            yield from self.__rebuild_search(dfilter2, skip,
+                                             self.gen_cursor2, self.add_row2)
 
-    def __rebuild_search(self, dfilter, skip, items, gen_cursor, add_func):
+    def __rebuild_search(self, dfilter, skip, gen_cursor, add_func):
         """
         Rebuild the data map for a single Gramps object type, where a search
         condition is applied.
         """
-        pmon = progressdlg.ProgressMonitor(
-            progressdlg.StatusProgress, (self.uistate,), popup_time=2,
-            title=_("Loading items..."))
-        status = progressdlg.LongOpStatus(total_steps=items,
-                                          interval=items // 20)
-        pmon.add_op(status)
-        with gen_cursor() as cursor:
-            for handle, data in cursor:
-                status.heartbeat()
-                self.__total += 1
-                if not (handle in skip or (dfilter and not
-                                        dfilter.match(handle, self.db))):
-                    _LOG.debug("    add %s %s" % (handle, data))
-                    self.__displayed += 1
-                    add_func(handle, data)
-        status.end()
+        for handle, data in read_cursor(gen_cursor):
+            self.__total += 1
+            if not (handle in skip or (dfilter and not
+                                    dfilter.match(handle, self.db))):
+                _LOG.debug("    add %s %s" % (handle, data))
+                self.__displayed += 1
+                add_func(handle, data)
+            if self.__total % STEP_SIZE == 0:
+                yield self.__total
 
     def _rebuild_filter(self, dfilter, dfilter2, skip):
         """
@@ -557,47 +560,61 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
             # The tree only has primary data
             items = self.number_items()
             _LOG.debug("rebuild filter primary")
-            self.__rebuild_filter(dfilter, skip, items,
-                                  self.gen_cursor, self.map, self.add_row)
+            self._populate(self.__rebuild_filter, dfilter, skip, items,
+                           self.gen_cursor, self.map, self.add_row,
+                           total=items)
         else:
             # The tree has both primary and secondary data. The navigation type
             # (navtype) which governs the filters that are offered, is for the
             # secondary data.
             items = self.number_items2()
             _LOG.debug("rebuild filter secondary")
-            self.__rebuild_filter(dfilter2, skip, items,
-                                    self.gen_cursor2, self.map2, self.add_row2)
+            self._populate(self.__rebuild_filter, dfilter2, skip, items,
+                           self.gen_cursor2, self.map2, self.add_row2,
+                           total=items)
 
-    def __rebuild_filter(self, dfilter, skip, items, gen_cursor, data_map,
-                         add_func):
+    def __rebuild_filter(self, token, dfilter, skip, items, gen_cursor,
+                         data_map, add_func):
         """
-        Rebuild the data map for a single Gramps object type, where a filter
-        is applied.
+        Generator populating the data map for a single Gramps object type,
+        where a filter is applied.  The filter is applied first, and the
+        rows are then added in steps.
         """
-        pmon = progressdlg.ProgressMonitor(
-            progressdlg.StatusProgress, (self.uistate,), popup_time=2,
-            title=_("Loading items..."))
-        status_ppl = progressdlg.LongOpStatus(total_steps=items,
-                                              interval=items // 20)
-        pmon.add_op(status_ppl)
-
         self.__total += items
         assert not skip
         if dfilter:
-            for handle in dfilter.apply(self.db,
-                                        user=User(parent=self.uistate.window)):
-                status_ppl.heartbeat()
+            handles = dfilter.apply(self.db,
+                                    user=User(parent=self.uistate.window))
+            if token.cancelled:
+                return
+            for handle in handles:
                 data = data_map(handle)
                 add_func(handle, data)
                 self.__displayed += 1
+                if self.__displayed % STEP_SIZE == 0:
+                    yield self.__displayed
         else:
-            with gen_cursor() as cursor:
-                for handle, data in cursor:
-                    status_ppl.heartbeat()
-                    add_func(handle, data)
-                    self.__displayed += 1
+            for handle, data in read_cursor(gen_cursor):
+                add_func(handle, data)
+                self.__displayed += 1
+                if self.__displayed % STEP_SIZE == 0:
+                    yield self.__displayed
 
-        status_ppl.end()
+    def _populated(self, background):
+        """
+        Show the rows, which are hidden from the view while they are added
+        in the background.
+        """
+        self._in_build = False
+        if not background:
+            return
+        self.clear_path_cache()
+        for index in range(len(self.tree[None].children)):
+            path = Gtk.TreePath((index,))
+            iternode = self.do_get_iter(path)[1]
+            self.row_inserted(path, iternode)
+            if self.do_iter_has_child(iternode):
+                self.row_has_child_toggled(path, iternode)
 
     def add_node(self, parent, child, sortkey, handle, add_parent=True,
                  secondary=False):
@@ -740,6 +757,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         Add a row to the model.
         """
         assert isinstance(handle, str)
+        if self._defer(self.add_row_by_handle, handle):
+            return
         self.clear_path_cache()
         if self._get_node(handle) is not None:
             return # row already exists
@@ -764,6 +783,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         Delete a row from the model.
         """
         assert isinstance(handle, str)
+        if self._defer(self.delete_row_by_handle, handle):
+            return
         cput = time.clock()
         self.clear_cache(handle)
         node = self._get_node(handle)
@@ -804,6 +825,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         place.
         """
         assert isinstance(handle, str)
+        if self._defer(self.update_row_by_handle, handle):
+            return
         self.clear_cache(handle)
         if self._get_node(handle) is None:
             return  # row not currently displayed
@@ -852,7 +875,7 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         visible
         """
         node = self._get_node(handle)
-        if node is None:
+        if node is None or self.is_populating():
             return None
         return self._get_iter(node)
 
@@ -951,7 +974,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         """
         Returns a node from a given path.
         """
-        if not self.tree or not self.tree[None].children:
+        if (not self.tree or not self.tree[None].children or
+                self.is_populating()):
             return False, Gtk.TreeIter()
         node = self.tree[None]
         if isinstance(path, tuple):
@@ -1040,6 +1064,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         Get the first child of the given node.
         """
         if iterparent is None:
+            if self.is_populating():
+                return False, None
             nodeid = id(self.tree[None])
         else:
             nodeparent = self.get_node_from_iter(iterparent)
@@ -1061,6 +1087,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         Get the number of children of the given node.
         """
         if iter is None:
+            if self.is_populating():
+                return 0
             node = self.tree[None]
         else:
             node = self.get_node_from_iter(iter)
@@ -1071,6 +1099,8 @@ class TreeBaseModel(GObject.GObject, Gtk.TreeModel, BaseModel):
         Get the nth child of the given node.
         """
         if iterparent is None:
+            if self.is_populating():
+                return False, None
             node = self.tree[None]
         else:
             node = self.get_node_from_iter(iterparent)
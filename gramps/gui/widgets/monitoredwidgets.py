@@ -51,7 +51,7 @@ from gi.repository import Pango
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 from ..autocomp import StandardCustomSelector, fill_entry
-from gramps.gen.datehandler import displayer, parser
+from gramps.gen.datehandler import displayer, cached_parser
 from gramps.gen.lib.date import Date, NextYear
 from gramps.gen.errors import ValidationError
 
@@ -639,7 +639,7 @@ class MonitoredDate:
         """
         Parse date from text entry to date object
         """
-        date = parser.parse(str(self.text_obj.get_text()))
+        date = cached_parser.parse(str(self.text_obj.get_text()))
         self.date_obj.copy(date)
 
     def validate(self, widget, data):
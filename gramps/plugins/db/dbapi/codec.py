@@ -0,0 +1,106 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Codecs for the blob_data column of DB-API databases.
+
+A codec converts the raw data of a primary object, as returned by its
+serialize method, to the value stored in the database and back.  The name
+and version of the codec used by a database are kept in its metadata
+table.
+"""
+
+#-------------------------------------------------------------------------
+#
+# Standard python modules
+#
+#-------------------------------------------------------------------------
+import pickle
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+import gramps.gen.lib as lib
+from gramps.gen.lib.serialize import to_json, from_json
+
+#-------------------------------------------------------------------------
+#
+# Codec classes
+#
+#-------------------------------------------------------------------------
+class PickleCodec:
+    """
+    Store raw data as a pickled tuple.
+
+    This is compact and the fastest to decode.
+    """
+    name = 'pickle'
+    version = 1
+
+    def encode(self, data, class_name):
+        """
+        Encode the raw data of an object of the given class.
+        """
+        return pickle.dumps(data)
+
+    def decode(self, blob):
+        """
+        Decode a stored value into raw data.
+        """
+        return pickle.loads(blob)
+
+
+class JsonCodec:
+    """
+    Store objects in the JSON format of :func:`.to_json`.
+
+    Decoding is slower than with pickle, but the stored data is readable by
+    other programs, and single fields can be read in SQL with the JSON
+    functions of the database, without loading the object in Gramps.
+    """
+    name = 'json'
+    version = 1
+
+    def encode(self, data, class_name):
+        """
+        Encode the raw data of an object of the given class.
+        """
+        return to_json(getattr(lib, class_name).create(data))
+
+    def decode(self, blob):
+        """
+        Decode a stored value into raw data.
+        """
+        return from_json(blob).serialize()
+
+
+CODECS = {codec.name: codec for codec in (PickleCodec, JsonCodec)}
+
+def get_codec(name):
+    """
+    Return a codec instance given its name.
+
+    :param name: name of the codec.
+    :type name: str
+    :raises KeyError: if there is no codec with this name.
+    """
+    return CODECS[name]()
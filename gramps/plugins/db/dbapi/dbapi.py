@@ -39,20 +39,77 @@ from gramps.gen.db.dbconst import (DBLOGNAME, DBBACKEND, KEY_TO_NAME_MAP,
                                    PERSON_KEY, FAMILY_KEY, SOURCE_KEY,
                                    EVENT_KEY, MEDIA_KEY, PLACE_KEY, NOTE_KEY,
                                    TAG_KEY, CITATION_KEY, REPOSITORY_KEY,
-                                   REFERENCE_KEY)
+                                   REFERENCE_KEY, ARRAYSIZE)
 from gramps.gen.db.generic import DbGeneric
+from gramps.gen.db.exceptions import DbException
 from gramps.gen.lib import (Tag, Media, Person, Family, Source,
-                            Citation, Event, Place, Repository, Note)
+                            Citation, Event, Place, Repository, Note,
+                            EventType)
 from gramps.gen.lib.genderstats import GenderStats
+from gramps.gen.config import config
 from gramps.gen.const import GRAMPS_LOCALE as glocale
+from .codec import PickleCodec, get_codec, CODECS
+_ = glocale.translation.gettext
 
 LOG = logging.getLogger(".dbapi")
 _LOG = logging.getLogger(DBLOGNAME)
 
+# Secondary indexes which are not needed while bulk loading.  They are
+# dropped at the start of a batch transaction and rebuilt at commit.
+SECONDARY_INDEXES = (
+    ('person_surname', 'person', 'surname'),
+    ('person_given_name', 'person', 'given_name'),
+    ('source_title', 'source', 'title'),
+    ('citation_page', 'citation', 'page'),
+    ('media_desc', 'media', 'desc'),
+    ('place_title', 'place', 'title'),
+    ('tag_name', 'tag', 'name'),
+    )
+
+# Indexes on the reference table.  They are dropped while the reference
+# map is rebuilt at the end of a batch transaction.
+REFERENCE_INDEXES = (
+    ('reference_ref_handle', 'reference', 'ref_handle'),
+    ('reference_obj_handle', 'reference', 'obj_handle'),
+    )
+
+# Derived columns of the person table, which summarise the events shown as
+# the birth and the death of the person: the event of the date, the sort
+# value of the date, the event of the place, and if fallback events, like a
+# baptism or a burial, are used.
+PERSON_SUMMARY_COLUMNS = (
+    ('birth_ref', 'VARCHAR(50)'),
+    ('birth_sortval', 'INTEGER'),
+    ('birth_fallback', 'INTEGER'),
+    ('birth_place_ref', 'VARCHAR(50)'),
+    ('birth_place_fallback', 'INTEGER'),
+    ('death_ref', 'VARCHAR(50)'),
+    ('death_sortval', 'INTEGER'),
+    ('death_fallback', 'INTEGER'),
+    ('death_place_ref', 'VARCHAR(50)'),
+    ('death_place_fallback', 'INTEGER'),
+    )
+PERSON_SUMMARY_VERSION = 1
+
 class DBAPI(DbGeneric):
     """
     Database backends class for DB-API 2.0 databases
     """
+    def __init__(self, directory=None):
+        # Rows buffered during a batch transaction, by object key.
+        self._bulk = None
+        self._bulk_ids = None
+        self._bulk_count = 0
+        # Persons and events whose person summaries must be updated at the
+        # end of a batch transaction.
+        self._summary_people = set()
+        self._summary_events = set()
+        self._has_person_summary = False
+        self._secondary_fields = {}
+        # Databases created before codecs were introduced use pickle.
+        self.codec = PickleCodec()
+        super().__init__(directory)
+
     def _initialize(self, directory, username, password):
         raise NotImplementedError
 
@@ -143,36 +200,21 @@ class DBAPI(DbGeneric):
                            ')')
 
         self._create_secondary_columns()
+        self._create_summary_columns()
 
         ## Indices:
         self.dbapi.execute('CREATE INDEX person_gramps_id '
                            'ON person(gramps_id)')
-        self.dbapi.execute('CREATE INDEX person_surname '
-                           'ON person(surname)')
-        self.dbapi.execute('CREATE INDEX person_given_name '
-                           'ON person(given_name)')
-        self.dbapi.execute('CREATE INDEX source_title '
-                           'ON source(title)')
         self.dbapi.execute('CREATE INDEX source_gramps_id '
                            'ON source(gramps_id)')
-        self.dbapi.execute('CREATE INDEX citation_page '
-                           'ON citation(page)')
         self.dbapi.execute('CREATE INDEX citation_gramps_id '
                            'ON citation(gramps_id)')
-        self.dbapi.execute('CREATE INDEX media_desc '
-                           'ON media(desc)')
         self.dbapi.execute('CREATE INDEX media_gramps_id '
                            'ON media(gramps_id)')
-        self.dbapi.execute('CREATE INDEX place_title '
-                           'ON place(title)')
         self.dbapi.execute('CREATE INDEX place_enclosed_by '
                            'ON place(enclosed_by)')
         self.dbapi.execute('CREATE INDEX place_gramps_id '
                            'ON place(gramps_id)')
-        self.dbapi.execute('CREATE INDEX tag_name '
-                           'ON tag(name)')
-        self.dbapi.execute('CREATE INDEX reference_ref_handle '
-                           'ON reference(ref_handle)')
         self.dbapi.execute('CREATE INDEX family_gramps_id '
                            'ON family(gramps_id)')
         self.dbapi.execute('CREATE INDEX event_gramps_id '
@@ -181,11 +223,106 @@ class DBAPI(DbGeneric):
                            'ON repository(gramps_id)')
         self.dbapi.execute('CREATE INDEX note_gramps_id '
                            'ON note(gramps_id)')
-        self.dbapi.execute('CREATE INDEX reference_obj_handle '
-                           'ON reference(obj_handle)')
+        self._create_indexes(SECONDARY_INDEXES + REFERENCE_INDEXES)
 
         self.dbapi.commit()
 
+        codec = get_codec(config.get('database.blob-codec'))
+        self._set_metadata('codec', (codec.name, codec.version))
+        self._set_metadata('person_summary', PERSON_SUMMARY_VERSION)
+
+    def _create_indexes(self, indexes):
+        """
+        Create the given (name, table, column) indexes if they are missing.
+        """
+        for (index, table, column) in indexes:
+            self.dbapi.execute('CREATE INDEX IF NOT EXISTS %s ON %s(%s)'
+                               % (index, table, column))
+
+    def _drop_indexes(self, indexes):
+        """
+        Drop the given (name, table, column) indexes if they exist.
+
+        SQLite cannot drop an index while a cursor still reads its table.
+        The indexes are then kept, which only makes loading slower.
+        """
+        try:
+            for (index, table, column) in indexes:
+                self.dbapi.execute('DROP INDEX IF EXISTS %s' % index)
+        except Exception as err:
+            _LOG.warning("Unable to drop the indexes, keeping them: %s", err)
+
+    def load(self, directory, *args, **kwargs):
+        """
+        Load the database, and select the codec used for its blob data.
+        """
+        super().load(directory, *args, **kwargs)
+        name, version = self._get_metadata('codec', ('pickle', 1))
+        if name not in CODECS or version > CODECS[name].version:
+            raise DbException(_("Unsupported data format '%s' version %s")
+                              % (name, version))
+        self.codec = get_codec(name)
+        self._has_person_summary = (self._get_metadata('person_summary', 0)
+                                    == PERSON_SUMMARY_VERSION)
+        if not self._has_person_summary and not self.readonly:
+            self._upgrade_person_summary()
+
+    def _upgrade_person_summary(self):
+        """
+        Add the person summary columns to a database created without them,
+        and fill them.
+        """
+        LOG.info("Creating person summary columns...")
+        self._txn_begin()
+        if self._get_metadata('person_summary', 0) == 0:
+            self._create_summary_columns()
+        self._update_person_summaries(list(self._iter_handles(PERSON_KEY)))
+        self._set_metadata('person_summary', PERSON_SUMMARY_VERSION,
+                           use_txn=False)
+        self._txn_commit()
+        self._has_person_summary = True
+
+    def _encode(self, obj):
+        """
+        Return the blob data for a primary object.
+        """
+        return self.codec.encode(obj.serialize(), obj.__class__.__name__)
+
+    def set_codec(self, name, callback=None):
+        """
+        Convert the blob data of every primary object to another codec.
+
+        The conversion is made in place in a single transaction.
+
+        :param name: name of the new codec.
+        :type name: str
+        :param callback: function called with the percentage done.
+        :type callback: function
+        """
+        new_codec = get_codec(name)
+        if new_codec.name == self.codec.name:
+            return
+        total = max(self.get_total(), 1)
+        count = 0
+        self._txn_begin()
+        for obj_key, table in KEY_TO_NAME_MAP.items():
+            class_name = KEY_TO_CLASS_MAP[obj_key]
+            handles = list(self._iter_handles(obj_key))
+            for start in range(0, len(handles), ARRAYSIZE):
+                rows = []
+                for handle in handles[start:start + ARRAYSIZE]:
+                    data = self._get_raw_data(obj_key, handle)
+                    rows.append([new_codec.encode(data, class_name), handle])
+                self.dbapi.executemany("UPDATE %s SET blob_data = ? "
+                                       "WHERE handle = ?" % table, rows)
+                count += len(rows)
+                if callback:
+                    callback(int(count * 100 / total))
+        self._set_metadata('codec', (new_codec.name, new_codec.version),
+                           use_txn=False)
+        self._txn_commit()
+        self.codec = new_codec
+
     def _close(self):
         self.dbapi.close()
 
@@ -224,6 +361,15 @@ class DBAPI(DbGeneric):
                    hex(id(self)), transaction.get_description())
         self.transaction = transaction
         self.dbapi.begin()
+        if transaction.batch:
+            try:
+                self._bulk_begin()
+            except:
+                self.dbapi.rollback()
+                self.transaction = None
+                self._bulk = None
+                self._bulk_ids = None
+                raise
         return transaction
 
     def transaction_commit(self, txn):
@@ -239,9 +385,16 @@ class DBAPI(DbGeneric):
                   TXNDEL: "-delete",
                   None: "-delete"}
         if txn.batch:
+            self._bulk_end()
             # FIXME: need a User GUI update callback here:
+            self._drop_indexes(REFERENCE_INDEXES)
             self.reindex_reference_map(lambda percent: percent)
+            self._create_indexes(SECONDARY_INDEXES + REFERENCE_INDEXES)
+            self._update_summaries(self._summary_people,
+                                   self._summary_events)
+        self._update_serial()
         self.dbapi.commit()
+        self.generation += 1
         if not txn.batch:
             # Now, emit signals:
             # do deletes and adds first
@@ -272,6 +425,12 @@ class DBAPI(DbGeneric):
         """
         Executed after a batch operation abort.
         """
+        # Buffered rows are discarded, and the dropped indexes are
+        # restored by the rollback.
+        self._bulk = None
+        self._bulk_ids = None
+        self._summary_people = set()
+        self._summary_events = set()
         self.dbapi.rollback()
         self.transaction = None
         txn.clear()
@@ -299,12 +458,14 @@ class DBAPI(DbGeneric):
         else:
             return default
 
-    def _set_metadata(self, key, value):
+    def _set_metadata(self, key, value, use_txn=True):
         """
         key: string
         value: item, will be serialized here
+        use_txn: if False, the caller is responsible for the transaction
         """
-        self._txn_begin()
+        if use_txn:
+            self._txn_begin()
         self.dbapi.execute("SELECT 1 FROM metadata WHERE setting = ?", [key])
         row = self.dbapi.fetchone()
         if row:
@@ -315,7 +476,8 @@ class DBAPI(DbGeneric):
             self.dbapi.execute(
                 "INSERT INTO metadata (setting, value) VALUES (?, ?)",
                 [key, pickle.dumps(value)])
-        self._txn_commit()
+        if use_txn:
+            self._txn_commit()
 
     def get_name_group_keys(self):
         """
@@ -347,6 +509,7 @@ class DBAPI(DbGeneric):
         :param locale: The locale to use for collation.
         :type locale: A GrampsLocale object.
         """
+        self._bulk_flush()
         if sort_handles:
             if locale != glocale:
                 self.dbapi.check_collation(locale)
@@ -369,6 +532,7 @@ class DBAPI(DbGeneric):
         :param locale: The locale to use for collation.
         :type locale: A GrampsLocale object.
         """
+        self._bulk_flush()
         if sort_handles:
             if locale != glocale:
                 self.dbapi.check_collation(locale)
@@ -399,6 +563,7 @@ class DBAPI(DbGeneric):
         Return a list of database handles, one handle for each Event in the
         database.
         """
+        self._bulk_flush()
         self.dbapi.execute("SELECT handle FROM event")
         rows = self.dbapi.fetchall()
         return [row[0] for row in rows]
@@ -413,6 +578,7 @@ class DBAPI(DbGeneric):
         :param locale: The locale to use for collation.
         :type locale: A GrampsLocale object.
         """
+        self._bulk_flush()
         if sort_handles:
             if locale != glocale:
                 self.dbapi.check_collation(locale)
@@ -435,6 +601,7 @@ class DBAPI(DbGeneric):
         :param locale: The locale to use for collation.
         :type locale: A GrampsLocale object.
         """
+        self._bulk_flush()
         if sort_handles:
             if locale != glocale:
                 self.dbapi.check_collation(locale)
@@ -457,6 +624,7 @@ class DBAPI(DbGeneric):
         :param locale: The locale to use for collation.
         :type locale: A GrampsLocale object.
         """
+        self._bulk_flush()
         if sort_handles:
             if locale != glocale:
                 self.dbapi.check_collation(locale)
@@ -474,6 +642,7 @@ class DBAPI(DbGeneric):
         Return a list of database handles, one handle for each Repository in
         the database.
         """
+        self._bulk_flush()
         self.dbapi.execute("SELECT handle FROM repository")
         rows = self.dbapi.fetchall()
         return [row[0] for row in rows]
@@ -488,6 +657,7 @@ class DBAPI(DbGeneric):
         :param locale: The locale to use for collation.
         :type locale: A GrampsLocale object.
         """
+        self._bulk_flush()
         if sort_handles:
             if locale != glocale:
                 self.dbapi.check_collation(locale)
@@ -505,6 +675,7 @@ class DBAPI(DbGeneric):
         Return a list of database handles, one handle for each Note in the
         database.
         """
+        self._bulk_flush()
         self.dbapi.execute("SELECT handle FROM note")
         rows = self.dbapi.fetchall()
         return [row[0] for row in rows]
@@ -519,6 +690,7 @@ class DBAPI(DbGeneric):
         :param locale: The locale to use for collation.
         :type locale: A GrampsLocale object.
         """
+        self._bulk_flush()
         if sort_handles:
             if locale != glocale:
                 self.dbapi.check_collation(locale)
@@ -537,13 +709,15 @@ class DBAPI(DbGeneric):
 
         If no such Tag exists, None is returned.
         """
+        self._bulk_flush()
         self.dbapi.execute("SELECT blob_data FROM tag WHERE name = ?", [name])
         row = self.dbapi.fetchone()
         if row:
-            return Tag.create(pickle.loads(row[0]))
+            return Tag.create(self.codec.decode(row[0]))
         return None
 
     def _get_number_of(self, obj_key):
+        self._bulk_flush()
         table = KEY_TO_NAME_MAP[obj_key]
         sql = "SELECT count(1) FROM %s" % table
         self.dbapi.execute(sql)
@@ -583,22 +757,27 @@ class DBAPI(DbGeneric):
         obj.change = int(change_time or time.time())
         table = KEY_TO_NAME_MAP[obj_key]
 
+        if trans.batch and self._bulk is not None:
+            return self._bulk_commit(obj, obj_key)
+
         if self._has_handle(obj_key, obj.handle):
             old_data = self._get_raw_data(obj_key, obj.handle)
             # update the object:
             sql = "UPDATE %s SET blob_data = ? WHERE handle = ?" % table
             self.dbapi.execute(sql,
-                               [pickle.dumps(obj.serialize()),
+                               [self._encode(obj),
                                 obj.handle])
         else:
             # Insert the object:
             sql = ("INSERT INTO %s (handle, blob_data) VALUES (?, ?)") % table
             self.dbapi.execute(sql,
                                [obj.handle,
-                                pickle.dumps(obj.serialize())])
+                                self._encode(obj)])
         self._update_secondary_values(obj)
         if not trans.batch:
             self._update_backlinks(obj, trans)
+            if obj_key == EVENT_KEY:
+                self._update_summaries((), [obj.handle])
             if old_data:
                 trans.add(obj_key, TXNUPD, obj.handle,
                           old_data,
@@ -610,6 +789,89 @@ class DBAPI(DbGeneric):
 
         return old_data
 
+    def _bulk_begin(self):
+        """
+        Enter bulk-load mode for a batch transaction.
+
+        Commits are buffered and written in groups with executemany, and the
+        secondary indexes are dropped until the transaction is committed.
+        """
+        self._bulk = {}
+        self._bulk_ids = {}
+        self._bulk_count = 0
+        self._summary_people = set()
+        self._summary_events = set()
+        self._drop_indexes(SECONDARY_INDEXES)
+
+    def _bulk_end(self):
+        """
+        Leave bulk-load mode, writing any rows still in the buffer.
+        """
+        if self._bulk is not None:
+            self._bulk_flush()
+        self._bulk = None
+        self._bulk_ids = None
+
+    def _bulk_commit(self, obj, obj_key):
+        """
+        Buffer an object committed in a batch transaction.
+
+        Returns the previous data of the object, if any.
+        """
+        rows = self._bulk.setdefault(obj_key, {})
+        if obj_key == PERSON_KEY:
+            self._summary_people.add(obj.handle)
+        elif obj_key == EVENT_KEY:
+            self._summary_events.add(obj.handle)
+        if obj.handle in rows:
+            blob, values, exists = rows[obj.handle]
+            old_data = self.codec.decode(blob)
+        else:
+            old_data = self._get_raw_data(obj_key, obj.handle)
+            exists = old_data is not None
+            self._bulk_count += 1
+        rows[obj.handle] = (self._encode(obj),
+                            self._get_secondary_values(obj),
+                            exists)
+        gramps_id = getattr(obj, 'gramps_id', None)
+        if gramps_id:
+            self._bulk_ids.setdefault(obj_key, set()).add(gramps_id)
+        if self._bulk_count >= ARRAYSIZE:
+            self._bulk_flush()
+        return old_data
+
+    def _bulk_flush(self):
+        """
+        Write the rows buffered by a batch transaction to the database.
+        """
+        if not self._bulk:
+            return
+        for obj_key, rows in self._bulk.items():
+            table = KEY_TO_NAME_MAP[obj_key]
+            columns = self._get_secondary_columns(KEY_TO_CLASS_MAP[obj_key])
+            inserts = []
+            updates = []
+            for handle, (blob, values, exists) in rows.items():
+                if exists:
+                    updates.append([blob] + values + [handle])
+                else:
+                    inserts.append([handle, blob] + values)
+            if inserts:
+                self.dbapi.executemany(
+                    "INSERT INTO %s (handle, blob_data, %s) VALUES (%s)"
+                    % (table, ", ".join(columns),
+                       ", ".join(["?"] * (len(columns) + 2))),
+                    inserts)
+            if updates:
+                self.dbapi.executemany(
+                    "UPDATE %s SET blob_data = ?, %s WHERE handle = ?"
+                    % (table, ", ".join(["%s = ?" % column
+                                         for column in columns])),
+                    updates)
+        self._bulk = {}
+        self._bulk_ids = {}
+        self._bulk_count = 0
+
     def _update_backlinks(self, obj, transaction):
 
         # Find existing references
@@ -626,17 +888,21 @@ class DBAPI(DbGeneric):
                                                             current_references)
         new_references = current_references.difference(existing_references)
 
-        # Delete the existing references
-        self.dbapi.execute("DELETE FROM reference WHERE obj_handle = ?",
-                           [obj.handle])
-
-        # Now, add the current ones
-        for (ref_class_name, ref_handle) in current_references:
-            sql = ("INSERT INTO reference " +
-                   "(obj_handle, obj_class, ref_handle, ref_class)" +
-                   "VALUES(?, ?, ?, ?)")
-            self.dbapi.execute(sql, [obj.handle, obj.__class__.__name__,
-                                     ref_handle, ref_class_name])
+        # Only touch the rows that have changed
+        if no_longer_required_references:
+            self.dbapi.executemany(
+                "DELETE FROM reference "
+                "WHERE obj_handle = ? AND ref_handle = ?",
+                [(obj.handle, ref_handle) for (ref_class_name, ref_handle)
+                 in no_longer_required_references])
+        if new_references:
+            self.dbapi.executemany(
+                "INSERT INTO reference "
+                "(obj_handle, obj_class, ref_handle, ref_class) "
+                "VALUES (?, ?, ?, ?)",
+                [(obj.handle, obj.__class__.__name__,
+                  ref_handle, ref_class_name)
+                 for (ref_class_name, ref_handle) in new_references])
 
         if not transaction.batch:
             # Add new references to the transaction
@@ -656,6 +922,7 @@ class DBAPI(DbGeneric):
     def _do_remove(self, handle, transaction, obj_key):
         if self.readonly or not handle:
             return
+        self._bulk_flush()
         if self._has_handle(obj_key, handle):
             data = self._get_raw_data(obj_key, handle)
             obj_class = KEY_TO_CLASS_MAP[obj_key]
@@ -663,6 +930,11 @@ class DBAPI(DbGeneric):
             table = KEY_TO_NAME_MAP[obj_key]
             sql = "DELETE FROM %s WHERE handle = ?" % table
             self.dbapi.execute(sql, [handle])
+            if obj_key == EVENT_KEY:
+                if transaction.batch:
+                    self._summary_events.add(handle)
+                else:
+                    self._update_summaries((), [handle])
             if not transaction.batch:
                 transaction.add(obj_key, TXNDEL, handle, data, None)
 
@@ -710,10 +982,30 @@ class DBAPI(DbGeneric):
             if (include_classes is None) or (row[0] in include_classes):
                 yield (row[0], row[1])
 
+    def select_handles(self, class_name, where, params):
+        """
+        Return the handles of the objects of a class which match an SQL
+        condition on the secondary columns of its table.
+
+        :param class_name: name of the primary object class.
+        :type class_name: str
+        :param where: SQL WHERE clause with ? placeholders.
+        :type where: str
+        :param params: values of the placeholders.
+        :type params: list
+        :returns: list of handles.
+        """
+        self._bulk_flush()
+        self.dbapi.execute("SELECT handle FROM %s WHERE %s"
+                           % (class_name.lower(), where), params)
+        rows = self.dbapi.fetchall()
+        return [row[0] for row in rows]
+
     def find_initial_person(self):
         """
         Returns first person in the database
         """
+        self._bulk_flush()
         handle = self.get_default_handle()
         person = None
         if handle:
@@ -729,6 +1021,7 @@ class DBAPI(DbGeneric):
         """
         Return an iterator over handles in the database
         """
+        self._bulk_flush()
         table = KEY_TO_NAME_MAP[obj_key]
         sql = "SELECT handle FROM %s" % table
         self.dbapi.execute(sql)
@@ -740,6 +1033,7 @@ class DBAPI(DbGeneric):
         """
         Return an iterator over raw data in the database.
         """
+        self._bulk_flush()
         table = KEY_TO_NAME_MAP[obj_key]
         sql = "SELECT handle, blob_data FROM %s" % table
         with self.dbapi.cursor() as cursor:
@@ -747,13 +1041,14 @@ class DBAPI(DbGeneric):
             rows = cursor.fetchmany()
             while rows:
                 for row in rows:
-                    yield (row[0], pickle.loads(row[1]))
+                    yield (row[0], self.codec.decode(row[1]))
                 rows = cursor.fetchmany()
 
     def _iter_raw_place_tree_data(self):
         """
         Return an iterator over raw data in the place hierarchy.
         """
+        self._bulk_flush()
         to_do = ['']
         sql = 'SELECT handle, blob_data FROM place WHERE enclosed_by = ?'
         while to_do:
@@ -762,13 +1057,14 @@ class DBAPI(DbGeneric):
             rows = self.dbapi.fetchall()
             for row in rows:
                 to_do.append(row[0])
-                yield (row[0], pickle.loads(row[1]))
+                yield (row[0], self.codec.decode(row[1]))
 
     def reindex_reference_map(self, callback):
         """
         Reindex all primary records in the database.
         """
         callback(4)
+        self._txn_begin()
         self.dbapi.execute("DELETE FROM reference")
         primary_table = (
             (self.get_person_cursor, Person),
@@ -791,15 +1087,15 @@ class DBAPI(DbGeneric):
                     obj = class_func.create(val)
                     references = set(obj.get_referenced_handles_recursively())
                     # handle addition of new references
-                    for (ref_class_name, ref_handle) in references:
-                        self.dbapi.execute(
+                    if references:
+                        self.dbapi.executemany(
                             "INSERT INTO reference "
                             "(obj_handle, obj_class, ref_handle, ref_class) "
                             "VALUES (?, ?, ?, ?)",
-                            [obj.handle,
-                             obj.__class__.__name__,
-                             ref_handle,
-                             ref_class_name])
+                            [(obj.handle, obj.__class__.__name__,
+                              ref_handle, ref_class_name)
+                             for (ref_class_name, ref_handle) in references])
+        self._txn_commit()
         callback(5)
 
     def rebuild_secondary(self, update):
@@ -813,18 +1109,23 @@ class DBAPI(DbGeneric):
         self.genderStats = GenderStats(gstats)
 
     def _has_handle(self, obj_key, handle):
+        if self._bulk and handle in self._bulk.get(obj_key, ()):
+            return True
         table = KEY_TO_NAME_MAP[obj_key]
         sql = "SELECT 1 FROM %s WHERE handle = ?" % table
         self.dbapi.execute(sql, [handle])
         return self.dbapi.fetchone() is not None
 
     def _has_gramps_id(self, obj_key, gramps_id):
+        if self._bulk_ids and gramps_id in self._bulk_ids.get(obj_key, ()):
+            return True
         table = KEY_TO_NAME_MAP[obj_key]
         sql = "SELECT 1 FROM %s WHERE gramps_id = ?" % table
         self.dbapi.execute(sql, [gramps_id])
         return self.dbapi.fetchone() != None
 
     def _get_gramps_ids(self, obj_key):
+        self._bulk_flush()
         table = KEY_TO_NAME_MAP[obj_key]
         sql = "SELECT gramps_id FROM %s" % table
         self.dbapi.execute(sql)
@@ -832,20 +1133,23 @@ class DBAPI(DbGeneric):
         return [row[0] for row in rows]
 
     def _get_raw_data(self, obj_key, handle):
+        if self._bulk and handle in self._bulk.get(obj_key, ()):
+            return self.codec.decode(self._bulk[obj_key][handle][0])
         table = KEY_TO_NAME_MAP[obj_key]
         sql = "SELECT blob_data FROM %s WHERE handle = ?" % table
         self.dbapi.execute(sql, [handle])
         row = self.dbapi.fetchone()
         if row:
-            return pickle.loads(row[0])
+            return self.codec.decode(row[0])
 
     def _get_raw_from_id_data(self, obj_key, gramps_id):
+        self._bulk_flush()
         table = KEY_TO_NAME_MAP[obj_key]
         sql = "SELECT blob_data FROM %s WHERE gramps_id = ?" % table
         self.dbapi.execute(sql, [gramps_id])
         row = self.dbapi.fetchone()
         if row:
-            return pickle.loads(row[0])
+            return self.codec.decode(row[0])
 
     def get_gender_stats(self):
         """
@@ -874,6 +1178,7 @@ class DBAPI(DbGeneric):
         """
         Return the list of locale-sorted surnames contained in the database.
         """
+        self._bulk_flush()
         self.dbapi.execute("SELECT DISTINCT surname "
                            "FROM person "
                            "ORDER BY surname")
@@ -913,38 +1218,182 @@ class DBAPI(DbGeneric):
                     self.dbapi.execute("ALTER TABLE %s ADD COLUMN %s %s"
                                        % (table_name, field, sql_type))
 
-    def _update_secondary_values(self, obj):
+    def _get_secondary_fields(self, class_name):
         """
-        Given a primary object update its secondary field values
-        in the database.
-        Does not commit.
+        Return the names of the secondary fields of a primary object class.
+        """
+        fields = self._secondary_fields.get(class_name)
+        if fields is None:
+            cls = self._get_table_func(class_name, "class_func")
+            fields = [field[0] for field in cls.get_secondary_fields()
+                      if field[0] != 'handle']
+            self._secondary_fields[class_name] = fields
+        return fields
+
+    def _get_secondary_columns(self, class_name):
+        """
+        Return the names of the secondary columns of a primary object table,
+        including the derived columns.
+        """
+        columns = list(self._get_secondary_fields(class_name))
+        if class_name == 'Person':
+            columns += ['given_name', 'surname']
+            if self._has_person_summary:
+                columns += [column for column, dummy in PERSON_SUMMARY_COLUMNS]
+        if class_name == 'Place':
+            columns += ['enclosed_by']
+        return columns
+
+    def _get_secondary_values(self, obj):
+        """
+        Given a primary object return its secondary field values, in the
+        order of the columns returned by _get_secondary_columns.
         """
         table = obj.__class__.__name__
-        fields = [field[0] for field in obj.get_secondary_fields()]
-        sets = []
-        values = []
-        for field in fields:
-            sets.append("%s = ?" % field)
-            values.append(getattr(obj, field))
+        values = [getattr(obj, field)
+                  for field in self._get_secondary_fields(table)]
 
         # Derived fields
         if table == 'Person':
             given_name, surname = self._get_person_data(obj)
-            sets.append("given_name = ?")
-            values.append(given_name)
-            sets.append("surname = ?")
-            values.append(surname)
+            values += [given_name, surname]
+            if self._has_person_summary:
+                if self._bulk is None:
+                    values += self._get_person_summary(obj)
+                else:
+                    # The events may still be in the buffer
+                    values += [None] * len(PERSON_SUMMARY_COLUMNS)
         if table == 'Place':
-            handle = self._get_place_data(obj)
-            sets.append("enclosed_by = ?")
-            values.append(handle)
+            values.append(self._get_place_data(obj))
+        return self._sql_cast_list(values)
 
+    def _update_secondary_values(self, obj):
+        """
+        Given a primary object update its secondary field values
+        in the database.
+        Does not commit.
+        """
+        table = obj.__class__.__name__
+        sets = ["%s = ?" % column
+                for column in self._get_secondary_columns(table)]
+        values = self._get_secondary_values(obj)
         if len(values) > 0:
             table_name = table.lower()
             self.dbapi.execute("UPDATE %s SET %s where handle = ?"
                                % (table_name, ", ".join(sets)),
-                               self._sql_cast_list(values)
-                               + [obj.handle])
+                               values + [obj.handle])
+
+    def _create_summary_columns(self):
+        """
+        Create the person summary columns.
+        """
+        for column, sql_type in PERSON_SUMMARY_COLUMNS:
+            self.dbapi.execute("ALTER TABLE person ADD COLUMN %s %s"
+                               % (column, sql_type))
+
+    def _get_person_summary(self, person):
+        """
+        Given a Person, return the values of the person summary columns.
+
+        The events are chosen like in the person views: if there is no
+        birth or death event, the first primary fallback event with a date
+        is used for the date, and the first one with a place for the place.
+        """
+        values = []
+        for event_ref, is_fallback in (
+                (person.get_birth_ref(), EventType.is_birth_fallback),
+                (person.get_death_ref(), EventType.is_death_fallback)):
+            if event_ref:
+                event = self._get_summary_event(event_ref.ref)
+                values += [event_ref.ref,
+                           event and event.get_date_object().get_sort_value(),
+                           0]
+            else:
+                event = None
+                values += next(
+                    ([handle, fallback.get_date_object().get_sort_value(), 1]
+                     for handle, fallback in self._iter_fallback_events(
+                         person, is_fallback)
+                     if not fallback.get_date_object().is_empty()),
+                    [None, None, 0])
+            if event and event.get_place_handle():
+                values += [event_ref.ref, 0]
+            elif event_ref and not event:
+                values += [None, 0]
+            else:
+                values += next(
+                    ([handle, 1]
+                     for handle, fallback in self._iter_fallback_events(
+                         person, is_fallback)
+                     if fallback.get_place_handle()),
+                    [None, 0])
+        return values
+
+    def _iter_fallback_events(self, person, is_fallback):
+        """
+        Iterate over the (handle, event) of the primary events of a person
+        which are birth or death fallbacks.
+        """
+        for event_ref in person.get_primary_event_ref_list():
+            event = self._get_summary_event(event_ref.ref)
+            if event and is_fallback(event.get_type()):
+                yield event_ref.ref, event
+
+    def _get_summary_event(self, handle):
+        data = self._get_raw_data(EVENT_KEY, handle)
+        return Event.create(data) if data else None
+
+    def _update_summaries(self, person_handles, event_handles):
+        """
+        Update the person summaries of some persons, and of the persons
+        who refer to some events.
+        """
+        if not self._has_person_summary:
+            return
+        handles = set(person_handles)
+        event_handles = list(event_handles)
+        for start in range(0, len(event_handles), ARRAYSIZE):
+            chunk = event_handles[start:start + ARRAYSIZE]
+            self.dbapi.execute(
+                "SELECT DISTINCT obj_handle FROM reference "
+                "WHERE obj_class = 'Person' AND ref_handle IN (%s)"
+                % ", ".join(["?"] * len(chunk)), chunk)
+            handles.update(row[0] for row in self.dbapi.fetchall())
+        self._update_person_summaries(list(handles))
+
+    def _update_person_summaries(self, handles):
+        """
+        Update the person summaries of the given persons.
+        """
+        sets = ", ".join("%s = ?" % column
+                         for column, dummy in PERSON_SUMMARY_COLUMNS)
+        for start in range(0, len(handles), ARRAYSIZE):
+            rows = []
+            for handle in handles[start:start + ARRAYSIZE]:
+                data = self._get_raw_data(PERSON_KEY, handle)
+                if data:
+                    person = Person.create(data)
+                    rows.append(self._get_person_summary(person) + [handle])
+            self.dbapi.executemany("UPDATE person SET %s WHERE handle = ?"
+                                   % sets, rows)
+
+    def get_person_summary(self, handle):
+        """
+        Return the summary of the events shown as the birth and the death
+        of a person, as a dictionary with the names of the
+        PERSON_SUMMARY_COLUMNS as keys.
+        """
+        if not self._has_person_summary:
+            return None
+        self.dbapi.execute("SELECT %s FROM person WHERE handle = ?"
+                           % ", ".join(column for column, dummy
+                                       in PERSON_SUMMARY_COLUMNS),
+                           [handle])
+        row = self.dbapi.fetchone()
+        if row is None:
+            return None
+        return {column: value for (column, dummy), value
+                in zip(PERSON_SUMMARY_COLUMNS, row)}
 
     def _sql_cast_list(self, values):
         """
@@ -40,11 +40,71 @@ import logging
 #-------------------------------------------------------------------------
 from gramps.plugins.db.dbapi.dbapi import DBAPI
 from gramps.gen.db.dbconst import ARRAYSIZE
+from gramps.gen.config import config
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 _ = glocale.translation.gettext
 
 sqlite3.paramstyle = 'qmark'
 
+LOG = logging.getLogger(".sqlite")
+
+#-------------------------------------------------------------------------
+#
+# Connection profiles
+#
+#-------------------------------------------------------------------------
+# The page size only takes effect when a database is created, and must be
+# set before the journal mode.  Cache and mmap sizes are in KiB and MiB.
+PRAGMAS = ('page_size', 'journal_mode', 'synchronous', 'temp_store',
+           'cache_size', 'mmap_size')
+
+PROFILES = {
+    # Durable writes with a rollback journal, but a larger page cache and
+    # memory-mapped reads.
+    'safe': {
+        'page_size': 4096,
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'temp_store': 'MEMORY',
+        'cache_size': 65536,
+        'mmap_size': 256,
+        },
+    # Write-ahead log without syncing.  A crash will not corrupt the
+    # database, but the last transactions may be lost on power failure.
+    'fast-import': {
+        'page_size': 4096,
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'temp_store': 'MEMORY',
+        'cache_size': 262144,
+        'mmap_size': 1024,
+        },
+    }
+
+def get_pragmas():
+    """
+    Return the connection settings for SQLite databases.
+
+    These are the settings of the profile selected by the
+    database.sqlite-profile preference, overridden by any of the
+    individual database.sqlite-* preferences which are set.
+
+    :returns: the settings, keyed by pragma name.
+    :rtype: dict
+    """
+    profile = config.get('database.sqlite-profile')
+    if profile not in PROFILES:
+        LOG.warning("Unknown SQLite profile '%s', using 'safe'", profile)
+        profile = 'safe'
+    pragmas = dict(PROFILES[profile])
+    for (key, unset) in (('journal-mode', ''), ('synchronous', ''),
+                         ('temp-store', ''), ('cache-size', 0),
+                         ('mmap-size', -1), ('page-size', 0)):
+        value = config.get('database.sqlite-' + key)
+        if value != unset:
+            pragmas[key.replace('-', '_')] = value
+    return pragmas
+
 #-------------------------------------------------------------------------
 #
 # SQLite class
@@ -61,6 +121,7 @@ class SQLite(DBAPI):
             _("Database version"): sqlite3.sqlite_version,
             _("Database module version"): sqlite3.version,
             _("Database module location"): sqlite3.__file__,
+            _("Journal mode"): self.dbapi.get_pragma('journal_mode'),
         })
         return summary
 
@@ -70,6 +131,7 @@ class SQLite(DBAPI):
         else:
             path_to_db = os.path.join(directory, 'sqlite.db')
         self.dbapi = Connection(path_to_db)
+        self.dbapi.set_pragmas(get_pragmas())
 
 
 #-------------------------------------------------------------------------
@@ -114,6 +176,43 @@ class Connection:
         if collation not in self.__collations:
             self.__connection.create_collation(collation, locale.strcoll)
 
+    def set_pragmas(self, pragmas):
+        """
+        Apply connection settings.
+
+        Settings which cannot be applied, for example changing the journal
+        mode of a read-only database, are logged and skipped.
+
+        :param pragmas: settings keyed by pragma name.  The cache_size is
+                        in KiB and the mmap_size in MiB.
+        :type pragmas: dict
+        """
+        for pragma in PRAGMAS:
+            if pragma not in pragmas:
+                continue
+            value = pragmas[pragma]
+            if pragma == 'cache_size':
+                value = -int(value)
+            elif pragma == 'mmap_size':
+                value = int(value) * 1024 * 1024
+            try:
+                self.__cursor.execute("PRAGMA %s = %s" % (pragma, value))
+                self.__cursor.fetchall()
+            except sqlite3.Error as err:
+                self.log.warning("Unable to set %s to %s: %s",
+                                 pragma, value, err)
+
+    def get_pragma(self, pragma):
+        """
+        Return the current value of a connection setting.
+
+        :param pragma: name of the pragma.
+        :type pragma: str
+        """
+        self.__cursor.execute("PRAGMA %s" % pragma)
+        row = self.__cursor.fetchone()
+        return row[0] if row else None
+
     def execute(self, *args, **kwargs):
         """
         Executes an SQL statement.
@@ -126,6 +225,23 @@ class Connection:
         self.log.debug(args)
         self.__cursor.execute(*args, **kwargs)
 
+    def executemany(self, *args, **kwargs):
+        """
+        Executes an SQL statement once for each parameter sequence.
+
+        The statement is compiled once and kept in the statement cache of
+        the connection, so repeated calls with the same SQL are cheap.
+
+        :param args: arguments to be passed to the sqlite3 executemany
+                     statement
+        :type args: list
+        :param kwargs: arguments to be passed to the sqlite3 executemany
+                       statement
+        :type kwargs: list
+        """
+        self.log.debug(args[0])
+        self.__cursor.executemany(*args, **kwargs)
+
     def fetchone(self):
         """
         Fetches the next row of a query result set, returning a single sequence,
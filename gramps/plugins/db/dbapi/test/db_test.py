@@ -23,6 +23,7 @@
 # Standard python modules
 #
 #-------------------------------------------------------------------------
+import sqlite3
 import unittest
 
 #-------------------------------------------------------------------------
@@ -30,10 +31,18 @@ import unittest
 # Gramps modules
 #
 #-------------------------------------------------------------------------
+from gramps.gen.config import config
 from gramps.gen.db import DbTxn
 from gramps.gen.db.utils import make_database
+from gramps.gen.filters import GenericFilter
+from gramps.gen.filters.rules.person import (
+    IsMale, IsFemale, HasIdOf, RegExpIdOf, HasTag, PeoplePrivate,
+    HasNameOf)
 from gramps.gen.lib import (Person, Family, Event, Place, Repository, Source,
-                            Citation, Media, Note, Tag, Researcher, Surname)
+                            Citation, Media, Note, Tag, Researcher, Surname,
+                            EventRef, EventType)
+from gramps.gen.sort import Sort
+from gramps.plugins.db.dbapi.dbapi import PERSON_SUMMARY_COLUMNS
 
 #-------------------------------------------------------------------------
 #
@@ -865,6 +874,419 @@ class DbPersonTest(unittest.TestCase):
         self.assertEqual(saved['John'], (3, 1, 1))
         self.assertEqual(saved['Mary'], (1, 4, 0))
 
+#-------------------------------------------------------------------------
+#
+# DbReferenceTest class
+#
+#-------------------------------------------------------------------------
+class DbReferenceTest(unittest.TestCase):
+    '''
+    Tests of the reference map.
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = make_database("sqlite")
+        cls.db.load(":memory:")
+
+    def setUp(self):
+        with DbTxn('Add test objects', self.db) as trans:
+            self.notes = []
+            for text in ('one', 'two', 'three'):
+                note = Note(text)
+                self.db.add_note(note, trans)
+                self.notes.append(note.handle)
+            self.person = Person()
+            self.person.set_note_list(self.notes[:2])
+            self.db.add_person(self.person, trans)
+
+    def tearDown(self):
+        with DbTxn('Remove test objects', self.db) as trans:
+            self.db.remove_person(self.person.handle, trans)
+            for handle in self.notes:
+                self.db.remove_note(handle, trans)
+
+    def __backlinks(self, handle):
+        return list(self.db.find_backlink_handles(handle))
+
+    def test_add_references(self):
+        backlink = [('Person', self.person.handle)]
+        self.assertEqual(self.__backlinks(self.notes[0]), backlink)
+        self.assertEqual(self.__backlinks(self.notes[1]), backlink)
+        self.assertEqual(self.__backlinks(self.notes[2]), [])
+
+    def test_update_references(self):
+        self.person.set_note_list(self.notes[1:])
+        with DbTxn('Update references', self.db) as trans:
+            self.db.commit_person(self.person, trans)
+        backlink = [('Person', self.person.handle)]
+        self.assertEqual(self.__backlinks(self.notes[0]), [])
+        self.assertEqual(self.__backlinks(self.notes[1]), backlink)
+        self.assertEqual(self.__backlinks(self.notes[2]), backlink)
+
+    def test_undo_references(self):
+        self.person.set_note_list([])
+        with DbTxn('Remove references', self.db) as trans:
+            self.db.commit_person(self.person, trans)
+        self.assertEqual(self.__backlinks(self.notes[0]), [])
+        self.db.undo()
+        backlink = [('Person', self.person.handle)]
+        self.assertEqual(self.__backlinks(self.notes[0]), backlink)
+        self.assertEqual(self.__backlinks(self.notes[1]), backlink)
+
+    def test_reindex_reference_map(self):
+        self.db.reindex_reference_map(lambda percent: percent)
+        backlink = [('Person', self.person.handle)]
+        self.assertEqual(self.__backlinks(self.notes[0]), backlink)
+        self.assertEqual(self.__backlinks(self.notes[2]), [])
+
+#-------------------------------------------------------------------------
+#
+# DbBatchTest class
+#
+#-------------------------------------------------------------------------
+class DbBatchTest(unittest.TestCase):
+    '''
+    Tests of bulk loading in batch transactions.
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = make_database("sqlite")
+        cls.db.load(":memory:")
+
+    def tearDown(self):
+        with DbTxn('Remove test objects', self.db, batch=True) as trans:
+            for handle in self.db.get_person_handles():
+                self.db.remove_person(handle, trans)
+            for handle in self.db.get_note_handles():
+                self.db.remove_note(handle, trans)
+
+    def test_batch_add(self):
+        with DbTxn('Batch add', self.db, batch=True) as trans:
+            note = Note('note')
+            self.db.add_note(note, trans)
+            person = Person()
+            person.gramps_id = 'I0001'
+            person.add_note(note.handle)
+            self.db.add_person(person, trans)
+            # Buffered objects are visible within the transaction
+            self.assertTrue(self.db.has_person_handle(person.handle))
+            self.assertTrue(self.db.has_person_gramps_id('I0001'))
+            person = self.db.get_person_from_handle(person.handle)
+            self.assertEqual(person.get_note_list(), [note.handle])
+            self.assertEqual(self.db.get_number_of_people(), 1)
+            self.assertEqual(self.db.get_person_from_gramps_id('I0001').handle,
+                             person.handle)
+        self.assertEqual(self.db.get_person_handles(), [person.handle])
+        self.assertEqual(list(self.db.find_backlink_handles(note.handle)),
+                         [('Person', person.handle)])
+
+    def test_batch_update(self):
+        person = Person()
+        with DbTxn('Batch add', self.db, batch=True) as trans:
+            for number in range(1500):
+                self.db.add_person(Person(), trans)
+            self.db.add_person(person, trans)
+            person.gender = Person.FEMALE
+            self.db.commit_person(person, trans)
+        with DbTxn('Batch update', self.db, batch=True) as trans:
+            person.gramps_id = 'I9999'
+            self.db.commit_person(person, trans)
+        self.assertEqual(self.db.get_number_of_people(), 1501)
+        person = self.db.get_person_from_gramps_id('I9999')
+        self.assertEqual(person.gender, Person.FEMALE)
+
+    def test_batch_indexes(self):
+        with DbTxn('Batch add', self.db, batch=True) as trans:
+            self.db.add_person(Person(), trans)
+        self.db.dbapi.execute("SELECT name FROM sqlite_master "
+                              "WHERE type = 'index'")
+        indexes = [row[0] for row in self.db.dbapi.fetchall()]
+        self.assertIn('person_surname', indexes)
+        self.assertIn('reference_obj_handle', indexes)
+
+    def test_batch_open_cursor(self):
+        with DbTxn('Add people', self.db) as trans:
+            for number in range(200):
+                self.db.add_person(Person(), trans)
+        # The indexes cannot be dropped while the cursor reads the table
+        with self.db.get_person_cursor() as cursor:
+            next(iter(cursor))
+            with DbTxn('Batch add', self.db, batch=True) as trans:
+                person = Person()
+                self.db.add_person(person, trans)
+        self.assertTrue(self.db.has_person_handle(person.handle))
+        with DbTxn('Add person', self.db) as trans:
+            self.db.add_person(Person(), trans)
+        self.assertEqual(self.db.get_number_of_people(), 202)
+
+    def test_batch_begin_error(self):
+        bulk_begin = self.db._bulk_begin
+        def fail():
+            raise sqlite3.OperationalError('database table is locked')
+        self.db._bulk_begin = fail
+        try:
+            with self.assertRaises(sqlite3.OperationalError):
+                with DbTxn('Batch add', self.db, batch=True) as trans:
+                    pass
+        finally:
+            del self.db._bulk_begin
+        self.assertIsNone(self.db.transaction)
+        self.assertIsNone(self.db._bulk)
+        with DbTxn('Add person', self.db) as trans:
+            self.db.add_person(Person(), trans)
+        self.assertEqual(self.db.get_number_of_people(), 1)
+
+#-------------------------------------------------------------------------
+#
+# DbPersonSummaryTest class
+#
+#-------------------------------------------------------------------------
+class DbPersonSummaryTest(unittest.TestCase):
+    '''
+    Tests of the summary of the birth and death events of the persons.
+    '''
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+
+    def tearDown(self):
+        self.db.close()
+
+    def add_person(self, events, trans):
+        """
+        Add a person with (type, year, place) events.
+        """
+        person = Person()
+        for event_type, year, place in events:
+            event = Event()
+            event.set_type(event_type)
+            if year:
+                event.get_date_object().set_yr_mon_day(year, 0, 0)
+            if place:
+                event.set_place_handle(place)
+            self.db.add_event(event, trans)
+            event_ref = EventRef()
+            event_ref.set_reference_handle(event.handle)
+            person.add_event_ref(event_ref)
+            if event_type == EventType.BIRTH:
+                person.set_birth_ref(event_ref)
+        self.db.add_person(person, trans)
+        return person
+
+    def test_summary(self):
+        with DbTxn('Add places', self.db) as trans:
+            place = self.db.add_place(Place(), trans)
+        with DbTxn('Add people', self.db) as trans:
+            born = self.add_person([(EventType.BIRTH, 1900, None),
+                                    (EventType.BAPTISM, 1901, place)],
+                                   trans)
+            baptised = self.add_person([(EventType.BAPTISM, None, place),
+                                        (EventType.CHRISTEN, 1902, None),
+                                        (EventType.BURIAL, 1950, place)],
+                                       trans)
+        summary = self.db.get_person_summary(born.handle)
+        birth, baptism = [ref.ref for ref in born.get_event_ref_list()]
+        self.assertEqual(summary['birth_ref'], birth)
+        self.assertEqual(summary['birth_fallback'], 0)
+        self.assertEqual(summary['birth_place_ref'], baptism)
+        self.assertEqual(summary['birth_place_fallback'], 1)
+        self.assertIsNone(summary['death_ref'])
+
+        summary = self.db.get_person_summary(baptised.handle)
+        baptism, christening, burial = [
+            ref.ref for ref in baptised.get_event_ref_list()]
+        self.assertEqual(summary['birth_ref'], christening)
+        self.assertEqual(summary['birth_fallback'], 1)
+        self.assertEqual(summary['birth_place_ref'], baptism)
+        self.assertEqual(summary['death_ref'], burial)
+        self.assertEqual(summary['death_place_ref'], burial)
+
+        # Changes of the events update the summary
+        sortval = summary['death_sortval']
+        with DbTxn('Edit event', self.db) as trans:
+            event = self.db.get_event_from_handle(burial)
+            event.get_date_object().set_yr_mon_day(1960, 0, 0)
+            self.db.commit_event(event, trans)
+        self.assertGreater(
+            self.db.get_person_summary(baptised.handle)['death_sortval'],
+            sortval)
+        self.db.undo()
+        self.assertEqual(
+            self.db.get_person_summary(baptised.handle)['death_sortval'],
+            sortval)
+
+        sort = Sort(self.db)
+        self.assertEqual(sorted([baptised.handle, born.handle],
+                                key=sort.by_birthdate_key),
+                         [born.handle, baptised.handle])
+
+    def test_batch(self):
+        with DbTxn('Batch add', self.db, batch=True) as trans:
+            person = Person()
+            self.db.add_person(person, trans)
+            event = Event()
+            event.set_type(EventType.BIRTH)
+            event.get_date_object().set_yr_mon_day(1900, 0, 0)
+            self.db.add_event(event, trans)
+            event_ref = EventRef()
+            event_ref.set_reference_handle(event.handle)
+            person.add_event_ref(event_ref)
+            person.set_birth_ref(event_ref)
+            self.db.commit_person(person, trans)
+        summary = self.db.get_person_summary(person.handle)
+        self.assertEqual(summary['birth_ref'], event.handle)
+        self.assertEqual(summary['birth_sortval'],
+                         event.get_date_object().get_sort_value())
+
+    @unittest.skipIf(sqlite3.sqlite_version_info < (3, 35, 0),
+                     "DROP COLUMN needs SQLite 3.35")
+    def test_upgrade(self):
+        with DbTxn('Add people', self.db) as trans:
+            person = self.add_person([(EventType.BIRTH, 1900, None)], trans)
+        for column, dummy in PERSON_SUMMARY_COLUMNS:
+            self.db.dbapi.execute("ALTER TABLE person DROP COLUMN %s"
+                                  % column)
+        self.db._set_metadata('person_summary', 0)
+        self.db._has_person_summary = False
+        self.assertIsNone(self.db.get_person_summary(person.handle))
+        self.db._upgrade_person_summary()
+        summary = self.db.get_person_summary(person.handle)
+        self.assertEqual(summary['birth_ref'], person.get_birth_ref().ref)
+
+#-------------------------------------------------------------------------
+#
+# DbCodecTest class
+#
+#-------------------------------------------------------------------------
+class DbCodecTest(unittest.TestCase):
+    '''
+    Tests of the blob data codecs.
+    '''
+
+    def setUp(self):
+        config.set('database.blob-codec', 'json')
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        config.set('database.blob-codec',
+                   config.get_default('database.blob-codec'))
+        with DbTxn('Add test objects', self.db) as trans:
+            self.person = Person()
+            self.person.gramps_id = 'I0001'
+            self.person.primary_name.first_name = 'John'
+            self.db.add_person(self.person, trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def __stored(self):
+        self.db.dbapi.execute("SELECT blob_data FROM person")
+        return self.db.dbapi.fetchone()[0]
+
+    def test_json_codec(self):
+        self.assertEqual(self.db.codec.name, 'json')
+        self.assertIn('"gramps_id": "I0001"', self.__stored())
+        person = self.db.get_person_from_handle(self.person.handle)
+        self.assertEqual(person.serialize(), self.person.serialize())
+
+    def test_json_undo(self):
+        self.person.primary_name.first_name = 'Jack'
+        with DbTxn('Edit person', self.db) as trans:
+            self.db.commit_person(self.person, trans)
+        self.db.undo()
+        person = self.db.get_person_from_handle(self.person.handle)
+        self.assertEqual(person.primary_name.first_name, 'John')
+
+    def test_set_codec(self):
+        percent = []
+        self.db.set_codec('pickle', percent.append)
+        self.assertEqual(self.db.codec.name, 'pickle')
+        self.assertEqual(self.db._get_metadata('codec'), ('pickle', 1))
+        self.assertEqual(percent[-1], 100)
+        self.assertIsInstance(self.__stored(), bytes)
+        person = self.db.get_person_from_handle(self.person.handle)
+        self.assertEqual(person.serialize(), self.person.serialize())
+
+
+#-------------------------------------------------------------------------
+#
+# DbFilterTest class
+#
+#-------------------------------------------------------------------------
+class DbFilterTest(unittest.TestCase):
+    '''
+    Tests of filter rules evaluated in SQL.
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = make_database("sqlite")
+        cls.db.load(":memory:")
+        with DbTxn('Add test objects', cls.db) as trans:
+            tag = Tag()
+            tag.set_name('ToDo')
+            cls.db.add_tag(tag, trans)
+            for num, (gender, name) in enumerate(((Person.MALE, 'John'),
+                                                  (Person.FEMALE, 'Mary'),
+                                                  (Person.MALE, 'Jack'),
+                                                  (Person.UNKNOWN, 'Joan'))):
+                person = Person()
+                person.gramps_id = 'I%04d' % num
+                person.set_gender(gender)
+                person.primary_name.first_name = name
+                surname = Surname()
+                surname.set_surname('Smith')
+                person.primary_name.add_surname(surname)
+                person.set_privacy(num % 2 == 1)
+                if num < 2:
+                    person.add_tag(tag.handle)
+                cls.db.add_person(person, trans)
+
+    def __check(self, rules, logical_op='and', invert=False):
+        filter_ = GenericFilter()
+        filter_.set_rules(rules)
+        filter_.set_logical_op(logical_op)
+        filter_.set_invert(invert)
+        handles = self.db.get_person_handles()
+        expected = filter_.apply(self.db, handles)
+        result = filter_.apply(self.db)
+        self.assertEqual(set(result), set(expected))
+        return len(result)
+
+    def test_and(self):
+        self.assertEqual(self.__check([IsMale([])]), 2)
+        self.assertEqual(self.__check([IsMale([]), HasTag(['ToDo'])]), 1)
+        self.assertEqual(self.__check([IsFemale([]), PeoplePrivate([])]), 1)
+        self.assertEqual(self.__check([HasIdOf(['I0002'])]), 1)
+        self.assertEqual(self.__check([RegExpIdOf(['i000[12]'], True)]), 2)
+        self.assertEqual(self.__check([RegExpIdOf(['0.'])]), 0)
+        self.assertEqual(self.__check([HasTag(['Missing'])]), 0)
+
+    def test_and_python(self):
+        rules = [IsMale([]), HasNameOf(['Jack'] + [''] * 10)]
+        self.assertEqual(self.__check(rules), 1)
+
+    def test_or(self):
+        rules = [IsFemale([]), HasIdOf(['I0000'])]
+        self.assertEqual(self.__check(rules, 'or'), 2)
+        rules = [IsFemale([]), HasNameOf(['Jack'] + [''] * 10)]
+        self.assertEqual(self.__check(rules, 'or'), 2)
+
+    def test_invert(self):
+        self.assertEqual(self.__check([IsMale([])], invert=True), 2)
+        rules = [IsMale([]), HasNameOf(['Jack'] + [''] * 10)]
+        self.assertEqual(self.__check(rules, invert=True), 3)
+        rules = [IsFemale([]), HasIdOf(['I0000'])]
+        self.assertEqual(self.__check(rules, 'or', True), 2)
+
+    def test_select_handles(self):
+        handles = self.db.select_handles('Person', 'gender = ?',
+                                         [Person.FEMALE])
+        person = self.db.get_person_from_handle(handles[0])
+        self.assertEqual(person.gramps_id, 'I0001')
+
 
 if __name__ == "__main__":
     unittest.main()
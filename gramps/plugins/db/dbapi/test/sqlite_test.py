@@ -0,0 +1,86 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+#-------------------------------------------------------------------------
+#
+# Standard python modules
+#
+#-------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from gramps.gen.config import config
+from ..sqlite import Connection, get_pragmas, PROFILES
+
+#-------------------------------------------------------------------------
+#
+# ProfileTest class
+#
+#-------------------------------------------------------------------------
+class ProfileTest(unittest.TestCase):
+    '''
+    Tests of the SQLite connection profiles.
+    '''
+
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.conn = Connection(os.path.join(self.dirname, 'sqlite.db'))
+
+    def tearDown(self):
+        self.conn.close()
+        shutil.rmtree(self.dirname)
+        config.set('database.sqlite-profile',
+                   config.get_default('database.sqlite-profile'))
+        config.set('database.sqlite-cache-size',
+                   config.get_default('database.sqlite-cache-size'))
+
+    def test_safe_profile(self):
+        self.conn.set_pragmas(PROFILES['safe'])
+        self.assertEqual(self.conn.get_pragma('journal_mode'), 'delete')
+        self.assertEqual(self.conn.get_pragma('synchronous'), 2)
+        self.assertEqual(self.conn.get_pragma('cache_size'), -65536)
+
+    def test_fast_import_profile(self):
+        self.conn.set_pragmas(PROFILES['fast-import'])
+        self.assertEqual(self.conn.get_pragma('journal_mode'), 'wal')
+        self.assertEqual(self.conn.get_pragma('synchronous'), 0)
+        self.assertEqual(self.conn.get_pragma('temp_store'), 2)
+
+    def test_config_override(self):
+        config.set('database.sqlite-profile', 'fast-import')
+        config.set('database.sqlite-cache-size', 1024)
+        pragmas = get_pragmas()
+        self.assertEqual(pragmas['journal_mode'], 'WAL')
+        self.assertEqual(pragmas['cache_size'], 1024)
+
+    def test_unknown_profile(self):
+        config.set('database.sqlite-profile', 'unknown')
+        self.assertEqual(get_pragmas(), PROFILES['safe'])
+
+
+if __name__ == "__main__":
+    unittest.main()
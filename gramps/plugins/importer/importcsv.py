@@ -55,7 +55,7 @@ from gramps.gen.lib import (ChildRef, Citation, Event, EventRef, EventType,
                             NoteType, Person, Place, Source, Surname, Tag,
                             PlaceName, PlaceType, PlaceRef)
 from gramps.gen.db import DbTxn
-from gramps.gen.datehandler import parser as _dp
+from gramps.gen.datehandler import cached_parser as _dp
 from gramps.gen.utils.string import gender as gender_map
 from gramps.gen.utils.id import create_id
 from gramps.gen.utils.location import located_in
@@ -31,6 +31,8 @@
 import os
 import sys
 import time
+import queue
+import threading
 from xml.parsers.expat import ExpatError, ParserCreate
 from xml.sax.saxutils import escape
 from gramps.gen.const import URL_WIKISTRING
@@ -90,6 +92,15 @@ except:
 
 PERSON_RE = re.compile(r"\s*\<person\s(.*)$")
 
+# Size of the chunks of the file read ahead of the parser
+CHUNK_SIZE = 256 * 1024
+
+# Number of chunks read ahead of the parser
+MAX_CHUNKS = 8
+
+# Seconds between the updates of the throughput
+THROUGHPUT_INTERVAL = 1
+
 CHILD_REL_MAP = {
     "Birth"     : ChildRefType(ChildRefType.BIRTH),
     "Adopted"   : ChildRefType(ChildRefType.ADOPTED),
@@ -445,6 +456,76 @@ class ImportOpenFileContextManager:
 
         return xml_file
 
+#-------------------------------------------------------------------------
+#
+# ChunkReader
+#
+#-------------------------------------------------------------------------
+class ChunkReader:
+    """
+    Read a file in a thread, a chunk at a time, so that the next chunks are
+    read, and inflated for a compressed file, while the previous ones are
+    parsed.  At most max_chunks chunks wait in the queue.
+
+    The chunks are read by iterating over the reader.  An error raised
+    while reading the file is raised again by the iteration.
+    """
+    def __init__(self, ifile, chunk_size=CHUNK_SIZE, max_chunks=MAX_CHUNKS):
+        self.ifile = ifile
+        self.chunk_size = chunk_size
+        self.queue = queue.Queue(max_chunks)
+        # Bytes read, and seconds spent to read them
+        self.size = 0
+        self.busy = 0.0
+        # Seconds the parser waited for the chunks
+        self.wait = 0.0
+        self.__stop = False
+        self.__thread = threading.Thread(target=self.__read,
+                                         name="ChunkReader", daemon=True)
+
+    def start(self):
+        """
+        Start reading the file.
+        """
+        self.__thread.start()
+
+    def __read(self):
+        try:
+            while not self.__stop:
+                start = time.perf_counter()
+                chunk = self.ifile.read(self.chunk_size)
+                self.busy += time.perf_counter() - start
+                self.size += len(chunk)
+                self.queue.put(chunk)
+                if not chunk:
+                    break
+        except Exception as err:
+            self.queue.put(err)
+
+    def __iter__(self):
+        while True:
+            start = time.perf_counter()
+            chunk = self.queue.get()
+            self.wait += time.perf_counter() - start
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        """
+        Stop reading the file, if the parsing stopped before its end.
+        """
+        self.__stop = True
+        while self.__thread.is_alive():
+            # let the thread put its last chunk
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.__thread.join(0.1)
+
 #-------------------------------------------------------------------------
 #
 # Gramps database parsing class.  Derived from SAX XML parser
@@ -932,7 +1013,23 @@ class GrampsParser(UpdateCallback):
             self.p.StartElementHandler = self.startElement
             self.p.EndElementHandler = self.endElement
             self.p.CharacterDataHandler = self.characters
-            self.p.ParseFile(ifile)
+            # The file is read in a thread, and parsed in this one, which
+            # owns the database connection
+            reader = ChunkReader(ifile)
+            self.__start = time.perf_counter()
+            self.__next_throughput = self.__start + THROUGHPUT_INTERVAL
+            reader.start()
+            try:
+                for chunk in reader:
+                    self.p.Parse(chunk, False)
+                    if time.perf_counter() >= self.__next_throughput:
+                        self.__show_throughput(reader)
+                self.p.Parse(b'', True)
+            finally:
+                reader.close()
+            LOG.debug("%s, in %.1f s", self.__get_throughput(reader),
+                      time.perf_counter() - self.__start)
+            self.set_text("")
 
             if len(self.name_formats) > 0:
                 # add new name formats to the existing table
@@ -974,6 +1071,25 @@ class GrampsParser(UpdateCallback):
         self.db.request_rebuild()
         return self.info
 
+    def __get_throughput(self, reader):
+        """
+        Return the throughput of the stages of the import: the reading of
+        the file, the parsing of its lines and the import of the objects.
+        Each stage is measured over the time it was busy.
+        """
+        busy = time.perf_counter() - self.__start - reader.wait
+        return _("Read %(read).1f MB/s, parsed %(lines)d lines/s, "
+                 "imported %(objects)d objects/s") % {
+                     'read': reader.size / max(reader.busy, 1e-6) / 1e6,
+                     'lines': self.p.CurrentLineNumber / max(busy, 1e-6),
+                     'objects': sum(self.info.data_newobject) /
+                                max(busy, 1e-6)}
+
+    def __show_throughput(self, reader):
+        self.__next_throughput = time.perf_counter() + THROUGHPUT_INTERVAL
+        self.set_text(self.__get_throughput(reader))
+        self.update(self.p.CurrentLineNumber)
+
     def start_database(self, attrs):
         """
         Get the xml version of the file.
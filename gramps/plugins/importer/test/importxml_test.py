@@ -0,0 +1,74 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest of the reading of the Gramps XML files
+"""
+import io
+import gzip
+import unittest
+
+from gramps.plugins.importer.importxml import ChunkReader
+
+class FailingFile(io.BytesIO):
+    """
+    A file which cannot be read after its first bytes.
+    """
+    def read(self, size=-1):
+        if self.tell() >= 10:
+            raise IOError("Read error")
+        return io.BytesIO.read(self, size)
+
+class ChunkReaderTest(unittest.TestCase):
+    """
+    Tests of the reading of a file in a thread.
+    """
+    data = b"".join(b'<person handle="_%d"/>\n' % index
+                    for index in range(1000))
+
+    def test_read(self):
+        reader = ChunkReader(io.BytesIO(gzip.compress(self.data)), 100, 2)
+        reader.ifile = gzip.GzipFile(fileobj=reader.ifile)
+        reader.start()
+        chunks = list(reader)
+        reader.close()
+        self.assertEqual(b"".join(chunks), self.data)
+        self.assertTrue(all(len(chunk) == 100 for chunk in chunks[:-1]))
+        self.assertEqual(reader.size, len(self.data))
+
+    def test_error(self):
+        reader = ChunkReader(FailingFile(self.data), 10, 2)
+        reader.start()
+        with self.assertRaises(IOError):
+            for dummy in reader:
+                pass
+        reader.close()
+
+    def test_close(self):
+        reader = ChunkReader(io.BytesIO(self.data), 10, 1)
+        reader.start()
+        for dummy in reader:
+            break
+        reader.close()
+        self.assertLess(reader.size, len(self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,549 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2000-2007  Donald N. Allingham
+# Copyright (C) 2026       Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Find people who may be recorded twice in a database.
+
+Comparing every person with every other person is too slow for large
+databases, so people are first grouped in blocks.  People of the same
+gender group, with the same surname (or SoundEx code of the surname), and
+sharing the initial of one of their given names, are in the same block.
+
+Within a block, people are only compared if their years of birth and of
+death, and the surnames of their parents, could match.  A value which is
+not known matches any value.  Pairs of people which are not compared would
+not have been reported anyway.
+
+The data needed to compare two people is extracted once for each person.
+The comparisons can be made in several processes.
+
+Usage::
+
+    finder = DuplicateFinder(db, threshold=0.25)
+    for handle1, (handle2, chance) in finder.find_duplicates().items():
+        ...
+"""
+
+#-------------------------------------------------------------------------
+#
+# Standard python modules
+#
+#-------------------------------------------------------------------------
+import multiprocessing
+from collections import defaultdict
+from itertools import combinations, islice, product
+
+#-------------------------------------------------------------------------
+#
+# Gramps modules
+#
+#-------------------------------------------------------------------------
+from gramps.gen.lib import Person, Date
+from gramps.gen.db.familygraph import get_family_graph
+from gramps.gen.soundex import soundex
+from gramps.gen.const import GRAMPS_LOCALE as glocale
+_ = glocale.translation.sgettext
+
+# Smallest number of candidate pairs worth starting worker processes for.
+MIN_PAIRS = 20000
+
+# Number of pairs sent to a worker at once.
+CHUNK_SIZE = 5000
+
+_WORKER_SCORER = None
+
+#-------------------------------------------------------------------------
+#
+# Helper functions
+#
+#-------------------------------------------------------------------------
+def is_initial(name):
+    if len(name) > 2:
+        return 0
+    elif len(name) == 2:
+        if name[0] == name[0].upper() and name[1] == '.':
+            return 1
+    else:
+        return name[0] == name[0].upper()
+
+def get_surnames(name):
+    """Construct a full surname of the surnames"""
+    return ' '.join([surn.get_surname() for surn in name.get_surname_list()])
+
+#-------------------------------------------------------------------------
+#
+# PersonFeatures
+#
+#-------------------------------------------------------------------------
+class PersonFeatures:
+    """
+    The data of a person used to compare it with other people.
+
+    Names are (surnames, suffix, first name) tuples, and places are
+    (handle, title) tuples.
+    """
+    __slots__ = ('handle', 'gender', 'name', 'birth', 'death', 'birth_place',
+                 'death_place', 'parents', 'father', 'mother', 'families')
+
+    def __init__(self, db, person, names, places):
+        self.handle = person.handle
+        self.gender = person.get_gender()
+        self.name = names(person.handle)
+        self.birth, self.birth_place = self.__get_event(
+            db, person.get_birth_ref(), places)
+        self.death, self.death_place = self.__get_event(
+            db, person.get_death_ref(), places)
+
+        self.father = self.mother = None
+        family_handle = person.get_main_parents_family_handle()
+        self.parents = bool(family_handle)
+        if family_handle:
+            family = db.get_family_from_handle(family_handle)
+            self.father = names(family.get_father_handle())
+            self.mother = names(family.get_mother_handle())
+
+        # (father handle, father name, mother handle, mother name) tuples
+        families = []
+        for family_handle in person.get_family_handle_list():
+            family = db.get_family_from_handle(family_handle)
+            father_handle = family.get_father_handle()
+            mother_handle = family.get_mother_handle()
+            families.append((father_handle, names(father_handle),
+                             mother_handle, names(mother_handle)))
+        self.families = tuple(families)
+
+    @staticmethod
+    def __get_event(db, event_ref, places):
+        if not event_ref:
+            return None, ("", "")
+        event = db.get_event_from_handle(event_ref.ref)
+        date = event.get_date_object()
+        place_handle = event.get_place_handle()
+        return (None if date.is_empty() else date,
+                (place_handle, places(place_handle)))
+
+    @staticmethod
+    def get_year(date):
+        """
+        Return the year of a date, or None if the date could match dates in
+        other years.
+        """
+        if (date is None or date.is_compound() or
+                date.get_calendar() != Date.CAL_GREGORIAN):
+            return None
+        return date.get_year()
+
+#-------------------------------------------------------------------------
+#
+# Scorer
+#
+#-------------------------------------------------------------------------
+class Scorer:
+    """
+    Compute how likely it is that two people are the same person.
+    """
+
+    def __init__(self, features, use_soundex=True):
+        self.features = features
+        self.use_soundex = use_soundex
+        self.__soundex = {}
+
+    def gen_key(self, val):
+        if self.use_soundex:
+            key = self.__soundex.get(val)
+            if key is None:
+                try:
+                    key = soundex(val)
+                except UnicodeEncodeError:
+                    key = val
+                self.__soundex[val] = key
+            return key
+        else:
+            return val
+
+    def name_compare(self, s1, s2):
+        return self.gen_key(s1) == self.gen_key(s2)
+
+    def score(self, handle1, handle2):
+        """
+        Return the chance that two people are the same, or -1 if they are
+        certainly different.  Ancestry is not checked.
+        """
+        p1 = self.features[handle1]
+        p2 = self.features[handle2]
+
+        chance = self.name_match(p1.name, p2.name)
+        if chance == -1:
+            return -1
+
+        for value in (self.date_match(p1.birth, p2.birth),
+                      self.date_match(p1.death, p2.death),
+                      self.place_match(p1.birth_place, p2.birth_place),
+                      self.place_match(p1.death_place, p2.death_place)):
+            if value == -1:
+                return -1
+            chance += value
+
+        if p1.parents and p2.parents:
+            value = self.name_match(p1.father, p2.father)
+            if value == -1:
+                return -1
+            chance += value
+
+            value = self.name_match(p1.mother, p2.mother)
+            if value == -1:
+                return -1
+            chance += value
+
+        # compare the partners of the people
+        index = 0 if p1.gender == Person.FEMALE else 2
+        for family1 in p1.families:
+            for family2 in p2.families:
+                handle1, name1 = family1[index:index + 2]
+                handle2, name2 = family2[index:index + 2]
+                if handle1 and handle2:
+                    if handle1 == handle2:
+                        chance += 1
+                    else:
+                        value = self.name_match(name1, name2)
+                        if value != -1:
+                            chance += value
+        return chance
+
+    def date_match(self, date1, date2):
+        if date1 is None or date2 is None:
+            return 0
+        if date1.is_equal(date2):
+            return 1
+
+        if date1.is_compound() or date2.is_compound():
+            return self.range_compare(date1, date2)
+
+        if date1.get_year() == date2.get_year():
+            if date1.get_month() == date2.get_month():
+                return 0.75
+            if not date1.get_month_valid() or not date2.get_month_valid():
+                return 0.75
+            else:
+                return -1
+        else:
+            return -1
+
+    def range_compare(self, date1, date2):
+        start_date_1 = date1.get_start_date()[0:3]
+        start_date_2 = date2.get_start_date()[0:3]
+        stop_date_1 = date1.get_stop_date()[0:3]
+        stop_date_2 = date2.get_stop_date()[0:3]
+        if date1.is_compound() and date2.is_compound():
+            if (start_date_2 <= start_date_1 <= stop_date_2 or
+                start_date_1 <= start_date_2 <= stop_date_1 or
+                start_date_2 <= stop_date_1 <= stop_date_2 or
+                start_date_1 <= stop_date_2 <= stop_date_1):
+                return 0.5
+            else:
+                return -1
+        elif date2.is_compound():
+            if start_date_2 <= start_date_1 <= stop_date_2:
+                return 0.5
+            else:
+                return -1
+        else:
+            if start_date_1 <= start_date_2 <= stop_date_1:
+                return 0.5
+            else:
+                return -1
+
+    def name_match(self, name, name1):
+
+        if not name1 or not name:
+            return 0
+
+        srn1, sfx1, first1 = name
+        srn2, sfx2, first2 = name1
+
+        if not self.name_compare(srn1, srn2):
+            return -1
+        if sfx1 != sfx2:
+            if sfx1 != "" and sfx2 != "":
+                return -1
+
+        if first1 == first2:
+            return 1
+        else:
+            list1 = first1.split()
+            list2 = first2.split()
+
+            if len(list1) < len(list2):
+                return self.list_reduce(list1, list2)
+            else:
+                return self.list_reduce(list2, list1)
+
+    def place_match(self, place1, place2):
+        p1_id, name1 = place1
+        p2_id, name2 = place2
+        if p1_id == p2_id:
+            return 1
+
+        if not (name1 and name2):
+            return 0
+        if name1 == name2:
+            return 1
+
+        list1 = name1.replace(",", " ").split()
+        list2 = name2.replace(",", " ").split()
+
+        value = 0
+        for name in list1:
+            for name2 in list2:
+                if name == name2:
+                    value += 0.5
+                elif name[0] == name2[0] and self.name_compare(name, name2):
+                    value += 0.25
+        return min(value, 1) if value else -1
+
+    def list_reduce(self, list1, list2):
+        value = 0
+        for name in list1:
+            for name2 in list2:
+                if is_initial(name) and name[0] == name2[0]:
+                    value += 0.25
+                elif is_initial(name2) and name2[0] == name[0]:
+                    value += 0.25
+                elif name == name2:
+                    value += 0.5
+                elif name[0] == name2[0] and self.name_compare(name, name2):
+                    value += 0.25
+        return min(value, 1) if value else -1
+
+    def score_pairs(self, pairs, threshold):
+        """
+        Return the (handle1, handle2, chance) tuples of the pairs with a
+        chance of at least the threshold.
+        """
+        result = []
+        for handle1, handle2 in pairs:
+            chance = self.score(handle1, handle2)
+            if chance >= threshold:
+                result.append((handle1, handle2, chance))
+        return result
+
+#-------------------------------------------------------------------------
+#
+# Worker process
+#
+#-------------------------------------------------------------------------
+def _init_worker(scorer):
+    global _WORKER_SCORER
+    _WORKER_SCORER = scorer
+
+def _score_chunk(args):
+    pairs, threshold = args
+    return _WORKER_SCORER.score_pairs(pairs, threshold)
+
+#-------------------------------------------------------------------------
+#
+# DuplicateFinder
+#
+#-------------------------------------------------------------------------
+class DuplicateFinder:
+    """
+    Find pairs of people who may be the same person.
+    """
+
+    def __init__(self, db, threshold=0.25, use_soundex=True, workers=0,
+                 user=None):
+        """
+        :param db: the database to search.
+        :param threshold: lowest chance of a pair to be reported.
+        :param use_soundex: compare surnames by their SoundEx codes.
+        :param workers: number of worker processes to use for the
+                        comparisons; 0 compares in this process.
+        :param user: a :class:`.User` instance for progress reporting.
+        """
+        self.db = db
+        self.threshold = threshold
+        self.workers = workers
+        self.user = user
+        self.features = {}
+        self.scorer = Scorer(self.features, use_soundex)
+        self.__names = {}
+        self.__places = {}
+
+    #---------------------------------------------------------------------
+    #
+    # Features
+    #
+    #---------------------------------------------------------------------
+    def __get_name(self, handle):
+        if not handle:
+            return None
+        name = self.__names.get(handle)
+        if name is None:
+            primary = self.db.get_person_from_handle(
+                handle).get_primary_name()
+            name = (get_surnames(primary), primary.get_suffix(),
+                    primary.get_first_name())
+            self.__names[handle] = name
+        return name
+
+    def __get_place_title(self, handle):
+        if not handle:
+            return ""
+        title = self.__places.get(handle)
+        if title is None:
+            title = self.db.get_place_from_handle(handle).get_title()
+            self.__places[handle] = title
+        return title
+
+    def extract_features(self):
+        """
+        Extract the data needed for the comparisons from all the people of
+        the database.
+        """
+        if self.features:
+            return
+        if self.user:
+            self.user.begin_progress(_('Find Duplicates'),
+                                     _('Pass 1: Building preliminary lists'),
+                                     self.db.get_number_of_people())
+        for person in self.db.iter_people():
+            if self.user:
+                self.user.step_progress()
+            self.features[person.handle] = PersonFeatures(
+                self.db, person, self.__get_name, self.__get_place_title)
+        if self.user:
+            self.user.end_progress()
+
+    #---------------------------------------------------------------------
+    #
+    # Candidates
+    #
+    #---------------------------------------------------------------------
+    def get_block_keys(self, features):
+        """
+        Return the keys of the blocks of a person.
+        """
+        surname, dummy, first_name = features.name
+        surname_key = self.scorer.gen_key(surname)
+        is_male = features.gender == Person.MALE
+        initials = set(token[0] for token in first_name.split()) or {''}
+        return [(is_male, surname_key, initial) for initial in initials]
+
+    def get_match_key(self, features):
+        """
+        Return the values which must match for two people of a block to be
+        compared, or None for values which match any value.
+        """
+        parents = [self.scorer.gen_key(parent[0]) if parent else None
+                   for parent in (features.father, features.mother)]
+        return (features.get_year(features.birth),
+                features.get_year(features.death)) + tuple(parents)
+
+    def get_blocks(self):
+        """
+        Return the blocks of people, as lists of handles.
+        """
+        blocks = defaultdict(list)
+        for features in self.features.values():
+            for key in self.get_block_keys(features):
+                blocks[key].append(features.handle)
+        return [block for block in blocks.values() if len(block) > 1]
+
+    def iter_candidates(self):
+        """
+        Generate the pairs of people to compare.
+        """
+        seen = set()
+        for block in self.get_blocks():
+            groups = defaultdict(list)
+            for handle in block:
+                key = self.get_match_key(self.features[handle])
+                groups[key].append(handle)
+            keys = list(groups)
+            pairs = []
+            for index, key1 in enumerate(keys):
+                group1 = groups[key1]
+                pairs.extend(combinations(group1, 2))
+                for key2 in keys[index + 1:]:
+                    if all(value1 is None or value2 is None or value1 == value2
+                           for value1, value2 in zip(key1, key2)):
+                        pairs.extend(product(group1, groups[key2]))
+            for pair in pairs:
+                if pair in seen or pair[::-1] in seen:
+                    continue
+                seen.add(pair)
+                yield pair
+
+    #---------------------------------------------------------------------
+    #
+    # Comparisons
+    #
+    #---------------------------------------------------------------------
+    def __score_chunks(self, chunks):
+        """
+        Generate the pairs of each chunk with a chance of at least the
+        threshold, one list for each chunk.
+        """
+        if self.workers > 1 and len(chunks) * CHUNK_SIZE >= MIN_PAIRS:
+            pool = multiprocessing.Pool(min(self.workers, len(chunks)),
+                                        _init_worker, (self.scorer, ))
+            try:
+                yield from pool.imap(_score_chunk,
+                                     [(chunk, self.threshold)
+                                      for chunk in chunks])
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            for chunk in chunks:
+                yield self.scorer.score_pairs(chunk, self.threshold)
+
+    def find_duplicates(self):
+        """
+        Return the possible duplicates, as a dictionary of handles to
+        (handle of the other person, chance) tuples.
+        """
+        self.extract_features()
+        pairs = iter(self.iter_candidates())
+        chunks = list(iter(lambda: list(islice(pairs, CHUNK_SIZE)), []))
+        if self.user:
+            self.user.begin_progress(_('Find Duplicates'),
+                                     _('Pass 2: Calculating potential '
+                                       'matches'), len(chunks))
+
+        graph = get_family_graph(self.db)
+        result = {}
+        for matches in self.__score_chunks(chunks):
+            if self.user:
+                self.user.step_progress()
+            for handle1, handle2, chance in matches:
+                if (handle2 in graph.get_ancestors(handle1, 1) or
+                        handle1 in graph.get_ancestors(handle2, 1)):
+                    continue
+                for key, other in ((handle1, handle2), (handle2, handle1)):
+                    # one entry is enough for each pair
+                    if result.get(other, (None, ))[0] == key:
+                        continue
+                    if key not in result or result[key][1] < chance:
+                        result[key] = (other, chance)
+        if self.user:
+            self.user.end_progress()
+        return result
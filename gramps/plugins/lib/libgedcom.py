@@ -91,10 +91,11 @@ all lines until the next level 2 token is found (in this case, skipping the
 import os
 import re
 import time
+import codecs
 # from xml.parsers.expat import ParserCreate
-from collections import defaultdict, OrderedDict
+from collections import defaultdict, OrderedDict, deque
 import string
-from io import StringIO, TextIOWrapper
+from io import TextIOWrapper
 from urllib.parse import urlparse
 
 #------------------------------------------------------------------------
@@ -127,12 +128,12 @@ from gramps.gen.mime import get_type
 from gramps.gen.utils.id import create_id
 from gramps.gen.utils.lds import TEMPLES
 from gramps.gen.utils.unknown import make_unknown, create_explanation_note
-from gramps.gen.datehandler._dateparser import DateParser
+from gramps.gen.datehandler._dateparser import DateParser, CachedDateParser
 from gramps.gen.db.dbconst import EVENT_KEY
 from gramps.gen.lib.const import IDENTICAL
 from gramps.gen.lib import (StyledText, StyledTextTag, StyledTextTagType)
 from gramps.gen.lib.urlbase import UrlBase
-from gramps.plugins.lib.libplaceimport import PlaceImport
+from gramps.plugins.lib.libplaceimport import PlaceImport, PlaceIndex
 from gramps.gen.display.place import displayer as _pd
 from gramps.gen.utils.grampslocale import GrampsLocale
 
@@ -721,14 +722,13 @@ CUSTOMEVENTTAGS = {
     "_SEPR"     : _("Separation"),         # Applies to Families
     "_WEIG"     : _("Weight"),
 }
-# table for skipping illegal control chars in GEDCOM import
+# pattern for skipping illegal control chars in GEDCOM import
 # Only 09, 0A, 0D are allowed.
-STRIP_DICT = dict.fromkeys(list(range(9)) + list(range(11, 13)) +
-                           list(range(14, 32)))
+STRIP_RE = re.compile('[\x00-\x08\x0B\x0C\x0E-\x1F]')
 # The C1 Control characters are not treated in Latin-1 (ISO-8859-1) as
 # undefined, but if they have been used, the file is probably supposed to be
 # cp1252
-DEL_AND_C1 = dict.fromkeys(list(range(0x7F, 0x9F)))
+DEL_AND_C1_RE = re.compile('[\x7F-\x9E]')
 
 #-------------------------------------------------------------------------
 #
@@ -848,6 +848,9 @@ class GedcomDateParser(DateParser):
 #-------------------------------------------------------------------------
 class Lexer:
     """ low level line reading and early parsing """
+    # <LEVEL> <TAG> [<VALUE>], with a tag which is not an xref_id
+    __LINE_RE = re.compile(r' *([0-9]+) +([^ @][^ ]*)(?: (.*))?', re.DOTALL)
+
     def __init__(self, ifile, __add_msg):
         self.ifile = ifile
         self.current_list = []
@@ -897,57 +900,34 @@ class Lexer:
                 self.eof = True
                 return
 
-            original_line = line
-            try:
-                # According to the GEDCOM 5.5 standard,
-                # Chapter 1 subsection Grammar "leading whitespace preceeding
-                # a GEDCOM line should be ignored"
-                # We will also strip the terminator which is any combination
-                # of carriage_return and line_feed
-                line = line.lstrip(' ').rstrip('\n\r')
-                # split into level+delim+rest
-                line = line.partition(' ')
-                level = int(line[0])
-                # there should only be one space after the level,
-                # but we can ignore more,
-                line = line[2].lstrip(' ')
-                # then split into tag+delim+line_value
-                # or xfef_id+delim+rest
-                # the xref_id can have spaces in it
-                if line.startswith('@'):
-                    line = line.split('@', 2)
-                    # line is now [None, alphanum+pointer_string, rest]
-                    tag = '@' + line[1] + '@'
-                    line_value = line[2].lstrip()
-                    # Ignore meaningless @IDENT@ on CONT or CONC line
-                    # as noted at http://www.tamurajones.net/IdentCONT.xhtml
-                    if (line_value.lstrip().startswith("CONT ") or
-                            line_value.lstrip().startswith("CONC ")):
-                        line = line_value.lstrip().partition(' ')
-                        tag = line[0]
-                        line_value = line[2]
-                else:
-                    line = line.partition(' ')
-                    tag = line[0]
-                    line_value = line[2]
-            except:
-                problem = _("Line ignored ")
-                text = original_line.rstrip('\n\r')
-                prob_width = 66
-                problem = problem.ljust(prob_width)[0:(prob_width - 1)]
-                text = text.replace("\n", "\n".ljust(prob_width + 22))
-                message = "%s              %s" % (problem, text)
-                self.__add_msg(message)
-                continue
+            # The terminator is any combination of carriage_return and
+            # line_feed.  Most lines are of the simple form
+            # <LEVEL> <TAG> <VALUE>, which the regular expression parses in
+            # one step; the others are parsed below
+            match = self.__LINE_RE.fullmatch(line.rstrip('\n\r'))
+            if match:
+                level, tag, line_value = match.groups('')
+                level = int(level)
+            else:
+                try:
+                    level, tag, line_value = self.__parse_line(line)
+                except:
+                    problem = _("Line ignored ")
+                    text = line.rstrip('\n\r')
+                    prob_width = 66
+                    problem = problem.ljust(prob_width)[0:(prob_width - 1)]
+                    text = text.replace("\n", "\n".ljust(prob_width + 22))
+                    message = "%s              %s" % (problem, text)
+                    self.__add_msg(message)
+                    continue
 
             # Need to un-double '@' See Gedcom 5.5 spec 'any_char'
             line_value = line_value.replace('@@', '@')
             token = TOKENS.get(tag, TOKEN_UNKNOWN)
-            data = (level, token, line_value, tag, self.index)
 
-            func = self.func_map.get(data[1])
+            func = self.func_map.get(token)
             if func:
-                func(data)
+                func((level, token, line_value, tag, self.index))
             else:
                 # There will normally only be one space between tag and
                 # line_value, but in case there is more then one, remove extra
@@ -955,8 +935,46 @@ class Lexer:
                 # Also, Gedcom spec says there should be no spaces at end of
                 # line, however some programs put them there (FTM), so let's
                 # leave them in place.
-                data = data[:2] + (data[2].lstrip(),) + data[3:]
-                self.current_list.insert(0, data)
+                self.current_list.insert(
+                    0, (level, token, line_value.lstrip(), tag, self.index))
+
+    @staticmethod
+    def __parse_line(line):
+        """
+        Split a line into its level, tag and value.
+        """
+        # According to the GEDCOM 5.5 standard,
+        # Chapter 1 subsection Grammar "leading whitespace preceeding
+        # a GEDCOM line should be ignored"
+        # We will also strip the terminator which is any combination
+        # of carriage_return and line_feed
+        line = line.lstrip(' ').rstrip('\n\r')
+        # split into level+delim+rest
+        line = line.partition(' ')
+        level = int(line[0])
+        # there should only be one space after the level,
+        # but we can ignore more,
+        line = line[2].lstrip(' ')
+        # then split into tag+delim+line_value
+        # or xfef_id+delim+rest
+        # the xref_id can have spaces in it
+        if line.startswith('@'):
+            line = line.split('@', 2)
+            # line is now [None, alphanum+pointer_string, rest]
+            tag = '@' + line[1] + '@'
+            line_value = line[2].lstrip()
+            # Ignore meaningless @IDENT@ on CONT or CONC line
+            # as noted at http://www.tamurajones.net/IdentCONT.xhtml
+            if (line_value.lstrip().startswith("CONT ") or
+                    line_value.lstrip().startswith("CONC ")):
+                line = line_value.lstrip().partition(' ')
+                tag = line[0]
+                line_value = line[2]
+        else:
+            line = line.partition(' ')
+            tag = line[0]
+            line_value = line[2]
+        return level, tag, line_value
 
     def clean_up(self):
         """
@@ -992,7 +1010,8 @@ class GedLine:
     TOKEN_SEX    - Person gender item
     TOEKN_UKNOWN - Check to see if this is a known event
     """
-    __DATE_CNV = GedcomDateParser()
+    __slots__ = ("line", "level", "token", "token_text", "data")
+    __DATE_CNV = CachedDateParser(GedcomDateParser())
 
     @staticmethod
     def __extract_date(text):
@@ -1205,19 +1224,95 @@ _MAP_DATA = {
 #
 #-------------------------------------------------------------------------
 class BaseReader:
-    """ base char level reader """
-    def __init__(self, ifile, encoding, __add_msg):
+    """
+    Base char level reader.
+
+    The file is read in chunks of CHUNK_SIZE bytes, which are decoded with
+    an incremental decoder and split into lines, so that the memory used does
+    not depend on the size of the file.  The newlines are translated as with
+    universal newlines, and the illegal control chars are removed.
+    """
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, ifile, encoding, __add_msg, decoder=None):
         self.ifile = ifile
         self.enc = encoding
         self.__add_msg = __add_msg
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self.decoder = decoder
+        self.__lines = deque()
+        self.__rest = ''
+        self.__count = 0
+        self.__problems = {}
+        self.__eof = False
 
     def reset(self):
         """ return to beginning """
         self.ifile.seek(0)
+        self.decoder.reset()
+        self.__lines.clear()
+        self.__rest = ''
+        self.__count = 0
+        self.__problems.clear()
+        self.__eof = False
 
     def readline(self):
-        """ Read a single line """
-        raise NotImplementedError()
+        """ Read a single line, or '' at the end of the file """
+        while not self.__lines:
+            if self.__eof:
+                return ''
+            self.__read_chunk()
+        self.__count += 1
+        if self.__problems:
+            # report the problems in the order the lines are read
+            for problem, line in self.__problems.pop(self.__count, ()):
+                self.report_error(problem, line)
+        return self.__lines.popleft()
+
+    def __read_chunk(self):
+        """ Read a chunk of the file, and add its complete lines """
+        chunk = self.ifile.read(self.CHUNK_SIZE)
+        self.__eof = not chunk
+        text = self.__rest + self.decoder.decode(chunk, self.__eof)
+        # the LF of a CRLF may be in the next chunk
+        keep_cr = not self.__eof and text.endswith('\r')
+        if keep_cr:
+            text = text[:-1]
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        lines = text.split('\n')
+        self.__rest = lines.pop()
+        if keep_cr:
+            self.__rest += '\r'
+        # the last line of the file may have no terminator
+        unterminated = self.__eof and self.__rest != ''
+        if unterminated:
+            lines.append(self.__rest)
+            self.__rest = ''
+        self._check_lines(text, lines, self.__count + len(self.__lines) + 1)
+        if STRIP_RE.search(text):
+            lines = [STRIP_RE.sub('', line) for line in lines]
+        last = lines.pop() if unterminated else None
+        self.__lines.extend(line + '\n' for line in lines)
+        if unterminated:
+            self.__lines.append(last)
+
+    def _check_lines(self, text, lines, first):
+        """
+        Check the lines of a chunk, before the illegal control chars are
+        removed.  The lines may be modified in place.
+
+        :param text: the text of the chunk.
+        :param lines: the complete lines of the chunk, without their
+                      terminators.
+        :param first: the number of the first line, counted from 1.
+        """
+        pass
+
+    def _add_problem(self, number, problem, line):
+        """ Report a problem when the line with the number is read """
+        self.__problems.setdefault(number, []).append((problem, line))
 
     def report_error(self, problem, line):
         """ Create an error message """
@@ -1232,61 +1327,40 @@ class BaseReader:
 class UTF8Reader(BaseReader):
     """ The main UTF-8 reader, uses Python for char handling """
     def __init__(self, ifile, __add_msg, enc):
-        BaseReader.__init__(self, ifile, enc, __add_msg)
-        self.reset()
         if enc == 'UTF_8_SIG':
-            self.ifile = TextIOWrapper(ifile, encoding='utf_8_sig',
-                                       errors='replace', newline=None)
+            BaseReader.__init__(self, ifile, 'utf_8_sig', __add_msg)
         else:
-            self.ifile = TextIOWrapper(ifile, encoding='utf_8',
-                                       errors='replace', newline=None)
-
-    def readline(self):
-        line = self.ifile.readline()
-        return line.translate(STRIP_DICT)
+            BaseReader.__init__(self, ifile, 'utf_8', __add_msg)
+        self.reset()
 
 
 class UTF16Reader(BaseReader):
     """ The main UTF-16 reader, uses Python for char handling """
     def __init__(self, ifile, __add_msg):
-        BaseReader.__init__(self, ifile, 'UTF16', __add_msg)
-        self.ifile = TextIOWrapper(ifile, encoding='utf_16',
-                                   errors='replace', newline=None)
+        BaseReader.__init__(self, ifile, 'utf_16', __add_msg)
         self.reset()
 
-    def readline(self):
-        line = self.ifile.readline()
-        return line.translate(STRIP_DICT)
-
 
 class AnsiReader(BaseReader):
     """ The main ANSI (latin1) reader, uses Python for char handling """
     def __init__(self, ifile, __add_msg):
         BaseReader.__init__(self, ifile, 'latin1', __add_msg)
-        self.ifile = TextIOWrapper(ifile, encoding='latin1',
-                                   errors='replace', newline=None)
 
-    def readline(self):
-        line = self.ifile.readline()
-        if line.translate(DEL_AND_C1) != line:
-            self.report_error("DEL or C1 control chars in line did you mean "
-                              "CHAR cp1252??", line)
-        return line.translate(STRIP_DICT)
+    def _check_lines(self, text, lines, first):
+        if DEL_AND_C1_RE.search(text):
+            for number, line in enumerate(lines, first):
+                if DEL_AND_C1_RE.search(line):
+                    self._add_problem(number, "DEL or C1 control chars in "
+                                      "line did you mean CHAR cp1252??", line)
 
 
 class CP1252Reader(BaseReader):
     """ The extra credit CP1252 reader, uses Python for char handling """
     def __init__(self, ifile, __add_msg):
         BaseReader.__init__(self, ifile, 'cp1252', __add_msg)
-        self.ifile = TextIOWrapper(ifile, encoding='cp1252',
-                                   errors='replace', newline=None)
-
-    def readline(self):
-        line = self.ifile.readline()
-        return line.translate(STRIP_DICT)
 
 
-class AnselReader(BaseReader):
+class AnselDecoder(codecs.IncrementalDecoder):
     """
     ANSEL to Unicode Conversion
 
@@ -1303,10 +1377,15 @@ class AnselReader(BaseReader):
     which we also ignore for now (start/emd of string (or sort sequence)
     ---
     ?: should we allow TAB, as a Gramps extension?
+
+    The decoder replaces the illegal chars, and marks each of them with
+    ERROR_MARK in the text; their codes are kept in the problems list.
     """
-    __printable_ascii = list(map(chr, list(range(32, 127))))  # up thru 126
-    #                            LF  CR  Esc GS  RS  US
-    __use_ASCII = list(map(chr, [10, 13, 27, 29, 30, 31])) + __printable_ascii
+    ERROR_MARK = '\ufffe'
+
+    # runs of ANSEL codes that replicate ASCII
+    #                         LF  CR  Esc GS  RS  US
+    __ascii_run = re.compile(b'[\x0A\x0D\x1B\x1D-\x1F\x20-\x7E]+')
 
     # mappings of single byte ANSEL codes to unicode
     __onebyte = {
@@ -1499,67 +1578,91 @@ class AnselReader(BaseReader):
         b'\xF4\x41' : '\u1e00', b'\xF4\x61' : '\u1e01',
         b'\xF9\x48' : '\u1e2a', b'\xF9\x68' : '\u1e2b', }
 
-    def __ansel_to_unicode(self, text):
-        """ Convert an ANSEL encoded text to unicode """
+    def __init__(self, errors='strict'):
+        codecs.IncrementalDecoder.__init__(self, errors)
+        self.problems = deque()
+        self.__pending = b''
 
-        buff = StringIO()
-        error = ""
-        while text:
-            if text[0] < 128:
-                if chr(text[0]) in AnselReader.__use_ASCII:
-                    head = chr(text[0])
+    def reset(self):
+        self.problems.clear()
+        self.__pending = b''
+
+    def __add_problem(self, buff, code):
+        self.problems.append(" (%#X)" % code)
+        buff.append(self.ERROR_MARK)
+
+    def decode(self, data, final=False):
+        data = self.__pending + data
+        self.__pending = b''
+        buff = []
+        pos = 0
+        end = len(data)
+        while pos < end:
+            match = self.__ascii_run.match(data, pos)
+            if match:
+                buff.append(match.group().decode('ascii'))
+                pos = match.end()
+                continue
+            code = data[pos]
+            if code < 128:
+                # substitute space for disallowed (control) chars
+                buff.append(' ')
+                self.__add_problem(buff, code)
+                pos += 1
+                continue
+            head = data[pos:pos + 1]
+            if pos + 1 == end and not final and (
+                    head in AnselDecoder.__acombiners):
+                # the modified char is in the next chunk
+                self.__pending = head
+                break
+            if data[pos:pos + 2] in AnselDecoder.__twobyte:
+                buff.append(AnselDecoder.__twobyte[data[pos:pos + 2]])
+                pos += 2
+            elif head in AnselDecoder.__onebyte:
+                buff.append(AnselDecoder.__onebyte[head])
+                pos += 1
+            elif head in AnselDecoder.__acombiners:
+                cmb = AnselDecoder.__acombiners[head]
+                # always consume the combiner
+                pos += 1
+                if pos == end:
+                    self.__add_problem(buff, code)
+                    break
+                next_byte = data[pos]
+                if 32 <= next_byte < 127:
+                    # consume next as well
+                    pos += 1
+                    # unicode: combiner follows base-char
+                    buff.append(chr(next_byte) + cmb)
                 else:
-                    # substitute space for disallowed (control) chars
-                    error += " (%#X)" % text[0]
-                    head = ' '
-                text = text[1:]
+                    # just drop the unexpected combiner
+                    self.__add_problem(buff, next_byte)
             else:
-                if text[0:2] in AnselReader.__twobyte:
-                    head = AnselReader.__twobyte[text[0:2]]
-                    text = text[2:]
-                elif bytes([text[0]]) in AnselReader.__onebyte:
-                    head = AnselReader.__onebyte[bytes([text[0]])]
-                    text = text[1:]
-                elif bytes([text[0]]) in AnselReader.__acombiners:
-                    cmb = AnselReader.__acombiners[bytes([text[0]])]
-                    # always consume the combiner
-                    text = text[1:]
-                    next_byte = text[0]
-                    if next_byte < 128 and chr(next_byte) in \
-                            AnselReader.__printable_ascii:
-                        # consume next as well
-                        text = text[1:]
-                        # unicode: combiner follows base-char
-                        head = chr(next_byte) + cmb
-                    else:
-                        # just drop the unexpected combiner
-                        error += " (%#X)" % text[0]
-                        continue
-                else:
-                    error += " (%#X)" % text[0]
-                    head = '\ufffd'  # "Replacement Char"
-                    text = text[1:]
-            buff.write(head)
-        ans = buff.getvalue()
-
-        if error:
-            # e.g. Illegal character (oxAB) (0xCB)... 1 NOTE xyz?pqr?lmn
-            self.report_error(_("Illegal character%s") % error, ans)
-        buff.close()
-        return ans
+                buff.append('\ufffd')  # "Replacement Char"
+                self.__add_problem(buff, code)
+                pos += 1
+        return ''.join(buff)
+
 
+class AnselReader(BaseReader):
+    """ The ANSEL reader, uses the AnselDecoder for char handling """
     def __init__(self, ifile, __add_msg):
-        BaseReader.__init__(self, ifile, "ANSEL", __add_msg)
-        # In theory, we should have been able to skip the encode/decode from
-        # ascii.  But this way allows us to use pythons universal newline
-        self.ifile = TextIOWrapper(ifile, encoding='ascii',
-                                   errors='surrogateescape', newline=None)
+        BaseReader.__init__(self, ifile, "ANSEL", __add_msg, AnselDecoder())
 
-    def readline(self):
-        line = self.ifile.readline()
-        linebytes = line.encode(encoding='ascii',
-                                errors='surrogateescape')
-        return self.__ansel_to_unicode(linebytes)
+    def _check_lines(self, text, lines, first):
+        mark = AnselDecoder.ERROR_MARK
+        if mark not in text:
+            return
+        problems = self.decoder.problems
+        for index, line in enumerate(lines):
+            count = line.count(mark)
+            if count:
+                error = ''.join(problems.popleft() for dummy in range(count))
+                lines[index] = line = line.replace(mark, '')
+                # e.g. Illegal character (oxAB) (0xCB)... 1 NOTE xyz?pqr?lmn
+                self._add_problem(first + index,
+                                  _("Illegal character%s") % error, line)
 
 
 #-------------------------------------------------------------------------
@@ -1826,7 +1929,6 @@ class GedcomParser(UpdateCallback):
 
     __TRUNC_MSG = _("Your GEDCOM file is corrupted. "
                     "It appears to have been truncated.")
-    _EMPTY_LOC = Location().serialize()
 
     SyntaxError = "Syntax Error"
     BadFile = "Not a GEDCOM file"
@@ -1958,7 +2060,9 @@ class GedcomParser(UpdateCallback):
         self.rid2id = {}
         self.nid2id = {}
 
-        self.place_import = PlaceImport(self.dbase)
+        # look for existing places, build an index
+        self.place_index = PlaceIndex(self.dbase)
+        self.place_import = PlaceImport(self.dbase, self.place_index)
 
         #
         # Parse table for <<SUBMITTER_RECORD>> below the level 0 SUBM tag
@@ -2693,16 +2797,6 @@ class GedcomParser(UpdateCallback):
         }
         self.func_list.append(self.note_parse_tbl)
 
-        # look for existing place titles, build a map
-        self.place_names = defaultdict(list)
-        cursor = dbase.get_place_cursor()
-        data = next(cursor)
-        while data:
-            (handle, val) = data
-            self.place_names[val[2]].append(handle)
-            data = next(cursor)
-        cursor.close()
-
         enc = stage_one.get_encoding()
 
         if enc == "ANSEL":
@@ -2931,46 +3025,27 @@ class GedcomParser(UpdateCallback):
             self.dbase.add_note(note, self.trans)
         return note
 
-    def __loc_is_empty(self, location):
-        """
-        Determines whether a location is empty.
-
-        @param location: The current location
-        @type location: gen.lib.Location
-        @return True of False
-        """
-        if location is None:
-            return True
-        elif location.serialize() == self._EMPTY_LOC:
-            return True
-        elif location.is_empty():
-            return True
-        return False
-
     def __find_place(self, title, location, placeref_list):
         """
-        Finds an existing place based on the title and primary location.
+        Finds an existing place based on the title, primary location and
+        enclosing places.
 
         @param title: The place title
         @type title: string
         @param location: The current location
         @type location: gen.lib.Location
+        @param placeref_list: The references to the enclosing places
+        @type placeref_list: list of gen.lib.PlaceRef
         @return gen.lib.Place
         """
-        for place_handle in self.place_names[title]:
-            place = self.dbase.get_place_from_handle(place_handle)
-            if place.get_title() == title:
-                if self.__loc_is_empty(location) and \
-                   self.__loc_is_empty(self.__get_first_loc(place)) and \
-                   place.get_placeref_list() == placeref_list:
-                    return place
-                elif (not self.__loc_is_empty(location) and
-                      not self.__loc_is_empty(self.__get_first_loc(place)) and
-                      self.__get_first_loc(place).is_equivalent(location) ==
-                      IDENTICAL) and \
-                        place.get_placeref_list() == placeref_list:
-                    return place
-        return None
+        if placeref_list is None or placeref_list:
+            # Only the places without enclosing places are shared; each
+            # place detail, or LDS place, is a new place
+            return None
+        handle = self.place_index.find(title, location, placeref_list)
+        if handle is None:
+            return None
+        return self.dbase.get_place_from_handle(handle)
 
     def __add_place(self, event, sub_state):
         """
@@ -2998,7 +3073,7 @@ class GedcomParser(UpdateCallback):
                 # handle.
                 if location:
                     self.place_import.store_location(location, place.handle)
-                self.place_names[place.get_title()].append(place.get_handle())
+                self.place_index.add(place)
                 event.set_place_handle(place.get_handle())
             else:
                 place.merge(sub_state.place)
@@ -3006,6 +3081,7 @@ class GedcomParser(UpdateCallback):
                 location = sub_state.pf.load_place(self.place_import, place,
                                                    place_title)
                 self.dbase.commit_place(place, self.trans)
+                self.place_index.add(place)
                 if location:
                     self.place_import.store_location(location, place.handle)
                 event.set_place_handle(place.get_handle())
@@ -4660,7 +4736,7 @@ class GedcomParser(UpdateCallback):
                 place.set_title(title)
                 place.name.set_value(title)
                 self.dbase.add_place(place, self.trans)
-                self.place_names[place.get_title()].append(place.get_handle())
+                self.place_index.add(place)
             else:
                 pass
             state.lds_ord.set_place_handle(place.handle)
@@ -5733,10 +5809,11 @@ class GedcomParser(UpdateCallback):
             if place is None:
                 place = state.place
                 self.dbase.add_place(place, self.trans)
-                self.place_names[place.get_title()].append(place.get_handle())
+                self.place_index.add(place)
             else:
                 place.merge(state.place)
                 self.dbase.commit_place(place, self.trans)
+                self.place_index.add(place)
             place_title = _pd.display(self.dbase, place)
             state.pf.load_place(self.place_import, place, place_title)
 
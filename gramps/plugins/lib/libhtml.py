@@ -31,6 +31,7 @@ This module exports the Html class
 # Python modules
 #------------------------------------------------------------------------
 import re
+import weakref
 
 #------------------------------------------------------------------------
 #
@@ -97,6 +98,16 @@ _START_CLOSE = set([
     'param'
     ])
 
+# States of an object used as a context manager: its with block is running,
+# or is over and the object is complete
+_OPEN = 1
+_CLOSED = 2
+
+# The pages being written while they are built, with the method and the
+# indentation used to write them.  A page is only referenced weakly, in case
+# it is never finished because of an error.
+_STREAMS = []
+
 #------------------------------------------------------------------------
 #
 # Html class.
@@ -107,7 +118,8 @@ class Html(list):
     """
     HTML class: Manages a rooted tree of HTML objects
     """
-    __slots__ = ['items', 'indent', 'inline', 'close', 'cms']
+    __slots__ = ['items', 'indent', 'inline', 'close', 'cms', 'state',
+                 'start', '__weakref__']
 #
     @staticmethod
     def xmldecl(version=1.0, encoding="UTF-8", standalone="no"):
@@ -278,6 +290,8 @@ class Html(list):
         list.__init__(self, [])                  # instantiate object
         attr = ''
         self.indent, self.close, self.inline = True, True, False
+        self.state = None                       # not used in a with block
+        self.start = 0                          # nothing written yet
 #
 #       Handle keyword arguments passed to this constructor.
 #       Keywords that we process directly are handled.
@@ -396,6 +410,9 @@ class Html(list):
         Output function: performs an insertion-order tree traversal
         and calls supplied method for each item found.
 
+        If the object is a page being streamed, write the rest of it with
+        the method and indentation given to stream(), and stop streaming.
+
         :type  method: function reference
         :param method: function to call with each item found
         :type  indent: string
@@ -403,6 +420,17 @@ class Html(list):
         :type  tabs: string
         :param tabs: starting indentation
         """
+        for stream in _STREAMS:
+            if stream[0]() is self:
+                _STREAMS.remove(stream)
+                self.__write(stream[1], stream[2], '')
+                return
+        self.__write(method, indent, tabs)
+#
+    def __write(self, method, indent, tabs):
+        """
+        Write the items of this object which were not written yet.
+        """
         if self.indent is None:
             tabs = ''
         elif self.indent:
@@ -411,11 +439,61 @@ class Html(list):
             method(str('%s%s' % (tabs, self)))       # nested list elements
 #
         else:
-            for item in self[:]:                # else write one at a time
+            for item in self[self.start:]:      # else write one at a time
                 if isinstance(item, Html):      # recurse if nested Html class
-                    item.write(method=method, indent=indent, tabs=tabs)
+                    item.__write(method, indent, tabs)
                 else:
                     method(str('%s%s' % (tabs, item)))  # else write the line
+#
+    def stream(self, method=print, indent='\t'):
+        """
+        Stream function: write this page while it is built, to keep only
+        its unfinished parts in memory.
+
+        Each time the with block of an object ends, the items of the page
+        which are complete are written with method, in order, and removed
+        from the page.  An object is complete when its with block is over;
+        an object not used in a with block is complete when its parent is,
+        or once an item was added after it.  Hence no object may be changed
+        once complete, and the attributes of an object whose with block is
+        running may only be changed before a with block inside it ends.
+
+        The rest of the page is written by write().
+
+        :type  method: function reference
+        :param method: function to call with each item written
+        :type  indent: string
+        :param indent: string to use for indentation. Default = '\t' (tab)
+        """
+        _STREAMS.append((weakref.ref(self), method, indent))
+#
+    def __flush(self, method, indent, tabs):
+        """
+        Write the items of this unfinished object which are complete, and
+        remove them, but the first one.
+        """
+        if self.indent is None:
+            tabs = ''
+        elif self.indent:
+            tabs += indent
+        index = self.start
+        end = len(self) - (1 if self.close else 0)
+        while index < end:
+            item = self[index]
+            if isinstance(item, Html):
+                if (item.state == _OPEN or
+                        (item.state is None and index == end - 1)):
+                    if not item.inline:
+                        item.__flush(method, indent, tabs)
+                    break
+                item.__write(method, indent, tabs)
+            else:
+                method(str('%s%s' % (tabs, item)))
+            index += 1
+        if index > self.start:
+            # keep the opening tag for the tag and attr properties
+            del self[1:index]
+            self.start = 1
 #
     def addXML(self, version=1.0, encoding="UTF-8", standalone="no"):
         """
@@ -561,9 +639,18 @@ class Html(list):
     inside = property(__getinside, __setinside, __delinside)
 #
     def __enter__(self):
+        self.state = _OPEN
         return self
 #
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self.state = _CLOSED
+        if exc_type is None:
+            for stream in _STREAMS[:]:
+                page = stream[0]()
+                if page is None:
+                    _STREAMS.remove(stream)
+                else:
+                    page.__flush(stream[1], stream[2], '')
         return exc_type is None
 
 #------------------------------------------------------------------------
@@ -19,7 +19,7 @@
 #
 
 """
-Helper class for importing places.
+Helper classes for importing places.
 """
 from collections import OrderedDict
 
@@ -30,6 +30,98 @@ from collections import OrderedDict
 #-------------------------------------------------------------------------
 from gramps.gen.lib import Place, PlaceName, PlaceType, PlaceRef
 
+#-------------------------------------------------------------------------
+#
+# PlaceIndex class
+#
+#-------------------------------------------------------------------------
+class PlaceIndex:
+    """
+    An index of the places by title, location and enclosing places, to find
+    the place matching an imported place without reading all the places of
+    the same title.
+
+    The key of a place is the tuple of its title, its first alternate
+    location, and the handles of its enclosing places.  An empty location
+    is None.  An index must be told about the places added or changed by
+    the import, with :meth:`add`.
+    """
+    def __init__(self, db=None):
+        """
+        :param db: the database whose places are indexed, if any.
+        """
+        self.key2handles = {}
+        self.handle2key = {}
+        if db is not None:
+            with db.get_place_cursor() as cursor:
+                for handle, data in cursor:
+                    alt_loc = data[10]
+                    self.__add(handle, self.make_key(
+                        data[2], alt_loc[0] if alt_loc else None,
+                        [placeref[0] for placeref in data[5]]))
+
+    @staticmethod
+    def make_key(title, location, handles):
+        """
+        Return the key of a place.
+
+        :param title: the place title.
+        :param location: the serialized first alternate location, or None.
+        :param handles: the handles of the enclosing places.
+        """
+        if location is None or not any(location[0]):
+            # the parish alone does not make a location
+            location = None
+        else:
+            location = (tuple(location[0]), location[1])
+        return (title, location, tuple(handles))
+
+    @staticmethod
+    def get_key(title, location, placeref_list):
+        """
+        Return the key of a place from its objects.
+
+        :param title: the place title.
+        :param location: the first alternate location, or None.
+        :type location: :class:`~.location.Location`
+        :param placeref_list: the references to the enclosing places, or
+                              None.
+        """
+        if location is not None:
+            location = location.serialize()
+        return PlaceIndex.make_key(title, location,
+                                   [placeref.ref
+                                    for placeref in placeref_list or []])
+
+    def __add(self, handle, key):
+        old_key = self.handle2key.get(handle)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self.key2handles[old_key].remove(handle)
+        self.handle2key[handle] = key
+        self.key2handles.setdefault(key, []).append(handle)
+
+    def add(self, place):
+        """
+        Add a place to the index, or update it after a change.
+        """
+        alt_locs = place.get_alternate_locations()
+        self.__add(place.get_handle(),
+                   self.get_key(place.get_title(),
+                                alt_locs[0] if alt_locs else None,
+                                place.get_placeref_list()))
+
+    def find(self, title, location, placeref_list):
+        """
+        Return the handle of the first place with the title, location and
+        enclosing places, or None.  The arguments are those of
+        :meth:`get_key`.
+        """
+        handles = self.key2handles.get(
+            self.get_key(title, location, placeref_list))
+        return handles[0] if handles else None
+
 #-------------------------------------------------------------------------
 #
 # PlaceImport class
@@ -39,8 +131,14 @@ class PlaceImport:
     """
     Helper class for importing places.
     """
-    def __init__(self, db):
+    def __init__(self, db, index=None):
+        """
+        :param index: the PlaceIndex kept up to date with the places
+                      created and linked by :meth:`generate_hierarchy`, if
+                      any.
+        """
         self.db = db
+        self.index = index
         self.loc2handle = {}
         self.handle2loc = OrderedDict()
 
@@ -101,6 +199,8 @@ class PlaceImport:
                 placeref.ref = parent
                 place.set_placeref_list([placeref])
                 self.db.commit_place(place, trans, place.get_change_time())
+                if self.index is not None:
+                    self.index.add(place)
 
     def __add_place(self, name, type_num, parent, title, trans):
         """
@@ -118,4 +218,6 @@ class PlaceImport:
             place.set_placeref_list([placeref])
         handle = self.db.add_place(place, trans)
         self.db.commit_place(place, trans)
+        if self.index is not None:
+            self.index.add(place)
         return handle
@@ -43,6 +43,23 @@ authors_email = ["http://gramps-project.org"],
 #load_on_reg = True
 )
 
+#------------------------------------------------------------------------
+#
+# libduplicates
+#
+#------------------------------------------------------------------------
+register(GENERAL,
+id    = 'libduplicates',
+name  = "Duplicates lib",
+description =  _("Provides functions for finding duplicate people"),
+version = '1.0',
+gramps_target_version = MODULE_VERSION,
+status = STABLE,
+fname = 'libduplicates.py',
+authors = ["The Gramps project"],
+authors_email = ["http://gramps-project.org"],
+)
+
 #------------------------------------------------------------------------
 #
 # libgedcom
@@ -0,0 +1,127 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the search of duplicate people
+"""
+import unittest
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import make_database
+from gramps.gen.lib import (Person, Family, ChildRef, Event, EventRef,
+                            EventType, Name, Surname)
+from gramps.plugins.lib import libduplicates
+from gramps.plugins.lib.libduplicates import DuplicateFinder
+
+class DuplicateFinderTest(unittest.TestCase):
+    """
+    Duplicate finder tests.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.handles = {}
+        with DbTxn('Add people', self.db) as trans:
+            for key, first_name, surname, gender, year in (
+                    ('john', 'John', 'Smith', Person.MALE, 1850),
+                    ('jon', 'Jon', 'Smyth', Person.MALE, 1850),
+                    ('j', 'J.', 'Smith', Person.MALE, None),
+                    ('other', 'John', 'Smith', Person.MALE, 1890),
+                    ('mary', 'John', 'Smith', Person.FEMALE, 1850),
+                    ('father', 'John', 'Smith', Person.MALE, None)):
+                self.handles[key] = self.add_person(
+                    first_name, surname, gender, year, trans)
+            family = Family()
+            family.set_father_handle(self.handles['father'])
+            child_ref = ChildRef()
+            child_ref.set_reference_handle(self.handles['john'])
+            family.add_child_ref(child_ref)
+            self.db.add_family(family, trans)
+            for key, add in (('father', Person.add_family_handle),
+                             ('john', Person.add_parent_family_handle)):
+                person = self.db.get_person_from_handle(self.handles[key])
+                add(person, family.handle)
+                self.db.commit_person(person, trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def add_person(self, first_name, surname, gender, year, trans):
+        person = Person()
+        name = Name()
+        name.set_first_name(first_name)
+        name.add_surname(Surname())
+        name.get_primary_surname().set_surname(surname)
+        person.set_primary_name(name)
+        person.set_gender(gender)
+        if year:
+            event = Event()
+            event.set_type(EventType.BIRTH)
+            event.get_date_object().set_yr_mon_day(year, 0, 0)
+            self.db.add_event(event, trans)
+            event_ref = EventRef()
+            event_ref.set_reference_handle(event.handle)
+            person.add_event_ref(event_ref)
+            person.set_birth_ref(event_ref)
+        return self.db.add_person(person, trans)
+
+    def pairs(self, result):
+        names = {handle: key for key, handle in self.handles.items()}
+        return sorted(tuple(sorted((names[handle1], names[handle2])))
+                      for handle1, (handle2, chance) in result.items())
+
+    def test_candidates(self):
+        finder = DuplicateFinder(self.db)
+        finder.extract_features()
+        pairs = {frozenset(pair) for pair in finder.iter_candidates()}
+        handles = self.handles
+        # same birth year or unknown birth year
+        self.assertIn(frozenset((handles['john'], handles['jon'])), pairs)
+        self.assertIn(frozenset((handles['john'], handles['j'])), pairs)
+        # different birth years, or different gender groups
+        self.assertNotIn(frozenset((handles['john'], handles['other'])),
+                         pairs)
+        self.assertNotIn(frozenset((handles['john'], handles['mary'])), pairs)
+
+    def test_find_duplicates(self):
+        result = DuplicateFinder(self.db).find_duplicates()
+        pairs = self.pairs(result)
+        self.assertIn(('john', 'jon'), pairs)
+        # an ancestor is not a duplicate
+        self.assertNotIn(('father', 'john'), pairs)
+        self.assertEqual(len(pairs), len(set(pairs)))
+        result = DuplicateFinder(self.db, use_soundex=False).find_duplicates()
+        self.assertNotIn(('john', 'jon'), self.pairs(result))
+
+    def test_parallel(self):
+        min_pairs, chunk_size = (libduplicates.MIN_PAIRS,
+                                 libduplicates.CHUNK_SIZE)
+        libduplicates.MIN_PAIRS, libduplicates.CHUNK_SIZE = 1, 2
+        try:
+            result = DuplicateFinder(self.db, workers=2).find_duplicates()
+        finally:
+            libduplicates.MIN_PAIRS = min_pairs
+            libduplicates.CHUNK_SIZE = chunk_size
+        self.assertEqual(result, DuplicateFinder(self.db).find_duplicates())
+
+
+if __name__ == "__main__":
+    unittest.main()
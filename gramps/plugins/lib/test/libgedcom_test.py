@@ -0,0 +1,146 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the GEDCOM readers and lexer
+"""
+import io
+import time
+import logging
+import unittest
+
+from gramps.plugins.lib.libgedcom import (
+    Lexer, BaseReader, UTF8Reader, UTF16Reader, AnsiReader, AnselReader,
+    TOKEN_HEAD, TOKEN_NAME, TOKEN_NOTE, TOKEN_ID, TOKEN_TRLR)
+
+LOG = logging.getLogger(".libgedcom_test")
+
+RECORD = ("0 @I%d@ INDI\r\n"
+          "1 NAME René /Müller/\r\n"
+          "1 NOTE Line one\r\n"
+          "2 CONT line two with @@ sign\r\n"
+          "2 CONC  and more\r\n")
+
+# ANSEL with a combining acute accent before the e, and the ü of the
+# two byte table
+ANSEL_RECORD = (b"0 @I%d@ INDI\r\n"
+                b"1 NAME Ren\xe2e /M\xe8uller/\r\n"
+                b"1 NOTE Line one\r\n"
+                b"2 CONT line two with @@ sign\r\n"
+                b"2 CONC  and more\r\n")
+
+class LexerTest(unittest.TestCase):
+    """
+    GEDCOM lexer tests.
+    """
+
+    def setUp(self):
+        self.messages = []
+        self.chunk_size = BaseReader.CHUNK_SIZE
+
+    def tearDown(self):
+        BaseReader.CHUNK_SIZE = self.chunk_size
+
+    def lex(self, reader):
+        """
+        Return the lines of the lexer.
+        """
+        lexer = Lexer(reader, self.messages.append)
+        lines = []
+        line = lexer.readline()
+        while line is not None:
+            lines.append(line)
+            line = lexer.readline()
+        return lines
+
+    def check_lines(self, lines, count):
+        self.assertEqual(len(lines), count * 3 + 2)
+        self.assertEqual(lines[0].token, TOKEN_HEAD)
+        self.assertEqual(lines[-1].token, TOKEN_TRLR)
+        for index in range(count):
+            name, note = lines[index * 3 + 2:index * 3 + 4]
+            self.assertEqual(lines[index * 3 + 1].token, TOKEN_ID)
+            self.assertEqual(lines[index * 3 + 1].token_text, 'I%d' % index)
+            self.assertEqual(name.token, TOKEN_NAME)
+            self.assertEqual(name.data, 'René /Müller/')
+            self.assertEqual(note.token, TOKEN_NOTE)
+            self.assertEqual(note.line, index * 5 + 4)
+            self.assertEqual(note.data,
+                             'Line one\nline two with @ sign and more')
+
+    def make_text(self, count):
+        return ("0 HEAD\r\n" + "".join(RECORD % index
+                                       for index in range(count)) +
+                "0 TRLR")
+
+    def test_encodings(self):
+        text = self.make_text(3)
+        ansel = (b"0 HEAD\r\n" + b"".join(ANSEL_RECORD % index
+                                          for index in range(3)) +
+                 b"0 TRLR")
+        # small chunks, to split the CRLF and ANSEL combiners
+        for chunk_size in (1, 2, 7, self.chunk_size):
+            BaseReader.CHUNK_SIZE = chunk_size
+            for reader in (
+                    UTF8Reader(io.BytesIO(text.encode('utf_8')),
+                               self.messages.append, 'UTF8'),
+                    UTF8Reader(io.BytesIO(text.encode('utf_8_sig')),
+                               self.messages.append, 'UTF_8_SIG'),
+                    UTF16Reader(io.BytesIO(text.encode('utf_16')),
+                                self.messages.append),
+                    AnsiReader(io.BytesIO(text.encode('latin1')),
+                               self.messages.append),
+                    AnselReader(io.BytesIO(ansel), self.messages.append)):
+                self.check_lines(self.lex(reader), 3)
+        self.assertEqual(self.messages, [])
+
+    def test_errors(self):
+        ansel = b"0 HEAD\n1 NOTE a\x01b\xffc\n1 NOTE d\xe1\n0 TRLR\n"
+        BaseReader.CHUNK_SIZE = 3
+        lines = self.lex(AnselReader(io.BytesIO(ansel),
+                                     self.messages.append))
+        self.assertEqual([line.data for line in lines[1:3]],
+                         ['a b�c', 'd'])
+        self.assertEqual(len(self.messages), 2)
+        self.assertIn('(0X1) (0XFF)', self.messages[0])
+        self.assertTrue(self.messages[0].endswith('1 NOTE a b�c'))
+        self.assertIn('(0XA)', self.messages[1])
+
+        self.messages = []
+        text = b"0 HEAD\r1 NOTE \x81\x02x\rbad line\r0 TRLR\r"
+        lines = self.lex(AnsiReader(io.BytesIO(text), self.messages.append))
+        self.assertEqual([line.data for line in lines], ['', '\x81x', ''])
+        self.assertEqual(len(self.messages), 2)
+        self.assertIn('C1 control chars', self.messages[0])
+        self.assertIn('bad line', self.messages[1])
+
+    def test_speed(self):
+        count = 5000
+        data = self.make_text(count).encode('utf_8')
+        start = time.perf_counter()
+        lines = self.lex(UTF8Reader(io.BytesIO(data), self.messages.append,
+                                    'UTF8'))
+        elapsed = time.perf_counter() - start
+        self.check_lines(lines, count)
+        LOG.info("%d lines/s", count * 5 // elapsed)
+
+
+if __name__ == "__main__":
+    unittest.main()
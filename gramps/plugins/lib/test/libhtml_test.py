@@ -0,0 +1,116 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the writing of pages while they are built
+"""
+import unittest
+
+from gramps.plugins.lib.libhtml import Html
+
+class StreamTest(unittest.TestCase):
+    """
+    Streaming tests.
+    """
+
+    def build_page(self, stream=None, rows=50, sizes=None):
+        """
+        Build a page with a table, and return it.
+        """
+        page, head, body = Html.page(title="Test")
+        if stream is not None:
+            page.stream(stream.append)
+        with Html("div", class_="content", id="Test") as content:
+            body += content
+            content += Html("h3", "Title", inline=True)
+            table = Html("table", class_="infolist")
+            content += table
+            thead = Html("thead")
+            table += thead
+            thead += Html("tr") + Html("th", "Name", inline=True)
+            with Html("tbody") as tbody:
+                table += tbody
+                for row in range(rows):
+                    with Html("tr") as trow:
+                        tbody += trow
+                        trow.attr = 'id="Row%d"' % row
+                        cell = Html("td", class_="ColumnName")
+                        trow += cell
+                        cell += Html("a", "Person %d" % row, href="#",
+                                     inline=True)
+                        trow += Html("td", row, inline=True)
+                    if sizes is not None:
+                        sizes.append(len(tbody))
+        body += Html("div", "Footer", id="footer")
+        return page
+
+    def write_page(self, page, lines):
+        """
+        Write the rest of a page.
+        """
+        page.write(lines.append)
+        return lines
+
+    def test_stream(self):
+        """
+        The page is written as without streaming.
+        """
+        expected = self.write_page(self.build_page(), [])
+        lines = []
+        page = self.build_page(lines)
+        self.assertTrue(len(lines) > 0)
+        self.assertEqual(self.write_page(page, lines), expected)
+
+    def test_memory(self):
+        """
+        The rows written are removed from the page.
+        """
+        sizes = []
+        self.build_page([], rows=100, sizes=sizes)
+        self.assertTrue(max(sizes) <= 2)
+
+    def build_outer_page(self, outer=None, inner=None):
+        """
+        Build a page, and another one while it is built.
+        """
+        page, head, body = Html.page(title="Outer")
+        if outer is not None:
+            page.stream(outer.append)
+        with Html("div", id="Outer") as content:
+            body += content
+            content += Html("p", "Before", inline=True)
+            self.write_page(self.build_page(inner), [] if inner is None
+                            else inner)
+            content += Html("p", "After", inline=True)
+        return page
+
+    def test_nested(self):
+        """
+        A page built while another one is streamed.
+        """
+        expected = self.write_page(self.build_page(), [])
+        expected_outer = self.write_page(self.build_outer_page(), [])
+        outer, inner = [], []
+        page = self.build_outer_page(outer, inner)
+        self.assertEqual(self.write_page(page, outer), expected_outer)
+        self.assertEqual(inner, expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest that tests the index of the imported places
+"""
+import unittest
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import make_database
+from gramps.gen.lib import Place, PlaceRef, Location
+from gramps.plugins.lib.libplaceimport import PlaceImport, PlaceIndex
+
+def make_location(city, parish=''):
+    location = Location()
+    location.set_city(city)
+    location.set_parish(parish)
+    return location
+
+def make_placeref(handle):
+    placeref = PlaceRef()
+    placeref.ref = handle
+    return placeref
+
+class PlaceIndexTest(unittest.TestCase):
+    """
+    Place index tests.
+    """
+
+    def setUp(self):
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.handles = {}
+        with DbTxn('Add places', self.db) as trans:
+            for key, title, city, parent in (
+                    ('town', 'Town', '', None),
+                    ('church', "St. Mary's Church", '', None),
+                    ('church1', "St. Mary's Church", 'Bath', None),
+                    ('church2', "St. Mary's Church", 'Ely', None),
+                    ('church3', "St. Mary's Church", '', 'town')):
+                place = Place()
+                place.set_title(title)
+                if city:
+                    place.add_alternate_locations(make_location(city))
+                if parent:
+                    place.set_placeref_list(
+                        [make_placeref(self.handles[parent])])
+                self.handles[key] = self.db.add_place(place, trans)
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_find(self):
+        index = PlaceIndex(self.db)
+        title = "St. Mary's Church"
+        self.assertEqual(index.find(title, None, []),
+                         self.handles['church'])
+        # a location with a parish only is empty
+        self.assertEqual(index.find(title, make_location('', 'Parish'), None),
+                         self.handles['church'])
+        self.assertEqual(index.find(title, make_location('Ely'), []),
+                         self.handles['church2'])
+        self.assertIsNone(index.find(title, make_location('York'), []))
+        self.assertEqual(
+            index.find(title, None, [make_placeref(self.handles['town'])]),
+            self.handles['church3'])
+        self.assertIsNone(index.find('Town', make_location('Bath'), []))
+
+        # a changed place moves in the index
+        place = self.db.get_place_from_handle(self.handles['church2'])
+        place.get_alternate_locations()[0].set_city('York')
+        index.add(place)
+        self.assertIsNone(index.find(title, make_location('Ely'), []))
+        self.assertEqual(index.find(title, make_location('York'), []),
+                         self.handles['church2'])
+
+    def test_hierarchy(self):
+        index = PlaceIndex(self.db)
+        place_import = PlaceImport(self.db, index)
+        place_import.store_location(
+            ('', '', "St. Mary's Church", 'Bath', '', '', 'England'),
+            self.handles['church1'])
+        with DbTxn('Generate hierarchy', self.db) as trans:
+            place_import.generate_hierarchy(trans)
+        country = index.find('England', None, [])
+        self.assertIsNotNone(country)
+        city = index.find('Bath, England', None, [make_placeref(country)])
+        self.assertIsNotNone(city)
+        self.assertEqual(index.find("St. Mary's Church", make_location('Bath'),
+                                    [make_placeref(city)]),
+                         self.handles['church1'])
+
+
+if __name__ == "__main__":
+    unittest.main()
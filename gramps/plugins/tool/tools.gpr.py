@@ -162,7 +162,7 @@ authors_email = ["don@gramps-project.org"],
 category = TOOL_DBPROC,
 toolclass = 'DuplicatePeopleTool',
 optionclass = 'DuplicatePeopleToolOptions',
-tool_modes = [TOOL_MODE_GUI]
+tool_modes = [TOOL_MODE_GUI, TOOL_MODE_CLI]
   )
 
 #------------------------------------------------------------------------
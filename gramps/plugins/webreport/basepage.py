@@ -703,14 +703,13 @@ class BasePage: # pylint: disable=C1001
         trow2 += Html("td", srcrefs, class_="ColumnSources")
 
         # get event notes
-        notelist = event.get_note_list()
-        notelist.extend(event_ref.get_note_list())
+        notelist = event.get_note_list() + event_ref.get_note_list()
         htmllist = self.dump_notes(notelist)
 
         # if the event or event reference has an attribute attached to it,
         # get the text and format it correctly?
-        attrlist = event.get_attribute_list()
-        attrlist.extend(event_ref.get_attribute_list())
+        attrlist = (event.get_attribute_list() +
+                    event_ref.get_attribute_list())
         for attr in attrlist:
             htmllist.extend(Html("p",
                                  _("%(str1)s: %(str2)s") % {
@@ -2790,9 +2789,18 @@ class BasePage: # pylint: disable=C1001
                     role = "3"
             return role
 
-        for (bkref_class, bkref_handle, role) in sorted(
-                bkref_list, key=lambda x:
-                sort_by_role(x)):
+        # The references with the same role are sorted by name and ID, so
+        # that their order does not depend on the order of the set, which
+        # differs between processes.
+        def sort_key(obj):
+            """
+            Sort by role, name and ID
+            """
+            data = self.report.obj_dict[obj[0]][obj[1]]
+            return (sort_by_role(obj), data[1], data[2])
+
+        for (bkref_class, bkref_handle, role) in sorted(bkref_list,
+                                                        key=sort_key):
             list_html = Html("li")
             path = self.report.obj_dict[bkref_class][bkref_handle][0]
             name = self.report.obj_dict[bkref_class][bkref_handle][1]
@@ -2846,6 +2854,17 @@ class BasePage: # pylint: disable=C1001
     # -------------------------------------------------------------------------
     #              # Web Page Fortmatter and writer
     # -------------------------------------------------------------------------
+    def xhtml_stream(self, htmlinstance, output_file):
+        """
+        Will write the page to the file while it is built, for the pages
+        which can be long.  xhtml_writer writes the rest of the page.
+
+        @param: htmlinstance -- Web page created with libhtml
+                                src/plugins/lib/libhtml.py
+        @param: output_file  -- Open file that is being written to
+        """
+        htmlinstance.stream(partial(print, file=output_file))
+
     def xhtml_writer(self, htmlinstance, output_file, sio, date):
         """
         Will format, write, and close the file
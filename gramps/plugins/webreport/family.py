@@ -108,14 +108,22 @@ class FamilyPages(BasePage):
         with self.r_user.progress(_("Narrated Web Site Report"), message,
                                   len(self.report.obj_dict[Family]) + 1
                                  ) as step:
-            for family_handle in self.report.obj_dict[Family]:
-                step()
-                index += 1
-                self.familypage(self.report, title, family_handle)
+            jobs = [(family_handle,) for family_handle
+                    in self.report.obj_dict[Family]]
+            self.report.write_object_pages(Family, title, jobs, step)
             step()
             self.familylistpage(self.report, title,
                                 self.report.obj_dict[Family].keys())
 
+    def display_page(self, title, family_handle):
+        """
+        Generate and output the page of a family.
+
+        @param: title         -- Is the title of the web page
+        @param: family_handle -- The handle of the family
+        """
+        self.familypage(self.report, title, family_handle)
+
     def familylistpage(self, report, title, fam_list):
         """
         Create a family index
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Narrative Web Page generator.
+
+Incremental generation of the web site: the manifest of the pages of the
+objects written by the last run, with the objects each page was built
+from, so that only the pages whose objects changed are written again.
+
+The pages which are not the page of an object, like the index pages, are
+always written.
+"""
+
+#------------------------------------------------
+# python modules
+#------------------------------------------------
+from hashlib import md5
+import gzip
+import json
+import logging
+import os
+
+#------------------------------------------------
+# Gramps module
+#------------------------------------------------
+from gramps.gen.errors import HandleError
+
+LOG = logging.getLogger(".NarrativeWeb")
+
+# The kind of the dependencies on the back references of an object
+BACKLINKS = "Backlinks"
+
+def _digest(value):
+    """
+    Return a short digest of the representation of a value.
+    """
+    return md5(repr(value).encode('utf-8')).hexdigest()[:16]
+
+#------------------------------------------------
+#
+# RecordingDb
+#
+#------------------------------------------------
+class RecordingDb:
+    """
+    A proxy for the database of the report, which records the objects read
+    while a page is built.
+    """
+    def __init__(self, database):
+        self.db = database
+        self.handles = None
+
+    def __getattr__(self, attr):
+        """
+        If an attribute isn't found here, use the self.db version.
+        """
+        return getattr(self.db, attr)
+
+    def __record(self, kind, obj):
+        if self.handles is not None and obj is not None:
+            self.handles.add((kind, obj.handle))
+        return obj
+
+    def get_person_from_handle(self, handle):
+        return self.__record('Person', self.db.get_person_from_handle(handle))
+
+    def get_family_from_handle(self, handle):
+        return self.__record('Family', self.db.get_family_from_handle(handle))
+
+    def get_event_from_handle(self, handle):
+        return self.__record('Event', self.db.get_event_from_handle(handle))
+
+    def get_place_from_handle(self, handle):
+        return self.__record('Place', self.db.get_place_from_handle(handle))
+
+    def get_source_from_handle(self, handle):
+        return self.__record('Source', self.db.get_source_from_handle(handle))
+
+    def get_citation_from_handle(self, handle):
+        return self.__record('Citation',
+                             self.db.get_citation_from_handle(handle))
+
+    def get_media_from_handle(self, handle):
+        return self.__record('Media', self.db.get_media_from_handle(handle))
+
+    def get_repository_from_handle(self, handle):
+        return self.__record('Repository',
+                             self.db.get_repository_from_handle(handle))
+
+    def get_note_from_handle(self, handle):
+        return self.__record('Note', self.db.get_note_from_handle(handle))
+
+    def get_tag_from_handle(self, handle):
+        return self.__record('Tag', self.db.get_tag_from_handle(handle))
+
+    def get_person_from_gramps_id(self, gramps_id):
+        return self.__record('Person',
+                             self.db.get_person_from_gramps_id(gramps_id))
+
+    def get_media_from_gramps_id(self, gramps_id):
+        return self.__record('Media',
+                             self.db.get_media_from_gramps_id(gramps_id))
+
+    def get_note_from_gramps_id(self, gramps_id):
+        return self.__record('Note',
+                             self.db.get_note_from_gramps_id(gramps_id))
+
+    def find_backlink_handles(self, handle, include_classes=None):
+        if self.handles is not None:
+            self.handles.add((BACKLINKS, handle))
+        return self.db.find_backlink_handles(handle, include_classes)
+
+#------------------------------------------------
+#
+# Manifest
+#
+#------------------------------------------------
+class Manifest:
+    """
+    The pages of the objects written by the last run of the report.
+
+    For each page, the manifest keeps the files written, a digest of what
+    the report itself passed to the page, like its back references, and
+    the objects read while the page was built.  The objects are kept once,
+    with their change time, a digest of their data as the page saw it
+    through the proxies, which also changes when a person stops being
+    living, and whether the report has a page for them.
+
+    A page is written again if any of them changed, if one of its files is
+    missing, or if the options of the report changed.  The files of the
+    pages which are not written any more are removed when the manifest is
+    saved.
+    """
+    FILE_NAME = "narrativeweb.manifest"
+    VERSION = 1
+
+    def __init__(self, html_dir, database, state):
+        """
+        @param: html_dir -- The directory of the web site
+        @param: database -- The database of the report
+        @param: state    -- The options of the report, and anything else
+                            which changes all the pages
+        """
+        self.html_dir = html_dir
+        self.path = os.path.join(html_dir, self.FILE_NAME)
+        self.database = database
+        self.state = _digest(state)
+        self.obj_dict = None
+        self.bkref_dict = None
+        self.classes = {}
+        self.objects = []
+        self.indices = {}
+        self.pages = {}
+        self.written = 0
+        self.kept = 0
+        self.__fingerprints = {}
+        self.__changed = {}
+
+        self.old_objects = []
+        self.old_pages = {}
+        self.reuse = False
+        self.__load()
+
+    def __load(self):
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as mfile:
+                data = json.load(mfile)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != self.VERSION:
+            return
+        self.old_objects = data['objects']
+        self.old_pages = data['pages']
+        self.reuse = data['state'] == self.state
+
+    def set_objects(self, obj_dict, bkref_dict):
+        """
+        Set the objects of the report, once they are known.
+        """
+        self.obj_dict = obj_dict
+        self.bkref_dict = bkref_dict
+        self.classes = {obj_class.__name__: obj_class
+                        for obj_class in obj_dict}
+
+    def is_current(self, obj_class, handle, extra=()):
+        """
+        Return True if the page of an object written by the last run is
+        still current, and need not be written again.
+
+        @param: obj_class -- The class of the object
+        @param: handle    -- The handle of the object
+        @param: extra     -- Any other value passed to the page
+        """
+        key = "%s:%s" % (obj_class.__name__, handle)
+        entry = self.old_pages.get(key)
+        if entry is None:
+            return False
+        state = self.__get_state(obj_class, handle, extra)
+        if not self.__is_current(entry, state):
+            return False
+        deps = [self.__add(*self.old_objects[index][:2])
+                for index in entry['deps']]
+        self.pages[key] = {'state': state, 'files': entry['files'],
+                           'deps': deps}
+        self.kept += 1
+        return True
+
+    def add_page(self, obj_class, handle, extra, handles, files):
+        """
+        Add the page of an object written by this run.
+
+        @param: obj_class -- The class of the object
+        @param: handle    -- The handle of the object
+        @param: extra     -- Any other value passed to the page
+        @param: handles   -- The (class name, handle) of the objects read
+        @param: files     -- The files written
+        """
+        key = "%s:%s" % (obj_class.__name__, handle)
+        # the pages name the objects which refer to them from the report
+        handles = set(handles)
+        handles.add((obj_class.__name__, handle))
+        handles.update((bkref[0].__name__, bkref[1])
+                       for bkref in self.bkref_dict[obj_class].get(handle, ())
+                       if bkref[0])
+        deps = [self.__add(kind, dep_handle)
+                for (kind, dep_handle) in sorted(handles)]
+        self.pages[key] = {'state': self.__get_state(obj_class, handle, extra),
+                           'files': files, 'deps': deps}
+        self.written += 1
+
+    def save(self):
+        """
+        Remove the files of the pages which were not written, and save the
+        manifest for the next run.
+        """
+        files = set(fname for entry in self.pages.values()
+                    for fname in entry['files'])
+        for entry in self.old_pages.values():
+            for fname in entry['files']:
+                if fname not in files:
+                    try:
+                        os.remove(os.path.join(self.html_dir, fname))
+                    except OSError:
+                        pass
+        data = {'version': self.VERSION, 'state': self.state,
+                'objects': self.objects, 'pages': self.pages}
+        with gzip.open(self.path + ".tmp", 'wt', encoding='utf-8') as mfile:
+            json.dump(data, mfile, separators=(',', ':'))
+        os.replace(self.path + ".tmp", self.path)
+        LOG.info("%d object pages written, %d kept", self.written, self.kept)
+
+    def __get_state(self, obj_class, handle, extra):
+        bkrefs = self.bkref_dict[obj_class].get(handle, ())
+        return _digest((sorted(tuple(str(value) for value in bkref)
+                               for bkref in bkrefs), extra))
+
+    def __is_current(self, entry, state):
+        if not self.reuse or entry['state'] != state:
+            return False
+        for fname in entry['files']:
+            if not os.path.isfile(os.path.join(self.html_dir, fname)):
+                return False
+        for index in entry['deps']:
+            changed = self.__changed.get(index)
+            if changed is None:
+                kind, handle, fingerprint = self.old_objects[index]
+                changed = self.__get_fingerprint(kind, handle) != fingerprint
+                self.__changed[index] = changed
+            if changed:
+                return False
+        return True
+
+    def __add(self, kind, handle):
+        """
+        Add an object to the manifest, and return its index.
+        """
+        index = self.indices.get((kind, handle))
+        if index is None:
+            index = self.indices[(kind, handle)] = len(self.objects)
+            self.objects.append([kind, handle,
+                                 self.__get_fingerprint(kind, handle)])
+        return index
+
+    def __get_fingerprint(self, kind, handle):
+        fingerprint = self.__fingerprints.get((kind, handle))
+        if fingerprint is None:
+            fingerprint = self.__fingerprints[(kind, handle)] = \
+                self.__make_fingerprint(kind, handle)
+        return fingerprint
+
+    def __make_fingerprint(self, kind, handle):
+        """
+        Return the fingerprint of an object, as a list, like in the saved
+        manifest.
+        """
+        database = self.database
+        if kind == BACKLINKS:
+            return [_digest(sorted(database.find_backlink_handles(handle)))]
+        try:
+            obj = getattr(database,
+                          'get_%s_from_handle' % kind.lower())(handle)
+        except HandleError:
+            obj = None
+        if obj is None:
+            return [None]
+        obj_class = self.classes.get(kind)
+        return [obj.get_change_time(), _digest(obj.serialize()),
+                obj_class is not None and handle in self.obj_dict[obj_class]]
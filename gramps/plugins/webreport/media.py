@@ -137,11 +137,11 @@ class MediaPages(BasePage):
                 self.report.obj_dict[Media].keys(),
                 key=lambda x: sort_by_desc_and_gid(
                     self.r_db.get_media_from_handle(x)))
+            jobs = []
             prev = None
             total = len(sorted_media_handles)
             index = 1
             for handle in sorted_media_handles:
-                gc.collect() # Reduce memory usage when there are many images.
                 if index == media_count:
                     next_ = None
                 elif index < total:
@@ -150,10 +150,8 @@ class MediaPages(BasePage):
                     next_ = self.unused_media_handles[0]
                 else:
                     next_ = None
-                self.mediapage(self.report, title,
-                               handle, (prev, next_, index, media_count))
+                jobs.append((handle, (prev, next_, index, media_count)))
                 prev = handle
-                step()
                 index += 1
 
             total = len(self.unused_media_handles)
@@ -162,22 +160,32 @@ class MediaPages(BasePage):
             prev = sorted_media_handles[total_m-1] if total_m > 0 else 0
             if total > 0:
                 for media_handle in self.unused_media_handles:
-                    media = self.r_db.get_media_from_handle(media_handle)
-                    gc.collect() # Reduce memory usage when many images.
                     if index == media_count:
                         next_ = None
                     else:
                         next_ = self.unused_media_handles[idx]
-                    self.mediapage(self.report, title,
-                                   media_handle,
-                                   (prev, next_, index, media_count))
+                    jobs.append((media_handle,
+                                 (prev, next_, index, media_count)))
                     prev = media_handle
-                    step()
                     index += 1
                     idx += 1
+            self.report.write_object_pages(Media, title, jobs, step)
 
         self.medialistpage(self.report, title, sorted_media_handles)
 
+    def display_page(self, title, handle, info):
+        """
+        Generate and output the page of a media object.
+
+        @param: title  -- Is the title of the web page
+        @param: handle -- The handle of the media object
+        @param: info   -- A tuple containing the media handle for the
+                          next and previous media, the current page
+                          number, and the total number of media pages
+        """
+        gc.collect() # Reduce memory usage when there are many images.
+        self.mediapage(self.report, title, handle, info)
+
     def medialistpage(self, report, title, sorted_media_handles):
         """
         Generate and output the Media index page.
@@ -194,6 +202,7 @@ class MediaPages(BasePage):
         # save the media file name in case we create unused media pages
         self.cur_fname = self.report.cur_fname
         medialistpage, head, body = self.write_header(self._('Media'))
+        self.xhtml_stream(medialistpage, output_file)
 
         ldatec = 0
         # begin gallery division
@@ -250,9 +259,6 @@ class MediaPages(BasePage):
                                 ldatec = media.get_change_time()
                             title = media.get_description() or "[untitled]"
 
-                            trow = Html("tr")
-                            tbody += trow
-
                             media_data_row = [
                                 [index, "ColumnRowLabel"],
                                 [self.media_ref_link(media_handle,
@@ -261,10 +267,12 @@ class MediaPages(BasePage):
                                  "ColumnDate"],
                                 [media.get_mime_type(), "ColumnMime"]]
 
-                            trow.extend(
-                                Html("td", data, class_=colclass)
-                                for data, colclass in media_data_row
-                            )
+                            with Html("tr") as trow:
+                                tbody += trow
+                                trow.extend(
+                                    Html("td", data, class_=colclass)
+                                    for data, colclass in media_data_row
+                                )
                         step()
                         index += 1
 
@@ -278,25 +286,26 @@ class MediaPages(BasePage):
                     prev = None
                     total = len(self.unused_media_handles)
                     if total > 0:
-                        trow += Html("tr")
-                        trow.extend(
-                            Html("td", Html("h4", " "), inline=True) +
-                            Html("td",
-                                 Html("h4",
-                                      self._("Below unused media objects"),
-                                      inline=True),
-                                 class_="") +
-                            Html("td", Html("h4", " "), inline=True) +
-                            Html("td", Html("h4", " "), inline=True)
-                        )
+                        with Html("tr") as trow:
+                            tbody += trow
+                            trow.extend(
+                                Html("td", Html("h4", " "), inline=True) +
+                                Html("td",
+                                     Html("h4",
+                                          self._("Below unused media objects"),
+                                          inline=True),
+                                     class_="") +
+                                Html("td", Html("h4", " "), inline=True) +
+                                Html("td", Html("h4", " "), inline=True)
+                            )
                         for media_handle in self.unused_media_handles:
                             media = self.r_db.get_media_from_handle(media_handle)
-                            gc.collect() # Reduce memory usage when many images.
+                            # Reduce memory usage when many images.
+                            gc.collect()
                             if idx == total:
                                 next_ = None
                             else:
                                 self.unused_media_handles[idx]
-                            trow += Html("tr")
                             media_data_row = [
                                 [index, "ColumnRowLabel"],
                                 [self.media_ref_link(media_handle,
@@ -305,10 +314,12 @@ class MediaPages(BasePage):
                                 [self.rlocale.get_date(media.get_date_object()),
                                  "ColumnDate"],
                                 [media.get_mime_type(), "ColumnMime"]]
-                            trow.extend(
-                                Html("td", data, class_=colclass)
-                                for data, colclass in media_data_row
-                            )
+                            with Html("tr") as trow:
+                                tbody += trow
+                                trow.extend(
+                                    Html("td", data, class_=colclass)
+                                    for data, colclass in media_data_row
+                                )
                             prev = media_handle
                             step()
                             index += 1
@@ -77,6 +77,7 @@ from gramps.gen.config import config
 from gramps.gen.display.name import displayer as _nd
 from gramps.gen.display.place import displayer as _pd
 from gramps.gen.proxy import CacheProxyDb
+from gramps.gen.db.utils import get_database_source
 from gramps.plugins.lib.libhtmlconst import _CHARACTER_SETS, _CC, _COPY_OPTIONS
 from gramps.gen.relationship import get_relationship_calculator
 
@@ -102,6 +103,8 @@ from gramps.plugins.webreport.download import DownloadPage
 from gramps.plugins.webreport.introduction import IntroductionPage
 from gramps.plugins.webreport.addressbook import AddressBookPage
 from gramps.plugins.webreport.addressbooklist import AddressBookListPage
+from gramps.plugins.webreport.manifest import Manifest, RecordingDb
+from gramps.plugins.webreport.parallel import PagePool, MIN_PAGES
 
 from gramps.plugins.webreport.common import (get_gendex_data,
                                              HTTP, HTTPS, _WEB_EXT, CSS,
@@ -260,6 +263,15 @@ class NavWebReport(Report):
         self.bkref_dict = None
         self.rel_class = None
         self.tab = None
+        self.manifest = None
+        self.recorder = None
+        self.page_files = None
+        self.pool = None
+        self.workers = self.options['workers']
+        if self.workers > 1:
+            self.db_source = get_database_source(database)
+        else:
+            self.db_source = None
         if self.options['securesite']:
             self.secure_mode = HTTPS
         else:
@@ -337,6 +349,15 @@ class NavWebReport(Report):
             config.set('paths.website-cal-uri',
                        os.path.dirname(self.target_cal_uri))
 
+        # the pages of the objects which changed since the last run only
+        if self.options['incremental'] and not self.use_archive:
+            options = dict(self.options, incremental=None, workers=None)
+            has_repos = len(self._db.get_repository_handles()) > 0
+            self.manifest = Manifest(self.html_dir, self.database,
+                                     (sorted(options.items()), has_repos))
+            self.recorder = RecordingDb(self.database)
+            self.database = self.recorder
+
         # for use with discovering biological, half, and step siblings for use
         # in display_ind_parents()...
         self.rel_class = get_relationship_calculator(reinit=True,
@@ -348,38 +369,7 @@ class NavWebReport(Report):
         #
         #################################################
 
-        # FIXME: The whole of this section of code should be implemented by the
-        # registration process for the Web Page plugins.
-
-        # Note that by use of a dictionary we ensure that at most one Web Page
-        # plugin is provided for any object class
-
-        self.tab = {}
-        # FIXME: Initialising self.tab in this way means that this code has to
-        # run before the Web Page registration - I am not sure whether this is
-        # possible, in which case an alternative approach to provinding the
-        # mapping of object class to Web Page plugin will be needed.
-        for obj_class in ("Person", "Family", "Source", "Citation", "Place",
-                          "Event", "Media", "Repository"):
-            # FIXME: Would it be better if the Web Page plugins used a different
-            # base class rather than BasePage, which is really just for each web
-            # page
-            self.tab[obj_class] = BasePage(report=self, title="")
-
-        # Note that by not initialising any Web Page plugins that are not going
-        # to generate pages, we ensure that there is not performance implication
-        # for such plugins.
-        self.tab["Person"] = PersonPages(self)
-        if self.inc_families:
-            self.tab["Family"] = FamilyPages(self)
-        if self.inc_events:
-            self.tab["Event"] = EventPages(self)
-        if self.inc_gallery:
-            self.tab["Media"] = MediaPages(self)
-        self.tab["Place"] = PlacePages(self)
-        self.tab["Source"] = SourcePages(self)
-        self.tab["Repository"] = RepositoryPages(self)
-        self.tab["Citation"] = CitationPages(self)
+        self._init_plugins()
 
         # FIXME: The following routines that are not run in two passes have not
         # yet been converted to a form suitable for separation into Web Page
@@ -394,6 +384,8 @@ class NavWebReport(Report):
         #################################################
 
         self._build_obj_dict()
+        if self.manifest:
+            self.manifest.set_objects(self.obj_dict, self.bkref_dict)
 
         #################################################
         #
@@ -442,6 +434,11 @@ class NavWebReport(Report):
         # build classes SourceListPage and SourcePage
         self.tab["Source"].display_pages(self.title)
 
+        # all the pages of the objects are written
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+
         # build classes StatisticsPage
         if self.inc_stats:
             self.statistics_preview_page(self.title)
@@ -449,6 +446,9 @@ class NavWebReport(Report):
         # copy all of the neccessary files
         self.copy_narrated_files()
 
+        if self.manifest:
+            self.manifest.save()
+
         # if an archive is being used, close it?
         if self.archive:
             self.archive.close()
@@ -463,6 +463,62 @@ class NavWebReport(Report):
             self.user.warn(_("Missing media objects:"), error)
         self.database.clear_cache()
 
+    def _init_plugins(self):
+        """
+        Initialise the Web Page plugins
+        """
+        # FIXME: The whole of this section of code should be implemented by the
+        # registration process for the Web Page plugins.
+
+        # Note that by use of a dictionary we ensure that at most one Web Page
+        # plugin is provided for any object class
+
+        self.tab = {}
+        # FIXME: Initialising self.tab in this way means that this code has to
+        # run before the Web Page registration - I am not sure whether this is
+        # possible, in which case an alternative approach to provinding the
+        # mapping of object class to Web Page plugin will be needed.
+        for obj_class in ("Person", "Family", "Source", "Citation", "Place",
+                          "Event", "Media", "Repository"):
+            # FIXME: Would it be better if the Web Page plugins used a different
+            # base class rather than BasePage, which is really just for each web
+            # page
+            self.tab[obj_class] = BasePage(report=self, title="")
+
+        # Note that by not initialising any Web Page plugins that are not going
+        # to generate pages, we ensure that there is not performance implication
+        # for such plugins.
+        self.tab["Person"] = PersonPages(self)
+        if self.inc_families:
+            self.tab["Family"] = FamilyPages(self)
+        if self.inc_events:
+            self.tab["Event"] = EventPages(self)
+        if self.inc_gallery:
+            self.tab["Media"] = MediaPages(self)
+        self.tab["Place"] = PlacePages(self)
+        self.tab["Source"] = SourcePages(self)
+        self.tab["Repository"] = RepositoryPages(self)
+        self.tab["Citation"] = CitationPages(self)
+
+    def init_worker(self, obj_dict, bkref_dict, record):
+        """
+        Prepare the report of a worker process to write the pages of the
+        objects of the report of the main process.
+
+        @param: obj_dict   -- The objects of the report
+        @param: bkref_dict -- The back references of the objects
+        @param: record     -- Whether to record the objects read by the pages
+        """
+        self.rel_class = get_relationship_calculator(reinit=True,
+                                                     clocale=self.rlocale)
+        if record:
+            self.recorder = RecordingDb(self.database)
+            self.database = self.recorder
+        self._init_plugins()
+        self.obj_dict = obj_dict
+        self.bkref_dict = bkref_dict
+        self.visited = []
+
     def _build_obj_dict(self):
         """
         Construct the dictionaries of objects to be included in the reports.
@@ -1395,6 +1451,8 @@ class NavWebReport(Report):
                 self.cur_fname = os.path.join(subdir, fname) + ext
             else:
                 self.cur_fname = fname + ext
+        if self.page_files is not None:
+            self.page_files.append(self.cur_fname)
         if self.archive:
             string_io = BytesIO()
             output_file = TextIOWrapper(string_io, encoding=self.encoding,
@@ -1410,6 +1468,64 @@ class NavWebReport(Report):
                                errors='xmlcharrefreplace')
         return (output_file, string_io)
 
+    def write_object_pages(self, obj_class, title, jobs, step):
+        """
+        Write the pages of the objects of a class, in worker processes if
+        there are many of them.
+
+        @param: obj_class -- The class of the objects
+        @param: title     -- The title of the web pages
+        @param: jobs      -- For each page, the handle of the object and any
+                             other value passed to the page
+        @param: step      -- Called after each page
+        """
+        if self.manifest:
+            pages = []
+            for job in jobs:
+                if self.manifest.is_current(obj_class, job[0], job[1:]):
+                    step()
+                else:
+                    pages.append(job)
+        else:
+            pages = jobs
+        if (self.pool is None and self.db_source
+                and len(pages) >= MIN_PAGES):
+            # the workers are kept for the pages of the next classes
+            self.pool = PagePool(self, self.db_source, self.workers)
+        if self.pool and pages:
+            results = self.pool.write_pages(obj_class, title, pages)
+        else:
+            results = (self.write_object_page(obj_class, title, job)
+                       for job in pages)
+        for job, (handles, files) in zip(pages, results):
+            if self.manifest:
+                self.manifest.add_page(obj_class, job[0], job[1:],
+                                       handles, files)
+            step()
+
+    def write_object_page(self, obj_class, title, job):
+        """
+        Write the page of an object, and return the objects read and the
+        files written.
+
+        @param: obj_class -- The class of the object
+        @param: title     -- The title of the web page
+        @param: job       -- The handle of the object and any other value
+                             passed to the page
+        """
+        recorder = self.recorder
+        self.page_files = []
+        if recorder is not None:
+            recorder.handles = set()
+        try:
+            self.tab[obj_class.__name__].display_page(title, *job)
+            return (recorder.handles if recorder is not None else None,
+                    self.page_files)
+        finally:
+            self.page_files = None
+            if recorder is not None:
+                recorder.handles = None
+
     def close_file(self, output_file, string_io, date):
         """
         will close any file passed to it
@@ -1612,6 +1728,20 @@ class NavWebOptions(MenuReportOptions):
                                  "files"))
         addopt("target", self.__target)
 
+        self.__incremental = BooleanOption(
+            _('Only write the pages of the objects which changed'), False)
+        self.__incremental.set_help(
+            _('Whether to keep the pages written by the last run of the '
+              'report, if the objects in them did not change'))
+        addopt("incremental", self.__incremental)
+
+        workers = NumberOption(_("Number of processes writing the pages"),
+                               1, 1, 64)
+        workers.set_help(_("The number of processes writing the pages of "
+                           "the objects. The database of the report must "
+                           "be a family tree on disk"))
+        addopt("workers", workers)
+
         self.__archive_changed()
 
         title = StringOption(_("Web site title"), _('My Family Tree'))
@@ -2127,8 +2257,10 @@ class NavWebOptions(MenuReportOptions):
         if self.__archive.get_value() is True:
             self.__target.set_extension(".tar.gz")
             self.__target.set_directory_entry(False)
+            self.__incremental.set_available(False)
         else:
             self.__target.set_directory_entry(True)
+            self.__incremental.set_available(True)
 
     def __update_filters(self):
         """
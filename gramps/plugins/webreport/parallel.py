@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+#!/usr/bin/env python
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Narrative Web Page generator.
+
+Writing of the pages of the objects in several processes.  Each worker
+opens the database read-only, and makes its own report with the options
+and the tables of the objects of the report.  The workers write the pages
+in the directory of the web site; for an archive, they write each page in
+an archive in memory, and the report adds its members to the archive of
+the web site in the order of the pages.
+"""
+
+#------------------------------------------------
+# python modules
+#------------------------------------------------
+from collections import defaultdict
+from io import BytesIO
+import logging
+import multiprocessing
+import pickle
+import tarfile
+
+LOG = logging.getLogger(".NarrativeWeb")
+
+# Smallest number of pages worth starting worker processes for
+MIN_PAGES = 100
+
+# Number of pages sent to a worker at once
+CHUNK_SIZE = 10
+
+_WORKER_REPORT = None
+
+def _to_dict(table):
+    """
+    Return a table of the objects of the report as dictionaries, which can
+    be pickled.
+    """
+    return {obj_class: dict(objects) for obj_class, objects in table.items()}
+
+def _to_table(data):
+    """
+    Return a table of the objects of the report from its dictionaries.
+    """
+    table = defaultdict(lambda: defaultdict(set))
+    for obj_class, objects in data.items():
+        table[obj_class].update(objects)
+    return table
+
+#------------------------------------------------
+#
+# Worker process
+#
+#------------------------------------------------
+def _init_worker(backend, directory, data):
+    """
+    Open the database read-only and make the report.
+    """
+    global _WORKER_REPORT
+    from gramps.gen.db.utils import make_database
+    from gramps.gen.db.dbconst import DBMODE_R
+    from gramps.gen.user import User
+    from gramps.plugins.webreport.narrativeweb import (NavWebReport,
+                                                       NavWebOptions)
+    try:
+        database = make_database(backend)
+        database.load(directory, mode=DBMODE_R)
+        (name, options, obj_dict, bkref_dict,
+         record) = pickle.loads(data)
+        options_class = NavWebOptions(name, database)
+        options_class.load_previous_values()
+        for optname, value in options.items():
+            options_class.menu.get_option_by_name(optname).set_value(value)
+        report = NavWebReport(database, options_class, User())
+        report.init_worker(_to_table(obj_dict), _to_table(bkref_dict), record)
+        _WORKER_REPORT = report
+    except Exception:
+        # An exception would make the pool start new workers forever.
+        LOG.warning("Unable to start web page worker", exc_info=True)
+        _WORKER_REPORT = None
+
+def _write_page(job):
+    """
+    Write the page of an object, and return the objects read, the files
+    written and the archive of the page, or None if the worker could not be
+    started.
+    """
+    report = _WORKER_REPORT
+    if report is None:
+        return None
+    obj_class, title, page = job
+    if not report.use_archive:
+        return report.write_object_page(obj_class, title, page) + (None,)
+    members = BytesIO()
+    report.archive = tarfile.open(fileobj=members, mode="w")
+    try:
+        handles, files = report.write_object_page(obj_class, title, page)
+    finally:
+        report.archive.close()
+        report.archive = None
+    return handles, files, members.getvalue()
+
+#------------------------------------------------
+#
+# PagePool
+#
+#------------------------------------------------
+class PagePool:
+    """
+    The worker processes writing the pages of the objects of a report.
+    """
+    def __init__(self, report, source, workers):
+        """
+        @param: report  -- The report
+        @param: source  -- The backend and the directory of the database
+        @param: workers -- The number of worker processes
+        """
+        self.report = report
+        data = pickle.dumps(('navwebpage', report.options,
+                             _to_dict(report.obj_dict),
+                             _to_dict(report.bkref_dict),
+                             report.recorder is not None))
+        self.pool = multiprocessing.Pool(workers, _init_worker,
+                                         source + (data,))
+
+    def write_pages(self, obj_class, title, pages):
+        """
+        Write the pages in the workers, and yield the objects read and the
+        files written for each page, in order.
+        """
+        results = self.pool.imap(_write_page,
+                                 [(obj_class, title, page) for page in pages],
+                                 CHUNK_SIZE)
+        for page, result in zip(pages, results):
+            if result is None:
+                yield self.report.write_object_page(obj_class, title, page)
+                continue
+            handles, files, members = result
+            if members is not None:
+                self.__add_members(members)
+            yield handles, files
+
+    def __add_members(self, members):
+        """
+        Add the members of the archive of a page to the archive of the web
+        site.
+        """
+        with tarfile.open(fileobj=BytesIO(members)) as page_archive:
+            for tarinfo in page_archive:
+                self.report.archive.addfile(
+                    tarinfo, page_archive.extractfile(tarinfo))
+
+    def close(self):
+        """
+        Stop the worker processes.
+        """
+        self.pool.terminate()
+        self.pool.join()
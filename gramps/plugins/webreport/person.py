@@ -134,16 +134,23 @@ class PersonPages(BasePage):
         with self.r_user.progress(_("Narrated Web Site Report"), message,
                                   len(self.report.obj_dict[Person]) + 1
                                  ) as step:
-            index = 1
-            for person_handle in sorted(self.report.obj_dict[Person]):
-                step()
-                index += 1
-                person = self.r_db.get_person_from_handle(person_handle)
-                self.individualpage(self.report, title, person)
+            jobs = [(person_handle,) for person_handle
+                    in sorted(self.report.obj_dict[Person])]
+            self.report.write_object_pages(Person, title, jobs, step)
             step()
             self.individuallistpage(self.report, title,
                                     self.report.obj_dict[Person].keys())
 
+    def display_page(self, title, person_handle):
+        """
+        Generate and output the page of a person.
+
+        @param: title         -- Is the title of the web page
+        @param: person_handle -- The handle of the person
+        """
+        person = self.r_db.get_person_from_handle(person_handle)
+        self.individualpage(self.report, title, person)
+
 #################################################
 #
 #    creates the Individual List Page
@@ -170,6 +177,7 @@ class PersonPages(BasePage):
 
         output_file, sio = self.report.create_file("individuals")
         indlistpage, head, body = self.write_header(self._("Individuals"))
+        self.xhtml_stream(indlistpage, output_file)
         date = 0
 
         # begin Individuals division
@@ -192,38 +200,37 @@ class PersonPages(BasePage):
                 individuallist += alpha_nav
 
             # begin table and table head
-            with Html("table",
-                      class_="infolist primobjlist IndividualList") as table:
-                individuallist += table
-                thead = Html("thead")
-                table += thead
-
-                trow = Html("tr")
-                thead += trow
-
-                # show surname and first name
-                trow += Html("th", self._("Surname"), class_="ColumnSurname",
+            table = Html("table", class_="infolist primobjlist IndividualList")
+            individuallist += table
+            thead = Html("thead")
+            table += thead
+
+            trow = Html("tr")
+            thead += trow
+
+            # show surname and first name
+            trow += Html("th", self._("Surname"), class_="ColumnSurname",
+                         inline=True)
+            trow += Html("th", self._("Given Name"), class_="ColumnName",
+                         inline=True)
+
+            if showbirth:
+                trow += Html("th", self._("Birth"), class_="ColumnDate",
                              inline=True)
-                trow += Html("th", self._("Given Name"), class_="ColumnName",
-                             inline=True)
-
-                if showbirth:
-                    trow += Html("th", self._("Birth"), class_="ColumnDate",
-                                 inline=True)
 
-                if showdeath:
-                    trow += Html("th", self._("Death"), class_="ColumnDate",
-                                 inline=True)
+            if showdeath:
+                trow += Html("th", self._("Death"), class_="ColumnDate",
+                             inline=True)
 
-                if showpartner:
-                    trow += Html("th", self._("Partner"),
-                                 class_="ColumnPartner",
-                                 inline=True)
+            if showpartner:
+                trow += Html("th", self._("Partner"),
+                             class_="ColumnPartner",
+                             inline=True)
 
-                if showparents:
-                    trow += Html("th", self._("Parents"),
-                                 class_="ColumnParents",
-                                 inline=True)
+            if showparents:
+                trow += Html("th", self._("Parents"),
+                             class_="ColumnParents",
+                             inline=True)
 
             tbody = Html("tbody")
             table += tbody
@@ -259,149 +266,157 @@ class PersonPages(BasePage):
                         date = person.get_change_time()
 
                     # surname column
-                    trow = Html("tr")
-                    tbody += trow
-                    tcell = Html("td", class_="ColumnSurname", inline=True)
-                    trow += tcell
-
-                    if first or primary_difference(letter, prev_letter,
-                                                   self.rlocale):
-                        first = False
-                        first_surname = False
-                        prev_letter = letter
-                        trow.attr = 'class = "BeginSurname"'
-                        ttle = self._("Surnames %(surname)s beginning "
-                                      "with letter %(letter)s" %
-                                      {'surname' : surname,
-                                       'letter' : letter})
-                        tcell += Html(
-                            "a", html_escape(surnamed), name=letter,
-                            id_=letter,
-                            title=ttle)
-                    elif first_surname:
-                        first_surname = False
-                        tcell += Html("a", html_escape(surnamed),
-                                      title=self._("Surnames") + " " + surname)
-                    else:
-                        tcell += "&nbsp;"
-
-                    # firstname column
-                    link = self.new_person_link(person_handle, person=person,
-                                                name_style=_NAME_STYLE_FIRST)
-                    trow += Html("td", link, class_="ColumnName")
-
-                    # birth column
-                    if showbirth:
-                        tcell = Html("td", class_="ColumnBirth", inline=True)
+                    with Html("tr") as trow:
+                        tbody += trow
+                        tcell = Html("td", class_="ColumnSurname", inline=True)
                         trow += tcell
 
-                        birth_date = _find_birth_date(self.r_db, person)
-                        if birth_date is not None:
-                            if birth_date.fallback:
-                                tcell += Html('em',
-                                              self.rlocale.get_date(birth_date),
-                                              inline=True)
-                            else:
-                                tcell += self.rlocale.get_date(birth_date)
+                        if first or primary_difference(letter, prev_letter,
+                                                       self.rlocale):
+                            first = False
+                            first_surname = False
+                            prev_letter = letter
+                            trow.attr = 'class = "BeginSurname"'
+                            ttle = self._("Surnames %(surname)s beginning "
+                                          "with letter %(letter)s" %
+                                          {'surname' : surname,
+                                           'letter' : letter})
+                            tcell += Html(
+                                "a", html_escape(surnamed), name=letter,
+                                id_=letter,
+                                title=ttle)
+                        elif first_surname:
+                            first_surname = False
+                            tcell += Html("a", html_escape(surnamed),
+                                          title=self._("Surnames") + " " +
+                                          surname)
                         else:
                             tcell += "&nbsp;"
 
-                    # death column
-                    if showdeath:
-                        tcell = Html("td", class_="ColumnDeath", inline=True)
-                        trow += tcell
-
-                        death_date = _find_death_date(self.r_db, person)
-                        if death_date is not None:
-                            if death_date.fallback:
-                                tcell += Html('em',
-                                              self.rlocale.get_date(death_date),
-                                              inline=True)
+                        # firstname column
+                        link = self.new_person_link(
+                            person_handle, person=person,
+                            name_style=_NAME_STYLE_FIRST)
+                        trow += Html("td", link, class_="ColumnName")
+
+                        # birth column
+                        if showbirth:
+                            tcell = Html("td", class_="ColumnBirth",
+                                         inline=True)
+                            trow += tcell
+
+                            birth_date = _find_birth_date(self.r_db, person)
+                            if birth_date is not None:
+                                if birth_date.fallback:
+                                    tcell += Html(
+                                        'em', self.rlocale.get_date(birth_date),
+                                        inline=True)
+                                else:
+                                    tcell += self.rlocale.get_date(birth_date)
                             else:
-                                tcell += self.rlocale.get_date(death_date)
-                        else:
-                            tcell += "&nbsp;"
+                                tcell += "&nbsp;"
+
+                        # death column
+                        if showdeath:
+                            tcell = Html("td", class_="ColumnDeath",
+                                         inline=True)
+                            trow += tcell
+
+                            death_date = _find_death_date(self.r_db, person)
+                            if death_date is not None:
+                                if death_date.fallback:
+                                    tcell += Html(
+                                        'em', self.rlocale.get_date(death_date),
+                                        inline=True)
+                                else:
+                                    tcell += self.rlocale.get_date(death_date)
+                            else:
+                                tcell += "&nbsp;"
+
+                        # partner column
+                        if showpartner:
+
+                            family_list = person.get_family_handle_list()
+                            first_family = True
+                            #partner_name = None
+                            tcell = () # pylint: disable=R0204
+                            if family_list:
+                                for family_handle in family_list:
+                                    family = self.r_db.get_family_from_handle(
+                                        family_handle)
+                                    partner_handle = utils.find_spouse(
+                                        person, family)
+                                    if partner_handle:
+                                        if not first_family:
+                                            # have to do this to get the comma
+                                            # on the same line as the link
+                                            if isinstance(tcell[-1], Html):
+                                                # tcell is an instance of Html
+                                                # (or of a subclass thereof)
+                                                tcell[-1].inside += ","
+                                            else:
+                                                tcell = tcell[:-1] + (
+                                                    # TODO for Arabic,
+                                                    # translate?
+                                                    (tcell[-1] + ", "),)
+                                        # Have to manipulate as tuples so that
+                                        # subsequent people are not nested
+                                        # within the first link
+                                        tcell += (self.new_person_link(
+                                            partner_handle),)
+                                        first_family = False
+                            else:
+                                tcell = "&nbsp;"
+                            trow += Html("td", class_="ColumnPartner") + tcell
 
-                    # partner column
-                    if showpartner:
+                        # parents column
+                        if showparents:
 
-                        family_list = person.get_family_handle_list()
-                        first_family = True
-                        #partner_name = None
-                        tcell = () # pylint: disable=R0204
-                        if family_list:
-                            for family_handle in family_list:
+                            parent_hdl_list = \
+                                person.get_parent_family_handle_list()
+                            if parent_hdl_list:
+                                parent_handle = parent_hdl_list[0]
                                 family = self.r_db.get_family_from_handle(
-                                    family_handle)
-                                partner_handle = utils.find_spouse(
-                                    person, family)
-                                if partner_handle:
-                                    if not first_family:
-                                        # have to do this to get the comma on
-                                        # the same line as the link
-                                        if isinstance(tcell[-1], Html):
-                                            # tcell is an instance of Html (or
-                                            # of a subclass thereof)
-                                            tcell[-1].inside += ","
-                                        else:
-                                            tcell = tcell[:-1] + (
-                                                # TODO for Arabic, translate?
-                                                (tcell[-1] + ", "),)
-                                    # Have to manipulate as tuples so that
-                                    # subsequent people are not nested
-                                    # within the first link
-                                    tcell += (
-                                        self.new_person_link(partner_handle),)
-                                    first_family = False
-                        else:
-                            tcell = "&nbsp;"
-                        trow += Html("td", class_="ColumnPartner") + tcell
-
-                    # parents column
-                    if showparents:
-
-                        parent_hdl_list = person.get_parent_family_handle_list()
-                        if parent_hdl_list:
-                            parent_handle = parent_hdl_list[0]
-                            family = self.r_db.get_family_from_handle(
-                                parent_handle)
-                            father_handle = family.get_father_handle()
-                            mother_handle = family.get_mother_handle()
-                            if father_handle:
-                                father = self.r_db.get_person_from_handle(
-                                    father_handle)
-                            else:
-                                father = None
-                            if mother_handle:
-                                mother = self.r_db.get_person_from_handle(
-                                    mother_handle)
-                            else:
-                                mother = None
-                            if father:
-                                father_name = self.get_name(father)
-                            if mother:
-                                mother_name = self.get_name(mother)
-                            samerow = False
-                            if mother and father:
-                                tcell = (Html("span", father_name,
-                                              class_="father fatherNmother",
-                                              inline=True),
-                                         Html("span", mother_name,
-                                              class_="mother", inline=True))
-                            elif mother:
-                                tcell = Html("span", mother_name,
-                                             class_="mother", inline=True)
-                            elif father:
-                                tcell = Html("span", father_name,
-                                             class_="father", inline=True)
+                                    parent_handle)
+                                father_handle = family.get_father_handle()
+                                mother_handle = family.get_mother_handle()
+                                if father_handle:
+                                    father = self.r_db.get_person_from_handle(
+                                        father_handle)
+                                else:
+                                    father = None
+                                if mother_handle:
+                                    mother = self.r_db.get_person_from_handle(
+                                        mother_handle)
+                                else:
+                                    mother = None
+                                if father:
+                                    father_name = self.get_name(father)
+                                if mother:
+                                    mother_name = self.get_name(mother)
+                                samerow = False
+                                if mother and father:
+                                    tcell = (Html("span", father_name,
+                                                  class_="father "
+                                                  "fatherNmother",
+                                                  inline=True),
+                                             Html("span", mother_name,
+                                                  class_="mother",
+                                                  inline=True))
+                                elif mother:
+                                    tcell = Html("span", mother_name,
+                                                 class_="mother", inline=True)
+                                elif father:
+                                    tcell = Html("span", father_name,
+                                                 class_="father", inline=True)
+                                else:
+                                    tcell = "&nbsp;"
+                                    samerow = True
                             else:
                                 tcell = "&nbsp;"
                                 samerow = True
-                        else:
-                            tcell = "&nbsp;"
-                            samerow = True
-                        trow += Html("td", class_="ColumnParents",
-                                     inline=samerow) + tcell
+                            trow += Html("td", class_="ColumnParents",
+                                         inline=samerow) + tcell
 
         # create clear line for proper styling
         # create footer section
@@ -117,15 +117,22 @@ class PlacePages(BasePage):
         with self.r_user.progress(_("Narrated Web Site Report"), message,
                                   len(self.report.obj_dict[Place]) + 1
                                  ) as step:
-            index = 1
-            for place_handle in self.report.obj_dict[Place]:
-                step()
-                index += 1
-                self.placepage(self.report, title, place_handle)
+            jobs = [(place_handle,) for place_handle
+                    in self.report.obj_dict[Place]]
+            self.report.write_object_pages(Place, title, jobs, step)
             step()
             self.placelistpage(self.report, title,
                                self.report.obj_dict[Place].keys())
 
+    def display_page(self, title, place_handle):
+        """
+        Generate and output the page of a place.
+
+        @param: title        -- Is the title of the web page
+        @param: place_handle -- The handle of the place
+        """
+        self.placepage(self.report, title, place_handle)
+
     def placelistpage(self, report, title, place_handles):
         """
         Create a place index
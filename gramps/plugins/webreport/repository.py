@@ -114,12 +114,18 @@ class RepositoryPages(BasePage):
             # RepositoryListPage Class
             self.repositorylistpage(self.report, title, repos_dict, keys)
 
-            idx = 1
-            for index, key in enumerate(keys):
-                (repo, handle) = repos_dict[key]
-                step()
-                idx += 1
-                self.repositorypage(self.report, title, repo, handle)
+            jobs = [(repos_dict[key][1],) for key in keys]
+            self.report.write_object_pages(Repository, title, jobs, step)
+
+    def display_page(self, title, handle):
+        """
+        Generate and output the page of a repository.
+
+        @param: title  -- Is the title of the web page
+        @param: handle -- The handle of the repository
+        """
+        repo = self.r_db.get_repository_from_handle(handle)
+        self.repositorypage(self.report, title, repo, handle)
 
     def repositorylistpage(self, report, title, repos_dict, keys):
         """
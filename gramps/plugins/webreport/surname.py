@@ -97,6 +97,7 @@ class SurnamePage(BasePage):
         self.uplink = True
         (surnamepage, head,
          body) = self.write_header("%s - %s" % (self._("Surname"), surname))
+        self.xhtml_stream(surnamepage, output_file)
         ldatec = 0
 
         # begin SurnameDetail division
@@ -165,106 +166,112 @@ class SurnamePage(BasePage):
                     person = self.r_db.get_person_from_handle(person_handle)
                     if person.get_change_time() > ldatec:
                         ldatec = person.get_change_time()
-                    trow = Html("tr")
-                    tbody += trow
+                    with Html("tr") as trow:
+                        tbody += trow
 
-                    # firstname column
-                    link = self.new_person_link(person_handle, uplink=True,
-                                                person=person,
-                                                name_style=_NAME_STYLE_FIRST)
-                    trow += Html("td", link, class_="ColumnName")
+                        # firstname column
+                        link = self.new_person_link(
+                            person_handle, uplink=True, person=person,
+                            name_style=_NAME_STYLE_FIRST)
+                        trow += Html("td", link, class_="ColumnName")
 
-                    # birth column
-                    if showbirth:
-                        tcell = Html("td", class_="ColumnBirth", inline=True)
-                        trow += tcell
+                        # birth column
+                        if showbirth:
+                            tcell = Html("td", class_="ColumnBirth",
+                                         inline=True)
+                            trow += tcell
 
-                        birth_date = _find_birth_date(self.r_db, person)
-                        if birth_date is not None:
-                            if birth_date.fallback:
-                                tcell += Html('em',
-                                              self.rlocale.get_date(birth_date),
-                                              inline=True)
+                            birth_date = _find_birth_date(self.r_db, person)
+                            if birth_date is not None:
+                                if birth_date.fallback:
+                                    tcell += Html(
+                                        'em', self.rlocale.get_date(birth_date),
+                                        inline=True)
+                                else:
+                                    tcell += self.rlocale.get_date(birth_date)
                             else:
-                                tcell += self.rlocale.get_date(birth_date)
-                        else:
-                            tcell += "&nbsp;"
+                                tcell += "&nbsp;"
 
-                    # death column
-                    if showdeath:
-                        tcell = Html("td", class_="ColumnDeath", inline=True)
-                        trow += tcell
+                        # death column
+                        if showdeath:
+                            tcell = Html("td", class_="ColumnDeath",
+                                         inline=True)
+                            trow += tcell
 
-                        death_date = _find_death_date(self.r_db, person)
-                        if death_date is not None:
-                            if death_date.fallback:
-                                tcell += Html('em',
-                                              self.rlocale.get_date(death_date),
-                                              inline=True)
+                            death_date = _find_death_date(self.r_db, person)
+                            if death_date is not None:
+                                if death_date.fallback:
+                                    tcell += Html(
+                                        'em', self.rlocale.get_date(death_date),
+                                        inline=True)
+                                else:
+                                    tcell += self.rlocale.get_date(death_date)
                             else:
-                                tcell += self.rlocale.get_date(death_date)
-                        else:
-                            tcell += "&nbsp;"
+                                tcell += "&nbsp;"
 
-                    # partner column
-                    if showpartner:
-                        tcell = Html("td", class_="ColumnPartner")
-                        trow += tcell
-                        family_list = person.get_family_handle_list()
-                        if family_list:
-                            fam_count = 0
-                            for family_handle in family_list:
-                                fam_count += 1
-                                family = self.r_db.get_family_from_handle(
-                                    family_handle)
-                                partner_handle = utils.find_spouse(
-                                    person, family)
-                                if partner_handle:
-                                    link = self.new_person_link(partner_handle,
-                                                                uplink=True)
-                                    if fam_count < len(family_list):
-                                        if isinstance(link, Html):
-                                            link.inside += ","
-                                        else:
-                                            link += ','
-                                    tcell += link
-                        else:
-                            tcell += "&nbsp;"
+                        # partner column
+                        if showpartner:
+                            tcell = Html("td", class_="ColumnPartner")
+                            trow += tcell
+                            family_list = person.get_family_handle_list()
+                            if family_list:
+                                fam_count = 0
+                                for family_handle in family_list:
+                                    fam_count += 1
+                                    family = self.r_db.get_family_from_handle(
+                                        family_handle)
+                                    partner_handle = utils.find_spouse(
+                                        person, family)
+                                    if partner_handle:
+                                        link = self.new_person_link(
+                                            partner_handle, uplink=True)
+                                        if fam_count < len(family_list):
+                                            if isinstance(link, Html):
+                                                link.inside += ","
+                                            else:
+                                                link += ','
+                                        tcell += link
+                            else:
+                                tcell += "&nbsp;"
 
-                    # parents column
-                    if showparents:
-                        parent_hdl_list = person.get_parent_family_handle_list()
-                        if parent_hdl_list:
-                            parent_hdl = parent_hdl_list[0]
-                            fam = self.r_db.get_family_from_handle(parent_hdl)
-                            f_id = fam.get_father_handle()
-                            m_id = fam.get_mother_handle()
-                            mother = father = None
-                            if f_id:
-                                father = self.r_db.get_person_from_handle(f_id)
-                                if father:
-                                    father_name = self.get_name(father)
-                            if m_id:
-                                mother = self.r_db.get_person_from_handle(m_id)
-                                if mother:
-                                    mother_name = self.get_name(mother)
-                            if mother and father:
-                                tcell = Html("span", father_name,
-                                             class_="father fatherNmother")
-                                tcell += Html("span", mother_name,
-                                              class_="mother")
-                            elif mother:
-                                tcell = Html("span", mother_name,
-                                             class_="mother", inline=True)
-                            elif father:
-                                tcell = Html("span", father_name,
-                                             class_="father", inline=True)
-                            samerow = False
-                        else:
-                            tcell = "&nbsp;" # pylint: disable=R0204
-                            samerow = True
-                        trow += Html("td", tcell,
-                                     class_="ColumnParents", inline=samerow)
+                        # parents column
+                        if showparents:
+                            parent_hdl_list = \
+                                person.get_parent_family_handle_list()
+                            if parent_hdl_list:
+                                parent_hdl = parent_hdl_list[0]
+                                fam = self.r_db.get_family_from_handle(
+                                    parent_hdl)
+                                f_id = fam.get_father_handle()
+                                m_id = fam.get_mother_handle()
+                                mother = father = None
+                                if f_id:
+                                    father = self.r_db.get_person_from_handle(
+                                        f_id)
+                                    if father:
+                                        father_name = self.get_name(father)
+                                if m_id:
+                                    mother = self.r_db.get_person_from_handle(
+                                        m_id)
+                                    if mother:
+                                        mother_name = self.get_name(mother)
+                                if mother and father:
+                                    tcell = Html("span", father_name,
+                                                 class_="father fatherNmother")
+                                    tcell += Html("span", mother_name,
+                                                  class_="mother")
+                                elif mother:
+                                    tcell = Html("span", mother_name,
+                                                 class_="mother", inline=True)
+                                elif father:
+                                    tcell = Html("span", father_name,
+                                                 class_="father", inline=True)
+                                samerow = False
+                            else:
+                                tcell = "&nbsp;" # pylint: disable=R0204
+                                samerow = True
+                            trow += Html("td", tcell,
+                                         class_="ColumnParents", inline=samerow)
 
         # add clearline for proper styling
         # add footer section
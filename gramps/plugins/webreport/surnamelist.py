@@ -100,6 +100,7 @@ class SurnameListPage(BasePage):
             output_file, sio = self.report.create_file("surnames_count")
             (surnamelistpage, head,
              body) = self.write_header(self._('Surnames by person count'))
+        self.xhtml_stream(surnamelistpage, output_file)
 
         # begin surnames division
         with Html("div", class_="content", id="surnames") as surnamelist:
@@ -191,44 +192,45 @@ class SurnameListPage(BasePage):
                             letter = '&nbsp;'
                             surname = self._("<absent>")
 
-                        trow = Html("tr")
-                        tbody += trow
-
-                        tcell = Html("td", class_="ColumnLetter", inline=True)
-                        trow += tcell
-
-                        if first or primary_difference(letter, prev_letter,
-                                                       self.rlocale):
-                            first = False
-                            prev_letter = letter
-                            trow.attr = 'class = "BeginLetter"'
-                            ttle = self._("Surnames beginning with "
-                                          "letter %s") % letter
-                            hyper = Html("a", letter, name=letter,
-                                         title=ttle, inline=True)
-                            tcell += hyper
-                        elif first_surname or surname != prev_surname:
-                            first_surname = False
-                            tcell += "&nbsp;"
-                            prev_surname = surname
-
-                        # In case the user choose a format name like "*SURNAME*"
-                        # We must display this field in upper case. So we use
-                        # the english format of format_name to find if this is
-                        # the case.
-                        # name_format = self.report.options['name_format']
-                        nme_format = _nd.name_formats[name_format][1]
-                        if "SURNAME" in nme_format:
-                            surnamed = surname.upper()
-                        else:
-                            surnamed = surname
-                        trow += Html("td",
-                                     self.surname_link(name_to_md5(surname),
-                                                       surnamed),
-                                     class_="ColumnSurname", inline=True)
-
-                        trow += Html("td", len(data_list),
-                                     class_="ColumnQuantity", inline=True)
+                        with Html("tr") as trow:
+                            tbody += trow
+
+                            tcell = Html("td", class_="ColumnLetter",
+                                         inline=True)
+                            trow += tcell
+
+                            if first or primary_difference(letter, prev_letter,
+                                                           self.rlocale):
+                                first = False
+                                prev_letter = letter
+                                trow.attr = 'class = "BeginLetter"'
+                                ttle = self._("Surnames beginning with "
+                                              "letter %s") % letter
+                                hyper = Html("a", letter, name=letter,
+                                             title=ttle, inline=True)
+                                tcell += hyper
+                            elif first_surname or surname != prev_surname:
+                                first_surname = False
+                                tcell += "&nbsp;"
+                                prev_surname = surname
+
+                            # In case the user choose a format name like
+                            # "*SURNAME*" We must display this field in upper
+                            # case. So we use the english format of format_name
+                            # to find if this is the case.
+                            # name_format = self.report.options['name_format']
+                            nme_format = _nd.name_formats[name_format][1]
+                            if "SURNAME" in nme_format:
+                                surnamed = surname.upper()
+                            else:
+                                surnamed = surname
+                            trow += Html("td",
+                                         self.surname_link(name_to_md5(surname),
+                                                           surnamed),
+                                         class_="ColumnSurname", inline=True)
+
+                            trow += Html("td", len(data_list),
+                                         class_="ColumnQuantity", inline=True)
 
         # create footer section
         # add clearline for proper styling
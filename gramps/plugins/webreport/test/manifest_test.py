@@ -0,0 +1,126 @@
+#
+# Gramps - a GTK+/GNOME based genealogy program
+#
+# Copyright (C) 2026      Gramps Development Team
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""
+Unittest of the manifest of the incremental web site generation
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from collections import defaultdict
+
+from gramps.gen.db import DbTxn
+from gramps.gen.db.utils import make_database
+from gramps.gen.lib import Person, Event, EventRef
+from gramps.plugins.webreport.manifest import Manifest, RecordingDb
+
+class ManifestTest(unittest.TestCase):
+    """
+    Tests of the pages written again by an incremental run.
+    """
+
+    def setUp(self):
+        self.html_dir = tempfile.mkdtemp()
+        self.db = make_database("sqlite")
+        self.db.load(":memory:")
+        self.obj_dict = defaultdict(lambda: defaultdict(set))
+        self.bkref_dict = defaultdict(lambda: defaultdict(set))
+        with DbTxn('Add people', self.db) as trans:
+            self.event = self.db.add_event(Event(), trans)
+            person = Person()
+            ref = EventRef()
+            ref.ref = self.event
+            person.add_event_ref(ref)
+            self.with_event = self.db.add_person(person, trans)
+            self.without_event = self.db.add_person(Person(), trans)
+        for handle in (self.with_event, self.without_event):
+            self.obj_dict[Person][handle] = ("", "", "")
+        self.obj_dict[Event][self.event] = ("", "", "")
+        self.bkref_dict[Event][self.event].add((Person, self.with_event, ""))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.html_dir)
+
+    def run_report(self, options=None):
+        """
+        Write the pages of the people and events like the report, and
+        return the handles of the pages written.
+        """
+        manifest = Manifest(self.html_dir, self.db, options)
+        manifest.set_objects(self.obj_dict, self.bkref_dict)
+        database = RecordingDb(self.db)
+        written = []
+        for obj_class, method in ((Person, database.get_person_from_handle),
+                                  (Event, database.get_event_from_handle)):
+            for handle in sorted(self.obj_dict[obj_class]):
+                if manifest.is_current(obj_class, handle):
+                    continue
+                database.handles = set()
+                obj = method(handle)
+                for event_ref in getattr(obj, 'event_ref_list', []):
+                    database.get_event_from_handle(event_ref.ref)
+                fname = handle + ".html"
+                with open(os.path.join(self.html_dir, fname), 'w'):
+                    pass
+                manifest.add_page(obj_class, handle, (), database.handles,
+                                  [fname])
+                written.append(handle)
+        manifest.save()
+        return written
+
+    def test_changes(self):
+        everything = [self.with_event, self.without_event, self.event]
+        self.assertEqual(sorted(self.run_report()), sorted(everything))
+        self.assertEqual(self.run_report(), [])
+
+        # the page of the person shows the event
+        with DbTxn('Edit event', self.db) as trans:
+            event = self.db.get_event_from_handle(self.event)
+            event.set_description('Changed')
+            self.db.commit_event(event, trans)
+        self.assertEqual(self.run_report(), [self.with_event, self.event])
+
+        # the page of the event names the people who refer to it
+        with DbTxn('Edit person', self.db) as trans:
+            person = self.db.get_person_from_handle(self.with_event)
+            person.set_gender(Person.MALE)
+            self.db.commit_person(person, trans)
+        self.assertEqual(self.run_report(), [self.with_event, self.event])
+
+        self.assertEqual(sorted(self.run_report({'title': 'Other'})),
+                         sorted(everything))
+        os.remove(os.path.join(self.html_dir, self.without_event + ".html"))
+        self.assertEqual(self.run_report({'title': 'Other'}),
+                         [self.without_event])
+
+    def test_stale_pages(self):
+        self.run_report()
+        del self.obj_dict[Person][self.without_event]
+        self.assertEqual(self.run_report(), [])
+        self.assertFalse(os.path.exists(
+            os.path.join(self.html_dir, self.without_event + ".html")))
+        self.assertTrue(os.path.exists(
+            os.path.join(self.html_dir, self.with_event + ".html")))
+
+
+if __name__ == "__main__":
+    unittest.main()
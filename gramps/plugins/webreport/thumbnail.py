@@ -110,6 +110,10 @@ class ThumbnailPreviewPage(BasePage):
         output_file, sio = self.report.create_file("thumbnails")
         thumbnailpage, head, body = self.write_header(self._("Thumbnails"))
 
+        # add body id element
+        body.attr = 'id ="ThumbnailPreview"'
+        self.xhtml_stream(thumbnailpage, output_file)
+
         with Html("div", class_="content", id="Preview") as previewpage:
             body += previewpage
 
@@ -153,56 +157,59 @@ class ThumbnailPreviewPage(BasePage):
                 num_of_cols = 7
                 grid_row = 0
                 while grid_row < num_of_rows:
-                    trow = Html("tr", class_="thumbnail", id="RowNumber: %08d" % grid_row)
-                    tbody += trow
-
-                    cols = 0
-                    while cols < num_of_cols and indexpos < num_of_images:
-                        ptitle = media_list[indexpos][0]
-                        person_handle = media_list[indexpos][1]
-                        photo = media_list[indexpos][2]
-
-                        # begin table cell and attach to table row(trow)...
-                        tcell = Html("td", class_="highlight weekend thumbnail")
-                        trow += tcell
-
-                        # attach index number...
-                        numberdiv = Html("div", class_="date")
-                        tcell += numberdiv
-
-                        # attach anchor name to date cell in upper right
-                        # corner of grid...
-                        numberdiv += Html("a", index, name=index, title=index,
-                                          inline=True)
-
-                        # begin unordered list and
-                        # attach to table cell(tcell)...
-                        unordered = Html("ul")
-                        tcell += unordered
-
-                        # create thumbnail
-                        (real_path,
-                         newpath) = self.report.prepare_copy_media(photo)
-                        newpath = self.report.build_url_fname(newpath)
-
-                        list_html = Html("li")
-                        unordered += list_html
-
-                        # attach thumbnail to list...
-                        list_html += self.thumb_hyper_image(newpath, "img",
-                                                            person_handle,
-                                                            ptitle)
-
-                        index += 1
-                        indexpos += 1
-                        cols += 1
+                    with Html("tr", class_="thumbnail",
+                              id="RowNumber: %08d" % grid_row) as trow:
+                        tbody += trow
+
+                        cols = 0
+                        while cols < num_of_cols and indexpos < num_of_images:
+                            ptitle = media_list[indexpos][0]
+                            person_handle = media_list[indexpos][1]
+                            photo = media_list[indexpos][2]
+
+                            # begin table cell and attach to table row(trow)...
+                            tcell = Html("td",
+                                         class_="highlight weekend thumbnail")
+                            trow += tcell
+
+                            # attach index number...
+                            numberdiv = Html("div", class_="date")
+                            tcell += numberdiv
+
+                            # attach anchor name to date cell in upper right
+                            # corner of grid...
+                            numberdiv += Html("a", index, name=index,
+                                              title=index, inline=True)
+
+                            # begin unordered list and
+                            # attach to table cell(tcell)...
+                            unordered = Html("ul")
+                            tcell += unordered
+
+                            # create thumbnail
+                            (real_path,
+                             newpath) = self.report.prepare_copy_media(photo)
+                            newpath = self.report.build_url_fname(newpath)
+
+                            list_html = Html("li")
+                            unordered += list_html
+
+                            # attach thumbnail to list...
+                            list_html += self.thumb_hyper_image(newpath, "img",
+                                                                person_handle,
+                                                                ptitle)
+
+                            index += 1
+                            indexpos += 1
+                            cols += 1
+
+                        # if last row is incomplete, finish it off?
+                        if grid_row == num_of_rows - 1:
+                            for emptycols in range(cols, num_of_cols):
+                                trow += Html("td", class_="emptyDays",
+                                             inline=True)
                     grid_row += 1
 
-        # if last row is incomplete, finish it off?
-        if grid_row == num_of_rows and cols < num_of_cols:
-            for emptycols in range(cols, num_of_cols):
-                trow += Html("td", class_="emptyDays", inline=True)
-
         message = _("Creating thumbnail preview page...")
         # begin Thumbnail Reference section...
         with Html("div", class_="subsection", id="references") as section:
@@ -217,14 +224,14 @@ class ThumbnailPreviewPage(BasePage):
 
                 index = 1
                 for ptitle, person_handle, photo in media_list:
-                    trow = Html("tr")
-                    tbody += trow
+                    with Html("tr") as trow:
+                        tbody += trow
 
-                    tcell1 = Html("td",
-                                  self.thumbnail_link(ptitle, index),
-                                  class_="ColumnRowLabel")
-                    tcell2 = Html("td", ptitle, class_="ColumnName")
-                    trow += (tcell1, tcell2)
+                        tcell1 = Html("td",
+                                      self.thumbnail_link(ptitle, index),
+                                      class_="ColumnRowLabel")
+                        tcell2 = Html("td", ptitle, class_="ColumnName")
+                        trow += (tcell1, tcell2)
 
                     # increase progress meter...
                     cb_progress()
@@ -232,10 +239,6 @@ class ThumbnailPreviewPage(BasePage):
                     # increase index for row number...
                     index += 1
 
-
-        # add body id element
-        body.attr = 'id ="ThumbnailPreview"'
-
         # add footer section
         # add clearline for proper styling
         footer = self.write_footer(None)
@@ -933,6 +933,23 @@ class WebCalReport(Report):
                     # change day number
                     current_ord += 1
 
+            # table foot section, with the note of the month
+            if cal == "wc":
+                # One has to be minused because the array starts at zero,
+                # but January =1
+                note = self.month_notes[month-1].strip()
+                if note:
+                    note = self.database.get_note_from_gramps_id(note)
+                    note = self.get_note_format(note)
+
+                cal_foot = Html("tfoot")
+                table += cal_foot
+
+                trow = Html("tr") + (
+                    Html("td", note, colspan=7, inline=True)
+                    )
+                cal_foot += trow
+
             if cal == "yg":
                 for weeks in range(nweeks, 6):
 
@@ -975,6 +992,7 @@ class WebCalReport(Report):
                 # Add xml, doctype, meta and stylesheets
                 # body has already been added to webcal  already once
                 webcal, body = self.write_header(nr_up, self.title_text)
+                self.XHTMLStream(webcal, open_file)
 
                 # create Year Navigation menu
                 if self.multiyear and ((self.end_year - self.start_year) > 0):
@@ -985,29 +1003,13 @@ class WebCalReport(Report):
                 currentsection = _dd.long_months[month]
                 body += self.month_navigation(nr_up, year, currentsection, True)
 
-                # build the calendar
+                # build the calendar, with the note section for
+                # webcalendar()
                 content = Html("div", class_="content", id="WebCal")
                 body += content
                 monthly_calendar = self.calendar_build("wc", year, month)
                 content += monthly_calendar
 
-                # create note section for webcalendar()
-                # One has to be minused because the array starts at zero,
-                # but January =1
-                note = self.month_notes[month-1].strip()
-                if note:
-                    note = self.database.get_note_from_gramps_id(note)
-                    note = self.get_note_format(note)
-
-                # table foot  section
-                cal_foot = Html("tfoot")
-                monthly_calendar += cal_foot
-
-                trow = Html("tr") + (
-                    Html("td", note, colspan=7, inline=True)
-                    )
-                cal_foot += trow
-
                 # create blank line for stylesheets
                 # create footer division section
                 footer = self.write_footer(nr_up)
@@ -1062,6 +1064,7 @@ class WebCalReport(Report):
             # body has already been added to yearglance  already once
             yearglance, body = self.write_header(nr_up, title,
                                                  "fullyearlinked", False)
+            self.XHTMLStream(yearglance, open_file)
 
             # create Year Navigation menu
             if self.multiyear and ((self.end_year - self.start_year) > 0):
@@ -1128,6 +1131,7 @@ class WebCalReport(Report):
 
         # create page header
         oneday, body = self.write_header(nr_up, title, "OneDay")
+        self.XHTMLStream(oneday, one_day_file)
 
         # create Year Navigation menu
         if self.multiyear and ((self.end_year - self.start_year) > 0):
@@ -1475,6 +1479,13 @@ class WebCalReport(Report):
         # return footer to its callers
         return footer
 
+    def XHTMLStream(self, page, open_file):
+        """
+        Write the page to the file while it is built, one month of the
+        calendar at a time.  XHTMLWriter writes the rest of the page.
+        """
+        page.stream(lambda line: open_file.write(line + '\n'))
+
     def XHTMLWriter(self, page, open_file):
         """
         This function is simply to make the web page look pretty and readable